@@ -0,0 +1,61 @@
+"""
+블록 기간 백필 스크립트
+volume_blocks의 기간 필드(60이평선 회귀일, 기간 최고/최저가, 평균 거래량)와
+시장 대비 성과(지수 수익률, 상대 수익률, 베타/알파), 2번 블록 지지선(S1/S2/S3)을 일괄 계산
+
+Usage:
+    python backfill_ranges.py                   # 전체 블록
+    python backfill_ranges.py --missing-only    # 미계산 + 진행중 블록만
+    python backfill_ranges.py --codes 005930 000660
+    python backfill_ranges.py --skip-market     # 시장 대비 성과 제외
+    python backfill_ranges.py --all-supports    # 입력이 바뀌지 않은 지지선도 재계산
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from infrastructure.database import add_database_argument, configure_database, get_session, init_database
+from infrastructure.database.models import Stock
+from services.block_range_calculator import BlockRangeCalculator
+from services.market_performance import MarketPerformanceCalculator
+from services.support_level_calculator import SupportLevelCalculator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill volume block range and market performance fields")
+    parser.add_argument("--codes", nargs="*", default=None, help="종목 코드 (기본: 전 종목)")
+    parser.add_argument("--missing-only", action="store_true", help="기간 미계산/진행중 블록만")
+    parser.add_argument("--skip-market", action="store_true", help="시장 대비 성과 계산 생략")
+    parser.add_argument("--workers", type=int, default=None, help="시장 대비 성과 계산 프로세스 수")
+    parser.add_argument("--all-supports", action="store_true", help="모든 2번 블록 지지선 재계산 (수정주가 반영 등)")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    init_database()
+
+    stock_ids = None
+    if args.codes:
+        with get_session() as session:
+            stock_ids = [s.id for s in session.query(Stock.id).filter(Stock.code.in_(args.codes)).all()]
+
+    def progress(completed, total, message):
+        if completed == total or completed % 100 == 0:
+            print(message)
+
+    updated = BlockRangeCalculator().update(stock_ids, only_missing=args.missing_only, progress_callback=progress)
+    print(f"[SUCCESS] {updated} block ranges updated")
+
+    if not args.skip_market:
+        updated = MarketPerformanceCalculator(max_workers=args.workers).update(stock_ids, progress_callback=progress)
+        print(f"[SUCCESS] {updated} block market performances updated")
+
+    updated = SupportLevelCalculator().update(stock_ids, force=args.all_supports, progress_callback=progress)
+    print(f"[SUCCESS] {updated} Block 2 support levels updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+탐지 벤치마크 스크립트
+시드 고정 합성 종목군에서 탐지/후처리 엔진 시간 측정 → JSON 기준치와 비교 (회귀 시 종료 코드 1)
+
+Usage:
+    python benchmark_detection.py                             # 기본 크기 (10/50/200종목), 기준치와 비교
+    python benchmark_detection.py --update-baseline           # 측정 결과를 기준치로 저장
+    python benchmark_detection.py --sizes 10 50 --engines block_detector use_case_bulk
+    python benchmark_detection.py --write-db data/benchmarks/synthetic.db --sizes 500    # 합성 DB만 생성
+    python benchmark_detection.py --write-dump data/exports/synthetic --sizes 500        # 합성 덤프만 생성
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core.config import BENCHMARK_CONFIG
+from services.detection_benchmark import ENGINES, DetectionBenchmark, compare, load_baseline, save_baseline
+from services.synthetic_market import SyntheticMarket
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoboStock detection benchmark")
+    parser.add_argument("--sizes", nargs="+", type=int, default=BENCHMARK_CONFIG['universe_sizes'],
+                        help="종목군 크기 (종목 수)")
+    parser.add_argument("--years", type=int, default=BENCHMARK_CONFIG['years'], help="종목당 기간 (년)")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_CONFIG['seed'])
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_CONFIG['repeat'], help="반복 측정 횟수 (최솟값 사용)")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=None, help="측정할 엔진 (기본: 전체)")
+    parser.add_argument("--baseline", default=str(BENCHMARK_CONFIG['baseline_path']), help="기준치 JSON 경로")
+    parser.add_argument("--update-baseline", action="store_true", help="측정 결과를 기준치로 저장")
+    parser.add_argument("--max-regression", type=float, default=BENCHMARK_CONFIG['max_regression_pct'],
+                        help="허용 증가율 (%%)")
+    parser.add_argument("--write-db", default=None, help="측정 없이 합성 SQLite DB만 생성 (가장 큰 크기)")
+    parser.add_argument("--write-dump", default=None, help="측정 없이 합성 덤프(CSV.gz)만 생성 (가장 큰 크기)")
+    args = parser.parse_args()
+
+    if args.write_db or args.write_dump:
+        market = SyntheticMarket(stocks=max(args.sizes), years=args.years, seed=args.seed)
+        if args.write_db:
+            print(f"[SYNTHETIC] {market.write_sqlite(args.write_db)}")
+        if args.write_dump:
+            reports = market.write_dump(args.write_dump)
+            print(f"[SYNTHETIC] {sum(r.rows for r in reports.values()):,} rows → {args.write_dump}")
+        return
+
+    print("=" * 60)
+    print(f"RoboStock Detection Benchmark (seed {args.seed}, {args.years}y, repeat {args.repeat})")
+    print("=" * 60)
+
+    benchmark = DetectionBenchmark(args.sizes, args.years, args.seed, args.repeat, args.engines)
+    report = benchmark.run(lambda name, size, seconds: print(f"  {name:<18} {size:>5} stocks  {seconds:>8.3f}s"))
+
+    baseline = load_baseline(args.baseline)
+    print("\n" + "-" * 60)
+    print(f"  {'engine@stocks x years-seed':<34} {'baseline':>10} {'current':>10} {'change':>9}")
+    for key, result in report['results'].items():
+        previous = (baseline or {}).get('results', {}).get(key)
+        if previous:
+            change = (result['seconds'] / max(previous['seconds'], 1e-9) - 1) * 100
+            print(f"  {key:<34} {previous['seconds']:>9.3f}s {result['seconds']:>9.3f}s {change:>+8.1f}%")
+        else:
+            print(f"  {key:<34} {'-':>10} {result['seconds']:>9.3f}s {'new':>9}")
+
+    regressions = compare(report, baseline, args.max_regression)
+
+    if args.update_baseline:
+        print(f"\n[BASELINE] Saved → {save_baseline(report, args.baseline)}")
+    elif baseline is None:
+        print(f"\n[BASELINE] None at {args.baseline} (run with --update-baseline to record)")
+
+    print("=" * 60)
+    if regressions and not args.update_baseline:
+        print(f"[REGRESSION] {len(regressions)} measurement(s) slower than baseline by > {args.max_regression:.0f}%:")
+        for regression in regressions:
+            print(f"  !! {regression.key}: {regression.baseline:.3f}s → {regression.current:.3f}s "
+                  f"(+{regression.pct:.1f}%)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"[ERROR] Benchmark failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,45 @@
+"""
+케이스 생성/라벨링 스크립트
+저장된 1번/2번 블록 쌍으로 케이스를 만들고 진행 중인 케이스의 사후 수익률(최고가, 최대 수익률,
+목표 수익률 도달일, ReturnLevel)을 갱신
+
+Usage:
+    python build_cases.py                     # 전 종목
+    python build_cases.py --codes 005930 000660
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from infrastructure.database import add_database_argument, configure_database, get_session, init_database
+from infrastructure.database.models import Stock
+from services.case_pipeline import CasePipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build cases from Block 1/Block 2 pairs and label forward returns")
+    parser.add_argument("--codes", nargs="*", default=None, help="종목 코드 (기본: 전 종목)")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    init_database()
+
+    stock_ids = None
+    if args.codes:
+        with get_session() as session:
+            stock_ids = [s.id for s in session.query(Stock.id).filter(Stock.code.in_(args.codes)).all()]
+
+    def progress(completed, total, message):
+        if completed == total or completed % 100 == 0:
+            print(message)
+
+    created, labeled = CasePipeline().update(stock_ids, progress_callback=progress)
+    print(f"[SUCCESS] {created} cases created, {labeled} cases labeled")
+
+
+if __name__ == "__main__":
+    main()
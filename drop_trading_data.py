@@ -6,7 +6,7 @@ Drop trading_data table
 import sys
 sys.path.insert(0, 'src')
 
-from infrastructure.database import get_session
+from infrastructure.database import get_session, snapshot_before
 from sqlalchemy import text
 
 def drop_trading_data_table():
@@ -18,6 +18,7 @@ def drop_trading_data_table():
         ))
 
         if result.fetchone():
+            snapshot_before("drop_trading_data")
             print("[INFO] Dropping trading_data table...")
             session.execute(text("DROP TABLE trading_data"))
             session.commit()
@@ -0,0 +1,65 @@
+"""
+DB 내보내기 스크립트
+price_data / investor_trading / volume_blocks → Parquet 또는 CSV.gz (청크 스트리밍)
+
+Usage:
+    python export_db.py                               # 전체, Parquet, market/year 파티션
+    python export_db.py --format csv --incremental    # 지난 내보내기 이후 추가분만
+    python export_db.py --tables price_data --partition year
+    python export_db.py --db data/other.db             # 다른 DB 파일 (기본: ROBOSTOCK_DB 또는 data/robostock.db)
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core.config import DUMP_CONFIG
+from infrastructure.database import add_database_argument, configure_database
+from infrastructure.dumps import DataExporter, EXPORT_TABLES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoboStock DB export")
+    parser.add_argument("--output", default=str(DUMP_CONFIG['export_dir']),
+                        help="출력 디렉토리 (기본: data/exports)")
+    parser.add_argument("--format", choices=["parquet", "csv"], default=DUMP_CONFIG['default_format'])
+    parser.add_argument("--tables", nargs="+", choices=list(EXPORT_TABLES), default=None,
+                        help="내보낼 테이블 (기본: 전체)")
+    parser.add_argument("--partition", nargs="*", choices=["market", "year"], default=["market", "year"],
+                        help="파티션 키 (빈 값이면 파티션 없음)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="이전 내보내기 워터마크 이후 추가된 행만")
+    parser.add_argument("--chunk-size", type=int, default=None, help="청크 행 수")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    print("=" * 60)
+    print("RoboStock DB Export")
+    print("=" * 60)
+
+    exporter = DataExporter(chunk_size=args.chunk_size)
+    reports = exporter.export_all(
+        args.output,
+        fmt=args.format,
+        tables=args.tables,
+        partition_by=args.partition,
+        incremental=args.incremental
+    )
+
+    print("\n" + "-" * 60)
+    for name, report in reports.items():
+        print(f"  {name:<18} {report.rows:>12,} rows  id {report.since_id} → {report.last_id}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"[ERROR] Export failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,54 @@
+"""
+DB 가져오기 스크립트
+export_db.py 로 만든 Parquet/CSV.gz 덤프 → stocks / price_data / investor_trading
+
+Usage:
+    python import_db.py                                  # data/exports 전체
+    python import_db.py --input backup/ --tables price_data
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from core.config import DUMP_CONFIG
+from infrastructure.database import add_database_argument, configure_database, init_database
+from infrastructure.dumps import DataImporter, IMPORT_TABLES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoboStock DB import")
+    parser.add_argument("--input", default=str(DUMP_CONFIG['export_dir']),
+                        help="덤프 디렉토리 (기본: data/exports)")
+    parser.add_argument("--tables", nargs="+", choices=list(IMPORT_TABLES), default=None,
+                        help="가져올 테이블 (기본: price_data, investor_trading)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="청크 행 수")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    print("=" * 60)
+    print("RoboStock DB Import")
+    print("=" * 60)
+
+    init_database()
+    importer = DataImporter(chunk_size=args.chunk_size)
+    reports = importer.import_dir(args.input, tables=args.tables)
+
+    print("\n" + "-" * 60)
+    for name, report in reports.items():
+        print(f"  {name:<18} {report.rows_inserted:>12,} rows  "
+              f"({report.rows_per_second:,.0f} rows/s, skipped {report.rows_invalid + report.rows_skipped_existing:,})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"[ERROR] Import failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
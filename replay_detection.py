@@ -0,0 +1,72 @@
+"""
+스트리밍 탐지 리플레이 스크립트
+DB 주가 이력을 날짜순으로 StreamingBlockDetector에 흘려 넣고 BlockDetector 배치 결과와 비교
+
+Usage:
+    python replay_detection.py                       # 전 종목, 최근 10년
+    python replay_detection.py --codes 005930 000660 --years 5
+    python replay_detection.py --save-state data/stream_state.npz
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from infrastructure.database import add_database_argument, configure_database, get_session
+from infrastructure.database.models import Stock
+from services.block_detector import BlockDetector
+from services.streaming_block_detector import StreamingBlockDetector, check_parity, replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming block detector replay / parity check")
+    parser.add_argument("--codes", nargs="*", default=None, help="종목 코드 (기본: 전 종목)")
+    parser.add_argument("--years", type=int, default=10, help="리플레이 기간 (년)")
+    parser.add_argument("--min-trading-value", type=float, default=None, help="1번 블록 최소 거래대금 (원)")
+    parser.add_argument("--save-state", default=None, help="리플레이 후 상태 저장 경로 (.npz)")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    settings = None
+    if args.min_trading_value is not None:
+        settings = {'block1': {'min_trading_value': args.min_trading_value}}
+
+    with get_session() as session:
+        query = session.query(Stock.id, Stock.code)
+        if args.codes:
+            query = query.filter(Stock.code.in_(args.codes))
+        stocks = query.all()
+
+    end = date.today()
+    start = end - timedelta(days=365 * args.years)
+    loader = BlockDetector()
+    frames = {stock_id: loader._load_price_frame(stock_id, start, end) for stock_id, _ in stocks}
+    bars = sum(len(df) for df in frames.values())
+    print(f"[INFO] {len(frames)} stocks, {bars:,} bars ({start} ~ {end})")
+
+    detector = StreamingBlockDetector(settings)
+    events, elapsed = replay(detector, frames, flush=args.save_state is None)
+    print(f"[INFO] Replayed in {elapsed:.1f}s ({bars / elapsed if elapsed > 0 else 0:,.0f} bars/s), "
+          f"{len(events)} events")
+
+    if args.save_state:
+        detector.save(Path(args.save_state))
+        print(f"[SUCCESS] State saved to {args.save_state}")
+        events.extend(detector.flush())
+
+    mismatches = check_parity(frames, settings, events)
+    if mismatches:
+        codes = dict(stocks)
+        for stock_id, reason in mismatches.items():
+            print(f"  [MISMATCH] {codes.get(stock_id, stock_id)}: {reason}")
+        print(f"[ERROR] {len(mismatches)} stocks differ from batch detection")
+        sys.exit(1)
+    print("[SUCCESS] Streaming results match batch detection")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+DB 스냅샷 스크립트
+SQLite 온라인 백업 API로 robostock.db 스냅샷 생성/복원 (앱 실행 중에도 가능)
+
+Usage:
+    python snapshot_db.py create --reason "before migration"
+    python snapshot_db.py list
+    python snapshot_db.py verify [FILE]
+    python snapshot_db.py restore [FILE]          # FILE 생략 시 최신 스냅샷
+    python snapshot_db.py prune --keep-last 5 --max-age-days 14
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from infrastructure.database import add_database_argument, configure_database
+from infrastructure.database.snapshot import SnapshotManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RoboStock DB snapshot")
+    parser.add_argument("--dir", default=None, help="스냅샷 디렉토리 (기본: data/snapshots)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    create = sub.add_parser("create", help="스냅샷 생성")
+    create.add_argument("--reason", default="manual")
+    create.add_argument("--pages", type=int, default=None, help="백업 단계당 페이지 수")
+
+    sub.add_parser("list", help="스냅샷 목록")
+
+    verify = sub.add_parser("verify", help="스냅샷 무결성 검증")
+    verify.add_argument("file", nargs="?", default=None)
+
+    restore = sub.add_parser("restore", help="스냅샷 복원")
+    restore.add_argument("file", nargs="?", default=None)
+    restore.add_argument("--no-safety", action="store_true", help="복원 전 현재 DB 스냅샷 생략")
+
+    prune = sub.add_parser("prune", help="보존 정책 적용")
+    prune.add_argument("--keep-last", type=int, default=None)
+    prune.add_argument("--max-age-days", type=int, default=None)
+
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+    manager = SnapshotManager(snapshot_dir=args.dir)
+
+    if args.command == "create":
+        info = manager.create(reason=args.reason, pages_per_step=args.pages)
+        print(f"[SUCCESS] {info.file}: {info.db_size:,} → {info.file_size:,} bytes ({info.elapsed:.1f}s)")
+
+    elif args.command == "list":
+        snapshots = manager.list_snapshots()
+        if not snapshots:
+            print("[INFO] No snapshots")
+        for info in snapshots:
+            print(f"  {info.file:<40} {info.created_at}  {info.file_size / 1024 / 1024:>8.1f}MB  {info.reason}")
+
+    elif args.command == "verify":
+        ok = manager.verify(args.file)
+        print("[SUCCESS] Snapshot OK" if ok else "[ERROR] Snapshot is corrupt")
+        if not ok:
+            sys.exit(1)
+
+    elif args.command == "restore":
+        info = manager.restore(args.file, safety_snapshot=not args.no_safety)
+        print(f"[SUCCESS] Restored {info.file} ({info.created_at})")
+
+    elif args.command == "prune":
+        removed = manager.prune(keep_last=args.keep_last, max_age_days=args.max_age_days)
+        print(f"[INFO] {len(removed)} snapshots removed")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"[ERROR] Snapshot failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -3,13 +3,16 @@ Detect Blocks Use Case
 블록 탐지 유스케이스 (Repository 패턴 활용)
 """
 
-from typing import Dict, List
-from datetime import datetime, date
+from typing import Dict, List, Optional
+from datetime import datetime, date, timedelta
 
 from domain.repositories.stock_repository import StockRepository
 from domain.repositories.price_data_repository import PriceDataRepository
 from domain.repositories.block_repository import BlockRepository
+from domain.repositories.detection_state_repository import DetectionStateRepository
 from domain.services.block_detection_service import BlockDetectionService
+from domain.services.detection_params import DetectionParams
+from domain.services.incremental_block_detector import IncrementalBlockDetector
 from domain.entities.volume_block import VolumeBlock
 from core.enums import BlockType
 from core.exceptions import EntityNotFoundException, InsufficientDataException
@@ -23,32 +26,43 @@ class DetectBlocksUseCase:
     - Repository를 통해 데이터 조회
     - Domain Service를 통해 블록 탐지
     - 결과를 Repository를 통해 저장
+    - 증분 모드: 종목별 탐지 상태(워터마크)를 이어받아 새 봉만 평가
     """
 
     def __init__(
         self,
         stock_repo: StockRepository,
         price_data_repo: PriceDataRepository,
-        block_repo: BlockRepository
+        block_repo: BlockRepository,
+        state_repo: Optional[DetectionStateRepository] = None,
+        params: Optional[DetectionParams] = None
     ):
+        """
+        Args:
+            params: 탐지 규칙 (None이면 DetectionParams.for_detection_service,
+                    for_block_detector()를 주면 레거시 BlockDetector와 같은 블록)
+        """
         self._stock_repo = stock_repo
         self._price_data_repo = price_data_repo
         self._block_repo = block_repo
-        self._detection_service = BlockDetectionService()
+        self._state_repo = state_repo
+        self._detection_service = BlockDetectionService(params)
 
     def execute(
         self,
         stock_code: str,
         start_date: date,
-        end_date: date
+        end_date: date,
+        incremental: bool = False
     ) -> Dict:
         """
         블록 탐지 실행
 
         Args:
             stock_code: 종목 코드
-            start_date: 시작일
+            start_date: 시작일 (증분 모드에서는 저장된 상태가 없을 때만 사용)
             end_date: 종료일
+            incremental: True면 저장된 상태 이후의 봉만 평가 (state_repo 필요)
 
         Returns:
             {
@@ -65,51 +79,114 @@ class DetectBlocksUseCase:
         if not stock:
             raise EntityNotFoundException("Stock", stock_code)
 
-        # 2. 주가 데이터 조회
-        price_data_list = self._price_data_repo.get_by_stock_range(
+        if incremental:
+            return self._execute_incremental(stock, start_date, end_date)
+
+        # 2. 주가 시계열 조회 (한 번만 로드, 이후 메모리에서 슬라이스)
+        series = self._price_data_repo.get_series(
             stock.id,
             start_date,
             end_date
         )
 
-        if not price_data_list:
+        if not series:
             raise InsufficientDataException(1, 0)
 
-        # 3. 1번 블록 탐지 (Domain Service 활용)
-        blocks_1 = self._detection_service.detect_block_1_from_data(
-            stock.id,
-            price_data_list
-        )
+        # 3~4. 1번 블록 + 모든 1번 블록의 2번 블록 일괄 탐지 (Domain Service → detection_core)
+        # 저장 전 임시 id(음수) - 저장 시 BlockWriter가 날짜로 실제 1번 블록 id를 연결
+        blocks_1, all_blocks_2 = self._detection_service.detect_blocks_from_data(stock.id, series)
 
-        # 4. 1번 블록 저장
-        saved_blocks_1 = []
-        for block in blocks_1:
-            saved_block = self._block_repo.save(block)
-            saved_blocks_1.append(saved_block)
-
-        # 5. 각 1번 블록에 대해 2번 블록 탐지
-        all_blocks_2 = []
-        for block_1 in saved_blocks_1:
-            # 1번 블록 이후 데이터 조회
-            price_data_after = self._price_data_repo.get_by_stock_range(
-                stock.id,
-                block_1.date,
-                end_date
-            )
-
-            # 2번 블록 탐지
-            blocks_2 = self._detection_service.detect_block_2_from_data(
-                stock.id,
-                block_1,
-                price_data_after
-            )
-
-            # 2번 블록 저장
-            for block in blocks_2:
-                saved_block = self._block_repo.save(block)
-                all_blocks_2.append(saved_block)
+        # 5. 일괄 저장 (기존 블록과 차분, 기간 내 사라진 블록 삭제, 2번 블록 부모 연결)
+        saved = self._block_repo.save_detection(
+            stock.id, blocks_1 + all_blocks_2, replace_range=(start_date, end_date)
+        )
+        saved_blocks_1 = [b for b in saved if b.block_type == BlockType.BLOCK_1]
+        saved_blocks_2 = [b for b in saved if b.block_type == BlockType.BLOCK_2]
 
         # 6. 결과 반환
+        return {
+            'stock_id': stock.id,
+            'stock_name': stock.name,
+            'stock_code': stock.code,
+            'blocks_1_count': len(saved_blocks_1),
+            'blocks_2_count': len(saved_blocks_2),
+            'blocks_1': saved_blocks_1,
+            'blocks_2': saved_blocks_2
+        }
+
+    def _execute_incremental(self, stock, start_date: date, end_date: date) -> Dict:
+        """
+        증분 블록 탐지 - 저장된 상태의 마지막 처리일 다음 날부터 end_date까지만 조회/평가
+
+        상태가 없으면 start_date부터 처음 쌓음 (같은 기간 배치 탐지와 같은 1번 블록).
+        2번 블록 구간이 열린 1번 블록은 다음 실행에서 이어서 탐지됨.
+        """
+        if self._state_repo is None:
+            raise ValueError("Incremental detection requires a DetectionStateRepository")
+
+        params = self._detection_service.detection_params()
+        settings_hash = params.fingerprint()
+        state = self._state_repo.get(stock.id, settings_hash)
+        detector = IncrementalBlockDetector(params, state)
+
+        load_from = state.last_date + timedelta(days=1) if state else start_date
+        series = self._price_data_repo.get_series(stock.id, load_from, end_date)
+        events = detector.update_series(series)
+
+        if detector.state.rows < self._detection_service.MIN_DATA_POINTS:
+            raise InsufficientDataException(self._detection_service.MIN_DATA_POINTS, detector.state.rows)
+
+        # 이전 실행에서 저장된 부모 1번 블록은 한 번에 조회, 이번 실행의 1번 블록은 임시 id(음수)
+        parent_dates = [e.parent_date for e in events if e.block_type == BlockType.BLOCK_2]
+        parent_ids: Dict[date, int] = {}
+        if parent_dates:
+            parent_ids = {
+                b.date: b.id for b in self._block_repo.get_by_date_range(
+                    stock.id, min(parent_dates), max(parent_dates), BlockType.BLOCK_1
+                )
+            }
+
+        blocks = []
+        for event in events:
+            info = event.block
+            if event.block_type == BlockType.BLOCK_1:
+                block_1 = VolumeBlock(
+                    stock_id=stock.id,
+                    block_type=BlockType.BLOCK_1,
+                    date=info['date'],
+                    volume=info['volume'],
+                    trading_value=info['trading_value'],
+                    close_price=info['close_price'],
+                    new_high_grade=info['new_high_grade'],
+                    max_volume_period_days=info['max_volume_period_days'],
+                    id=-(len(blocks) + 1)
+                )
+                parent_ids[block_1.date] = block_1.id
+                blocks.append(block_1)
+                continue
+
+            parent_id = parent_ids.get(event.parent_date)
+            if parent_id is None:
+                continue
+            blocks.append(VolumeBlock(
+                stock_id=stock.id,
+                block_type=BlockType.BLOCK_2,
+                date=info['date'],
+                volume=info['volume'],
+                trading_value=info['trading_value'],
+                close_price=info['close_price'],
+                parent_block_id=parent_id,
+                days_from_parent=info['days_from_block1'],
+                volume_ratio=info['volume_ratio'],
+                pattern_type=info['pattern_type']
+            ))
+
+        saved = self._block_repo.save_detection(stock.id, blocks) if blocks else []
+        saved_blocks_1 = [b for b in saved if b.block_type == BlockType.BLOCK_1]
+        all_blocks_2 = [b for b in saved if b.block_type == BlockType.BLOCK_2]
+
+        self._state_repo.save(stock.id, settings_hash, detector.state)
+
         return {
             'stock_id': stock.id,
             'stock_name': stock.name,
@@ -117,7 +194,9 @@ class DetectBlocksUseCase:
             'blocks_1_count': len(saved_blocks_1),
             'blocks_2_count': len(all_blocks_2),
             'blocks_1': saved_blocks_1,
-            'blocks_2': all_blocks_2
+            'blocks_2': all_blocks_2,
+            'bars_processed': len(series),
+            'last_date': detector.state.last_date
         }
 
     def execute_bulk(
@@ -125,7 +204,8 @@ class DetectBlocksUseCase:
         stock_codes: List[str],
         start_date: date,
         end_date: date,
-        progress_callback=None
+        progress_callback=None,
+        incremental: bool = False
     ) -> List[Dict]:
         """
         여러 종목에 대해 블록 탐지
@@ -135,6 +215,7 @@ class DetectBlocksUseCase:
             start_date: 시작일
             end_date: 종료일
             progress_callback: 진행 상황 콜백
+            incremental: 증분 모드 (execute 참고)
 
         Returns:
             각 종목별 탐지 결과 리스트
@@ -143,7 +224,7 @@ class DetectBlocksUseCase:
 
         for idx, stock_code in enumerate(stock_codes):
             try:
-                result = self.execute(stock_code, start_date, end_date)
+                result = self.execute(stock_code, start_date, end_date, incremental)
                 results.append(result)
 
                 if progress_callback:
@@ -13,9 +13,18 @@ from .config import (
     RESOURCES_DIR,
     ICONS_DIR,
     FONTS_DIR,
+    DATABASE_CONFIG,
     APP_CONFIG,
     DATA_COLLECTION,
     BLOCK_CRITERIA,
+    DETECTION_CONFIG,
+    MARKET_CONFIG,
+    CASE_CONFIG,
+    SWEEP_CONFIG,
+    CACHE_CONFIG,
+    DUMP_CONFIG,
+    SNAPSHOT_CONFIG,
+    BENCHMARK_CONFIG,
     UI_CONFIG,
     SPACING,
     SHADOWS,
@@ -38,6 +47,8 @@ from .enums import (
     PanelType,
     NewHighGrade,
     PatternType,
+    RangeEndReason,
+    CaseStatus,
     ThemeMode,
     LayoutMode,
     NotificationType,
@@ -84,9 +95,18 @@ __all__ = [
     "RESOURCES_DIR",
     "ICONS_DIR",
     "FONTS_DIR",
+    "DATABASE_CONFIG",
     "APP_CONFIG",
     "DATA_COLLECTION",
     "BLOCK_CRITERIA",
+    "DETECTION_CONFIG",
+    "MARKET_CONFIG",
+    "CASE_CONFIG",
+    "SWEEP_CONFIG",
+    "CACHE_CONFIG",
+    "DUMP_CONFIG",
+    "SNAPSHOT_CONFIG",
+    "BENCHMARK_CONFIG",
     "UI_CONFIG",
     "SPACING",
     "SHADOWS",
@@ -106,6 +126,8 @@ __all__ = [
     "PanelType",
     "NewHighGrade",
     "PatternType",
+    "RangeEndReason",
+    "CaseStatus",
     "ThemeMode",
     "LayoutMode",
     "NotificationType",
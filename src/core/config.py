@@ -11,7 +11,7 @@ BASE_DIR = Path(__file__).parent.parent.parent
 SRC_DIR = BASE_DIR / "src"
 DATA_DIR = BASE_DIR / "data"
 LOG_DIR = DATA_DIR / "logs"
-DB_PATH = DATA_DIR / "robostock.db"
+DB_PATH = DATA_DIR / "robostock.db"  # 기본(운영) DB - DATABASE_CONFIG['env_var']로 다른 프로필 선택
 RESOURCES_DIR = BASE_DIR / "resources"
 ICONS_DIR = RESOURCES_DIR / "icons"
 FONTS_DIR = RESOURCES_DIR / "fonts"
@@ -20,6 +20,14 @@ FONTS_DIR = RESOURCES_DIR / "fonts"
 for directory in [DATA_DIR, LOG_DIR, RESOURCES_DIR, ICONS_DIR, FONTS_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
 
+# ===== DB 프로필 설정 =====
+DATABASE_CONFIG = {
+    # DB 선택 환경변수: 파일 경로 / ':memory:' (공유 캐시 인메모리) / 'temp' (임시 파일) - 없으면 DB_PATH
+    'env_var': 'ROBOSTOCK_DB',
+    # 임시 파일 프로필 디렉토리 (None이면 시스템 임시 디렉토리)
+    'temp_dir': None,
+}
+
 # ===== 앱 설정 =====
 APP_CONFIG = {
     'name': 'RoboStock',
@@ -54,6 +62,8 @@ BLOCK_CRITERIA = {
         'high_trading_value': 200_000_000_000,
         # 패턴 매칭 일수: 3일 (D, D+1, D+2 패턴 분석)
         'pattern_match_days': 3,
+        # D+1/D+2 인정 거래량 비율: D일 대비 50% 이상 (+ D일 고가 돌파)
+        'pattern_volume_ratio_min': 0.5,
     },
     'block_3': {
         # 거래량 비율: 2번 블록 최대 대비 최소 15% (추가 자금 유입 확인)
@@ -62,9 +72,114 @@ BLOCK_CRITERIA = {
         'price_range_pct': 0.12,
         # 2번 블록으로부터 최대 간격: 180일 (6개월, 패턴 유효성)
         'max_days_from_block2': 180,
+        # 수급 품질 가산점: 외국인 + 기관 매수강세 지수 합계 기준 (%)
+        'buying_strength_sum_min': 5.0,
     },
     # 이동평균 기간: 60일 (중기 추세 판단)
     'ma_period': 60,
+    # 돌파 확인: 블록 기간 안에서 D일 고가 위 종가가 14일 연속이면 확인
+    'breakout_hold_days': 14,
+}
+
+# ===== 블록 탐지 실행 설정 =====
+DETECTION_CONFIG = {
+    # 병렬 탐지 프로세스 수 (None이면 CPU 코어 수)
+    'max_workers': None,
+    # 프로세스당 한 번에 처리하는 종목 수 (작을수록 진행률/중지 반응이 빠름)
+    'shard_size': 16,
+    # volume_blocks 일괄 저장 단위 (종목 수)
+    'write_batch_size': 200,
+    # 탐지 결과 캐시 (설정 지문 + 종목별 데이터 워터마크가 같으면 재탐지 생략)
+    'result_cache': True,
+    # 사전 필터 (종목별 기간 최대 거래대금이 1번 블록 조건 미만이면 탐지 생략)
+    'prefilter': True,
+    # 3번/4번 블록 탐지 (2번 블록 이후 구간까지 조회, 수급 데이터로 품질 점수)
+    'block_3_4': True,
+}
+
+# ===== 시장 지수 / 시장 대비 성과 설정 =====
+MARKET_CONFIG = {
+    # 비교 지수 (MarketType 값 → pykrx 지수 티커)
+    'index_tickers': {'KOSPI': '1001', 'KOSDAQ': '2001'},
+    # 베타 회귀 최소 기간 (거래일) - 블록 기간이 더 짧으면 기간 종료일 기준 직전 거래일까지 확장
+    'beta_min_days': 60,
+    # 지수 시세 upsert 단위 (행) - executemany로 한 행씩 바인딩하므로 SQLite 변수 한도와 무관
+    'index_write_chunk': 1000,
+}
+
+# ===== 케이스 생성 / 사후 수익률 라벨링 설정 =====
+CASE_CONFIG = {
+    # 관찰 기간 (달력일, 진입일 = 첫 2번 블록 D일 기준)
+    'horizon_days': 365 * 5,
+    # 목표 수익률 (%) - 진입가 대비 고가가 처음 도달한 날까지의 일수 기록
+    'target_return_pct': 50.0,
+    # ReturnLevel 경계 (최대 수익률 %, Level 1~4 하한)
+    'level_thresholds': (50.0, 100.0, 300.0, 1000.0),
+}
+
+# ===== 블록 조건 파라미터 스윕 기본 그리드 =====
+SWEEP_CONFIG = {
+    # 1번 블록 최소 거래대금 (원)
+    'min_trading_values': [10_000_000_000, 30_000_000_000, 50_000_000_000, 100_000_000_000],
+    # 1번 블록 최대 거래량 조회 기간 (일)
+    'lookback_days': [365, 730, 1095],
+    # 2번 블록 거래량 비율 (1번 블록 대비)
+    'volume_ratios': [0.5, 0.8, 1.0],
+    # 2번 블록 최대 간격 (일)
+    'block2_windows': [90, 180, 270],
+    # 사후 수익률 기간 (거래일)
+    'return_horizons': [20, 60, 120],
+}
+
+# ===== 캐시 설정 =====
+CACHE_CONFIG = {
+    # 종목별 주가 시계열 LRU 캐시 메모리 한도 (bytes)
+    'price_series_max_bytes': 256 * 1024 * 1024,
+}
+
+# ===== 덤프(내보내기/가져오기) 설정 =====
+DUMP_CONFIG = {
+    'export_dir': DATA_DIR / "exports",
+    # 청크 크기: 한 번에 메모리에 올리는 최대 행 수
+    'chunk_size': 100_000,
+    # 기본 포맷: 'parquet' (pyarrow 필요) 또는 'csv' (gzip 압축)
+    'default_format': 'parquet',
+}
+
+# ===== DB 스냅샷 설정 =====
+SNAPSHOT_CONFIG = {
+    'snapshot_dir': DATA_DIR / "snapshots",
+    # 백업 단계당 복사 페이지 수 (4KB 페이지 기준 약 4MB)
+    'pages_per_step': 1024,
+    # 단계 사이 대기 시간 (초) - 수집 중인 쓰기 작업에 양보
+    'step_sleep': 0.005,
+    # 원본 DB를 WAL 모드로 전환 (읽기 트랜잭션을 잡고 복사하는 동안에도 쓰기 가능)
+    'source_wal': True,
+    # 백업 재시작 허용 횟수 / 전체 제한 시간 (초) - 넘으면 SNAPSHOT_TIMEOUT 예외
+    'max_restarts': 3,
+    'timeout': 1800,
+    # 보존 정책: 최근 N개 유지, N일 지난 스냅샷 삭제 (최신 1개는 항상 유지)
+    'keep_last': 10,
+    'max_age_days': 30,
+    # gzip 압축 레벨 (1=빠름, 9=작음)
+    'compress_level': 6,
+}
+
+# ===== 탐지 벤치마크 (합성 시장 데이터) 설정 =====
+BENCHMARK_CONFIG = {
+    # 종목군 크기 (종목 수) - 크기별로 합성 DB를 만들어 측정
+    'universe_sizes': [10, 50, 200],
+    # 종목당 기간 (년)
+    'years': 5,
+    # 합성 데이터 시드 (같은 시드 = 같은 데이터)
+    'seed': 42,
+    # 엔진별 반복 측정 횟수 (최솟값 사용)
+    'repeat': 3,
+    # 기준 대비 허용 증가율 (%) - 넘으면 회귀로 실패
+    'max_regression_pct': 25.0,
+    # 이보다 짧은 측정(초)은 잡음으로 보고 회귀 판정 제외
+    'min_seconds': 0.05,
+    'baseline_path': DATA_DIR / "benchmarks" / "detection_baseline.json",
 }
 
 # ===== UI 레이아웃 설정 =====
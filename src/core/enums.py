@@ -59,6 +59,18 @@ class PatternType(Enum):
     D_D2 = "D+D+2"
     D_D1_D2 = "D+D+1+D+2"
 
+class RangeEndReason(Enum):
+    """블록 기간 종료 사유 (60이평선 회귀)"""
+    TOUCH = "터치"       # 저가가 60이평선 터치
+    BREAK = "하방이탈"   # 종가가 60이평선 아래
+    OPEN = "진행중"      # 아직 회귀하지 않음 (마지막 거래일까지)
+
+class CaseStatus(Enum):
+    """케이스 상태 (cases.status 값)"""
+    ACTIVE = "active"          # 관찰 기간 진행 중 (새 봉이 들어오면 갱신)
+    COMPLETED = "completed"    # 관찰 기간 종료, 목표 수익률 도달
+    FAILED = "failed"          # 관찰 기간 종료, Level 0
+
 class ThemeMode(Enum):
     """테마 모드"""
     DARK = "dark"
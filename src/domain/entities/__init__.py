@@ -5,10 +5,13 @@ Domain Entities
 
 from .stock import Stock
 from .price_data import PriceData
+from .price_series import PriceSeries, validate_ohlcv
 from .volume_block import VolumeBlock
 
 __all__ = [
     "Stock",
     "PriceData",
+    "PriceSeries",
+    "validate_ohlcv",
     "VolumeBlock",
 ]
@@ -0,0 +1,316 @@
+"""
+Price Series Value Object
+종목별 주가 시계열 (NumPy 컬럼 기반)
+"""
+
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from domain.entities.price_data import PriceData
+
+
+def validate_ohlcv(
+    open_: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    OHLCV 배열 벡터화 검증
+
+    PriceData.__post_init__ 과 동일한 규칙을 행 단위 루프 없이 적용하고,
+    첫 오류에서 예외를 던지는 대신 규칙별 불량 행 마스크를 반환
+
+    Returns:
+        {규칙명: bool 배열 (True = 위반 행)}
+    """
+    return {
+        'non_positive_price': (open_ <= 0) | (high <= 0) | (low <= 0) | (close <= 0),
+        'high_below_low': high < low,
+        'high_below_open_close': (high < open_) | (high < close),
+        'low_above_open_close': (low > open_) | (low > close),
+        'negative_volume': volume < 0,
+    }
+
+
+class PriceSeries:
+    """
+    주가 시계열 값 객체
+
+    List[PriceData] 대신 종목 하나의 OHLCV를 연속된 NumPy 컬럼으로 보관
+    - 날짜 오름차순 정렬 보장
+    - 날짜 구간 슬라이스는 searchsorted + 뷰(view)로 복사 없이 처리
+    - 검증은 시계열 단위로 한 번만 수행 (validation_masks)
+    """
+
+    __slots__ = (
+        'stock_id',
+        'dates',
+        'open',
+        'high',
+        'low',
+        'close',
+        'volume',
+        'trading_value',
+        'market_cap',
+    )
+
+    def __init__(
+        self,
+        stock_id: int,
+        dates: Sequence,
+        open: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[int],
+        trading_value: Optional[Sequence[float]] = None,
+        market_cap: Optional[Sequence[float]] = None,
+        assume_sorted: bool = False
+    ):
+        if stock_id is None or stock_id <= 0:
+            raise ValueError("Invalid stock_id")
+
+        dates_arr = np.asarray(dates, dtype='datetime64[D]')
+        columns = {
+            'open': np.asarray(open, dtype=np.float64),
+            'high': np.asarray(high, dtype=np.float64),
+            'low': np.asarray(low, dtype=np.float64),
+            'close': np.asarray(close, dtype=np.float64),
+            'volume': np.asarray(volume, dtype=np.int64),
+        }
+
+        n = len(dates_arr)
+        for name, column in columns.items():
+            if len(column) != n:
+                raise ValueError(f"Column '{name}' length {len(column)} != dates length {n}")
+
+        # 거래대금이 비어 있으면 거래량 × 종가 (PriceData.calculate_trading_value 와 동일)
+        fallback_value = columns['volume'] * columns['close']
+        if trading_value is None:
+            trading_value_arr = fallback_value
+        else:
+            trading_value_arr = np.asarray(trading_value, dtype=np.float64)
+            if len(trading_value_arr) != n:
+                raise ValueError("Column 'trading_value' length mismatch")
+            missing = np.isnan(trading_value_arr) | (trading_value_arr == 0)
+            if missing.any():
+                trading_value_arr = np.where(missing, fallback_value, trading_value_arr)
+
+        market_cap_arr = None
+        if market_cap is not None:
+            market_cap_arr = np.asarray(market_cap, dtype=np.float64)
+            if len(market_cap_arr) != n:
+                raise ValueError("Column 'market_cap' length mismatch")
+
+        if not assume_sorted and n > 1 and np.any(dates_arr[1:] < dates_arr[:-1]):
+            order = np.argsort(dates_arr, kind='stable')
+            dates_arr = dates_arr[order]
+            columns = {name: column[order] for name, column in columns.items()}
+            trading_value_arr = trading_value_arr[order]
+            if market_cap_arr is not None:
+                market_cap_arr = market_cap_arr[order]
+
+        self.stock_id = stock_id
+        self.dates = dates_arr
+        self.open = columns['open']
+        self.high = columns['high']
+        self.low = columns['low']
+        self.close = columns['close']
+        self.volume = columns['volume']
+        self.trading_value = trading_value_arr
+        self.market_cap = market_cap_arr
+
+    # ===== 생성 헬퍼 =====
+
+    @classmethod
+    def from_price_data(cls, stock_id: int, price_data_list: Iterable[PriceData]) -> 'PriceSeries':
+        """PriceData 리스트 → PriceSeries (하위 호환용)"""
+        rows = list(price_data_list)
+        return cls(
+            stock_id=stock_id,
+            dates=[p.date for p in rows],
+            open=[p.open for p in rows],
+            high=[p.high for p in rows],
+            low=[p.low for p in rows],
+            close=[p.close for p in rows],
+            volume=[p.volume for p in rows],
+            trading_value=[np.nan if p.trading_value is None else p.trading_value for p in rows],
+            market_cap=[np.nan if p.market_cap is None else p.market_cap for p in rows],
+        )
+
+    @classmethod
+    def from_rows(cls, stock_id: int, rows: Sequence[tuple]) -> 'PriceSeries':
+        """
+        DB 조회 튜플 → PriceSeries
+
+        Args:
+            rows: (date, open, high, low, close, volume, trading_value, market_cap) 튜플,
+                  날짜 오름차순
+        """
+        if not rows:
+            return cls.empty(stock_id)
+
+        dates, opens, highs, lows, closes, volumes, values, caps = zip(*rows)
+        return cls(
+            stock_id=stock_id,
+            dates=dates,
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            volume=volumes,
+            trading_value=np.array(values, dtype=np.float64),
+            market_cap=np.array(caps, dtype=np.float64),
+            assume_sorted=True
+        )
+
+    @classmethod
+    def empty(cls, stock_id: int) -> 'PriceSeries':
+        """빈 시계열"""
+        return cls(stock_id, [], [], [], [], [], [], assume_sorted=True)
+
+    # ===== 기본 프로토콜 =====
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __bool__(self) -> bool:
+        return len(self.dates) > 0
+
+    @property
+    def nbytes(self) -> int:
+        """컬럼 메모리 사용량 (bytes)"""
+        total = sum(
+            getattr(self, name).nbytes
+            for name in ('dates', 'open', 'high', 'low', 'close', 'volume', 'trading_value')
+        )
+        if self.market_cap is not None:
+            total += self.market_cap.nbytes
+        return total
+
+    @property
+    def first_date(self) -> Optional[date]:
+        return self.dates[0].item() if len(self) else None
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return self.dates[-1].item() if len(self) else None
+
+    def date_at(self, position: int) -> date:
+        """위치 → datetime.date"""
+        return self.dates[position].item()
+
+    # ===== 슬라이스 =====
+
+    def _take(self, index) -> 'PriceSeries':
+        """슬라이스/마스크로 부분 시계열 생성 (정렬 유지)"""
+        new = object.__new__(PriceSeries)
+        new.stock_id = self.stock_id
+        new.dates = self.dates[index]
+        new.open = self.open[index]
+        new.high = self.high[index]
+        new.low = self.low[index]
+        new.close = self.close[index]
+        new.volume = self.volume[index]
+        new.trading_value = self.trading_value[index]
+        new.market_cap = self.market_cap[index] if self.market_cap is not None else None
+        return new
+
+    def bounds(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> tuple:
+        """
+        날짜 구간 [start_date, end_date] 의 위치 범위 (양 끝 포함)
+
+        Returns:
+            (start_pos, end_pos) - end_pos는 exclusive
+        """
+        lo = 0 if start_date is None else int(
+            np.searchsorted(self.dates, np.datetime64(start_date, 'D'), side='left')
+        )
+        hi = len(self) if end_date is None else int(
+            np.searchsorted(self.dates, np.datetime64(end_date, 'D'), side='right')
+        )
+        return lo, max(lo, hi)
+
+    def slice_dates(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> 'PriceSeries':
+        """날짜 구간 슬라이스 (양 끝 포함, 복사 없는 뷰)"""
+        lo, hi = self.bounds(start_date, end_date)
+        return self._take(slice(lo, hi))
+
+    def after(self, target_date: date) -> 'PriceSeries':
+        """target_date 다음 거래일부터의 시계열"""
+        lo = int(np.searchsorted(self.dates, np.datetime64(target_date, 'D'), side='right'))
+        return self._take(slice(lo, len(self)))
+
+    # ===== 검증 =====
+
+    def validation_masks(self) -> Dict[str, np.ndarray]:
+        """규칙별 불량 행 마스크 (True = 위반)"""
+        return validate_ohlcv(self.open, self.high, self.low, self.close, self.volume)
+
+    def invalid_mask(self) -> np.ndarray:
+        """하나 이상의 규칙을 위반한 행 마스크"""
+        mask = np.zeros(len(self), dtype=bool)
+        for rule_mask in self.validation_masks().values():
+            mask |= rule_mask
+        return mask
+
+    def is_valid(self) -> bool:
+        """모든 행이 유효한지 여부"""
+        return not self.invalid_mask().any()
+
+    def drop_invalid(self) -> 'PriceSeries':
+        """불량 행을 제외한 시계열"""
+        mask = self.invalid_mask()
+        if not mask.any():
+            return self
+        return self._take(~mask)
+
+    # ===== 변환 =====
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """DatetimeIndex('date') DataFrame 변환 (BlockDetectionService 호환 컬럼)"""
+        df = pd.DataFrame(
+            {
+                'open': self.open,
+                'high': self.high,
+                'low': self.low,
+                'close': self.close,
+                'volume': self.volume,
+                'trading_value': self.trading_value,
+            },
+            index=pd.DatetimeIndex(self.dates.astype('datetime64[ns]'), name='date')
+        )
+        return df
+
+    def to_price_data(self) -> List[PriceData]:
+        """PriceData 엔티티 리스트로 변환 (하위 호환용, 대량 사용 지양)"""
+        caps = self.market_cap
+        return [
+            PriceData(
+                stock_id=self.stock_id,
+                date=self.dates[i].item(),
+                open=float(self.open[i]),
+                high=float(self.high[i]),
+                low=float(self.low[i]),
+                close=float(self.close[i]),
+                volume=int(self.volume[i]),
+                trading_value=float(self.trading_value[i]),
+                market_cap=None if caps is None or np.isnan(caps[i]) else float(caps[i]),
+            )
+            for i in range(len(self))
+        ]
+
+    def __repr__(self) -> str:
+        return (
+            f"<PriceSeries stock_id={self.stock_id} rows={len(self)} "
+            f"range={self.first_date}~{self.last_date}>"
+        )
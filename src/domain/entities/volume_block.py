@@ -35,6 +35,10 @@ class VolumeBlock:
     volume_ratio: Optional[float] = None
     pattern_type: Optional[PatternType] = None
 
+    # 3번/4번 블록 전용 (수급 품질)
+    quality_score: Optional[int] = None
+    quality_grade: Optional[str] = None
+
     # Range 정보
     range_end_date: Optional[date] = None
     range_duration_days: Optional[int] = None
@@ -46,6 +50,9 @@ class VolumeBlock:
     ma60_at_start: Optional[float] = None
     ma60_at_end: Optional[float] = None
     range_end_reason: Optional[str] = None
+    breakout_run_days: Optional[int] = None
+    breakout_confirmed_date: Optional[date] = None
+    support_hold_days: Optional[int] = None
 
     # 시장 대비 성과
     market_index: Optional[str] = None
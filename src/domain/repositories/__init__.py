@@ -6,9 +6,11 @@ Repository 인터페이스 (ABC)
 from .stock_repository import StockRepository
 from .price_data_repository import PriceDataRepository
 from .block_repository import BlockRepository
+from .detection_state_repository import DetectionStateRepository
 
 __all__ = [
     "StockRepository",
     "PriceDataRepository",
     "BlockRepository",
+    "DetectionStateRepository",
 ]
@@ -4,7 +4,7 @@ Volume Block Repository Interface
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import date
 
 from domain.entities.volume_block import VolumeBlock
@@ -59,6 +59,24 @@ class BlockRepository(ABC):
         """대량 블록 저장"""
         pass
 
+    @abstractmethod
+    def save_detection(
+        self,
+        stock_id: int,
+        blocks: List[VolumeBlock],
+        replace_range: Optional[Tuple[date, date]] = None
+    ) -> List[VolumeBlock]:
+        """
+        종목 탐지 결과 일괄 저장 (저장된 블록과 차분, 한 트랜잭션)
+
+        2번 블록은 날짜 - days_from_parent 의 1번 블록에 연결.
+        replace_range를 주면 구간에서 이번 결과에 없는 블록은 삭제.
+
+        Returns:
+            저장된 블록 (입력 순서, id 포함)
+        """
+        pass
+
     @abstractmethod
     def exists(
         self,
@@ -0,0 +1,28 @@
+"""
+Detection State Repository Interface
+증분 블록 탐지 상태 접근 인터페이스
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.services.incremental_block_detector import BlockDetectionState
+
+
+class DetectionStateRepository(ABC):
+    """증분 탐지 상태 Repository 인터페이스 (종목 × 설정 지문 단위)"""
+
+    @abstractmethod
+    def get(self, stock_id: int, settings_hash: str) -> Optional[BlockDetectionState]:
+        """상태 조회 (없으면 None)"""
+        pass
+
+    @abstractmethod
+    def save(self, stock_id: int, settings_hash: str, state: BlockDetectionState) -> None:
+        """상태 저장 (있으면 갱신)"""
+        pass
+
+    @abstractmethod
+    def delete_by_stock(self, stock_id: int) -> int:
+        """종목의 모든 상태 삭제 (과거 주가가 바뀌었을 때 재계산용)"""
+        pass
@@ -8,6 +8,7 @@ from typing import Optional, List
 from datetime import date
 
 from domain.entities.price_data import PriceData
+from domain.entities.price_series import PriceSeries
 
 
 class PriceDataRepository(ABC):
@@ -32,6 +33,16 @@ class PriceDataRepository(ABC):
         """기간별 주가 데이터 조회"""
         pass
 
+    @abstractmethod
+    def get_series(
+        self,
+        stock_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> PriceSeries:
+        """기간별 주가 시계열 조회 (None이면 해당 방향 전체)"""
+        pass
+
     @abstractmethod
     def get_latest(self, stock_id: int) -> Optional[PriceData]:
         """최신 주가 데이터 조회"""
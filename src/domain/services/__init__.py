@@ -4,7 +4,26 @@ Domain Services
 """
 
 from .block_detection_service import BlockDetectionService
+from .detection_core import PriceColumns, detect_blocks, find_block_1, find_block_2
+from .detection_params import DetectionParams
+from .incremental_block_detector import (
+    BlockDetectionState,
+    BlockEvent,
+    IncrementalBlockDetector,
+)
+from .sweep_kernels import StockSweep, SweepGrid, sweep_stock
 
 __all__ = [
     "BlockDetectionService",
+    "BlockDetectionState",
+    "BlockEvent",
+    "DetectionParams",
+    "IncrementalBlockDetector",
+    "PriceColumns",
+    "StockSweep",
+    "SweepGrid",
+    "detect_blocks",
+    "find_block_1",
+    "find_block_2",
+    "sweep_stock",
 ]
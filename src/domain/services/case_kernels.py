@@ -0,0 +1,100 @@
+"""
+Case Kernels
+케이스 사후 수익률 라벨링 일괄 계산 (종목 시계열당 전방 최대값 테이블 1회 + 구간 조회)
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+
+def forward_max_table(values) -> np.ndarray:
+    """
+    전방 최대값 테이블 [levels, n] - table[k, i] = max(values[i : i + 2^k]) (배열 끝에서 잘림)
+
+    NaN은 -inf로 취급. 구간 최대값과 첫 도달 검색을 모두 O(log n) 단계의 배열 연산으로 처리.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    levels = max(int(n).bit_length(), 1)
+    table = np.full((levels, n), -np.inf)
+    table[0] = np.where(np.isnan(values), -np.inf, values)
+    for k in range(1, levels):
+        step = 1 << (k - 1)
+        table[k] = table[k - 1]
+        table[k, :n - step] = np.maximum(table[k - 1, :n - step], table[k - 1, step:])
+    return table
+
+
+def range_max(table: np.ndarray, starts, ends) -> np.ndarray:
+    """구간 [starts[i], ends[i]] (양끝 포함) 최대값 - 빈 구간(ends < starts)이나 값이 없으면 NaN"""
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    result = np.full(len(starts), np.nan)
+    valid = ends >= starts
+    if not valid.any():
+        return result
+
+    s, e = starts[valid], ends[valid]
+    k = np.floor(np.log2(e - s + 1)).astype(np.int64)
+    best = np.maximum(table[k, s], table[k, e - (1 << k) + 1])
+    result[valid] = np.where(np.isneginf(best), np.nan, best)
+    return result
+
+
+def first_reach(table: np.ndarray, starts, ends, targets) -> np.ndarray:
+    """
+    구간 [starts[i], ends[i]]에서 값이 targets[i] 이상인 첫 행 번호 - 없으면 -1
+
+    2^k 단위로 큰 보폭부터 "그 구간 최대값 < 목표"이면 건너뛰는 이진 도약 (모든 구간 동시 진행).
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.float64)
+    n = table.shape[1]
+    if n == 0 or len(starts) == 0:
+        return np.full(len(starts), -1, dtype=np.int64)
+
+    position = starts.copy()
+    for k in range(table.shape[0] - 1, -1, -1):
+        step = 1 << k
+        row = np.minimum(position, n - 1)
+        skip = (position + step - 1 <= ends) & (table[k, row] < targets)
+        position = np.where(skip, position + step, position)
+
+    row = np.minimum(position, n - 1)
+    reached = (position <= ends) & (table[0, row] >= targets)
+    return np.where(reached, position, -1)
+
+
+def return_levels(max_return, thresholds: Sequence[float] = (50.0, 100.0, 300.0, 1000.0)) -> np.ndarray:
+    """최대 수익률(%) → ReturnLevel 값 0~4 (수익률 NaN이면 -1)"""
+    max_return = np.asarray(max_return, dtype=np.float64)
+    levels = np.searchsorted(np.asarray(thresholds, dtype=np.float64), max_return, side='right')
+    return np.where(np.isnan(max_return), -1, levels)
+
+
+@dataclass
+class ForwardLabels:
+    """케이스별 관찰 구간 결과 (입력 순서, 구간이 비어 있으면 peak NaN / 행 -1)"""
+
+    peak: np.ndarray
+    peak_row: np.ndarray
+    reach_row: np.ndarray
+
+
+def forward_labels(high, starts, ends, targets) -> ForwardLabels:
+    """
+    관찰 구간 [starts[i], ends[i]]의 최고가, 최고가 첫 행, 목표가 첫 도달 행 일괄 계산
+
+    Args:
+        high: 종목 고가 [n]
+        starts / ends: 관찰 구간 행 번호 [k] (진입 다음 거래일 ~ 관찰 종료일 또는 마지막 거래일)
+        targets: 목표가 [k] (NaN이면 도달 검색 생략)
+    """
+    table = forward_max_table(high)
+    peak = range_max(table, starts, ends)
+    peak_row = first_reach(table, starts, ends, np.where(np.isnan(peak), np.inf, peak))
+    reach_row = first_reach(table, starts, ends, np.where(np.isnan(targets), np.inf, targets))
+    return ForwardLabels(peak=peak, peak_row=peak_row, reach_row=reach_row)
@@ -0,0 +1,167 @@
+"""
+Detection Core
+1번/2번 블록 일괄 탐지 공통 코어 (컬럼 배열 입력 - BlockDetector / BlockDetectionService 공용)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.enums import PatternType
+from domain.entities.price_series import PriceSeries
+from domain.services.detection_kernels import (
+    block_1_mask, block_2_candidates, new_high_grades, rolling_max_by_days, rolling_max_by_rows,
+    PATTERN_D_ONLY, PATTERN_D_D1, PATTERN_D_D2, PATTERN_D_D1_D2
+)
+from domain.services.detection_params import LOOKBACK_DAYS, DetectionParams
+
+# block_2_candidates 패턴 코드 → PatternType
+PATTERN_TYPES = {
+    PATTERN_D_ONLY: PatternType.D_ONLY,
+    PATTERN_D_D1: PatternType.D_D1,
+    PATTERN_D_D2: PatternType.D_D2,
+    PATTERN_D_D1_D2: PatternType.D_D1_D2,
+}
+
+
+@dataclass(frozen=True)
+class PriceColumns:
+    """
+    탐지 입력 컬럼 (날짜 오름차순, 같은 길이의 NumPy 배열)
+
+    거래대금 NaN은 그대로 둠 - 레거시 DataFrame은 NaN(조건 통과), PriceSeries는 거래량 × 종가로 채운 값.
+    """
+
+    dates: np.ndarray  # datetime64[D]
+    high: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    trading_value: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'PriceColumns':
+        """price_frame_from_rows 형식 DataFrame → 컬럼"""
+        return cls(
+            dates=df.index.values.astype('datetime64[D]'),
+            high=df['high'].to_numpy(dtype=np.float64),
+            close=df['close'].to_numpy(dtype=np.float64),
+            volume=df['volume'].to_numpy(),
+            trading_value=df['trading_value'].to_numpy(dtype=np.float64),
+        )
+
+    @classmethod
+    def from_series(cls, series: PriceSeries) -> 'PriceColumns':
+        """PriceSeries → 컬럼 (복사 없음)"""
+        return cls(series.dates, series.high, series.close, series.volume, series.trading_value)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def until(self, end_date: Optional[date]) -> 'PriceColumns':
+        """end_date까지(포함)의 앞부분 (뷰)"""
+        if end_date is None:
+            return self
+        stop = int(np.searchsorted(self.dates, np.datetime64(end_date, 'D'), side='right'))
+        return PriceColumns(self.dates[:stop], self.high[:stop], self.close[:stop],
+                            self.volume[:stop], self.trading_value[:stop])
+
+
+def find_block_1(prices: PriceColumns, params: DetectionParams) -> List[Dict]:
+    """
+    1번 블록 일괄 탐지 - 거래대금 조건 + 조회 기간 최대 거래량 (현재 행 포함) + 신고가 등급
+
+    Returns:
+        [{date, volume, trading_value, close_price, new_high_grade, max_volume_period_days}, ...]
+    """
+    if len(prices) == 0:
+        return []
+
+    if params.lookback == LOOKBACK_DAYS:
+        max_volume = rolling_max_by_days(prices.dates, prices.volume, params.max_period_days)
+    else:
+        max_volume = rolling_max_by_rows(prices.volume, params.max_period_days)
+    rows = np.flatnonzero(block_1_mask(prices.volume, prices.trading_value, max_volume, params.min_trading_value))
+    if len(rows) == 0:
+        return []
+
+    grades = new_high_grades(prices.high, prices.dates, by=params.lookback)
+    dates = prices.dates[rows].tolist()
+    return [
+        {
+            'date': block_date,
+            'volume': int(prices.volume[row]),
+            'trading_value': float(prices.trading_value[row]),
+            'close_price': float(prices.close[row]),
+            'new_high_grade': grades[row],
+            'max_volume_period_days': params.max_period_days,
+        }
+        for block_date, row in zip(dates, rows)
+    ]
+
+
+def find_block_2(prices: PriceColumns, blocks_1: Sequence[Dict], params: DetectionParams) -> List[Dict]:
+    """
+    모든 1번 블록의 2번 블록 일괄 탐지
+
+    Args:
+        prices: 각 1번 블록 이후 max_days_from_block1일까지 포함한 컬럼
+        blocks_1: [{date, volume, ...}, ...]
+
+    Returns:
+        1번 블록 순서, 날짜순 [{date, volume, trading_value, close_price, volume_ratio, days_from_block1,
+        pattern_type}, ...] (부모 = date - days_from_block1)
+    """
+    if len(prices) == 0 or not blocks_1:
+        return []
+
+    block_1_dates = np.asarray([b['date'] for b in blocks_1], dtype='datetime64[D]')
+    window_idx, row_idx, volume_ratio, pattern_codes = block_2_candidates(
+        prices.dates,
+        prices.volume,
+        prices.trading_value,
+        block_1_dates,
+        [b['volume'] for b in blocks_1],
+        params.max_days_from_block1,
+        params.min_volume_ratio,
+        params.block2_min_trading_value,
+        params.avg_window,
+        params.threshold_ratio,
+        include_start=params.block2_same_day,
+    )
+    if not params.classify_pattern:
+        pattern_codes = np.full(len(row_idx), PATTERN_D_ONLY, dtype=np.int8)
+
+    days_from_block1 = (prices.dates[row_idx] - block_1_dates[window_idx]).astype(int)
+    trading_values = prices.trading_value[row_idx]
+    return [
+        {
+            'date': block_date,
+            'volume': int(prices.volume[row]),
+            'trading_value': None if np.isnan(trading_value) else float(trading_value),
+            'close_price': float(prices.close[row]),
+            'volume_ratio': float(ratio),
+            'days_from_block1': int(days),
+            'pattern_type': PATTERN_TYPES[code],
+        }
+        for block_date, row, trading_value, ratio, days, code in zip(
+            prices.dates[row_idx].tolist(), row_idx, trading_values, volume_ratio, days_from_block1, pattern_codes
+        )
+    ]
+
+
+def detect_blocks(
+    prices: PriceColumns,
+    params: DetectionParams,
+    end_date: Optional[date] = None
+) -> Tuple[List[Dict], List[Dict]]:
+    """
+    1번 블록(end_date까지) + 2번 블록(전체 컬럼) 일괄 탐지
+
+    Returns:
+        (blocks_1, blocks_2)
+    """
+    blocks_1 = find_block_1(prices.until(end_date), params)
+    return blocks_1, find_block_2(prices, blocks_1, params)
@@ -0,0 +1,376 @@
+"""
+Detection Kernels
+블록 탐지용 벡터화 커널 (시계열 전체를 한 번에 계산)
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.enums import NewHighGrade
+
+# 신고가 등급별 조회 기간 (None = 전체 기간), 긴 기간부터 판정
+NEW_HIGH_HORIZONS: Tuple[Tuple[NewHighGrade, Optional[int]], ...] = (
+    (NewHighGrade.S, None),  # 역사적 신고가
+    (NewHighGrade.A, 3650),  # 10년
+    (NewHighGrade.B, 1825),  # 5년
+    (NewHighGrade.C, 730),   # 2년
+    (NewHighGrade.D, 365),   # 1년
+    (NewHighGrade.E, 180),   # 6개월
+)
+
+# 등급 코드 (0=S ... 6=F) - 스크리닝/ML 피처용 정수 표현
+NEW_HIGH_GRADE_ORDER: Tuple[NewHighGrade, ...] = tuple(grade for grade, _ in NEW_HIGH_HORIZONS) + (NewHighGrade.F,)
+
+
+def rolling_max_by_days(dates, values, days: int) -> np.ndarray:
+    """
+    기간(일) 기준 롤링 최대값 - 각 행에서 [date - days, date] 구간 (양끝 포함)
+
+    레거시 BlockDetector의 df[date - timedelta(days):date] 라벨 슬라이싱과 동일한 구간.
+    pandas 시간 기반 rolling(O(n))으로 계산하며 NaN은 무시 (Series.max와 동일).
+
+    Args:
+        dates: 오름차순 날짜 배열 (datetime64 또는 DatetimeIndex)
+        values: 값 배열
+        days: 조회 기간 (일)
+    """
+    index = pd.DatetimeIndex(dates)
+    series = pd.Series(np.asarray(values, dtype=np.float64), index=index)
+    return series.rolling(f'{days}D', closed='both', min_periods=1).max().to_numpy()
+
+
+def rolling_max_by_rows(values, rows: int) -> np.ndarray:
+    """
+    행 기준 롤링 최대값 - 각 행에서 iloc[max(0, i - rows):i + 1] 구간
+
+    BlockDetectionService의 행 기반 lookback과 동일한 구간 (현재 행 포함 rows + 1개).
+    """
+    series = pd.Series(np.asarray(values, dtype=np.float64))
+    return series.rolling(rows + 1, min_periods=1).max().to_numpy()
+
+
+def block_1_mask(
+    volume,
+    trading_value,
+    rolling_max_volume: np.ndarray,
+    min_trading_value: Optional[float]
+) -> np.ndarray:
+    """
+    1번 블록 조건 마스크
+
+    - 거래대금 >= min_trading_value (NaN 거래대금은 통과 - 기존 `value < min` 비교와 동일)
+    - 거래량 >= 조회 기간 최대 거래량 (현재 행 포함)
+
+    Args:
+        min_trading_value: None이면 거래대금 조건 비활성화
+    """
+    volume = np.asarray(volume, dtype=np.float64)
+    trading_value = np.asarray(trading_value, dtype=np.float64)
+
+    mask = volume >= rolling_max_volume
+    if min_trading_value is not None:
+        mask &= ~(trading_value < min_trading_value)
+    return mask
+
+
+def expanding_max(values) -> np.ndarray:
+    """누적 최대값 (NaN 무시, NaN 행은 NaN)"""
+    return pd.Series(np.asarray(values, dtype=np.float64)).cummax().to_numpy()
+
+
+def new_high_grade_codes(
+    high,
+    dates=None,
+    by: str = 'days',
+    horizons: Sequence[Tuple[NewHighGrade, Optional[int]]] = NEW_HIGH_HORIZONS
+) -> np.ndarray:
+    """
+    모든 행의 신고가 등급 코드를 한 번에 계산
+
+    등급 = 현재 고가가 조회 구간 최대 고가 이상인 가장 긴 기간 (없으면 F).
+    기간별 롤링 최대값을 시계열당 한 번만 계산하고 배열 비교로 판정.
+
+    Args:
+        high: 고가 배열
+        dates: 날짜 배열 (by='days'일 때 필요)
+        by: 'days' - [날짜 - N일, 날짜] 구간 (레거시 BlockDetector)
+            'rows' - iloc[i - N:i + 1] 구간 (BlockDetectionService)
+        horizons: (등급, 기간) 목록
+
+    Returns:
+        int8 배열 (NEW_HIGH_GRADE_ORDER 인덱스)
+    """
+    if by not in ('days', 'rows'):
+        raise ValueError(f"Unknown lookback mode: {by}")
+    if by == 'days' and dates is None:
+        raise ValueError("dates are required for day-based grading")
+
+    high = np.asarray(high, dtype=np.float64)
+    codes = np.full(len(high), len(horizons), dtype=np.int8)
+    undecided = np.ones(len(high), dtype=bool)
+
+    for code, (_, period) in enumerate(horizons):
+        if period is None:
+            window_max = expanding_max(high)
+        elif by == 'days':
+            window_max = rolling_max_by_days(dates, high, period)
+        else:
+            window_max = rolling_max_by_rows(high, period)
+
+        hit = undecided & (high >= window_max)
+        codes[hit] = code
+        undecided &= ~hit
+
+    return codes
+
+
+def new_high_grades(high, dates=None, by: str = 'days') -> np.ndarray:
+    """
+    모든 행의 신고가 등급 (NewHighGrade object 배열)
+
+    Usage:
+        grades = new_high_grades(series.high, series.dates)
+        screening = series.to_dataframe().assign(grade=[g.value for g in grades])
+    """
+    order = np.array(NEW_HIGH_GRADE_ORDER, dtype=object)
+    return order[new_high_grade_codes(high, dates, by)]
+
+
+# 2번 블록 패턴 코드 (block_2_candidates 반환값)
+PATTERN_D_ONLY, PATTERN_D_D1, PATTERN_D_D2, PATTERN_D_D1_D2 = 0, 1, 2, 3
+
+
+def window_bounds(dates, starts, ends, include_start: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    날짜 구간들의 행 범위 [lo, hi) - searchsorted
+
+    Args:
+        dates: 오름차순 datetime64[D] 배열
+        starts: 구간 시작일 배열
+        ends: 구간 종료일 배열 (포함)
+        include_start: True면 시작일 포함, False면 시작일 다음 날부터
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    lo = np.searchsorted(dates, np.asarray(starts, dtype='datetime64[D]'), side='left' if include_start else 'right')
+    hi = np.searchsorted(dates, np.asarray(ends, dtype='datetime64[D]'), side='right')
+    return lo, np.maximum(hi, lo)
+
+
+def trailing_mean(values, window: int) -> np.ndarray:
+    """
+    직전 window개 행 평균 (현재 행 제외) - 앞쪽 window개 행은 NaN
+
+    int64 누적합으로 계산해 np.mean(values[i - window:i])와 같은 값을 보장
+    (합계가 2^53 미만인 정수 거래량 기준).
+    """
+    values = np.asarray(values, dtype=np.int64)
+    csum = np.concatenate(([0], np.cumsum(values)))
+    means = np.full(len(values), np.nan)
+    if len(values) > window:
+        means[window:] = (csum[window:-1] - csum[:-1 - window]).astype(np.float64) / window
+    return means
+
+
+def block_2_candidates(
+    dates,
+    volume,
+    trading_value,
+    block_1_dates,
+    block_1_volumes,
+    max_days: int,
+    min_volume_ratio: float = 0.0,
+    min_trading_value: Optional[float] = None,
+    avg_window: int = 20,
+    threshold_ratio: float = 0.8,
+    include_start: bool = False
+):
+    """
+    모든 1번 블록의 2번 블록 후보를 한 번에 계산
+
+    각 1번 블록 구간 (1번 블록일, 1번 블록일 + max_days]을 searchsorted로 잘라
+    (include_start면 1번 블록 당일 포함 - BlockDetectionService 규칙)
+    구간 내 행들을 하나의 배열로 펼친 뒤 조건/패턴을 일괄 판정.
+
+    패턴 (구간 내 위치 기준 - 레거시 _classify_pattern과 동일):
+    - 기준 = 구간 내 직전 avg_window일 평균 (구간 내 위치 < avg_window면 당일 거래량 × 0.5)
+    - 임계값 = 기준 × threshold_ratio
+    - D+1 / D+2 거래량 >= 임계값이면 해당 패턴 (구간 밖의 행은 보지 않음)
+
+    Returns:
+        (window_idx, row_idx, volume_ratio, pattern_codes) - 1번 블록 순서, 날짜 순
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    volume = np.asarray(volume, dtype=np.int64)
+    trading_value = np.asarray(trading_value, dtype=np.float64)
+    block_1_dates = np.asarray(block_1_dates, dtype='datetime64[D]')
+    block_1_volumes = np.asarray(block_1_volumes, dtype=np.float64)
+
+    lo, hi = window_bounds(dates, block_1_dates, block_1_dates + np.timedelta64(max_days, 'D'), include_start)
+    lengths = hi - lo
+    total = int(lengths.sum())
+
+    empty = np.array([], dtype=np.int64)
+    if total == 0:
+        return empty, empty, np.array([], dtype=np.float64), np.array([], dtype=np.int8)
+
+    # 구간들을 펼친 (window, row) 쌍
+    window_idx = np.repeat(np.arange(len(lo)), lengths)
+    window_lo = np.repeat(lo, lengths)
+    window_hi = np.repeat(hi, lengths)
+    row_idx = window_lo + (np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths))
+    local = row_idx - window_lo
+
+    volume_float = volume.astype(np.float64)
+    volume_ratio = volume_float[row_idx] / block_1_volumes[window_idx]
+
+    keep = volume_ratio >= (min_volume_ratio or 0.0)
+    if min_trading_value:
+        keep &= ~(trading_value[row_idx] < min_trading_value)
+
+    # D+1 / D+2 임계값 (구간 내 위치 기준)
+    mean_prev = trailing_mean(volume, avg_window)
+    base = np.where(local >= avg_window, mean_prev[row_idx], volume_float[row_idx] * 0.5)
+    threshold = base * threshold_ratio
+
+    n = len(volume)
+    next_1 = np.minimum(row_idx + 1, n - 1)
+    next_2 = np.minimum(row_idx + 2, n - 1)
+    has_d1 = (row_idx + 1 < window_hi) & (volume_float[next_1] >= threshold)
+    has_d2 = (row_idx + 2 < window_hi) & (volume_float[next_2] >= threshold)
+    pattern = (has_d1.astype(np.int8) * PATTERN_D_D1) + (has_d2.astype(np.int8) * PATTERN_D_D2)
+
+    return window_idx[keep], row_idx[keep], volume_ratio[keep], pattern[keep]
+
+
+def block_3_4_candidates(
+    dates,
+    high,
+    volume,
+    anchor_rows,
+    max_days: int,
+    volume_ratio_min: float,
+    price_range_pct: float,
+    pattern_days: int = 3
+):
+    """
+    2번 블록(앵커)별 3번/4번 블록 일괄 계산
+
+    기준 (앵커 D ~ D+pattern_days-1 행): 2번 블록 최대 거래량 / 최고가
+    조건 (앵커 패턴 구간 다음 행 ~ 앵커 날짜 + max_days일):
+    - 거래량 >= 기준 거래량 × volume_ratio_min
+    - |고가 - 기준 고가| / 기준 고가 <= price_range_pct
+    3번 블록 = 구간 내 첫 충족 행, 4번 블록 = 두 번째 충족 행
+    (구간들을 펼친 배열에서 구간별 누적 개수로 순번 판정)
+
+    Returns:
+        (ref_volume, ref_high, row_3, row_4) - 앵커 순서, 해당 블록이 없으면 행 번호 -1
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    high = np.asarray(high, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    anchor_rows = np.asarray(anchor_rows, dtype=np.int64)
+    n = len(volume)
+    k = len(anchor_rows)
+
+    row_3 = np.full(k, -1, dtype=np.int64)
+    row_4 = np.full(k, -1, dtype=np.int64)
+    if k == 0 or n == 0:
+        return np.zeros(k), np.zeros(k), row_3, row_4
+
+    reference = np.minimum(anchor_rows[:, None] + np.arange(pattern_days)[None, :], n - 1)  # [k, P]
+    ref_volume = volume[reference].max(axis=1)
+    ref_high = high[reference].max(axis=1)
+
+    lo = np.minimum(anchor_rows + pattern_days, n)
+    hi = np.searchsorted(dates, dates[anchor_rows] + np.timedelta64(max_days, 'D'), side='right')
+    hi = np.maximum(hi, lo)
+    lengths = hi - lo
+    total = int(lengths.sum())
+    if total == 0:
+        return ref_volume, ref_high, row_3, row_4
+
+    window_idx = np.repeat(np.arange(k), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    row_idx = np.repeat(lo, lengths) + (np.arange(total) - np.repeat(offsets, lengths))
+
+    ok = volume[row_idx] >= ref_volume[window_idx] * volume_ratio_min
+    ok &= np.abs(high[row_idx] - ref_high[window_idx]) <= ref_high[window_idx] * price_range_pct
+
+    # 구간별 순번 (1부터)
+    counts = np.cumsum(ok)
+    before = np.where(offsets > 0, counts[np.maximum(offsets - 1, 0)], 0)
+    rank = counts - np.repeat(before, lengths)
+
+    first = ok & (rank == 1)
+    second = ok & (rank == 2)
+    row_3[window_idx[first]] = row_idx[first]
+    row_4[window_idx[second]] = row_idx[second]
+    return ref_volume, ref_high, row_3, row_4
+
+
+def lookup_by_date(keys, dates, values) -> np.ndarray:
+    """
+    날짜 기준 left join - keys 각 날짜의 values 행 (일치하는 날짜가 없으면 NaN)
+
+    Args:
+        keys: 조회할 날짜 [k]
+        dates: values의 날짜 [m] (정렬/중복 여부 무관, 중복이면 앞 행)
+        values: [m] 또는 [m, c]
+    """
+    keys = np.asarray(keys, dtype='datetime64[D]')
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full((len(keys),) + values.shape[1:], np.nan)
+    if len(dates) == 0 or len(keys) == 0:
+        return result
+
+    order = np.argsort(dates, kind='stable')
+    sorted_dates = dates[order]
+    position = np.minimum(np.searchsorted(sorted_dates, keys), len(dates) - 1)
+    matched = sorted_dates[position] == keys
+    result[matched] = values[order[position[matched]]]
+    return result
+
+
+# 수급 품질 등급 (점수 하한 → 등급)
+QUALITY_GRADES: Tuple[Tuple[int, str], ...] = ((10, 'S'), (8, 'A'), (6, 'B'), (0, 'C'))
+
+
+def supply_quality_scores(
+    institutional_net_buy,
+    foreign_net_buy,
+    institutional_strength,
+    foreign_strength,
+    program_net_buy,
+    strength_sum_min: float = 5.0
+) -> np.ndarray:
+    """
+    3번/4번 블록 수급 품질 점수 (10점 만점, 수급 데이터가 없으면 기본 5점)
+
+    - 기본 5점
+    - +5점: 외국인 + 기관 쌍끌이 순매수 / +3점: 한쪽만 순매수
+    - +2점: 외국인 + 기관 매수강세 지수 합계 > strength_sum_min (%)
+    - +1점: 프로그램 순매수
+    """
+    institutional = np.nan_to_num(np.asarray(institutional_net_buy, dtype=np.float64))
+    foreign = np.nan_to_num(np.asarray(foreign_net_buy, dtype=np.float64))
+    strength = (np.nan_to_num(np.asarray(institutional_strength, dtype=np.float64))
+                + np.nan_to_num(np.asarray(foreign_strength, dtype=np.float64)))
+    program = np.nan_to_num(np.asarray(program_net_buy, dtype=np.float64))
+
+    both = (institutional > 0) & (foreign > 0)
+    single = (institutional > 0) | (foreign > 0)
+    scores = 5 + np.where(both, 5, np.where(single, 3, 0)) + np.where(strength > strength_sum_min, 2, 0)
+    scores += np.where(program > 0, 1, 0)
+    return np.minimum(scores, 10).astype(np.int64)
+
+
+def quality_grades(scores) -> np.ndarray:
+    """품질 점수 → 등급 (S=10, A=8~9, B=6~7, C=5)"""
+    scores = np.asarray(scores)
+    grades = np.full(len(scores), QUALITY_GRADES[-1][1], dtype=object)
+    for minimum, grade in reversed(QUALITY_GRADES[:-1]):
+        grades[scores >= minimum] = grade
+    return grades
@@ -0,0 +1,87 @@
+"""
+Detection Params
+정규화된 1번/2번 블록 탐지 파라미터 (BlockDetector / BlockDetectionService / 증분 탐지 공용)
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from core.config import BLOCK_CRITERIA
+
+LOOKBACK_DAYS = 'days'  # [날짜 - N일, 날짜] 구간 (레거시 BlockDetector)
+LOOKBACK_ROWS = 'rows'  # 직전 N개 행 구간 (BlockDetectionService)
+
+
+@dataclass(frozen=True)
+class DetectionParams:
+    """
+    정규화된 탐지 파라미터
+
+    설정 dict의 비활성화 표현(None/0)을 하나로 맞춘 값으로, fingerprint()가
+    증분 탐지 상태의 키가 됨 (설정이 바뀌면 상태를 처음부터 다시 쌓음).
+    """
+
+    min_trading_value: Optional[float]
+    max_period_days: int
+    min_volume_ratio: float
+    block2_min_trading_value: Optional[float]
+    max_days_from_block1: int
+    lookback: str = LOOKBACK_DAYS
+    block2_same_day: bool = False  # 1번 블록 당일도 2번 블록 후보 (BlockDetectionService)
+    classify_pattern: bool = True  # False면 패턴 분류 없이 항상 D_ONLY
+    avg_window: int = 20
+    threshold_ratio: float = 0.8
+
+    @classmethod
+    def for_block_detector(cls, settings: Optional[Dict] = None) -> 'DetectionParams':
+        """레거시 BlockDetector와 같은 규칙 (기간 기준 lookback, D+1/D+2 패턴 분류)"""
+        min_trading_value = BLOCK_CRITERIA['block_1']['min_trading_value']
+        min_volume_ratio = BLOCK_CRITERIA['block_2']['volume_ratio_min']
+        block2_min_trading_value = None
+
+        if settings and 'block1' in settings:
+            min_trading_value = settings['block1'].get('min_trading_value', min_trading_value)
+            if min_trading_value is None:
+                min_trading_value = 0  # 조건 비활성화
+        if settings and 'block2' in settings:
+            min_volume_ratio = settings['block2'].get('min_volume_ratio', min_volume_ratio)
+            block2_min_trading_value = settings['block2'].get('min_trading_value')
+
+        return cls(
+            min_trading_value=float(min_trading_value),
+            max_period_days=BLOCK_CRITERIA['block_1']['max_volume_period_days'],
+            min_volume_ratio=float(min_volume_ratio or 0.0),
+            block2_min_trading_value=block2_min_trading_value or None,
+            max_days_from_block1=BLOCK_CRITERIA['block_2']['max_days_from_block1'],
+        )
+
+    @classmethod
+    def for_detection_service(cls, settings: Optional[Dict] = None) -> 'DetectionParams':
+        """BlockDetectionService와 같은 규칙 (행 기준 lookback, 1번 블록 당일 포함, 패턴 D_ONLY)"""
+        min_trading_value = BLOCK_CRITERIA['block_1']['min_trading_value']
+        min_volume_ratio = BLOCK_CRITERIA['block_2']['volume_ratio_min']
+        block2_min_trading_value = None
+
+        if settings and 'block1' in settings:
+            min_trading_value = settings['block1'].get('min_trading_value', min_trading_value)
+        if settings and 'block2' in settings:
+            min_volume_ratio = settings['block2'].get('min_volume_ratio', min_volume_ratio)
+            block2_min_trading_value = settings['block2'].get('min_trading_value')
+
+        return cls(
+            min_trading_value=None if min_trading_value is None else float(min_trading_value),
+            max_period_days=BLOCK_CRITERIA['block_1']['max_volume_period_days'],
+            min_volume_ratio=float(min_volume_ratio or 0.0),
+            block2_min_trading_value=block2_min_trading_value or None,
+            max_days_from_block1=BLOCK_CRITERIA['block_2']['max_days_from_block1'],
+            lookback=LOOKBACK_ROWS,
+            block2_same_day=True,
+            classify_pattern=False,
+        )
+
+    def fingerprint(self) -> str:
+        """파라미터 지문 (상태 테이블 키)"""
+        payload = json.dumps(asdict(self), sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,394 @@
+"""
+Incremental Block Detector
+종목별 롤링 상태를 유지하며 새 봉만 평가하는 증분 1번/2번 블록 탐지
+"""
+
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.enums import BlockType, NewHighGrade, PatternType
+from domain.entities.price_series import PriceSeries
+from domain.services.detection_kernels import NEW_HIGH_HORIZONS
+from domain.services.detection_params import LOOKBACK_DAYS, LOOKBACK_ROWS, DetectionParams
+
+# 신고가 등급 판정에 필요한 최대 조회 기간
+MAX_GRADE_HORIZON = max(period for _, period in NEW_HIGH_HORIZONS if period is not None)
+
+
+@dataclass
+class BlockEvent:
+    """
+    탐지 이벤트
+
+    block은 BlockDetector 결과와 같은 형식의 dict,
+    parent_date는 2번 블록의 1번 블록 날짜 (1번 블록이면 None)
+    """
+
+    block_type: BlockType
+    block: Dict
+    parent_date: Optional[date] = None
+    stock_id: Optional[int] = None  # 다종목 스트리밍에서 설정
+
+
+@dataclass
+class PendingBlock2:
+    """D+1/D+2 확인을 기다리는 2번 블록 후보"""
+
+    block: Dict
+    threshold: float
+    seen: int = 0  # 후보 이후 구간 안에서 본 봉 수
+    has_d1: bool = False
+    has_d2: bool = False
+
+
+@dataclass
+class OpenBlock1:
+    """2번 블록 구간이 아직 열려 있는 1번 블록"""
+
+    date: date
+    volume: int
+    seen: int = 0  # 구간 안에서 본 봉 수 (패턴 기준 위치)
+    pending: List[PendingBlock2] = field(default_factory=list)
+
+
+@dataclass
+class BlockDetectionState:
+    """
+    종목별 증분 탐지 상태
+
+    - volume_window: 1번 블록 lookback 구간의 (키, 거래량) 단조 감소 deque
+    - high_window: 신고가 등급 최대 기간(10년)의 (키, 고가) 단조 감소 deque
+    - expanding_high: 전체 기간 최고가 (S 등급)
+    - recent_volumes: 직전 avg_window개 거래량 (D+1/D+2 임계값)
+    - open_blocks: 2번 블록 구간이 열린 1번 블록과 대기 중인 후보
+
+    키는 lookback이 'days'면 날짜 서수(toordinal), 'rows'면 행 번호.
+    """
+
+    last_date: Optional[date] = None
+    rows: int = 0
+    expanding_high: Optional[float] = None
+    volume_window: Deque[Tuple[int, int]] = field(default_factory=deque)
+    high_window: Deque[Tuple[int, float]] = field(default_factory=deque)
+    recent_volumes: Deque[int] = field(default_factory=deque)
+    open_blocks: List[OpenBlock1] = field(default_factory=list)
+
+    # ===== 직렬화 =====
+
+    def to_dict(self) -> Dict:
+        """JSON 직렬화 가능한 dict"""
+        return {
+            'last_date': self.last_date.isoformat() if self.last_date else None,
+            'rows': self.rows,
+            'expanding_high': self.expanding_high,
+            'volume_window': [list(item) for item in self.volume_window],
+            'high_window': [list(item) for item in self.high_window],
+            'recent_volumes': list(self.recent_volumes),
+            'open_blocks': open_blocks_to_dict(self.open_blocks),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'BlockDetectionState':
+        return cls(
+            last_date=date.fromisoformat(data['last_date']) if data['last_date'] else None,
+            rows=data['rows'],
+            expanding_high=data['expanding_high'],
+            volume_window=deque((key, volume) for key, volume in data['volume_window']),
+            high_window=deque((key, high) for key, high in data['high_window']),
+            recent_volumes=deque(data['recent_volumes']),
+            open_blocks=open_blocks_from_dict(data['open_blocks']),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, payload: str) -> 'BlockDetectionState':
+        return cls.from_dict(json.loads(payload))
+
+
+def open_blocks_to_dict(open_blocks: List[OpenBlock1]) -> List[Dict]:
+    """열린 1번 블록 → JSON 직렬화 가능한 목록"""
+    return [
+        {
+            'date': block.date.isoformat(),
+            'volume': block.volume,
+            'seen': block.seen,
+            'pending': [
+                {
+                    'block': {**candidate.block, 'date': candidate.block['date'].isoformat()},
+                    'threshold': candidate.threshold,
+                    'seen': candidate.seen,
+                    'has_d1': candidate.has_d1,
+                    'has_d2': candidate.has_d2,
+                }
+                for candidate in block.pending
+            ],
+        }
+        for block in open_blocks
+    ]
+
+
+def open_blocks_from_dict(data: List[Dict]) -> List[OpenBlock1]:
+    return [
+        OpenBlock1(
+            date=date.fromisoformat(block['date']),
+            volume=block['volume'],
+            seen=block['seen'],
+            pending=[
+                PendingBlock2(
+                    block={**candidate['block'], 'date': date.fromisoformat(candidate['block']['date'])},
+                    threshold=candidate['threshold'],
+                    seen=candidate['seen'],
+                    has_d1=candidate['has_d1'],
+                    has_d2=candidate['has_d2'],
+                )
+                for candidate in block['pending']
+            ],
+        )
+        for block in data
+    ]
+
+
+class IncrementalBlockDetector:
+    """
+    증분 블록 탐지기 (종목 1개)
+
+    봉을 날짜순으로 한 개씩 받아 롤링 상태만 갱신 (봉당 분할상환 O(1)).
+    마지막 처리일(last_date) 이하의 봉은 이미 반영된 것으로 보고 건너뜀.
+
+    배치 탐지와의 관계:
+    - 1번 블록/신고가 등급: 같은 시작일부터 쌓은 상태면 배치 결과와 동일
+    - 2번 블록: D+2 봉이 도착하거나 구간이 닫힐 때 확정되어 이벤트로 나옴
+      (데이터 끝에서 배치와 맞추려면 flush())
+
+    Usage:
+        detector = IncrementalBlockDetector(DetectionParams.for_block_detector(settings), state)
+        events = detector.update_frame(new_rows_df)
+        repo.save(stock_id, detector.params.fingerprint(), detector.state)
+    """
+
+    def __init__(self, params: DetectionParams, state: Optional[BlockDetectionState] = None):
+        if params.lookback not in (LOOKBACK_DAYS, LOOKBACK_ROWS):
+            raise ValueError(f"Unknown lookback mode: {params.lookback}")
+        self.params = params
+        self.state = state or BlockDetectionState()
+
+    # ===== 입력 =====
+
+    def update(
+        self,
+        bar_date: date,
+        high: float,
+        close: float,
+        volume: int,
+        trading_value: float
+    ) -> List[BlockEvent]:
+        """
+        봉 하나 반영
+
+        Args:
+            trading_value: 거래대금 (NaN은 거래대금 조건 통과 - 배치와 동일)
+
+        Returns:
+            이 봉에서 확정된 이벤트 (1번 블록, 2번 블록 순)
+        """
+        state = self.state
+        if state.last_date is not None and bar_date <= state.last_date:
+            return []
+
+        params = self.params
+        key = bar_date.toordinal() if params.lookback == LOOKBACK_DAYS else state.rows
+        volume = int(volume)
+        events: List[BlockEvent] = []
+
+        # 1. 열린 1번 블록 구간: 대기 후보 갱신 + 현재 봉 2번 블록 판정
+        still_open = []
+        for block_1 in state.open_blocks:
+            if (bar_date - block_1.date).days > params.max_days_from_block1:
+                events.extend(self._finalize(block_1, candidate) for candidate in block_1.pending)
+                continue
+            self._advance_pending(block_1, volume, events)
+            self._evaluate_block_2(block_1, bar_date, close, volume, trading_value, events)
+            still_open.append(block_1)
+        state.open_blocks = still_open
+
+        # 2. 1번 블록: 조회 구간 최대 거래량 (단조 deque)
+        volume_window = state.volume_window
+        while volume_window and volume_window[0][0] < key - params.max_period_days:
+            volume_window.popleft()
+        while volume_window and volume_window[-1][1] <= volume:
+            volume_window.pop()
+        is_max_volume = not volume_window
+        volume_window.append((key, volume))
+
+        grade = self._update_highs(key, high)
+
+        passes_trading_value = (
+            params.min_trading_value is None or not trading_value < params.min_trading_value
+        )
+        if is_max_volume and passes_trading_value:
+            events.append(BlockEvent(BlockType.BLOCK_1, {
+                'date': bar_date,
+                'volume': volume,
+                'trading_value': float(trading_value),
+                'close_price': float(close),
+                'new_high_grade': grade,
+                'max_volume_period_days': params.max_period_days,
+            }))
+            block_1 = OpenBlock1(date=bar_date, volume=volume)
+            if params.block2_same_day:
+                self._evaluate_block_2(block_1, bar_date, close, volume, trading_value, events)
+            state.open_blocks.append(block_1)
+
+        # 3. 직전 거래량 (현재 봉 판정 후 반영)
+        state.recent_volumes.append(volume)
+        if len(state.recent_volumes) > params.avg_window:
+            state.recent_volumes.popleft()
+
+        state.rows += 1
+        state.last_date = bar_date
+        return events
+
+    def update_arrays(self, dates, high, close, volume, trading_value) -> List[BlockEvent]:
+        """날짜 오름차순 컬럼 배열 반영"""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        events = []
+        for bar_date, h, c, v, tv in zip(
+            dates.tolist(),
+            np.asarray(high, dtype=np.float64).tolist(),
+            np.asarray(close, dtype=np.float64).tolist(),
+            np.asarray(volume, dtype=np.int64).tolist(),
+            np.asarray(trading_value, dtype=np.float64).tolist()
+        ):
+            events.extend(self.update(bar_date, h, c, v, tv))
+        return events
+
+    def update_frame(self, df: pd.DataFrame) -> List[BlockEvent]:
+        """날짜 인덱스 DataFrame (BlockDetector._load_price_frame 형식) 반영"""
+        if df.empty:
+            return []
+        return self.update_arrays(
+            df.index.values, df['high'].to_numpy(), df['close'].to_numpy(),
+            df['volume'].to_numpy(), df['trading_value'].to_numpy()
+        )
+
+    def update_series(self, series: PriceSeries) -> List[BlockEvent]:
+        """PriceSeries 반영 (검증 실패 봉 제외 - BlockDetectionService와 동일)"""
+        series = series.drop_invalid()
+        return self.update_arrays(series.dates, series.high, series.close, series.volume, series.trading_value)
+
+    def flush(self) -> List[BlockEvent]:
+        """
+        대기 중인 2번 블록 후보를 지금까지의 D+1/D+2 확인 결과로 확정
+
+        데이터 끝에서 배치 탐지와 결과를 맞출 때 사용 (이후 봉으로 패턴이 바뀌지 않음).
+        """
+        events = []
+        for block_1 in self.state.open_blocks:
+            events.extend(self._finalize(block_1, candidate) for candidate in block_1.pending)
+            block_1.pending = []
+        return events
+
+    # ===== 내부 =====
+
+    def _update_highs(self, key: int, high: float) -> NewHighGrade:
+        """고가 deque/누적 최고가 갱신 + 현재 봉 신고가 등급"""
+        state = self.state
+        high_window = state.high_window
+        while high_window and high_window[0][0] < key - MAX_GRADE_HORIZON:
+            high_window.popleft()
+
+        if high != high:  # NaN 고가는 비교 불가 → F (배치와 동일), 상태에 넣지 않음
+            return NewHighGrade.F
+
+        while high_window and high_window[-1][1] <= high:
+            high_window.pop()
+        # 현재 고가보다 높은 가장 최근 봉 (없으면 None)
+        higher_key = high_window[-1][0] if high_window else None
+        high_window.append((key, high))
+
+        is_all_time_high = state.expanding_high is None or high >= state.expanding_high
+        if is_all_time_high:
+            state.expanding_high = high
+
+        for grade, period in NEW_HIGH_HORIZONS:
+            if period is None:
+                if is_all_time_high:
+                    return grade
+            elif higher_key is None or higher_key < key - period:
+                return grade
+        return NewHighGrade.F
+
+    def _evaluate_block_2(
+        self,
+        block_1: OpenBlock1,
+        bar_date: date,
+        close: float,
+        volume: int,
+        trading_value: float,
+        events: List[BlockEvent]
+    ):
+        """현재 봉의 2번 블록 조건 판정 (통과 시 후보 등록 또는 즉시 확정)"""
+        params = self.params
+        local = block_1.seen
+        block_1.seen += 1
+
+        volume_ratio = volume / block_1.volume
+        if volume_ratio < params.min_volume_ratio:
+            return
+        if params.block2_min_trading_value and trading_value < params.block2_min_trading_value:
+            return
+
+        block = {
+            'date': bar_date,
+            'volume': volume,
+            'trading_value': None if trading_value != trading_value else float(trading_value),
+            'close_price': float(close),
+            'volume_ratio': float(volume_ratio),
+            'days_from_block1': (bar_date - block_1.date).days,
+        }
+
+        if not params.classify_pattern:
+            block['pattern_type'] = PatternType.D_ONLY
+            events.append(BlockEvent(BlockType.BLOCK_2, block, block_1.date))
+            return
+
+        # D+1/D+2 임계값 - 구간 내 위치가 avg_window 이상이면 직전 평균, 아니면 당일 거래량의 절반
+        recent = self.state.recent_volumes
+        if local >= params.avg_window:
+            base = float(sum(recent)) / params.avg_window
+        else:
+            base = float(volume) * 0.5
+        block_1.pending.append(PendingBlock2(block=block, threshold=base * params.threshold_ratio))
+
+    def _advance_pending(self, block_1: OpenBlock1, volume: int, events: List[BlockEvent]):
+        """대기 후보에 현재 봉(D+1 또는 D+2) 반영, D+2까지 본 후보는 확정"""
+        remaining = []
+        for candidate in block_1.pending:
+            candidate.seen += 1
+            if candidate.seen == 1:
+                candidate.has_d1 = volume >= candidate.threshold
+                remaining.append(candidate)
+            else:
+                candidate.has_d2 = volume >= candidate.threshold
+                events.append(self._finalize(block_1, candidate))
+        block_1.pending = remaining
+
+    @staticmethod
+    def _finalize(block_1: OpenBlock1, candidate: PendingBlock2) -> BlockEvent:
+        if candidate.has_d1 and candidate.has_d2:
+            pattern_type = PatternType.D_D1_D2
+        elif candidate.has_d1:
+            pattern_type = PatternType.D_D1
+        elif candidate.has_d2:
+            pattern_type = PatternType.D_D2
+        else:
+            pattern_type = PatternType.D_ONLY
+        return BlockEvent(BlockType.BLOCK_2, {**candidate.block, 'pattern_type': pattern_type}, block_1.date)
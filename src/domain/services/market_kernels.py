@@ -0,0 +1,103 @@
+"""
+Market Kernels
+블록 기간 시장 대비 성과 일괄 계산 (지수 정렬 수익률 + 누적합 기반 구간 공분산)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def daily_returns(close) -> np.ndarray:
+    """일별 수익률 (첫 행 NaN)"""
+    close = np.asarray(close, dtype=np.float64)
+    returns = np.full(len(close), np.nan)
+    if len(close) > 1:
+        returns[1:] = close[1:] / close[:-1] - 1.0
+    return returns
+
+
+def segment_betas(stock_returns, index_returns, starts, ends, min_count: int = 2):
+    """
+    구간 [starts[i], ends[i]] (양끝 포함) 회귀 베타 - cov(종목, 지수) / var(지수)
+
+    두 수익률이 모두 있는 행만 사용. 합계/제곱합/교차곱의 누적합 5개로 모든 구간을 한 번에 계산.
+
+    Returns:
+        (beta, 유효 행 수) - 유효 행이 min_count 미만이거나 지수 분산이 0이면 beta NaN
+    """
+    stock_returns = np.asarray(stock_returns, dtype=np.float64)
+    index_returns = np.asarray(index_returns, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64) + 1
+
+    valid = ~np.isnan(stock_returns) & ~np.isnan(index_returns)
+    x = np.where(valid, index_returns, 0.0)
+    y = np.where(valid, stock_returns, 0.0)
+
+    def segment_sum(values):
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        return csum[ends] - csum[starts]
+
+    count = segment_sum(valid.astype(np.float64))
+    sum_x, sum_y = segment_sum(x), segment_sum(y)
+    sum_xy, sum_xx = segment_sum(x * y), segment_sum(x * x)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = sum_xy - sum_x * sum_y / count
+        variance = sum_xx - sum_x * sum_x / count
+        beta = np.where((count >= min_count) & (variance > 0), covariance / variance, np.nan)
+    return beta, count.astype(np.int64)
+
+
+@dataclass
+class MarketPerformance:
+    """블록별 시장 대비 성과 (%, 입력 블록 순서, 계산 불가 항목은 NaN)"""
+
+    range_return: np.ndarray
+    index_return: np.ndarray
+    relative_return: np.ndarray
+    beta: np.ndarray
+    alpha: np.ndarray
+
+
+def market_performance(
+    close,
+    index_close,
+    start_rows,
+    end_rows,
+    beta_min_days: int = 60
+) -> MarketPerformance:
+    """
+    블록 기간 성과 일괄 계산
+
+    - 수익률: 기간 시작일 종가 → 종료일 종가 (%)
+    - 상대 수익률: 종목 - 지수 (%p)
+    - 베타: 기간 일별 수익률 회귀, 기간이 beta_min_days 거래일보다 짧으면 종료일 기준 직전까지 확장
+    - 알파: 종목 수익률 - 베타 × 지수 수익률 (%p)
+
+    Args:
+        close: 종목 종가 [n]
+        index_close: 같은 날짜로 정렬한 지수 종가 [n] (없는 날은 NaN)
+        start_rows / end_rows: 블록 기간 행 번호 [k]
+    """
+    close = np.asarray(close, dtype=np.float64)
+    index_close = np.asarray(index_close, dtype=np.float64)
+    starts = np.asarray(start_rows, dtype=np.int64)
+    ends = np.asarray(end_rows, dtype=np.int64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        range_return = (close[ends] / close[starts] - 1.0) * 100
+        index_return = (index_close[ends] / index_close[starts] - 1.0) * 100
+
+    # 수익률 행 t는 (t-1 → t) 이므로 기간 수익률 행은 start+1 ~ end
+    window_starts = np.maximum(np.minimum(starts + 1, ends - beta_min_days + 1), 1)
+    beta, _ = segment_betas(daily_returns(close), daily_returns(index_close), window_starts, ends)
+
+    return MarketPerformance(
+        range_return=range_return,
+        index_return=index_return,
+        relative_return=range_return - index_return,
+        beta=beta,
+        alpha=range_return - beta * index_return,
+    )
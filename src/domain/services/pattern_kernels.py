@@ -0,0 +1,87 @@
+"""
+Pattern Kernels
+2번 블록 D/D+1/D+2 패턴 스냅샷 일괄 계산 (블록별 구간 시작 행 + 오프셋 위치 인덱싱)
+"""
+
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+
+@dataclass
+class PatternSnapshots:
+    """
+    (블록, 오프셋) 평탄화 결과 - 구간 밖(아직 오지 않은 D+1/D+2, 시세 없는 D일) 행은 제외
+
+    block_index: 입력 블록 번호, offset: 0=D, 1=D+1, 2=D+2, row: 입력 행 번호
+    """
+
+    block_index: np.ndarray
+    offset: np.ndarray
+    row: np.ndarray
+    volume_ratio_vs_d: np.ndarray
+    is_high_breakout: np.ndarray  # D일 고가 돌파 (D일 행은 False)
+    is_qualified: np.ndarray      # D일 행은 True, D+N은 거래량 >= D × 비율 & 고가 > D일 고가
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+
+def pattern_snapshots(
+    owner,
+    dates,
+    high,
+    volume,
+    block_dates,
+    days: int = 3,
+    volume_ratio_min: float = 0.5
+) -> PatternSnapshots:
+    """
+    모든 2번 블록의 D ~ D+(days-1) 행 일괄 판정
+
+    입력은 블록별 D일부터의 시세 행을 블록 순서대로 이어 붙인 배열 (owner 오름차순, 블록 안은 날짜순).
+    블록 구간 시작 행을 searchsorted 한 번으로 찾고 D+N 행은 시작 행 + N 위치 인덱싱 (거래일 기준).
+
+    Args:
+        owner: 행별 블록 번호 [n] (0 ~ k-1, 오름차순)
+        dates / high / volume: [n]
+        block_dates: 2번 블록 날짜 [k] (구간 첫 행 날짜가 다르면 D일 시세 없음 → 제외)
+        volume_ratio_min: D+N 인정 거래량 비율 (D일 대비)
+    """
+    owner = np.asarray(owner, dtype=np.int64)
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    high = np.asarray(high, dtype=np.float64)
+    volume = np.asarray(volume, dtype=np.float64)
+    block_dates = np.asarray(block_dates, dtype='datetime64[D]')
+    blocks = np.arange(len(block_dates))
+
+    seg_start = np.searchsorted(owner, blocks)
+    seg_end = np.searchsorted(owner, blocks, side='right')
+    found = seg_start < seg_end
+    found[found] = dates[seg_start[found]] == block_dates[found]
+
+    base = seg_start[owner]
+    offset = np.arange(len(owner)) - base
+    row = np.flatnonzero(found[owner] & (offset < days))
+    base, offset = base[row], offset[row]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        volume_ratio = volume[row] / volume[base]
+    breakout = (offset > 0) & (high[row] > high[base])
+    qualified = (offset == 0) | (breakout & (volume[row] >= volume[base] * volume_ratio_min))
+
+    return PatternSnapshots(
+        block_index=owner[row],
+        offset=offset,
+        row=row,
+        volume_ratio_vs_d=volume_ratio,
+        is_high_breakout=breakout,
+        is_qualified=qualified,
+    )
+
+
+def gather_columns(columns: Dict[str, np.ndarray], rows) -> Dict[str, np.ndarray]:
+    """{컬럼: [n] 배열} → 같은 행 번호들의 값 (위치 인덱싱)"""
+    rows = np.asarray(rows, dtype=np.int64)
+    return {name: np.asarray(values)[rows] for name, values in columns.items()}
@@ -0,0 +1,191 @@
+"""
+Range Kernels
+블록 기간(D일 ~ 60이평선 회귀일) 일괄 계산 (종목 시계열당 이동평균 1회 + 구간 축약/연속 판정)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from core.enums import RangeEndReason
+from domain.services.run_kernels import runs_above, segment_rows
+
+
+def moving_average(values, window: int) -> np.ndarray:
+    """
+    현재 행 포함 window개 행 단순 이동평균 - 앞쪽 window-1개 행은 NaN
+    """
+    values = np.asarray(values, dtype=np.float64)
+    means = np.full(len(values), np.nan)
+    if len(values) >= window:
+        csum = np.concatenate(([0.0], np.cumsum(values)))
+        means[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return means
+
+
+def next_true(mask) -> np.ndarray:
+    """
+    각 행 이후(현재 행 포함) 처음 True인 행 번호 - 없으면 -1
+
+    뒤에서부터 누적 최소값 한 번으로 모든 시작 행의 첫 True 검색을 처리.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    n = len(mask)
+    positions = np.where(mask, np.arange(n), n)
+    following = np.minimum.accumulate(positions[::-1])[::-1]
+    return np.where(following < n, following, -1)
+
+
+def segment_reduce(ufunc, values, starts, ends) -> np.ndarray:
+    """
+    구간 [starts[i], ends[i]] (양끝 포함) 축약 - ufunc.reduceat
+
+    구간이 겹쳐도 되도록 (시작, 끝+1) 쌍을 펼쳐 reduceat 후 짝수 칸만 사용.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    if len(starts) == 0:
+        return np.zeros(0)
+    # 끝+1이 배열 길이와 같을 수 있으므로 뒤에 한 칸 추가 (결과에는 쓰이지 않음)
+    padded = np.append(values, values[-1])
+    indices = np.empty(2 * len(starts), dtype=np.int64)
+    indices[0::2] = starts
+    indices[1::2] = np.asarray(ends, dtype=np.int64) + 1
+    return ufunc.reduceat(padded, indices)[0::2]
+
+
+def segment_first_match(values, targets, starts, ends) -> np.ndarray:
+    """구간별 values == targets[i]인 첫 행 번호 (구간 최고가/최저가 날짜용)"""
+    values = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    owner, rows = segment_rows(starts, ends)
+    hits = values[rows] == np.asarray(targets)[owner]
+    first_owner, first = np.unique(owner[hits], return_index=True)
+    result = np.full(len(starts), -1, dtype=np.int64)
+    result[first_owner] = rows[hits][first]
+    return result
+
+
+@dataclass
+class BlockRanges:
+    """블록별 기간 계산 결과 (입력 시작일 순서, 시작일이 시계열에 없으면 end_row = -1)"""
+
+    start_row: np.ndarray
+    end_row: np.ndarray
+    reason: np.ndarray
+    high: np.ndarray
+    high_row: np.ndarray
+    low: np.ndarray
+    low_row: np.ndarray
+    avg_volume: np.ndarray
+    ma_at_start: np.ndarray
+    ma_at_end: np.ndarray
+    breakout_run: np.ndarray   # 기간 안 D일 고가 위 최장 연속 종가 일수
+    breakout_row: np.ndarray   # D일 고가 위 종가가 hold_days일 연속 채워진 첫 행 (-1 = 미확인)
+    support_hold: np.ndarray   # D+1부터 D일 저가 이상으로 이어진 연속 종가 일수
+
+
+def block_ranges(df: pd.DataFrame, start_dates, ma_period: int = 60, hold_days: int = 14) -> BlockRanges:
+    """
+    블록 시작일들의 기간 일괄 계산
+
+    종료일: 시작일 다음 거래일부터 처음으로 저가 <= 60이평 (터치) 또는 종가 < 60이평 (하방이탈)인 날,
+    아직 회귀하지 않았으면 마지막 거래일 (진행중). 이평은 종가 기준, 현재 행 포함.
+    돌파 확인/지지 유지는 D+1 ~ 종료일 구간에서 run_kernels 연속 판정.
+
+    Args:
+        df: 날짜 인덱스 DataFrame (price_frame_from_rows 형식) - 시작일 이전 ma_period 거래일 포함 권장
+        start_dates: 블록 D일 배열
+        hold_days: 돌파 확인 연속 일수 (D일 고가 위 종가)
+    """
+    dates = df.index.values.astype('datetime64[D]')
+    starts_d = np.asarray(start_dates, dtype='datetime64[D]')
+    k = len(starts_d)
+    n = len(df)
+
+    start_row = np.searchsorted(dates, starts_d)
+    found = (start_row < n)
+    found[found] = dates[start_row[found]] == starts_d[found]
+
+    close = df['close'].to_numpy(dtype=np.float64)
+    low = df['low'].to_numpy(dtype=np.float64)
+    high = df['high'].to_numpy(dtype=np.float64)
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    ma = moving_average(close, ma_period)
+
+    # NaN 이평(데이터 부족)은 비교가 False → 회귀로 보지 않음
+    broken = close < ma
+    touched = low <= ma
+    following = next_true(broken | touched)
+
+    # 시작일 다음 행부터 첫 회귀 (마지막 행에서 시작하면 회귀 없음)
+    s = start_row[found]
+    e = np.full(len(s), -1, dtype=np.int64)
+    has_next = s + 1 < n
+    e[has_next] = following[s[has_next] + 1]
+    closed = e >= 0
+    reasons = np.full(len(s), RangeEndReason.OPEN.value, dtype=object)
+    reasons[closed] = np.where(broken[e[closed]], RangeEndReason.BREAK.value, RangeEndReason.TOUCH.value)
+    e[~closed] = n - 1
+
+    end_row = np.full(k, -1, dtype=np.int64)
+    end_row[found] = e
+    reason = np.full(k, None, dtype=object)
+    reason[found] = reasons
+
+    result = BlockRanges(
+        start_row=np.where(found, start_row, -1),
+        end_row=end_row,
+        reason=reason,
+        high=np.full(k, np.nan), high_row=np.full(k, -1, dtype=np.int64),
+        low=np.full(k, np.nan), low_row=np.full(k, -1, dtype=np.int64),
+        avg_volume=np.full(k, np.nan),
+        ma_at_start=np.full(k, np.nan), ma_at_end=np.full(k, np.nan),
+        breakout_run=np.zeros(k, dtype=np.int64), breakout_row=np.full(k, -1, dtype=np.int64),
+        support_hold=np.zeros(k, dtype=np.int64),
+    )
+    if not found.any():
+        return result
+
+    result.high[found] = segment_reduce(np.maximum, high, s, e)
+    result.low[found] = segment_reduce(np.minimum, low, s, e)
+    result.avg_volume[found] = segment_reduce(np.add, volume, s, e) / (e - s + 1)
+    result.high_row[found] = segment_first_match(high, result.high[found], s, e)
+    result.low_row[found] = segment_first_match(low, result.low[found], s, e)
+    result.ma_at_start[found] = ma[s]
+    result.ma_at_end[found] = ma[e]
+
+    breakout = runs_above(close, high[s], s + 1, e, min_length=hold_days)
+    result.breakout_run[found] = breakout.longest
+    result.breakout_row[found] = breakout.completed
+    result.support_hold[found] = runs_above(close, low[s], s + 1, e, inclusive=True).leading
+    return result
+
+
+def range_fields(df: pd.DataFrame, ranges: BlockRanges) -> List[Dict]:
+    """BlockRanges → volume_blocks 범위 컬럼 값 (시작일이 시계열에 없는 블록은 빈 dict)"""
+    dates = df.index.date
+    fields = []
+    for i in range(len(ranges.start_row)):
+        start, end = ranges.start_row[i], ranges.end_row[i]
+        if start < 0:
+            fields.append({})
+            continue
+        fields.append({
+            'range_end_date': dates[end],
+            'range_duration_days': (dates[end] - dates[start]).days,
+            'range_high': float(ranges.high[i]),
+            'range_high_date': dates[ranges.high_row[i]],
+            'range_low': float(ranges.low[i]),
+            'range_low_date': dates[ranges.low_row[i]],
+            'range_avg_volume': int(round(ranges.avg_volume[i])),
+            'ma60_at_start': None if np.isnan(ranges.ma_at_start[i]) else float(ranges.ma_at_start[i]),
+            'ma60_at_end': None if np.isnan(ranges.ma_at_end[i]) else float(ranges.ma_at_end[i]),
+            'range_end_reason': ranges.reason[i],
+            'breakout_run_days': int(ranges.breakout_run[i]),
+            'breakout_confirmed_date': dates[ranges.breakout_row[i]] if ranges.breakout_row[i] >= 0 else None,
+            'support_hold_days': int(ranges.support_hold[i]),
+        })
+    return fields
@@ -0,0 +1,119 @@
+"""
+Run Kernels
+연속 구간(런) 길이 일괄 계산 (누적합/차분 런 길이 인코딩 - "N일 연속 종가 > 기준가" 류 판정)
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+
+def run_lengths(mask, resets=None) -> np.ndarray:
+    """
+    각 행에서 끝나는 True 연속 길이 (False 행은 0)
+
+    누적합에서 마지막 끊긴 지점의 누적합을 빼는 방식 - resets가 True인 행은 새 구간 시작으로 보고
+    그 앞의 런과 잇지 않음 (여러 구간을 이어 붙인 배열용).
+    """
+    mask = np.asarray(mask, dtype=bool)
+    counts = np.cumsum(mask, dtype=np.int64)
+    breaks = ~mask
+    if resets is not None:
+        breaks = breaks | np.asarray(resets, dtype=bool)
+    # 끊긴 행의 "그 행 직전까지 누적합" (False 행은 자기 누적합, 구간 시작 True 행은 누적합 - 1)
+    base = np.where(breaks, counts - mask, 0)
+    return counts - np.maximum.accumulate(base)
+
+
+def segment_rows(starts, ends) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    구간 [starts[i], ends[i]] (양끝 포함) 펼치기 → (구간 번호, 행 번호) [구간 길이 합]
+
+    빈 구간(ends < starts)은 행이 없음. 구간이 겹쳐도 됨.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.maximum(np.asarray(ends, dtype=np.int64) - starts + 1, 0)
+    owner = np.repeat(np.arange(len(starts)), lengths)
+    offsets = np.cumsum(lengths) - lengths
+    rows = np.repeat(starts, lengths) + (np.arange(int(lengths.sum())) - np.repeat(offsets, lengths))
+    return owner, rows
+
+
+@dataclass
+class RunStats:
+    """구간별 런 통계 (입력 구간 순서, 런이 없으면 길이 0 / 행 -1)"""
+
+    longest: np.ndarray       # 구간 안 최장 연속 길이
+    longest_end: np.ndarray   # 최장 런이 처음 끝나는 행
+    leading: np.ndarray       # 구간 첫 행부터 이어지는 연속 길이
+    completed: np.ndarray     # 연속 min_length개가 처음 채워진 행 (min_length 미지정이면 -1)
+
+
+def segment_runs(mask, starts, ends, min_length: int = 0) -> RunStats:
+    """
+    종목 시계열 하나(또는 이어 붙인 여러 종목)의 조건 mask에 대해 여러 구간의 런 통계 일괄 계산
+
+    구간들을 펼친 뒤 구간 시작마다 끊어 run_lengths 한 번 → 최장/선두/첫 완성은 구간별 축약.
+
+    Args:
+        mask: 조건 [n]
+        starts / ends: 구간 행 번호 [k] (양끝 포함, 빈 구간 가능)
+        min_length: 첫 완성 행을 찾을 연속 길이 (0이면 생략)
+    """
+    mask = np.asarray(mask, dtype=bool)
+    k = len(np.asarray(starts))
+    owner, rows = segment_rows(starts, ends)
+    return _runs_by_owner(mask[rows], owner, rows, k, min_length)
+
+
+def runs_above(values, levels, starts, ends, min_length: int = 0, inclusive: bool = False) -> RunStats:
+    """
+    구간별 기준가가 다른 "values > levels[i]" (inclusive면 >=) 연속 판정
+
+    Args:
+        values: 종가 등 [n] (NaN은 조건 불충족)
+        levels: 구간별 기준가 [k] (NaN이면 런 없음)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    levels = np.asarray(levels, dtype=np.float64)
+    owner, rows = segment_rows(starts, ends)
+    above = values[rows] >= levels[owner] if inclusive else values[rows] > levels[owner]
+    return _runs_by_owner(above, owner, rows, len(levels), min_length)
+
+
+def _runs_by_owner(hits, owner, rows, k: int, min_length: int) -> RunStats:
+    stats = RunStats(
+        longest=np.zeros(k, dtype=np.int64),
+        longest_end=np.full(k, -1, dtype=np.int64),
+        leading=np.zeros(k, dtype=np.int64),
+        completed=np.full(k, -1, dtype=np.int64),
+    )
+    if len(rows) == 0:
+        return stats
+
+    seg_start = np.ones(len(owner), dtype=bool)
+    seg_start[1:] = owner[1:] != owner[:-1]
+    runs = run_lengths(hits, seg_start)
+    present = owner[seg_start]
+    offsets = np.flatnonzero(seg_start)
+
+    longest = np.maximum.reduceat(runs, offsets)
+    stats.longest[present] = longest
+    # 최장 런 끝 행: 구간별 run == longest인 첫 위치
+    at_longest = (runs == np.repeat(longest, np.diff(np.append(offsets, len(runs))))) & (runs > 0)
+    first_owner, first = np.unique(owner[at_longest], return_index=True)
+    stats.longest_end[first_owner] = rows[at_longest][first]
+
+    # 선두 런: 구간 첫 False 이전까지 (False가 없으면 구간 전체)
+    broken = ~hits
+    lengths = np.bincount(owner, minlength=k)
+    stats.leading[present] = lengths[present]
+    broken_owner, first_broken = np.unique(owner[broken], return_index=True)
+    stats.leading[broken_owner] = np.flatnonzero(broken)[first_broken] - offsets[np.searchsorted(present, broken_owner)]
+
+    if min_length > 0:
+        done = runs >= min_length
+        done_owner, first_done = np.unique(owner[done], return_index=True)
+        stats.completed[done_owner] = rows[done][first_done]
+    return stats
@@ -0,0 +1,92 @@
+"""
+Support Kernels
+2번 블록 지지선(S1/S2/S3) 일괄 계산 (종목 시계열당 이동평균 1회 + 날짜 인덱스 조회)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from domain.services.detection_kernels import lookup_by_date
+from domain.services.range_kernels import moving_average
+
+
+def support_labels(ma_period: int = 60) -> Dict[int, str]:
+    """지지선 번호 → 표시 레이블"""
+    return {1: 'S1 (Block2 Low)', 2: 'S2 (Block1 Body)', 3: f'S3 (MA{ma_period})'}
+
+
+def support_input_key(block_2_date, block_1_date, ma_period: int = 60) -> str:
+    """
+    지지선 입력 키 - 2번 블록 날짜 | 부모 1번 블록 날짜 | 이평 기간
+
+    저장된 키와 다르면(블록 재탐지로 부모가 바뀌거나 이평 설정 변경) 다시 계산.
+    """
+    return f"{block_2_date}|{block_1_date or ''}|{ma_period}"
+
+
+@dataclass
+class SupportLevels:
+    """2번 블록별 지지선 가격 (입력 블록 순서, 해당 날짜 시세가 없으면 NaN)"""
+
+    s1: np.ndarray  # 2번 블록 D일 저가
+    s2: np.ndarray  # 1번 블록 D일 몸통 하단 min(시가, 종가)
+    s3: np.ndarray  # 2번 블록 D일 이동평균
+
+    def levels(self, i: int) -> Dict[int, float]:
+        """i번째 블록의 {지지선 번호: 가격} (NaN 제외)"""
+        values = {1: self.s1[i], 2: self.s2[i], 3: self.s3[i]}
+        return {level: float(price) for level, price in values.items() if not np.isnan(price)}
+
+
+def support_levels(
+    df: pd.DataFrame,
+    block_2_dates,
+    block_1_dates,
+    ma_period: int = 60
+) -> SupportLevels:
+    """
+    종목 1개의 모든 2번 블록 지지선 일괄 계산
+
+    Args:
+        df: 날짜 인덱스 OHLC DataFrame (오름차순, 첫 블록 이전 ma_period 거래일 포함)
+        block_2_dates: 2번 블록 날짜 [k]
+        block_1_dates: 부모 1번 블록 날짜 [k] (없으면 None/NaT → S2 NaN)
+    """
+    dates = df.index.values.astype('datetime64[D]')
+    block_2_dates = np.asarray(block_2_dates, dtype='datetime64[D]')
+    block_1_dates = np.asarray(
+        [np.datetime64('NaT') if d is None else d for d in block_1_dates], dtype='datetime64[D]'
+    )
+
+    body_low = np.minimum(df['open'].to_numpy(dtype=np.float64), df['close'].to_numpy(dtype=np.float64))
+    ma = moving_average(df['close'].to_numpy(dtype=np.float64), ma_period)
+
+    return SupportLevels(
+        s1=lookup_by_date(block_2_dates, dates, df['low'].to_numpy(dtype=np.float64)),
+        s2=lookup_by_date(block_1_dates, dates, body_low),
+        s3=lookup_by_date(block_2_dates, dates, ma),
+    )
+
+
+def support_rows(
+    block_ids,
+    levels: SupportLevels,
+    input_keys,
+    ma_period: int = 60
+) -> List[Dict]:
+    """지지선 계산 결과 → support_levels 저장 행"""
+    labels = support_labels(ma_period)
+    rows = []
+    for i, (block_id, input_key) in enumerate(zip(block_ids, input_keys)):
+        for level, price in levels.levels(i).items():
+            rows.append({
+                'block_id': int(block_id),
+                'level_number': level,
+                'price': price,
+                'label': labels[level],
+                'input_key': input_key,
+            })
+    return rows
@@ -0,0 +1,263 @@
+"""
+Sweep Kernels
+블록 조건 파라미터 그리드 일괄 평가 (종목별 피처 1회 계산 + 브로드캐스트 비교)
+"""
+
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.config import SWEEP_CONFIG
+from domain.services.detection_kernels import rolling_max_by_days, window_bounds
+
+# StockSweep 배열 축 순서: T(거래대금) × L(조회 기간) × R(거래량 비율) × W(2번 블록 간격) × H(수익률 기간)
+GRID_AXES = ('min_trading_value', 'lookback_days', 'volume_ratio', 'block2_window')
+
+
+@dataclass(frozen=True)
+class SweepGrid:
+    """파라미터 그리드 (축별 후보값)"""
+
+    min_trading_values: Tuple[float, ...]
+    lookback_days: Tuple[int, ...]
+    volume_ratios: Tuple[float, ...]
+    block2_windows: Tuple[int, ...]
+    return_horizons: Tuple[int, ...] = (20, 60, 120)
+
+    @classmethod
+    def from_config(cls, **overrides) -> 'SweepGrid':
+        """SWEEP_CONFIG 기본값 (축별 덮어쓰기 가능)"""
+        values = {key: tuple(overrides.get(key, SWEEP_CONFIG[key])) for key in (
+            'min_trading_values', 'lookback_days', 'volume_ratios', 'block2_windows', 'return_horizons'
+        )}
+        return cls(**values)
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        return (len(self.min_trading_values), len(self.lookback_days),
+                len(self.volume_ratios), len(self.block2_windows))
+
+    def combinations(self) -> pd.DataFrame:
+        """전체 조합 (StockSweep 배열을 C 순서로 펼친 순서와 같음)"""
+        return pd.DataFrame(
+            list(product(self.min_trading_values, self.lookback_days, self.volume_ratios, self.block2_windows)),
+            columns=list(GRID_AXES)
+        )
+
+
+@dataclass
+class StockSweep:
+    """
+    종목별 스윕 집계 (종목 간 덧셈으로 합산)
+
+    - blocks_1 [T, L]: 1번 블록 수
+    - blocks_2 [T, L, R, W]: 2번 블록 수 (1번 블록별 구간 내 조건 충족 행 수의 합)
+    - confirmed [T, L, R, W]: 2번 블록이 1개 이상인 1번 블록 수
+    - return_* [..., H]: 1번 블록일 종가 기준 H거래일 후 수익률 합계/유효 건수/상승 건수
+      (b1_* 는 1번 블록 전체, 나머지는 확인된 1번 블록)
+    - block_dates: {(t, l): 1번 블록 날짜 배열} (collect_blocks=True일 때)
+    """
+
+    blocks_1: np.ndarray
+    blocks_2: np.ndarray
+    confirmed: np.ndarray
+    b1_return_sum: np.ndarray
+    b1_return_count: np.ndarray
+    b1_win_count: np.ndarray
+    return_sum: np.ndarray
+    return_count: np.ndarray
+    win_count: np.ndarray
+    block_dates: Dict[Tuple[int, int], np.ndarray] = field(default_factory=dict)
+
+    SUMMABLE = (
+        'blocks_1', 'blocks_2', 'confirmed',
+        'b1_return_sum', 'b1_return_count', 'b1_win_count',
+        'return_sum', 'return_count', 'win_count',
+    )
+
+    @classmethod
+    def zeros(cls, grid: SweepGrid) -> 'StockSweep':
+        t, l, r, w = grid.shape
+        h = len(grid.return_horizons)
+        return cls(
+            blocks_1=np.zeros((t, l), dtype=np.int64),
+            blocks_2=np.zeros((t, l, r, w), dtype=np.int64),
+            confirmed=np.zeros((t, l, r, w), dtype=np.int64),
+            b1_return_sum=np.zeros((t, l, h)),
+            b1_return_count=np.zeros((t, l, h), dtype=np.int64),
+            b1_win_count=np.zeros((t, l, h), dtype=np.int64),
+            return_sum=np.zeros((t, l, r, w, h)),
+            return_count=np.zeros((t, l, r, w, h), dtype=np.int64),
+            win_count=np.zeros((t, l, r, w, h), dtype=np.int64),
+        )
+
+    def add(self, other: 'StockSweep'):
+        """다른 종목 집계 누적 (block_dates는 제외)"""
+        for name in self.SUMMABLE:
+            getattr(self, name).__iadd__(getattr(other, name))
+
+
+def forward_returns(close, horizons: Sequence[int]) -> np.ndarray:
+    """
+    H거래일 후 수익률 [n, H] (데이터가 없으면 NaN)
+    """
+    close = np.asarray(close, dtype=np.float64)
+    n = len(close)
+    returns = np.full((n, len(horizons)), np.nan)
+    for j, h in enumerate(horizons):
+        if h < n:
+            returns[:n - h, j] = close[h:] / close[:n - h] - 1.0
+    return returns
+
+
+def block_2_counts(
+    dates,
+    volume,
+    rows: np.ndarray,
+    volume_ratios: Sequence[float],
+    windows: Sequence[int]
+) -> np.ndarray:
+    """
+    후보 행별 2번 블록 수 [R, W, k]
+
+    행 rows[j]를 1번 블록으로 볼 때 (날짜, 날짜 + W일] 구간에서
+    거래량 / 1번 블록 거래량 >= R 인 행 수 (BlockDetector 2번 블록 조건과 동일, 거래대금 조건 제외)
+    """
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    volume = np.asarray(volume, dtype=np.float64)
+    ratios_grid = np.asarray(volume_ratios, dtype=np.float64)
+    counts = np.zeros((len(ratios_grid), len(windows), len(rows)), dtype=np.int64)
+    if len(rows) == 0:
+        return counts
+
+    starts = dates[rows]
+    for w, days in enumerate(windows):
+        lo, hi = window_bounds(dates, starts, starts + np.timedelta64(days, 'D'))
+        lengths = hi - lo
+        total = int(lengths.sum())
+        if total == 0:
+            continue
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        flat_rows = np.repeat(lo, lengths) + (np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths))
+        ratios = volume[flat_rows] / volume[rows][owner]
+        hits = ratios[None, :] >= ratios_grid[:, None]  # [R, total]
+        for r in range(len(ratios_grid)):
+            counts[r, w] = np.bincount(owner, weights=hits[r], minlength=len(rows)).astype(np.int64)
+    return counts
+
+
+def sweep_stock(
+    df: pd.DataFrame,
+    grid: SweepGrid,
+    end_date=None,
+    collect_blocks: bool = False
+) -> StockSweep:
+    """
+    종목 1개의 전체 그리드 평가
+
+    피처(조회 기간별 롤링 최대 거래량, 거래대금, 사후 수익률, 2번 블록 수)를 한 번씩만 계산하고
+    조합 판정은 [T, L, k] 마스크와 [R, W, k] 카운트의 축약(einsum)으로 처리.
+
+    Args:
+        df: 날짜 인덱스 DataFrame (BlockDetector._load_price_frame 형식),
+            1번 블록 종료일 + 최대 2번 블록 간격까지 포함
+        end_date: 1번 블록 종료일 (None이면 마지막 행)
+    """
+    result = StockSweep.zeros(grid)
+    if df.empty:
+        return result
+
+    dates = df.index.values.astype('datetime64[D]')
+    volume = df['volume'].to_numpy(dtype=np.float64)
+    trading_value = df['trading_value'].to_numpy(dtype=np.float64)
+
+    # 1번 블록 구간 (end_date 이하)
+    n_block_1 = len(df) if end_date is None else int(np.searchsorted(
+        df.index.values, np.datetime64(pd.Timestamp(end_date)), side='right'
+    ))
+    if n_block_1 == 0:
+        return result
+
+    # [L, n] 거래량 조건 / [T, n] 거래대금 조건 (NaN 거래대금은 통과 - block_1_mask와 동일)
+    volume_ok = np.stack([
+        volume[:n_block_1] >= rolling_max_by_days(df.index[:n_block_1], volume[:n_block_1], days)
+        for days in grid.lookback_days
+    ])
+    min_values = np.asarray(grid.min_trading_values, dtype=np.float64)
+    value_ok = ~(trading_value[None, :n_block_1] < min_values[:, None])
+
+    # 어느 조합에서든 1번 블록인 행만 후보로 축소
+    candidates = np.flatnonzero(volume_ok.any(axis=0) & value_ok.any(axis=0))
+    if len(candidates) == 0:
+        return result
+
+    block_1 = (value_ok[:, None, candidates] & volume_ok[None, :, candidates]).astype(np.int64)  # [T, L, k]
+    counts = block_2_counts(dates, volume, candidates, grid.volume_ratios, grid.block2_windows)  # [R, W, k]
+    has_block_2 = (counts > 0).astype(np.int64)
+
+    returns = forward_returns(df['close'].to_numpy(), grid.return_horizons)[candidates]  # [k, H]
+    valid = (~np.isnan(returns)).astype(np.int64)
+    wins = (returns > 0).astype(np.int64)
+    returns = np.nan_to_num(returns, nan=0.0)
+
+    result.blocks_1 = block_1.sum(axis=-1)
+    result.blocks_2 = np.einsum('tlk,rwk->tlrw', block_1, counts)
+    result.confirmed = np.einsum('tlk,rwk->tlrw', block_1, has_block_2)
+    result.b1_return_sum = np.einsum('tlk,kh->tlh', block_1, returns)
+    result.b1_return_count = np.einsum('tlk,kh->tlh', block_1, valid)
+    result.b1_win_count = np.einsum('tlk,kh->tlh', block_1, wins)
+    result.return_sum = np.einsum('tlk,rwk,kh->tlrwh', block_1, has_block_2, returns)
+    result.return_count = np.einsum('tlk,rwk,kh->tlrwh', block_1, has_block_2, valid)
+    result.win_count = np.einsum('tlk,rwk,kh->tlrwh', block_1, has_block_2, wins)
+
+    if collect_blocks:
+        t_len, l_len = grid.shape[:2]
+        result.block_dates = {
+            (t, l): dates[candidates[block_1[t, l].astype(bool)]]
+            for t in range(t_len) for l in range(l_len)
+        }
+    return result
+
+
+def summarize(grid: SweepGrid, total: StockSweep) -> pd.DataFrame:
+    """
+    조합별 요약표 (combinations() 순서)
+
+    columns: 그리드 축 + blocks_1, blocks_2, confirmed, confirm_rate,
+             b1_mean_return_{H}, mean_return_{H}, win_rate_{H}
+    """
+    t, l, r, w = grid.shape
+    table = grid.combinations()
+
+    blocks_1 = np.broadcast_to(total.blocks_1[:, :, None, None], (t, l, r, w)).ravel()
+    table['blocks_1'] = blocks_1
+    table['blocks_2'] = total.blocks_2.ravel()
+    table['confirmed'] = total.confirmed.ravel()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        table['confirm_rate'] = np.where(blocks_1 > 0, table['confirmed'] / blocks_1, np.nan)
+        for j, h in enumerate(grid.return_horizons):
+            b1_sum = np.broadcast_to(total.b1_return_sum[:, :, None, None, j], (t, l, r, w)).ravel()
+            b1_count = np.broadcast_to(total.b1_return_count[:, :, None, None, j], (t, l, r, w)).ravel()
+            count = total.return_count[..., j].ravel()
+            table[f'b1_mean_return_{h}'] = np.where(b1_count > 0, b1_sum / b1_count, np.nan)
+            table[f'mean_return_{h}'] = np.where(count > 0, total.return_sum[..., j].ravel() / count, np.nan)
+            table[f'win_rate_{h}'] = np.where(count > 0, total.win_count[..., j].ravel() / count, np.nan)
+    return table
+
+
+def sensitivity(table: pd.DataFrame, axis: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    한 축의 값별 평균 (나머지 축 평균) - 그리드에서 파라미터 하나가 결과에 주는 영향
+
+    Args:
+        axis: GRID_AXES 중 하나
+        columns: 집계할 열 (None이면 블록 수/확인율/수익률 전체)
+    """
+    if axis not in GRID_AXES:
+        raise ValueError(f"Unknown sweep axis: {axis}")
+    if columns is None:
+        columns = [c for c in table.columns if c not in GRID_AXES]
+    return table.groupby(axis)[columns].mean()
@@ -15,9 +15,12 @@ from .database import (
 from .repositories import (
     SQLAlchemyStockRepository,
     SQLAlchemyPriceDataRepository,
-    SQLAlchemyBlockRepository
+    SQLAlchemyBlockRepository,
+    CachedPriceDataRepository
 )
 
+from .cache import LRUCache, price_series_cache
+
 __all__ = [
     # Database
     "DatabaseManager",
@@ -31,4 +34,9 @@ __all__ = [
     "SQLAlchemyStockRepository",
     "SQLAlchemyPriceDataRepository",
     "SQLAlchemyBlockRepository",
+    "CachedPriceDataRepository",
+
+    # Cache
+    "LRUCache",
+    "price_series_cache",
 ]
@@ -0,0 +1,33 @@
+"""
+Cache Infrastructure
+인메모리 캐시 (주가/지수 시계열 등)
+"""
+
+from core.config import CACHE_CONFIG
+
+from .lru_cache import LRUCache, CacheStats
+
+# 종목별 전체 주가 시계열 캐시 (key: stock_id, value: PriceSeries)
+# Repository/수집기 쓰기 시 invalidate(stock_id)로 무효화
+price_series_cache = LRUCache(
+    max_bytes=CACHE_CONFIG['price_series_max_bytes'],
+    name="price_cache"
+)
+
+# DB 기반 탐지 결과 캐시 (models → database → snapshot이 price_series_cache를 참조하므로 뒤에서 import)
+from .detection_result_cache import DetectionResultCache, detection_settings_hash
+from .index_series_cache import IndexSeries, IndexSeriesCache
+
+# 시장 지수 종가 시계열 (수집기가 지수 시세 저장 시 invalidate)
+index_series_cache = IndexSeriesCache()
+
+__all__ = [
+    "LRUCache",
+    "CacheStats",
+    "price_series_cache",
+    "DetectionResultCache",
+    "detection_settings_hash",
+    "IndexSeries",
+    "IndexSeriesCache",
+    "index_series_cache",
+]
@@ -0,0 +1,198 @@
+"""
+Detection Result Cache
+설정 지문 + 데이터 워터마크 기반 블록 탐지 결과 캐시 (detection_results 테이블)
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import delete, func, select
+from sqlalchemy.engine import Engine
+
+from core.config import BLOCK_CRITERIA
+from core.enums import NewHighGrade, PatternType
+from domain.services.detection_params import DetectionParams
+from infrastructure.database.batch import upsert_rows
+from infrastructure.database.models import DetectionResult, InvestorTrading, PriceData
+
+logger = logging.getLogger(__name__)
+
+# (blocks_1, blocks_2, blocks_3, blocks_4)
+CachedBlocks = Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]
+
+_BLOCK_KEYS = ('blocks_1', 'blocks_2', 'blocks_3', 'blocks_4')
+
+# 같은 (종목, 설정 지문) 재저장 시 덮어쓰는 컬럼
+_CACHE_FIELDS = ('watermark', 'blocks_1_count', 'blocks_2_count', 'blocks', 'created_at')
+
+
+def detection_settings_hash(settings: Optional[Dict], start_date, end_date) -> str:
+    """
+    탐지 설정 + 기간의 정규화 지문
+
+    UI 토글처럼 탐지 결과에 영향이 없는 키나 조건 비활성화 표현(None/0) 차이는
+    DetectionParams로 정규화되어 같은 지문이 됨.
+    """
+    from services.block_detector import BlockDetector
+
+    payload = json.dumps({
+        'params': DetectionParams.for_block_detector(settings).fingerprint(),
+        'block_3_4': BlockDetector.block_3_4_enabled(settings),
+        'start': pd.Timestamp(start_date).date().isoformat(),
+        'end': pd.Timestamp(end_date).date().isoformat(),
+    }, sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _encode_block(block: Dict) -> Dict:
+    encoded = dict(block)
+    encoded['date'] = block['date'].isoformat()
+    if block.get('parent_date') is not None:
+        encoded['parent_date'] = block['parent_date'].isoformat()
+    for key in ('new_high_grade', 'pattern_type'):
+        if encoded.get(key) is not None:
+            encoded[key] = encoded[key].value
+    return encoded
+
+
+def _decode_block(data: Dict) -> Dict:
+    block = dict(data)
+    block['date'] = date.fromisoformat(data['date'])
+    if data.get('parent_date') is not None:
+        block['parent_date'] = date.fromisoformat(data['parent_date'])
+    if block.get('new_high_grade') is not None:
+        block['new_high_grade'] = NewHighGrade(block['new_high_grade'])
+    if block.get('pattern_type') is not None:
+        block['pattern_type'] = PatternType(block['pattern_type'])
+    return block
+
+
+class DetectionResultCache:
+    """
+    블록 탐지 결과 캐시
+
+    - 키: (종목, detection_settings_hash) - 설정을 바꿨다가 되돌리면 이전 결과 재사용
+    - 워터마크: 탐지 구간(시작일 ~ 종료일 + 2번/3번 블록 최대 간격) 주가의 행 수/첫날/마지막날/
+      거래량 합계/고가 합계 + 같은 구간 수급의 행 수/마지막날/INVESTOR_COLUMNS 합계
+      → 수집/가져오기로 데이터가 바뀐 종목만 무효화
+    - 결과 block dict는 BlockDetector 결과 형식 그대로 복원
+
+    Usage:
+        cache = DetectionResultCache(engine)
+        key = detection_settings_hash(settings, start, end)
+        marks = cache.watermarks(start, end)
+        hits = cache.get_many(key, marks)
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def ensure_table(self):
+        DetectionResult.__table__.create(self.engine, checkfirst=True)
+
+    def watermarks(self, start_date, end_date, horizon_days: Optional[int] = None) -> Dict[int, str]:
+        """
+        종목별 데이터 워터마크 (주가/수급 GROUP BY 집계 각 한 번)
+
+        Args:
+            horizon_days: 종료일 이후 포함 기간 (None이면 2번 블록 최대 간격)
+
+        Returns:
+            {stock_id: watermark} - 구간에 데이터가 없는 종목은 없음
+        """
+        from services.block_detector import INVESTOR_COLUMNS
+
+        if horizon_days is None:
+            horizon_days = BLOCK_CRITERIA['block_2']['max_days_from_block1']
+        start = pd.Timestamp(start_date).date()
+        end = pd.Timestamp(end_date).date() + timedelta(days=horizon_days)
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(
+                    PriceData.stock_id,
+                    func.count(),
+                    func.min(PriceData.date),
+                    func.max(PriceData.date),
+                    func.sum(PriceData.volume),
+                    func.total(PriceData.high),
+                    func.total(PriceData.close),
+                    # 수집기가 기존 행의 거래대금을 채우는 경우 (1번 블록 조건) 반영
+                    func.total(PriceData.trading_value)
+                )
+                .where(PriceData.date >= start, PriceData.date <= end)
+                .group_by(PriceData.stock_id)
+            ).all()
+            # 3/4번 블록 quality_score는 수급 데이터로 계산 → 수급만 바뀐 종목도 무효화
+            investor_rows = conn.execute(
+                select(
+                    InvestorTrading.stock_id,
+                    func.count(),
+                    func.max(InvestorTrading.date),
+                    *(func.total(getattr(InvestorTrading, name)) for name in INVESTOR_COLUMNS)
+                )
+                .where(InvestorTrading.date >= start, InvestorTrading.date <= end)
+                .group_by(InvestorTrading.stock_id)
+            ).all()
+
+        investor = {stock_id: ':'.join(repr(value) for value in aggregates)
+                    for stock_id, *aggregates in investor_rows}
+        return {
+            stock_id: f"{count}:{first}:{last}:{volume}:{high_total!r}:{close_total!r}:{value_total!r}"
+                      f"|{investor.get(stock_id, '0')}"
+            for stock_id, count, first, last, volume, high_total, close_total, value_total in rows
+        }
+
+    def get_many(self, settings_hash: str, watermarks: Dict[int, str]) -> Dict[int, CachedBlocks]:
+        """워터마크가 일치하는 종목의 캐시된 (blocks_1, blocks_2, blocks_3, blocks_4)"""
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(DetectionResult.stock_id, DetectionResult.watermark, DetectionResult.blocks)
+                .where(DetectionResult.settings_hash == settings_hash)
+            ).all()
+
+        hits = {}
+        for stock_id, watermark, blocks in rows:
+            if watermarks.get(stock_id) != watermark:
+                continue
+            payload = json.loads(blocks)
+            hits[stock_id] = tuple([_decode_block(b) for b in payload.get(key, [])] for key in _BLOCK_KEYS)
+        return hits
+
+    @staticmethod
+    def put_many(conn, settings_hash: str, entries: List[Tuple]):
+        """
+        결과 upsert (호출자의 트랜잭션에서 executemany)
+
+        Args:
+            entries: [(stock_id, watermark, blocks_1, blocks_2[, blocks_3, blocks_4]), ...]
+        """
+        now = datetime.now()
+        upsert_rows(conn, DetectionResult, ('stock_id', 'settings_hash'), _CACHE_FIELDS, [
+            {
+                'stock_id': stock_id,
+                'settings_hash': settings_hash,
+                'watermark': watermark,
+                'blocks_1_count': len(blocks[0]),
+                'blocks_2_count': len(blocks[1]),
+                'blocks': json.dumps({
+                    key: [_encode_block(b) for b in values] for key, values in zip(_BLOCK_KEYS, blocks)
+                }, separators=(',', ':')),
+                'created_at': now,
+            }
+            for stock_id, watermark, *blocks in entries
+        ])
+
+    def invalidate(self, stock_id: Optional[int] = None) -> int:
+        """캐시 삭제 (stock_id가 None이면 전체)"""
+        statement = delete(DetectionResult)
+        if stock_id is not None:
+            statement = statement.where(DetectionResult.stock_id == stock_id)
+        with self.engine.begin() as conn:
+            removed = conn.execute(statement).rowcount
+        logger.info(f"[DETECTION_CACHE] Invalidated {removed} entries")
+        return removed
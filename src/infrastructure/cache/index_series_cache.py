@@ -0,0 +1,94 @@
+"""
+Index Series Cache
+시장 지수 종가 시계열 공유 캐시 (지수별 읽기 전용 배열, 프로세스당 1회 로드)
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from domain.services.detection_kernels import lookup_by_date
+from infrastructure.database.models import IndexPrice
+
+
+@dataclass(frozen=True)
+class IndexSeries:
+    """지수 일별 종가 (날짜 오름차순, 읽기 전용 배열)"""
+
+    index_code: str
+    dates: np.ndarray  # datetime64[D]
+    close: np.ndarray  # float64
+
+    @classmethod
+    def from_rows(cls, index_code: str, rows) -> 'IndexSeries':
+        """(date, close) 행 → IndexSeries"""
+        dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+        close = np.array([row[1] for row in rows], dtype=np.float64)
+        order = np.argsort(dates, kind='stable')
+        dates, close = dates[order], close[order]
+        dates.setflags(write=False)
+        close.setflags(write=False)
+        return cls(index_code, dates, close)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.dates.nbytes + self.close.nbytes)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def close_at(self, dates) -> np.ndarray:
+        """주어진 날짜들의 지수 종가 (지수 데이터가 없는 날은 NaN)"""
+        return lookup_by_date(dates, self.dates, self.close)
+
+
+class IndexSeriesCache:
+    """
+    지수 시계열 캐시
+
+    - 지수당 전체 종가를 한 번만 읽어 불변 배열로 보관 (스레드 간 공유, 워커 프로세스에는 초기화 인자로 전달)
+    - 수집기가 지수 시세를 저장하면 invalidate()
+
+    Usage:
+        series = index_series_cache.get('KOSPI')
+        closes = series.close_at(stock_dates)
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self._engine = engine
+        self._series: Dict[str, IndexSeries] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def get(self, index_code: str) -> IndexSeries:
+        """지수 시계열 (처음 요청 시 DB에서 로드, 데이터가 없으면 빈 시계열)"""
+        with self._lock:
+            series = self._series.get(index_code)
+            if series is None:
+                with self.engine.connect() as conn:
+                    rows = conn.execute(
+                        select(IndexPrice.date, IndexPrice.close)
+                        .where(IndexPrice.index_code == index_code)
+                        .order_by(IndexPrice.date)
+                    ).all()
+                series = IndexSeries.from_rows(index_code, rows)
+                self._series[index_code] = series
+            return series
+
+    def invalidate(self, index_code: Optional[str] = None):
+        """캐시 삭제 (index_code가 None이면 전체)"""
+        with self._lock:
+            if index_code is None:
+                self._series.clear()
+            else:
+                self._series.pop(index_code, None)
@@ -0,0 +1,163 @@
+"""
+LRU Cache
+메모리(bytes) 한도 기반 스레드 안전 LRU 캐시
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from shared.utils.instrumentation import metrics
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    current_bytes: int = 0
+    max_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """적중률 (0~1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache:
+    """
+    bytes 예산 기반 LRU 캐시
+
+    - 항목 크기는 sizeof(value)로 계산 (기본: value.nbytes)
+    - 예산 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - 적중/실패/제거 카운터는 전역 metrics 레지스트리에 '<name>.*' 로 기록
+    - 키별 세대(generation): invalidate/clear 시 증가 → 로드 전에 읽은 세대로 put하면
+      로드 도중 무효화된 오래된 값은 저장하지 않음
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        name: str = "cache",
+        sizeof: Optional[Callable[[Any], int]] = None
+    ):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.name = name
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: int(getattr(value, 'nbytes', 0)))
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = CacheStats(max_bytes=max_bytes)
+        self._counter = itertools.count(1)
+        self._generations: Dict[Hashable, int] = {}
+        self._cleared_at = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """조회 (적중 시 최근 사용으로 갱신)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                metrics.increment(f"{self.name}.misses")
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            metrics.increment(f"{self.name}.hits")
+            return entry[0]
+
+    def generation(self, key: Hashable) -> int:
+        """키의 현재 세대 (마지막 invalidate/clear 시점)"""
+        with self._lock:
+            return max(self._generations.get(key, 0), self._cleared_at)
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> bool:
+        """
+        저장
+
+        Args:
+            generation: 값 로드 전에 읽은 generation(key) - 그 사이 무효화됐으면 저장하지 않음
+
+        Returns:
+            저장 여부 (단일 항목이 예산보다 크거나 세대가 바뀌었으면 저장하지 않음)
+        """
+        size = self._sizeof(value)
+
+        with self._lock:
+            if generation is not None and generation != self.generation(key):
+                return False
+
+            self._remove(key)
+
+            if size > self.max_bytes:
+                return False
+
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self._stats.evictions += 1
+                metrics.increment(f"{self.name}.evictions")
+
+            metrics.set(f"{self.name}.bytes", self._current_bytes)
+            return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """항목 무효화"""
+        with self._lock:
+            self._generations[key] = next(self._counter)
+            removed = self._remove(key)
+            if removed:
+                self._stats.invalidations += 1
+                metrics.increment(f"{self.name}.invalidations")
+                metrics.set(f"{self.name}.bytes", self._current_bytes)
+            return removed
+
+    def clear(self):
+        """전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._cleared_at = next(self._counter)
+            self._current_bytes = 0
+            metrics.set(f"{self.name}.bytes", 0)
+
+    def stats(self) -> CacheStats:
+        """현재 통계 스냅샷"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                invalidations=self._stats.invalidations,
+                entries=len(self._entries),
+                current_bytes=self._current_bytes,
+                max_bytes=self.max_bytes
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _remove(self, key: Hashable) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._current_bytes -= entry[1]
+        return True
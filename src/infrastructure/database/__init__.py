@@ -3,8 +3,17 @@ Database Infrastructure
 데이터베이스 연결 및 ORM 모델
 """
 
-from .connection import DatabaseManager, db_manager, get_session, init_database, reset_database
+from .connection import (
+    DatabaseManager, db_manager, get_session, init_database, reset_database, use_database, configure_database
+)
+from .batch import (
+    IN_CHUNK, chunks, lead_start, optional_float, replace_block_rows, select_in_chunks, update_by_id, upsert_rows
+)
+from .migrations import add_missing_columns, add_missing_indexes
 from .models import Base
+from .profiles import DatabaseProfile, add_database_argument
+from .price_summary import PriceSummaryStore, refresh_price_summary
+from .snapshot import SnapshotManager, SnapshotInfo, snapshot_before
 
 __all__ = [
     'DatabaseManager',
@@ -12,5 +21,24 @@ __all__ = [
     'get_session',
     'init_database',
     'reset_database',
+    'use_database',
+    'configure_database',
+    'DatabaseProfile',
+    'add_database_argument',
+    'add_missing_columns',
+    'add_missing_indexes',
+    'IN_CHUNK',
+    'chunks',
+    'select_in_chunks',
+    'lead_start',
+    'optional_float',
+    'update_by_id',
+    'upsert_rows',
+    'replace_block_rows',
     'Base',
+    'PriceSummaryStore',
+    'refresh_price_summary',
+    'SnapshotManager',
+    'SnapshotInfo',
+    'snapshot_before',
 ]
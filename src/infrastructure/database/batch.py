@@ -0,0 +1,109 @@
+"""
+Batch Helpers
+일괄 계산 엔진 공용 DB 헬퍼 (IN 절 분할 조회, executemany update/upsert/교체 저장, 선행 조회 기간)
+"""
+
+import math
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from sqlalchemy import bindparam, delete, insert, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+
+# SQLite 바인딩 변수 제한 안쪽으로 IN 절 분할
+IN_CHUNK = 500
+
+# executemany upsert 단위 (행) - 한 행씩 바인딩하므로 변수 한도와 무관
+UPSERT_CHUNK = 1000
+
+
+def chunks(values: Sequence, size: int = IN_CHUNK) -> Iterator[Sequence]:
+    """IN 절용 분할 (size개씩)"""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def select_in_chunks(conn: Connection, query, column, values: Optional[Iterable]) -> List:
+    """
+    query.where(column IN values)를 IN_CHUNK개씩 나눠 실행한 행 목록 (values가 None이면 조건 없이 한 번)
+
+    values는 정렬·중복 제거 후 분할 → query가 column 우선 정렬이면 전체 순서도 유지됨.
+    """
+    if values is None:
+        return conn.execute(query).all()
+    rows = []
+    for chunk in chunks(sorted(set(values))):
+        rows.extend(conn.execute(query.where(column.in_(chunk))).all())
+    return rows
+
+
+def lead_start(first: date, periods: int) -> date:
+    """
+    첫 날짜의 이평/회귀를 계산할 수 있도록 periods 거래일(→ 달력일 환산)만큼 앞선 조회 시작일
+    """
+    return first - timedelta(days=periods * 7 // 5 + 10)
+
+
+def optional_float(value: float) -> Optional[float]:
+    """NaN → None (DB NULL)"""
+    return None if math.isnan(value) else float(value)
+
+
+def update_by_id(conn: Connection, model, fields: Sequence[str], updates: List[Dict]) -> int:
+    """
+    id별 executemany update 후 커밋 (배치 단위 트랜잭션)
+
+    Args:
+        updates: [{'_id': id, field: value, ...}, ...]
+
+    Returns:
+        갱신 행 수
+    """
+    if not updates:
+        return 0
+    conn.execute(
+        update(model)
+        .where(model.id == bindparam('_id'))
+        .values({name: bindparam(name) for name in fields}),
+        updates
+    )
+    conn.commit()
+    return len(updates)
+
+
+def upsert_rows(
+    conn: Connection,
+    model,
+    keys: Sequence[str],
+    fields: Sequence[str],
+    rows: List[Dict],
+    size: int = UPSERT_CHUNK
+) -> int:
+    """
+    INSERT ... ON CONFLICT(keys) DO UPDATE fields를 size행씩 executemany (호출자의 트랜잭션에서 실행)
+
+    Returns:
+        처리 행 수
+    """
+    if not rows:
+        return 0
+    statement = sqlite_insert(model)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: statement.excluded[name] for name in fields}
+    )
+    for chunk in chunks(rows, size):
+        conn.execute(statement, chunk)
+    return len(rows)
+
+
+def replace_block_rows(conn: Connection, model, block_ids: Sequence[int], rows: List[Dict]):
+    """대상 블록의 기존 행 삭제(IN 절 분할) + executemany insert 후 커밋 (배치 단위 트랜잭션)"""
+    if not block_ids:
+        return
+    for chunk in chunks(list(block_ids)):
+        conn.execute(delete(model).where(model.block_id.in_(chunk)))
+    if rows:
+        conn.execute(insert(model), rows)
+    conn.commit()
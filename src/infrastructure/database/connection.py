@@ -6,43 +6,75 @@ SQLAlchemy 데이터베이스 연결 및 세션 관리
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+import atexit
 import logging
+import sqlite3
 
+from infrastructure.database.migrations import add_missing_columns, add_missing_indexes
 from infrastructure.database.models import Base
-from core.config import DB_PATH
+from infrastructure.database.profiles import MEMORY, TEMP, DatabaseProfile
+from infrastructure.cache import price_series_cache
+from core.exceptions import DatabaseConnectionException
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseManager:
-    """데이터베이스 관리자 (싱글톤)"""
+    """
+    데이터베이스 관리자 (싱글톤)
+
+    엔진은 첫 사용 시 환경변수 프로필(없으면 DB_PATH)로 생성 - import만으로는 DB 파일을 열지 않음.
+    configure()로 다른 프로필(파일/인메모리/임시 파일)로 재초기화.
+    """
 
     _instance = None
     _engine = None
     _session_factory = None
+    _profile: Optional[DatabaseProfile] = None
+    # 인메모리 프로필 유지 연결 (마지막 연결이 닫히면 공유 캐시 DB가 사라짐)
+    _keepers: Dict[str, sqlite3.Connection] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(DatabaseManager, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def _ensure(self):
         if self._engine is None:
-            self._initialize()
+            self.configure()
+
+    def configure(self, profile=None) -> Optional[DatabaseProfile]:
+        """
+        프로필로 (재)초기화 - 이전 프로필 반환
+
+        Args:
+            profile: DatabaseProfile 또는 --db/환경변수 형식 값 (None이면 환경변수 프로필)
 
-    def _initialize(self):
-        """데이터베이스 초기화"""
-        # core.config에서 DB 경로 가져오기
-        db_path = DB_PATH
+        기존 세션/엔진을 정리하고 종목별 시계열 캐시를 비움 (다른 DB의 같은 stock_id 혼동 방지).
+        이전 프로필의 인메모리 DB/임시 파일은 release() 전까지 유지.
+        """
+        profile = DatabaseProfile.from_env() if profile is None else DatabaseProfile.parse(profile)
+        previous = self._profile
+        if self._engine is not None:
+            self._session_factory.remove()
+            self._engine.dispose()
+            from infrastructure.cache import index_series_cache
+            price_series_cache.clear()
+            index_series_cache.invalidate()
 
-        # 디렉토리 확인 (이미 config에서 생성되지만 안전을 위해)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        if profile.kind == MEMORY:
+            if profile.name not in self._keepers:
+                self._keepers[profile.name] = sqlite3.connect(profile.sqlite_uri, uri=True, check_same_thread=False)
+        else:
+            # 디렉토리 확인 (기본 경로는 config에서 생성되지만 안전을 위해)
+            profile.path.parent.mkdir(parents=True, exist_ok=True)
 
         # SQLite 엔진 생성
-        database_url = f'sqlite:///{db_path}'
-        logger.info(f"Initializing database at: {db_path}")
+        logger.info(f"Initializing database at: {profile}")
         self._engine = create_engine(
-            database_url,
+            profile.url,
             echo=False,  # SQL 쿼리 로그 (개발 시 True)
             pool_pre_ping=True,
             connect_args={'check_same_thread': False}  # SQLite용
@@ -56,15 +88,47 @@ class DatabaseManager:
                 bind=self._engine
             )
         )
+        self._profile = profile
+        return previous
+
+    def release(self, profile: DatabaseProfile):
+        """
+        사용이 끝난 프로필 정리 (인메모리: 유지 연결 닫기, 임시 파일: 삭제, 파일: 그대로)
+
+        현재 프로필은 정리하지 않음.
+        """
+        if profile is None or profile == self._profile:
+            return
+        if profile.kind == MEMORY:
+            keeper = self._keepers.pop(profile.name, None)
+            if keeper is not None:
+                keeper.close()
+        elif profile.kind == TEMP:
+            for suffix in ('', '-journal', '-wal', '-shm'):
+                Path(f'{profile.path}{suffix}').unlink(missing_ok=True)
+
+    def close(self):
+        """엔진 정리 + 현재 프로필까지 정리 (프로세스 종료 시)"""
+        if self._engine is None:
+            return
+        profile = self._profile
+        self._session_factory.remove()
+        self._engine.dispose()
+        self._engine = self._session_factory = self._profile = None
+        self.release(profile)
+        for name in list(self._keepers):
+            self._keepers.pop(name).close()
 
     def create_all_tables(self):
         """모든 테이블 생성"""
-        Base.metadata.create_all(self._engine)
+        Base.metadata.create_all(self.engine)
+        add_missing_columns(self.engine)
+        add_missing_indexes(self.engine)
         logger.info("Database tables created successfully")
 
     def drop_all_tables(self):
         """모든 테이블 삭제 (주의!)"""
-        Base.metadata.drop_all(self._engine)
+        Base.metadata.drop_all(self.engine)
         logger.warning("Database tables dropped")
 
     @contextmanager
@@ -76,6 +140,7 @@ class DatabaseManager:
             with db_manager.get_session() as session:
                 stock = session.query(Stock).first()
         """
+        self._ensure()
         session = self._session_factory()
         try:
             yield session
@@ -86,22 +151,48 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @property
+    def profile(self) -> DatabaseProfile:
+        """현재 프로필"""
+        self._ensure()
+        return self._profile
+
+    @property
+    def db_path(self) -> Optional[Path]:
+        """현재 DB 파일 경로 (인메모리면 None)"""
+        return self.profile.path
+
+    def file_path(self) -> Path:
+        """
+        현재 DB 파일 경로 - 워커 프로세스/스냅샷처럼 파일이 필요한 작업용
+
+        Raises:
+            DatabaseConnectionException: 인메모리 프로필
+        """
+        if not self.profile.is_file:
+            raise DatabaseConnectionException(f"{self.profile} has no file (use a file or temp profile)")
+        return self.profile.path
+
     def get_scoped_session(self):
         """스코프드 세션 반환 (직접 관리용)"""
+        self._ensure()
         return self._session_factory()
 
     def remove_session(self):
         """현재 스레드의 세션 제거"""
-        self._session_factory.remove()
+        if self._session_factory is not None:
+            self._session_factory.remove()
 
     @property
     def engine(self):
-        """엔진 반환"""
+        """엔진 반환 (첫 사용 시 생성)"""
+        self._ensure()
         return self._engine
 
 
 # 전역 데이터베이스 매니저 인스턴스
 db_manager = DatabaseManager()
+atexit.register(db_manager.close)
 
 
 # 편의 함수들
@@ -115,9 +206,52 @@ def get_session():
     return db_manager.get_session()
 
 
-def reset_database():
-    """데이터베이스 리셋 (모든 데이터 삭제 후 재생성)"""
+def configure_database(profile=None) -> Optional[DatabaseProfile]:
+    """
+    전역 DB 프로필 전환 (CLI --db 값 / DatabaseProfile, None이면 환경변수) - 이전 프로필 반환
+    """
+    return db_manager.configure(profile)
+
+
+@contextmanager
+def use_database(profile):
+    """
+    블록 안에서만 전역 DB를 profile로 전환 (테이블 생성 포함, 끝나면 원래 DB로 복귀)
+
+    블록에서 만든 인메모리 DB/임시 파일은 나올 때 정리.
+
+    Usage:
+        with use_database(tmp_path / 'synthetic.db'):
+            block_detector.detect_all_blocks(...)
+        with use_database(DatabaseProfile.memory()):
+            ...
+    """
+    previous = db_manager.configure(DatabaseProfile.parse(profile))
+    current = db_manager.profile
+    try:
+        db_manager.create_all_tables()
+        yield db_manager
+    finally:
+        db_manager.configure(previous)
+        if current != previous:
+            db_manager.release(current)
+
+
+def reset_database(snapshot: bool = True):
+    """
+    데이터베이스 리셋 (모든 데이터 삭제 후 재생성)
+
+    Args:
+        snapshot: True면 삭제 전에 스냅샷 생성 (data/snapshots)
+    """
+    if snapshot:
+        from infrastructure.database.snapshot import snapshot_before
+        snapshot_before("reset_database")
+
     logger.warning("Resetting database...")
     db_manager.drop_all_tables()
     db_manager.create_all_tables()
+    price_series_cache.clear()
+    from infrastructure.repositories.block_writer import BlockWriter
+    BlockWriter.forget_engines()
     logger.info("Database reset complete")
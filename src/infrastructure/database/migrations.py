@@ -0,0 +1,79 @@
+"""
+Schema Migrations
+기존 DB에 모델에 새로 추가된 컬럼/인덱스 반영 (create_all은 기존 테이블을 변경하지 않음)
+"""
+
+import logging
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Table, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from .models import Base
+
+logger = logging.getLogger(__name__)
+
+
+def add_missing_columns(engine: Engine, tables: Optional[Iterable[Table]] = None) -> List[str]:
+    """
+    모델에는 있고 DB 테이블에는 없는 nullable 컬럼을 ALTER TABLE ADD COLUMN으로 추가
+
+    Args:
+        tables: 대상 테이블 (None이면 모델 전체, 아직 없는 테이블은 건너뜀)
+
+    Returns:
+        추가된 컬럼 ('table.column')
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    with engine.begin() as conn:
+        for table in tables or Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added.append(f'{table.name}.{column.name}')
+    if added:
+        logger.info(f"[MIGRATION] Added columns: {', '.join(added)}")
+    return added
+
+
+def add_missing_indexes(engine: Engine, tables: Optional[Iterable[Table]] = None) -> List[str]:
+    """
+    모델에는 있고 DB 테이블에는 없는 인덱스 생성
+
+    기존 중복 행 때문에 유니크 인덱스를 만들 수 없으면 경고 후 건너뜀 (앱 시작을 막지 않음 -
+    BlockWriter.ensure_unique_key와 같은 처리, 인덱스마다 별도 트랜잭션).
+
+    Args:
+        tables: 대상 테이블 (None이면 모델 전체, 아직 없는 테이블은 건너뜀)
+
+    Returns:
+        생성된 인덱스 이름
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    for table in tables or Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                with engine.begin() as conn:
+                    index.create(conn)
+            except IntegrityError as e:
+                logger.warning(f"[MIGRATION] Skipped index {index.name} (duplicate rows): {e.orig}")
+                continue
+            added.append(index.name)
+    if added:
+        logger.info(f"[MIGRATION] Added indexes: {', '.join(added)}")
+    return added
@@ -6,7 +6,7 @@ SQLAlchemy ORM 모델 정의
 from datetime import datetime, date
 from sqlalchemy import (
     Column, Integer, String, Float, Date, DateTime, Boolean,
-    ForeignKey, Text, Enum as SQLEnum
+    ForeignKey, Text, UniqueConstraint, Index, Enum as SQLEnum
 )
 from sqlalchemy.orm import declarative_base, relationship
 from core.enums import BlockType, ReturnLevel, MarketType, NewHighGrade, PatternType
@@ -38,6 +38,10 @@ class Stock(Base):
 class PriceData(Base):
     """일별 주가 데이터 (OHLCV)"""
     __tablename__ = 'price_data'
+    __table_args__ = (
+        # 종목/기간별 거래대금 집계용 커버링 인덱스 (테이블 접근 없이 GROUP BY)
+        Index('ix_price_data_stock_date_value', 'stock_id', 'date', 'trading_value'),
+    )
 
     id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
@@ -50,6 +54,7 @@ class PriceData(Base):
     trading_value = Column(Float)  # 거래대금 (원)
     market_cap = Column(Float)  # 시가총액 (원)
     created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)  # 증분 내보내기 워터마크
 
     # Relationships
     stock = relationship("Stock", back_populates="price_data")
@@ -58,9 +63,35 @@ class PriceData(Base):
         return f"<PriceData(stock_id={self.stock_id}, date={self.date}, close={self.close})>"
 
 
+class IndexPrice(Base):
+    """시장 지수 일별 시세 (KOSPI/KOSDAQ, 블록 시장 대비 성과 기준)"""
+    __tablename__ = 'index_prices'
+    __table_args__ = (
+        UniqueConstraint('index_code', 'date', name='uq_index_prices_code_date'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    index_code = Column(String(10), nullable=False)  # MarketType 값 (KOSPI/KOSDAQ)
+    date = Column(Date, nullable=False)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float, nullable=False)
+    volume = Column(Float)  # 거래량 (주)
+    trading_value = Column(Float)  # 거래대금 (원)
+    created_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<IndexPrice(index_code={self.index_code}, date={self.date}, close={self.close})>"
+
+
 class InvestorTrading(Base):
     """투자자별 거래 데이터 (기관/외국인/개인 일별 매매)"""
     __tablename__ = 'investor_trading'
+    __table_args__ = (
+        # 종목 + 날짜 조회용 (패턴 스냅샷/3·4번 블록 수급 조인)
+        Index('ix_investor_trading_stock_date', 'stock_id', 'date'),
+    )
 
     id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
@@ -92,6 +123,7 @@ class InvestorTrading(Base):
     foreign_institutional_buying_strength = Column(Float)
 
     created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)  # 증분 내보내기 워터마크
 
     def __repr__(self):
         return f"<InvestorTrading(stock_id={self.stock_id}, date={self.date})>"
@@ -100,6 +132,10 @@ class InvestorTrading(Base):
 class VolumeBlock(Base):
     """거래량 블록"""
     __tablename__ = 'volume_blocks'
+    __table_args__ = (
+        # 블록 식별 키 (BlockWriter 차분/upsert 기준)
+        Index('uq_volume_blocks_stock_type_date', 'stock_id', 'block_type', 'date', unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
@@ -121,6 +157,10 @@ class VolumeBlock(Base):
     volume_ratio = Column(Float)
     pattern_type = Column(SQLEnum(PatternType))
 
+    # 3번/4번 블록 전용 필드 (수급 품질)
+    quality_score = Column(Integer)  # 0~10점
+    quality_grade = Column(String(1))  # S/A/B/C
+
     # Range 정보 (블록 기간: D일 ~ 60이평선 회귀일)
     range_end_date = Column(Date)
     range_duration_days = Column(Integer)
@@ -132,6 +172,9 @@ class VolumeBlock(Base):
     ma60_at_start = Column(Float)
     ma60_at_end = Column(Float)
     range_end_reason = Column(String(20))
+    breakout_run_days = Column(Integer)  # 기간 안 D일 고가 위 최장 연속 종가 일수
+    breakout_confirmed_date = Column(Date)  # 돌파 확인일 (breakout_hold_days일 연속 완성)
+    support_hold_days = Column(Integer)  # D+1부터 D일 저가 이상 연속 종가 일수
 
     # 시장 대비 성과
     market_index = Column(String(10))
@@ -161,12 +204,69 @@ class VolumeBlock(Base):
         return f"<VolumeBlock(stock_id={self.stock_id}, type={self.block_type}, date={self.date})>"
 
 
+class PriceSummary(Base):
+    """종목 × 월별 주가 요약 (탐지 사전 필터용, 수집기가 갱신)"""
+    __tablename__ = 'price_summaries'
+    __table_args__ = (
+        UniqueConstraint('stock_id', 'month', name='uq_price_summaries_stock_month'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
+    month = Column(String(7), nullable=False, index=True)  # 'YYYY-MM'
+    row_count = Column(Integer, nullable=False, default=0)
+    max_trading_value = Column(Float)  # 월 최대 거래대금 (원)
+    null_trading_values = Column(Integer, nullable=False, default=0)  # 거래대금 누락 행 수
+    max_volume = Column(Integer)
+
+    def __repr__(self):
+        return f"<PriceSummary(stock_id={self.stock_id}, month='{self.month}')>"
+
+
+class DetectionState(Base):
+    """증분 블록 탐지 상태 (종목 × 탐지 설정 지문)"""
+    __tablename__ = 'detection_states'
+    __table_args__ = (
+        UniqueConstraint('stock_id', 'settings_hash', name='uq_detection_states_stock_settings'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
+    settings_hash = Column(String(16), nullable=False)  # DetectionParams.fingerprint()
+    last_date = Column(Date, nullable=False)  # 마지막 처리일 (워터마크)
+    state = Column(Text, nullable=False)  # 롤링 상태 (JSON)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def __repr__(self):
+        return f"<DetectionState(stock_id={self.stock_id}, last_date={self.last_date})>"
+
+
+class DetectionResult(Base):
+    """블록 탐지 결과 캐시 (종목 × 탐지 설정/기간 지문)"""
+    __tablename__ = 'detection_results'
+    __table_args__ = (
+        UniqueConstraint('stock_id', 'settings_hash', name='uq_detection_results_stock_settings'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
+    settings_hash = Column(String(16), nullable=False, index=True)  # 설정 + 기간 지문
+    watermark = Column(String(100), nullable=False)  # 탐지 시점의 주가 데이터 요약 (달라지면 무효)
+    blocks_1_count = Column(Integer, nullable=False, default=0)
+    blocks_2_count = Column(Integer, nullable=False, default=0)
+    blocks = Column(Text, nullable=False)  # {"blocks_1": [...], "blocks_2": [...]} (JSON)
+    created_at = Column(DateTime, default=datetime.now)
+
+    def __repr__(self):
+        return f"<DetectionResult(stock_id={self.stock_id}, settings_hash={self.settings_hash})>"
+
+
 class BlockPatternData(Base):
     """2번 블록 D+1, D+2 패턴 상세 데이터"""
     __tablename__ = 'block_pattern_data'
 
     id = Column(Integer, primary_key=True)
-    block_id = Column(Integer, ForeignKey('volume_blocks.id'), nullable=False)
+    block_id = Column(Integer, ForeignKey('volume_blocks.id'), nullable=False, index=True)
     day_offset = Column(Integer, nullable=False)
 
     # 가격 데이터
@@ -209,6 +309,7 @@ class SupportLevel(Base):
     level_number = Column(Integer, nullable=False)
     price = Column(Float, nullable=False)
     label = Column(String(50))
+    input_key = Column(String(40))  # 계산 입력 (2번 블록 날짜|1번 블록 날짜|이평 기간) - 바뀌면 재계산
     created_at = Column(DateTime, default=datetime.now)
 
     # Relationships
@@ -231,11 +332,14 @@ class Case(Base):
     status = Column(String(20), default='active')  # active/completed/failed
 
     # 수익 정보
+    entry_date = Column(Date)  # 진입일 (첫 2번 블록 날짜)
     entry_price = Column(Float)  # 진입가 (2번 블록 종가)
     peak_price = Column(Float)  # 최고가
     peak_date = Column(Date)  # 최고가 날짜
     max_return = Column(Float)  # 최대 수익률 (%)
     return_level = Column(SQLEnum(ReturnLevel))  # 수익 Level (0-4)
+    days_to_target = Column(Integer)  # 목표 수익률(50%) 첫 도달까지 달력일
+    evaluated_through = Column(Date)  # 라벨링에 반영한 마지막 거래일 (증분 갱신 기준)
 
     # 분석 결과
     factor_scores = relationship("FactorScore", back_populates="case", cascade="all, delete-orphan")
@@ -0,0 +1,169 @@
+"""
+Price Summary
+종목 × 월별 주가 요약 (price_summaries) 유지 및 블록 탐지 사전 필터
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from sqlalchemy import case, delete, exists, func, insert, select
+from sqlalchemy.engine import Engine
+
+from .models import PriceData, PriceSummary
+
+logger = logging.getLogger(__name__)
+
+_MONTH = func.strftime('%Y-%m', PriceData.date)
+
+
+def _month(value) -> str:
+    return pd.Timestamp(value).strftime('%Y-%m')
+
+
+def _summary_select(where):
+    """price_data 월별 집계 SELECT (커버링 인덱스 ix_price_data_stock_date_value 사용)"""
+    return (
+        select(
+            PriceData.stock_id,
+            _MONTH,
+            func.count(),
+            func.max(PriceData.trading_value),
+            func.sum(case((PriceData.trading_value.is_(None), 1), else_=0)),
+            func.max(PriceData.volume)
+        )
+        .where(*where)
+        .group_by(PriceData.stock_id, _MONTH)
+    )
+
+
+def _replace(executor, stock_filter, month_filter=None):
+    """요약 행 삭제 후 price_data에서 다시 집계 (Session/Connection 공용)"""
+    summary_where = [stock_filter(PriceSummary.stock_id)]
+    price_where = [stock_filter(PriceData.stock_id)]
+    if month_filter is not None:
+        summary_where.append(month_filter(PriceSummary.month))
+        price_where.append(month_filter(_MONTH))
+
+    executor.execute(delete(PriceSummary).where(*summary_where))
+    executor.execute(insert(PriceSummary).from_select(
+        ['stock_id', 'month', 'row_count', 'max_trading_value', 'null_trading_values', 'max_volume'],
+        _summary_select(price_where)
+    ))
+
+
+def refresh_price_summary(executor, stock_id: int, dates: Optional[Iterable] = None):
+    """
+    종목 요약 갱신 - 주가 쓰기와 같은 트랜잭션에서 호출
+
+    Args:
+        executor: Session(flush 후) 또는 Connection
+        dates: 변경된 날짜들 (해당 월만 재집계, None이면 종목 전체)
+    """
+    if dates is None:
+        _replace(executor, lambda column: column == stock_id)
+        return
+
+    months = sorted({_month(d) for d in dates})
+    if months:
+        _replace(executor, lambda column: column == stock_id, lambda column: column.in_(months))
+
+
+class PriceSummaryStore:
+    """
+    price_summaries 관리 + 블록 탐지 사전 필터
+
+    - 월 단위 요약이라 기간 질의는 시작/종료 월 전체를 포함 → 최대 거래대금이 실제보다
+      크거나 같게 나와 조건을 만족할 수 있는 종목을 제외하는 일은 없음
+    - 수집기/Repository/가져오기가 쓰기 시점에 갱신, 기존 DB는 ensure()가 처음 한 번 채움
+
+    Usage:
+        store = PriceSummaryStore(engine)
+        store.ensure()
+        candidates, skipped = store.prefilter(stocks, start, end, min_trading_value)
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def ensure(self):
+        """테이블/커버링 인덱스 생성, 요약이 비어 있으면 전체 재구성"""
+        PriceSummary.__table__.create(self.engine, checkfirst=True)
+        for index in PriceData.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+        with self.engine.connect() as conn:
+            empty = not conn.execute(select(exists().select_from(PriceSummary))).scalar()
+            has_prices = conn.execute(select(exists().select_from(PriceData))).scalar()
+        if empty and has_prices:
+            self.rebuild()
+
+    def rebuild(self, stock_ids: Optional[Sequence[int]] = None) -> int:
+        """
+        요약 재구성 (stock_ids가 None이면 전체)
+
+        Returns:
+            요약 행 수
+        """
+        with self.engine.begin() as conn:
+            if stock_ids is None:
+                conn.execute(delete(PriceSummary))
+                conn.execute(insert(PriceSummary).from_select(
+                    ['stock_id', 'month', 'row_count', 'max_trading_value', 'null_trading_values', 'max_volume'],
+                    _summary_select([])
+                ))
+            else:
+                ids = list(stock_ids)
+                _replace(conn, lambda column: column.in_(ids))
+            count = conn.execute(select(func.count()).select_from(PriceSummary)).scalar()
+        logger.info(f"[PRICE_SUMMARY] Rebuilt {count} rows")
+        return count
+
+    def max_trading_values(self, start_date, end_date) -> Dict[int, Tuple[Optional[float], int]]:
+        """
+        종목별 기간 최대 거래대금 (집계 쿼리 1회)
+
+        Returns:
+            {stock_id: (최대 거래대금, 거래대금 누락 행 수)} - 기간에 데이터가 없는 종목은 없음
+        """
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                select(
+                    PriceSummary.stock_id,
+                    func.max(PriceSummary.max_trading_value),
+                    func.sum(PriceSummary.null_trading_values)
+                )
+                .where(PriceSummary.month >= _month(start_date), PriceSummary.month <= _month(end_date))
+                .group_by(PriceSummary.stock_id)
+            ).all()
+        return {stock_id: (max_value, nulls or 0) for stock_id, max_value, nulls in rows}
+
+    def prefilter(
+        self,
+        stocks: List[Dict],
+        start_date,
+        end_date,
+        min_trading_value: Optional[float]
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        1번 블록이 나올 수 없는 종목 분리
+
+        제외 조건: 기간에 주가가 없거나, 거래대금 누락 행 없이 최대 거래대금 < min_trading_value
+        (누락 거래대금은 1번 블록 거래대금 조건을 통과하므로 제외하지 않음)
+
+        Returns:
+            (탐지 대상, 제외 종목)
+        """
+        summaries = self.max_trading_values(start_date, end_date)
+        candidates, skipped = [], []
+        for stock in stocks:
+            summary = summaries.get(stock['id'])
+            if summary is None:
+                skipped.append(stock)
+                continue
+            max_value, nulls = summary
+            if min_trading_value and not nulls and (max_value is None or max_value < min_trading_value):
+                skipped.append(stock)
+            else:
+                candidates.append(stock)
+        return candidates, skipped
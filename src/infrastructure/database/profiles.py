@@ -0,0 +1,122 @@
+"""
+Database Profiles
+DB 위치 프로필 (운영 파일 / 공유 캐시 인메모리 / 임시 파일) - 환경변수/CLI로 선택
+"""
+
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Mapping, Optional, Union
+
+from core.config import DATABASE_CONFIG, DB_PATH
+
+FILE = 'file'
+MEMORY = 'memory'
+TEMP = 'temp'
+
+MEMORY_VALUES = (':memory:', 'memory')
+
+
+@dataclass(frozen=True)
+class DatabaseProfile:
+    """
+    DB 프로필
+
+    - file: 지정 경로 SQLite 파일
+    - memory: 이름 있는 공유 캐시 인메모리 DB (같은 프로세스의 모든 연결이 같은 DB를 봄,
+      DatabaseManager가 유지 연결을 잡고 있는 동안만 존재 - 워커 프로세스/스냅샷 불가)
+    - temp: 생성 시점에 만든 임시 파일 (release 시 삭제)
+
+    Usage:
+        DatabaseProfile.parse(':memory:')            # 환경변수/CLI 값
+        DatabaseProfile.file('data/other.db')
+        with use_database(DatabaseProfile.temp()):
+            ...
+    """
+
+    kind: str
+    path: Optional[Path] = None   # file/temp: DB 파일
+    name: Optional[str] = None    # memory: 공유 캐시 DB 이름
+
+    @classmethod
+    def file(cls, path) -> 'DatabaseProfile':
+        return cls(FILE, path=Path(path))
+
+    @classmethod
+    def memory(cls, name: Optional[str] = None) -> 'DatabaseProfile':
+        """name이 없으면 고유 이름 (프로필마다 독립된 DB)"""
+        return cls(MEMORY, name=name or f'robostock-{uuid.uuid4().hex[:12]}')
+
+    @classmethod
+    def temp(cls, directory=None) -> 'DatabaseProfile':
+        """임시 파일 생성 후 프로필 반환 (같은 프로필로 다시 전환하면 같은 파일)"""
+        directory = directory or DATABASE_CONFIG['temp_dir']
+        if directory:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix='robostock-', suffix='.db', dir=directory)
+        os.close(fd)
+        return cls(TEMP, path=Path(path))
+
+    @classmethod
+    def parse(cls, value: Union[str, Path, 'DatabaseProfile', None]) -> 'DatabaseProfile':
+        """
+        ':memory:' / 'memory' / 'memory:<이름>' → memory, 'temp' → temp, 그 외 → 파일 경로 (None이면 DB_PATH)
+        """
+        if isinstance(value, DatabaseProfile):
+            return value
+        if value is None or value == '':
+            return cls.file(DB_PATH)
+        text = str(value)
+        if text in MEMORY_VALUES:
+            return cls.memory()
+        if text.startswith('memory:'):
+            return cls.memory(text[len('memory:'):])
+        if text == TEMP:
+            return cls.temp()
+        return cls.file(text)
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> 'DatabaseProfile':
+        """
+        환경변수(DATABASE_CONFIG['env_var']) 프로필 (없으면 DB_PATH)
+
+        temp는 만든 파일 경로를 환경변수에 다시 기록 → 이후 띄우는 워커 프로세스도 같은 파일 사용
+        """
+        environ = os.environ if environ is None else environ
+        profile = cls.parse(environ.get(DATABASE_CONFIG['env_var']))
+        if profile.kind == TEMP and environ is os.environ:
+            os.environ[DATABASE_CONFIG['env_var']] = str(profile.path)
+        return profile
+
+    @property
+    def url(self) -> str:
+        """SQLAlchemy URL"""
+        if self.kind == MEMORY:
+            return f'sqlite:///file:{self.name}?mode=memory&cache=shared&uri=true'
+        return f'sqlite:///{self.path}'
+
+    @property
+    def sqlite_uri(self) -> str:
+        """sqlite3.connect(..., uri=True) 주소"""
+        if self.kind == MEMORY:
+            return f'file:{self.name}?mode=memory&cache=shared'
+        return f'file:{self.path.as_posix()}'
+
+    @property
+    def is_file(self) -> bool:
+        """파일 기반 여부 (워커 프로세스/스냅샷 가능)"""
+        return self.kind != MEMORY
+
+    def __str__(self) -> str:
+        return f':memory: ({self.name})' if self.kind == MEMORY else str(self.path)
+
+
+def add_database_argument(parser):
+    """CLI에 --db 옵션 추가 (configure_database(args.db)로 적용)"""
+    parser.add_argument(
+        "--db", default=None,
+        help=f"DB 프로필: 파일 경로 / :memory: / temp "
+             f"(기본: 환경변수 {DATABASE_CONFIG['env_var']} 또는 data/robostock.db)"
+    )
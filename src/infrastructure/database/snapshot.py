@@ -0,0 +1,368 @@
+"""
+Snapshot Manager
+SQLite 온라인 백업 API 기반 DB 스냅샷/복원 (gzip 압축 + manifest)
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+from core.config import SNAPSHOT_CONFIG
+from core.exceptions import EntityNotFoundException, RepositoryException
+from infrastructure.cache import price_series_cache
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = 'manifest.json'
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass
+class SnapshotInfo:
+    """스냅샷 메타데이터 (manifest 항목)"""
+
+    file: str
+    created_at: str
+    reason: str
+    db_size: int
+    file_size: int
+    sha256: str  # 압축 전 DB 파일 해시
+    pages: int
+    elapsed: float
+
+    @property
+    def created(self) -> datetime:
+        return datetime.fromisoformat(self.created_at)
+
+
+class SnapshotManager:
+    """
+    DB 스냅샷 관리자
+
+    - sqlite3 backup API로 페이지 단위(pages_per_step) 복사, 원본은 WAL 모드 + 읽기 트랜잭션 유지
+      → 수집 중인 쓰기 작업을 막지 않고 재시작 없이 일관된 스냅샷 (재시작/제한 시간 상한)
+    - <snapshot_dir>/robostock-YYYYmmdd-HHMMSS.db.gz + manifest.json (sha256 포함)
+    - 보존 정책: keep_last / max_age_days
+    - 복원도 backup API로 라이브 DB에 덮어씀 (파일 교체 없이 열린 연결 유지)
+
+    Usage:
+        manager = SnapshotManager()
+        info = manager.create(reason="before reset")
+        manager.restore(info.file)
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, snapshot_dir: Optional[Path] = None):
+        if db_path is None:
+            from infrastructure.database.connection import db_manager
+            db_path = db_manager.file_path()
+        self.db_path = Path(db_path)
+        self.snapshot_dir = Path(snapshot_dir or SNAPSHOT_CONFIG['snapshot_dir'])
+
+    # ===== manifest =====
+
+    def _manifest_path(self) -> Path:
+        return self.snapshot_dir / MANIFEST_FILE
+
+    def list_snapshots(self) -> List[SnapshotInfo]:
+        """스냅샷 목록 (오래된 순)"""
+        path = self._manifest_path()
+        if not path.exists():
+            return []
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        return sorted((SnapshotInfo(**entry) for entry in entries), key=lambda s: s.created_at)
+
+    def _save_manifest(self, snapshots: List[SnapshotInfo]):
+        path = self._manifest_path()
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump([asdict(s) for s in snapshots], f, indent=2, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    def get(self, name: Optional[str] = None) -> SnapshotInfo:
+        """
+        스냅샷 조회 (name이 None이면 최신)
+
+        Raises:
+            EntityNotFoundException: 스냅샷 없음
+        """
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            raise EntityNotFoundException("Snapshot", str(self.snapshot_dir))
+        if name is None:
+            return snapshots[-1]
+        name = Path(name).name
+        for snapshot in snapshots:
+            if snapshot.file == name:
+                return snapshot
+        raise EntityNotFoundException("Snapshot", name)
+
+    # ===== 생성 =====
+
+    def create(
+        self,
+        reason: str = 'manual',
+        pages_per_step: Optional[int] = None,
+        apply_retention: bool = True
+    ) -> SnapshotInfo:
+        """
+        온라인 스냅샷 생성
+
+        Args:
+            reason: manifest에 기록할 사유
+            pages_per_step: 백업 단계당 페이지 수 (None이면 설정값)
+            apply_retention: 생성 후 보존 정책 적용 여부
+
+        Raises:
+            EntityNotFoundException: DB 파일 없음
+        """
+        if not self.db_path.exists():
+            raise EntityNotFoundException("Database", str(self.db_path))
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        name = f"{self.db_path.stem}-{now.strftime('%Y%m%d-%H%M%S')}.db.gz"
+        target = self.snapshot_dir / name
+        suffix = 1
+        while target.exists():
+            target = self.snapshot_dir / name.replace('.db.gz', f"-{suffix}.db.gz")
+            suffix += 1
+        raw_path = target.with_name(target.name[:-3] + '.tmp')
+
+        start = time.perf_counter()
+        try:
+            pages = self._backup(self.db_path, raw_path, pages_per_step or SNAPSHOT_CONFIG['pages_per_step'])
+            sha256 = self._compress(raw_path, target)
+            info = SnapshotInfo(
+                file=target.name,
+                created_at=now.isoformat(timespec='seconds'),
+                reason=reason,
+                db_size=raw_path.stat().st_size,
+                file_size=target.stat().st_size,
+                sha256=sha256,
+                pages=pages,
+                elapsed=round(time.perf_counter() - start, 3)
+            )
+        except Exception:
+            target.unlink(missing_ok=True)
+            raise
+        finally:
+            raw_path.unlink(missing_ok=True)
+
+        self._save_manifest(self.list_snapshots() + [info])
+        logger.info(f"[SNAPSHOT] {info.file} created ({info.db_size:,} → {info.file_size:,} bytes, "
+                    f"{info.elapsed:.1f}s, reason: {reason})")
+
+        if apply_retention:
+            self.prune()
+        return info
+
+    @staticmethod
+    def _backup(source_path: Path, target_path: Path, pages_per_step: int) -> int:
+        """
+        backup API로 페이지 단위 복사, 복사한 전체 페이지 수 반환
+
+        원본 읽기 트랜잭션을 백업 내내 유지 → 다른 연결의 쓰기가 백업을 재시작시키지 않음
+        (WAL 모드면 쓰기도 막지 않음, 롤백 저널 모드면 커밋이 백업 끝까지 대기).
+
+        Raises:
+            RepositoryException: 재시작 횟수/제한 시간 초과 (SNAPSHOT_TIMEOUT)
+        """
+        total_pages = 0
+        last_remaining = None
+        restarts = 0
+        deadline = time.monotonic() + SNAPSHOT_CONFIG['timeout']
+
+        def progress(status, remaining, total):
+            nonlocal total_pages, last_remaining, restarts
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                logger.warning(f"[SNAPSHOT] Backup restarted by a concurrent write ({restarts})")
+            total_pages, last_remaining = total, remaining
+            logger.debug(f"[SNAPSHOT] {total - remaining}/{total} pages")
+
+            # 콜백 예외 → backup 중단 후 전파
+            if restarts > SNAPSHOT_CONFIG['max_restarts']:
+                raise RepositoryException(
+                    f"Snapshot backup restarted {restarts} times: {source_path}",
+                    code="SNAPSHOT_TIMEOUT"
+                )
+            if time.monotonic() > deadline:
+                raise RepositoryException(
+                    f"Snapshot backup timed out after {SNAPSHOT_CONFIG['timeout']}s "
+                    f"({total - remaining}/{total} pages): {source_path}",
+                    code="SNAPSHOT_TIMEOUT"
+                )
+
+        source = sqlite3.connect(str(source_path), isolation_level=None)
+        target = sqlite3.connect(str(target_path))
+        try:
+            if SNAPSHOT_CONFIG['source_wal']:
+                try:
+                    source.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"[SNAPSHOT] Could not switch {source_path.name} to WAL: {e}")
+
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            source.backup(
+                target,
+                pages=pages_per_step,
+                progress=progress,
+                sleep=SNAPSHOT_CONFIG['step_sleep']
+            )
+            source.execute("COMMIT")
+        finally:
+            target.close()
+            source.close()
+        return total_pages
+
+    @staticmethod
+    def _compress(raw_path: Path, target: Path) -> str:
+        """gzip 압축하며 원본 sha256 계산"""
+        digest = hashlib.sha256()
+        with open(raw_path, 'rb') as src, \
+                gzip.open(target, 'wb', compresslevel=SNAPSHOT_CONFIG['compress_level']) as dst:
+            while True:
+                block = src.read(COPY_BUFFER_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+                dst.write(block)
+        return digest.hexdigest()
+
+    # ===== 검증/복원 =====
+
+    def _decompress(self, info: SnapshotInfo, raw_path: Path):
+        """압축 해제 + sha256 검증"""
+        path = self.snapshot_dir / info.file
+        if not path.exists():
+            raise EntityNotFoundException("Snapshot file", str(path))
+
+        digest = hashlib.sha256()
+        with gzip.open(path, 'rb') as src, open(raw_path, 'wb') as dst:
+            while True:
+                block = src.read(COPY_BUFFER_SIZE)
+                if not block:
+                    break
+                digest.update(block)
+                dst.write(block)
+
+        if digest.hexdigest() != info.sha256:
+            raise RepositoryException(
+                f"Snapshot checksum mismatch: {info.file}",
+                code="SNAPSHOT_CORRUPT"
+            )
+
+    def verify(self, name: Optional[str] = None) -> bool:
+        """스냅샷 무결성 검증 (sha256 + PRAGMA integrity_check)"""
+        info = self.get(name)
+        raw_path = self.snapshot_dir / f"{info.file}.verify"
+        try:
+            self._decompress(info, raw_path)
+            conn = sqlite3.connect(str(raw_path))
+            try:
+                return conn.execute("PRAGMA integrity_check").fetchone()[0] == 'ok'
+            finally:
+                conn.close()
+        except RepositoryException:
+            return False
+        finally:
+            raw_path.unlink(missing_ok=True)
+
+    def restore(self, name: Optional[str] = None, safety_snapshot: bool = True) -> SnapshotInfo:
+        """
+        스냅샷 복원 (name이 None이면 최신)
+
+        Args:
+            name: 스냅샷 파일명
+            safety_snapshot: 복원 전에 현재 DB 스냅샷을 남길지 여부
+
+        Raises:
+            EntityNotFoundException: 스냅샷 없음
+            RepositoryException: 체크섬 불일치
+        """
+        info = self.get(name)
+        raw_path = self.snapshot_dir / f"{info.file}.restore"
+        start = time.perf_counter()
+        try:
+            self._decompress(info, raw_path)
+
+            if safety_snapshot and self.db_path.exists():
+                self.create(reason=f"before restore of {info.file}", apply_retention=False)
+
+            source = sqlite3.connect(str(raw_path))
+            target = sqlite3.connect(str(self.db_path))
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+                source.close()
+        finally:
+            raw_path.unlink(missing_ok=True)
+
+        price_series_cache.clear()
+        from infrastructure.repositories.block_writer import BlockWriter
+        BlockWriter.forget_engines()
+        logger.info(f"[SNAPSHOT] {info.file} restored to {self.db_path} "
+                    f"({time.perf_counter() - start:.1f}s)")
+        return info
+
+    # ===== 보존 정책 =====
+
+    def prune(self, keep_last: Optional[int] = None, max_age_days: Optional[int] = None) -> List[SnapshotInfo]:
+        """
+        보존 정책 적용: 최근 keep_last개를 넘거나 max_age_days 지난 스냅샷 삭제
+        (최신 스냅샷은 항상 유지)
+
+        Returns:
+            삭제된 스냅샷 목록
+        """
+        keep_last = SNAPSHOT_CONFIG['keep_last'] if keep_last is None else keep_last
+        max_age_days = SNAPSHOT_CONFIG['max_age_days'] if max_age_days is None else max_age_days
+
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return []
+
+        cutoff = datetime.now() - timedelta(days=max_age_days) if max_age_days else None
+        newest_first = list(reversed(snapshots))
+        kept, removed = [newest_first[0]], []
+        for index, snapshot in enumerate(newest_first[1:], start=1):
+            too_many = keep_last and index >= keep_last
+            too_old = cutoff is not None and snapshot.created < cutoff
+            (removed if too_many or too_old else kept).append(snapshot)
+
+        for snapshot in removed:
+            (self.snapshot_dir / snapshot.file).unlink(missing_ok=True)
+            logger.info(f"[SNAPSHOT] {snapshot.file} pruned")
+
+        if removed:
+            self._save_manifest(list(reversed(kept)))
+        return removed
+
+
+def snapshot_before(reason: str) -> Optional[SnapshotInfo]:
+    """
+    파괴적 작업 전 스냅샷 (인메모리/임시 프로필이거나 DB 파일이 없거나 비어 있으면 생략)
+
+    Usage:
+        snapshot_before("reset_database")
+    """
+    from infrastructure.database.connection import db_manager
+    from infrastructure.database.profiles import FILE
+    if db_manager.profile.kind != FILE:
+        return None
+    manager = SnapshotManager()
+    if not manager.db_path.exists() or manager.db_path.stat().st_size == 0:
+        return None
+    info = manager.create(reason=reason)
+    print(f"[SNAPSHOT] Saved {info.file} before {reason}")
+    return info
@@ -0,0 +1,16 @@
+"""
+Dump Infrastructure
+DB 테이블 내보내기/가져오기 (Parquet, CSV.gz)
+"""
+
+from .exporter import DataExporter, ExportReport, EXPORT_TABLES
+from .importer import DataImporter, ImportReport, IMPORT_TABLES
+
+__all__ = [
+    "DataExporter",
+    "ExportReport",
+    "EXPORT_TABLES",
+    "DataImporter",
+    "ImportReport",
+    "IMPORT_TABLES",
+]
@@ -0,0 +1,445 @@
+"""
+Data Exporter
+price_data / investor_trading / volume_blocks 스트리밍 내보내기 (Parquet, CSV.gz)
+"""
+
+import gzip
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+from sqlalchemy import Boolean, Date, DateTime, Enum as SQLEnum, Float, Integer, String
+from sqlalchemy import and_, func, or_, select, true, type_coerce
+from sqlalchemy.engine import Engine
+
+from core.config import DUMP_CONFIG
+from core.exceptions import ConfigurationException, ValidationException
+from infrastructure.database.models import InvestorTrading, PriceData, Stock, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 대상 테이블
+EXPORT_TABLES = {
+    'price_data': PriceData,
+    'investor_trading': InvestorTrading,
+    'volume_blocks': VolumeBlock,
+}
+
+EXPORT_FORMATS = ('parquet', 'csv')
+PARTITION_KEYS = ('market', 'year')
+STATE_FILE = '_export_state.json'
+
+# 파티션 키 (('market', 'KOSPI'), ('year', '2024'))
+PartitionKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class ExportReport:
+    """테이블별 내보내기 결과"""
+
+    table: str
+    rows: int = 0
+    chunks: int = 0
+    files: List[str] = field(default_factory=list)
+    since_id: int = 0
+    last_id: int = 0
+    rewritten: List[str] = field(default_factory=list)  # 수정된 행 때문에 다시 내보낸 파티션
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _require_pyarrow():
+    """Parquet 포맷용 pyarrow 임포트 (선택 의존성)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ConfigurationException(
+            "pyarrow",
+            "Parquet export requires pyarrow (pip install robostock[export]) - use format='csv' instead"
+        )
+    return pyarrow
+
+
+class _PartitionWriter:
+    """파티션별 출력 파일 핸들 관리 (청크 단위 append)"""
+
+    def __init__(self, root: Path, fmt: str, run_id: str, arrow_schema=None):
+        self.root = root
+        self.fmt = fmt
+        self.run_id = run_id
+        self.arrow_schema = arrow_schema
+        self._handles: Dict[Tuple, object] = {}
+        self.files: List[str] = []
+
+    def directory(self, key: PartitionKey) -> Path:
+        directory = self.root
+        for name, value in key:
+            directory = directory / f"{name}={value}"
+        return directory
+
+    def _path(self, key: PartitionKey) -> Path:
+        directory = self.directory(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = 'parquet' if self.fmt == 'parquet' else 'csv.gz'
+        return directory / f"part-{self.run_id}.{suffix}"
+
+    def write(self, key: PartitionKey, frame: pd.DataFrame):
+        handle = self._handles.get(key)
+
+        if self.fmt == 'parquet':
+            pa = _require_pyarrow()
+            table = pa.Table.from_pandas(frame, schema=self.arrow_schema, preserve_index=False)
+            if handle is None:
+                path = self._path(key)
+                handle = pa.parquet.ParquetWriter(str(path), self.arrow_schema, compression='zstd')
+                self._handles[key] = handle
+                self.files.append(str(path))
+            handle.write_table(table)
+        else:
+            if handle is None:
+                path = self._path(key)
+                handle = gzip.open(path, 'wt', encoding='utf-8', newline='')
+                self._handles[key] = handle
+                self.files.append(str(path))
+                frame.to_csv(handle, index=False, header=True)
+            else:
+                frame.to_csv(handle, index=False, header=False)
+
+    def close(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
+
+
+class DataExporter:
+    """
+    DB 테이블 스트리밍 내보내기
+
+    - SQLAlchemy yield_per(서버 측 커서)로 청크 단위 조회 → 메모리에는 항상 한 청크만 유지
+    - Hive 스타일 파티션: <table>/market=KOSPI/year=2024/part-<run>.parquet
+    - 증분 내보내기: 테이블별 마지막 id + 수정 시각(updated_at, 없으면 created_at) 워터마크를
+      _export_state.json 에 기록 → 새 행은 새 파일로 추가, 기존 행이 수정된 파티션은 통째로 다시
+      내보내고 이전 파일 삭제 (파티션 안에 같은 행이 중복되지 않음)
+
+    Usage:
+        exporter = DataExporter()
+        exporter.export_all("data/exports", fmt="parquet", incremental=True)
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, chunk_size: Optional[int] = None):
+        if engine is None:
+            from infrastructure.database.connection import db_manager
+            engine = db_manager.engine
+
+        self.engine = engine
+        self.chunk_size = chunk_size or DUMP_CONFIG['chunk_size']
+
+    # ===== 상태 (워터마크) =====
+
+    def load_state(self, output_dir: Path) -> Dict:
+        """워터마크 상태 로드"""
+        path = Path(output_dir) / STATE_FILE
+        if not path.exists():
+            return {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_state(self, output_dir: Path, state: Dict):
+        path = Path(output_dir) / STATE_FILE
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        tmp_path.replace(path)
+
+    # ===== 쿼리 =====
+
+    @staticmethod
+    def _modified(table):
+        """행 수정 시각 (마이그레이션 전 행은 updated_at이 비어 있어 created_at 사용)"""
+        return func.coalesce(table.c.updated_at, table.c.created_at)
+
+    @staticmethod
+    def _partition_filter(table, key: PartitionKey):
+        """파티션 키 → WHERE 조건 (빈 키 = 테이블 전체)"""
+        clauses = []
+        for name, value in key:
+            if name == 'market':
+                market = type_coerce(Stock.market, String)
+                clauses.append(Stock.market.is_(None) if value == 'UNKNOWN' else market == value)
+            else:
+                year = int(value)
+                clauses.append(table.c.date >= date(year, 1, 1))
+                clauses.append(table.c.date < date(year + 1, 1, 1))
+        return and_(true(), *clauses)
+
+    def _changed_partitions(
+        self,
+        model,
+        since_id: int,
+        since_modified: datetime,
+        partition_by: Sequence[str]
+    ) -> Set[PartitionKey]:
+        """이전 내보내기 이후 수정된 기존 행(id <= since_id)이 있는 파티션"""
+        table = model.__table__
+        names = [k for k in PARTITION_KEYS if k in partition_by]
+        columns = {
+            'market': func.coalesce(type_coerce(Stock.market, String), 'UNKNOWN'),
+            'year': func.substr(type_coerce(table.c.date, String), 1, 4),
+        }
+        stmt = (
+            select(*(columns[name] for name in names), true())
+            .select_from(table)
+            .join(Stock, Stock.id == table.c.stock_id)
+            .where(table.c.id <= since_id, self._modified(table) > since_modified)
+            .distinct()
+        )
+        with self.engine.connect() as conn:
+            return {tuple(zip(names, row[:len(names)])) for row in conn.execute(stmt)}
+
+    def _last_modified(self, model) -> Optional[datetime]:
+        table = model.__table__
+        with self.engine.connect() as conn:
+            return conn.execute(select(func.max(self._modified(table)))).scalar()
+
+    def _build_select(self, model, since_id: int, partitions: Iterable[PartitionKey] = ()):
+        """
+        내보내기 SELECT 구성 (id > since_id 행 + partitions 파티션 전체)
+
+        날짜/Enum 컬럼은 String으로 type_coerce 하여 행 단위 Python 변환을 피함
+        (Date → 'YYYY-MM-DD', Enum → 저장된 이름 문자열)
+        """
+        table = model.__table__
+        columns = []
+        for column in table.columns:
+            if isinstance(column.type, (Date, DateTime, SQLEnum)):
+                columns.append(type_coerce(column, String).label(column.name))
+            else:
+                columns.append(column)
+
+        columns.extend([
+            Stock.code.label('code'),
+            Stock.name.label('name'),
+            type_coerce(Stock.market, String).label('market'),
+        ])
+
+        return (
+            select(*columns)
+            .join(Stock, Stock.id == table.c.stock_id)
+            .where(or_(table.c.id > since_id, *(self._partition_filter(table, key) for key in partitions)))
+            .order_by(table.c.id)
+        )
+
+    def _arrow_schema(self, model):
+        """SQL 컬럼 타입 → Arrow 스키마 (청크마다 타입 추론이 달라지지 않도록 고정)"""
+        pa = _require_pyarrow()
+        fields = []
+        for column in model.__table__.columns:
+            if isinstance(column.type, SQLEnum):
+                arrow_type = pa.string()
+            elif isinstance(column.type, DateTime):
+                arrow_type = pa.timestamp('us')
+            elif isinstance(column.type, Date):
+                arrow_type = pa.date32()
+            elif isinstance(column.type, Boolean):
+                arrow_type = pa.bool_()
+            elif isinstance(column.type, Integer):
+                arrow_type = pa.int64()
+            elif isinstance(column.type, Float):
+                arrow_type = pa.float64()
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(column.name, arrow_type))
+
+        fields.extend([
+            pa.field('code', pa.string()),
+            pa.field('name', pa.string()),
+            pa.field('market', pa.string()),
+        ])
+        return pa.schema(fields)
+
+    def iter_chunks(
+        self,
+        table_name: str,
+        since_id: int = 0,
+        partitions: Iterable[PartitionKey] = ()
+    ) -> Iterator[pd.DataFrame]:
+        """
+        테이블을 청크 단위 DataFrame으로 스트리밍
+
+        Args:
+            table_name: EXPORT_TABLES 키
+            since_id: 이 id 초과 행만 조회 (증분)
+            partitions: id와 무관하게 전체를 조회할 파티션 (수정된 파티션 재내보내기)
+        """
+        model = self._model(table_name)
+        stmt = self._build_select(model, since_id, partitions)
+
+        with self.engine.connect() as conn:
+            result = conn.execution_options(yield_per=self.chunk_size).execute(stmt)
+            keys = list(result.keys())
+            for partition in result.partitions():
+                yield pd.DataFrame.from_records(partition, columns=keys)
+
+    # ===== 내보내기 =====
+
+    def export_table(
+        self,
+        table_name: str,
+        output_dir,
+        fmt: Optional[str] = None,
+        partition_by: Sequence[str] = PARTITION_KEYS,
+        incremental: bool = False
+    ) -> ExportReport:
+        """
+        단일 테이블 내보내기
+
+        Args:
+            table_name: 'price_data' | 'investor_trading' | 'volume_blocks'
+            output_dir: 출력 루트 디렉토리
+            fmt: 'parquet' | 'csv' (None이면 설정 기본값)
+            partition_by: 파티션 키 ('market', 'year' 부분집합, 빈 값이면 단일 파일)
+            incremental: True면 이전 워터마크 이후 추가된 행 + 수정된 행이 있는 파티션만 내보냄
+        """
+        fmt = fmt or DUMP_CONFIG['default_format']
+        if fmt not in EXPORT_FORMATS:
+            raise ValidationException("format", f"Unsupported export format: {fmt}")
+
+        unknown = set(partition_by) - set(PARTITION_KEYS)
+        if unknown:
+            raise ValidationException("partition_by", f"Unknown partition keys: {sorted(unknown)}")
+
+        model = self._model(table_name)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        state = self.load_state(output_dir)
+        previous = state.get(table_name, {}) if incremental else {}
+        since_id = previous.get('last_id', 0)
+        last_modified = self._last_modified(model)
+
+        # 이전 내보내기 이후 기존 행이 수정된 파티션 → 파티션 전체를 다시 내보냄
+        changed = set()
+        if since_id and previous.get('last_modified'):
+            if previous.get('partition_by', list(partition_by)) != list(partition_by):
+                raise ValidationException(
+                    "partition_by",
+                    f"Incremental export must keep partition_by={previous['partition_by']} "
+                    f"(export to a new directory to change it)"
+                )
+            changed = self._changed_partitions(
+                model, since_id, datetime.fromisoformat(previous['last_modified']), partition_by
+            )
+
+        report = ExportReport(table=table_name, since_id=since_id, last_id=since_id)
+        run_id = datetime.now().strftime('%Y%m%d%H%M%S%f')
+        arrow_schema = self._arrow_schema(model) if fmt == 'parquet' else None
+        writer = _PartitionWriter(output_dir / table_name, fmt, run_id, arrow_schema)
+        stale_files = [
+            path for key in sorted(changed)
+            for path in writer.directory(key).glob('part-*')
+            if path.is_file()
+        ]
+        date_column = 'date'
+        date_columns = [c.name for c in model.__table__.columns if isinstance(c.type, Date)]
+        datetime_columns = [c.name for c in model.__table__.columns if isinstance(c.type, DateTime)]
+
+        start = time.perf_counter()
+        try:
+            for chunk in self.iter_chunks(table_name, since_id, sorted(changed)):
+                if chunk.empty:
+                    continue
+
+                report.chunks += 1
+                report.rows += len(chunk)
+                report.last_id = max(report.last_id, int(chunk['id'].iloc[-1]))
+
+                if 'year' in partition_by:
+                    chunk_years = chunk[date_column].str.slice(0, 4)
+
+                if fmt == 'parquet':
+                    for name in date_columns:
+                        chunk[name] = pd.to_datetime(chunk[name], errors='coerce')
+                    for name in datetime_columns:
+                        chunk[name] = pd.to_datetime(chunk[name], errors='coerce', format='ISO8601')
+
+                if not partition_by:
+                    writer.write((), chunk)
+                    continue
+
+                group_keys = []
+                if 'market' in partition_by:
+                    group_keys.append(chunk['market'].fillna('UNKNOWN'))
+                if 'year' in partition_by:
+                    group_keys.append(chunk_years)
+
+                for values, frame in chunk.groupby(group_keys, sort=False):
+                    if not isinstance(values, tuple):
+                        values = (values,)
+                    key = tuple(zip([k for k in PARTITION_KEYS if k in partition_by], values))
+                    writer.write(key, frame)
+
+                logger.info(f"[EXPORT] {table_name}: {report.rows:,} rows (chunk {report.chunks})")
+        finally:
+            writer.close()
+
+        # 다시 내보낸 파티션의 이전 파일 삭제 (성공 시에만)
+        for path in stale_files:
+            path.unlink()
+        report.rewritten = ['/'.join(f"{name}={value}" for name, value in key) for key in sorted(changed)]
+
+        report.files = writer.files
+        report.elapsed = time.perf_counter() - start
+
+        # 워터마크 갱신 (성공 시에만)
+        state[table_name] = {
+            'last_id': report.last_id,
+            'last_modified': last_modified.isoformat() if last_modified else None,
+            'partition_by': list(partition_by),
+            'exported_at': datetime.now().isoformat(timespec='seconds'),
+            'format': fmt,
+        }
+        self._save_state(output_dir, state)
+
+        rewritten = f", {len(report.rewritten)} partitions rewritten" if report.rewritten else ""
+        print(f"[EXPORT] {table_name}: {report.rows:,} rows → {len(report.files)} files{rewritten} "
+              f"({report.elapsed:.1f}s, {report.rows_per_second:,.0f} rows/s)")
+        return report
+
+    def export_all(
+        self,
+        output_dir,
+        fmt: Optional[str] = None,
+        tables: Optional[Iterable[str]] = None,
+        partition_by: Sequence[str] = PARTITION_KEYS,
+        incremental: bool = False
+    ) -> Dict[str, ExportReport]:
+        """여러 테이블 순차 내보내기"""
+        reports = {}
+        for table_name in (tables or EXPORT_TABLES.keys()):
+            reports[table_name] = self.export_table(
+                table_name,
+                output_dir,
+                fmt=fmt,
+                partition_by=partition_by,
+                incremental=incremental
+            )
+        return reports
+
+    @staticmethod
+    def _model(table_name: str):
+        model = EXPORT_TABLES.get(table_name)
+        if model is None:
+            raise ValidationException(
+                "table",
+                f"Unknown export table: {table_name} (choose from {list(EXPORT_TABLES)})"
+            )
+        return model
@@ -0,0 +1,338 @@
+"""
+Data Importer
+Parquet/CSV 덤프 → stocks / price_data / investor_trading 고속 적재
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.engine import Engine
+
+from core.config import DUMP_CONFIG
+from core.enums import MarketType
+from core.exceptions import ValidationException
+from domain.entities.price_series import validate_ohlcv
+from infrastructure.database.models import InvestorTrading, PriceData
+from infrastructure.database.price_summary import PriceSummaryStore
+from infrastructure.dumps.exporter import _require_pyarrow
+from infrastructure.cache import price_series_cache
+
+logger = logging.getLogger(__name__)
+
+# 가져오기 대상 테이블 (stocks는 덤프의 code/name/market 컬럼으로 자동 생성)
+IMPORT_TABLES = {
+    'price_data': PriceData,
+    'investor_trading': InvestorTrading,
+}
+
+# 새 종목 생성 시 허용하는 market 값 (stocks.market Enum 저장값)
+MARKET_NAMES = [market.name for market in MarketType]
+
+# 적재 중 SQLite 설정 (종료 후 원복)
+FAST_LOAD_PRAGMAS = {
+    'synchronous': 'OFF',
+    'journal_mode': 'MEMORY',
+    'temp_store': 'MEMORY',
+    'cache_size': '-262144',  # 256MB
+}
+
+
+@dataclass
+class ImportReport:
+    """테이블별 가져오기 결과"""
+
+    table: str
+    files: int = 0
+    rows_read: int = 0
+    rows_inserted: int = 0
+    rows_invalid: int = 0
+    rows_skipped_existing: int = 0
+    stocks_created: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_inserted / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class DataImporter:
+    """
+    덤프 파일 고속 가져오기
+
+    - 단일 트랜잭션 + synchronous=OFF / journal_mode=MEMORY
+    - 대상 테이블 인덱스를 삭제 후 적재, 마지막에 재생성 (deferred index creation)
+    - executemany 배치 INSERT
+    - 종목코드 → stock_id 는 메모리 dict로 해석, 없는 종목은 즉시 생성
+    - 가격 검증은 validate_ohlcv 로 청크 단위 벡터화
+    - 이미 DB에 있는 (종목, 날짜) 구간은 종목별 최대 날짜 기준으로 건너뜀
+
+    Usage:
+        importer = DataImporter()
+        importer.import_dir("data/exports")
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, chunk_size: Optional[int] = None):
+        if engine is None:
+            from infrastructure.database.connection import db_manager
+            engine = db_manager.engine
+
+        self.engine = engine
+        self.chunk_size = chunk_size or DUMP_CONFIG['chunk_size']
+
+    # ===== 파일 읽기 =====
+
+    @staticmethod
+    def find_files(path) -> List[Path]:
+        """디렉토리(또는 단일 파일)에서 덤프 파일 목록"""
+        path = Path(path)
+        if path.is_file():
+            return [path]
+        files = list(path.rglob('*.parquet')) + list(path.rglob('*.csv.gz')) + list(path.rglob('*.csv'))
+        return sorted(files)
+
+    def iter_file_chunks(self, path: Path) -> Iterator[pd.DataFrame]:
+        """덤프 파일을 청크 단위로 읽기"""
+        if path.suffix == '.parquet':
+            pa = _require_pyarrow()
+            parquet_file = pa.parquet.ParquetFile(str(path))
+            for batch in parquet_file.iter_batches(batch_size=self.chunk_size):
+                yield batch.to_pandas()
+        else:
+            for chunk in pd.read_csv(path, chunksize=self.chunk_size, dtype={'code': str}):
+                yield chunk
+
+    # ===== 가져오기 =====
+
+    def import_dir(
+        self,
+        input_dir,
+        tables: Optional[Iterable[str]] = None
+    ) -> Dict[str, ImportReport]:
+        """
+        exporter 레이아웃(<dir>/<table>/...)의 덤프 가져오기
+
+        Args:
+            input_dir: 덤프 루트 디렉토리
+            tables: 가져올 테이블 (기본: price_data, investor_trading)
+        """
+        input_dir = Path(input_dir)
+        reports = {}
+        for table_name in (tables or IMPORT_TABLES.keys()):
+            table_dir = input_dir / table_name
+            if not table_dir.exists():
+                logger.warning(f"[IMPORT] {table_dir} not found, skipping")
+                continue
+            reports[table_name] = self.import_files(table_name, self.find_files(table_dir))
+        return reports
+
+    def import_files(self, table_name: str, files: Sequence[Path]) -> ImportReport:
+        """
+        덤프 파일들을 한 테이블로 적재 (단일 트랜잭션)
+
+        Raises:
+            ValidationException: 알 수 없는 테이블/필수 컬럼 누락
+        """
+        model = IMPORT_TABLES.get(table_name)
+        if model is None:
+            raise ValidationException(
+                "table",
+                f"Unknown import table: {table_name} (choose from {list(IMPORT_TABLES)})"
+            )
+
+        report = ImportReport(table=table_name, files=len(files))
+        # 생성/수정 시각은 적재 시각으로 기록 (덤프 값 무시)
+        columns = [
+            c.name for c in model.__table__.columns
+            if c.name not in ('id', 'created_at', 'updated_at')
+        ]
+        insert_sql = (
+            f"INSERT INTO {table_name} ({', '.join(columns)}, created_at, updated_at) "
+            f"VALUES ({', '.join('?' for _ in columns)}, ?, ?)"
+        )
+
+        start = time.perf_counter()
+        raw = self.engine.raw_connection()
+        conn = raw.driver_connection
+        previous_isolation = conn.isolation_level
+        previous_pragmas = {}
+
+        try:
+            conn.isolation_level = None  # 트랜잭션 수동 관리
+            cursor = conn.cursor()
+
+            for name, value in FAST_LOAD_PRAGMAS.items():
+                previous_pragmas[name] = cursor.execute(f"PRAGMA {name}").fetchone()[0]
+                cursor.execute(f"PRAGMA {name} = {value}")
+
+            cursor.execute("BEGIN")
+            try:
+                stock_ids = self._load_stock_ids(cursor)
+                last_dates = self._load_last_dates(cursor, table_name)
+                index_sqls = self._drop_indexes(cursor, table_name)
+                created_at = datetime.now().isoformat(sep=' ')
+
+                for path in files:
+                    for chunk in self.iter_file_chunks(path):
+                        report.rows_read += len(chunk)
+                        rows = self._prepare_chunk(
+                            table_name, chunk, columns, stock_ids, last_dates, cursor, report
+                        )
+                        if rows:
+                            cursor.executemany(insert_sql, [row + (created_at, created_at) for row in rows])
+                            report.rows_inserted += len(rows)
+
+                    logger.info(f"[IMPORT] {table_name}: {path.name} done "
+                                f"({report.rows_inserted:,} rows so far)")
+
+                # 인덱스 재생성
+                for sql in index_sqls:
+                    cursor.execute(sql)
+
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        finally:
+            cursor = conn.cursor()
+            for name, value in previous_pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+            conn.isolation_level = previous_isolation
+            raw.close()
+
+        price_series_cache.clear()
+        if table_name == 'price_data' and report.rows_inserted:
+            # 탐지 사전 필터용 월별 요약 재구성 (커버링 인덱스 집계 1회)
+            store = PriceSummaryStore(self.engine)
+            store.ensure()
+            store.rebuild()
+        report.elapsed = time.perf_counter() - start
+
+        print(f"[IMPORT] {table_name}: {report.rows_inserted:,} rows inserted "
+              f"(invalid {report.rows_invalid:,}, existing {report.rows_skipped_existing:,}, "
+              f"new stocks {report.stocks_created}) - {report.elapsed:.1f}s, "
+              f"{report.rows_per_second:,.0f} rows/s")
+        return report
+
+    # ===== 내부 =====
+
+    @staticmethod
+    def _load_stock_ids(cursor) -> Dict[str, int]:
+        return dict(cursor.execute("SELECT code, id FROM stocks").fetchall())
+
+    @staticmethod
+    def _load_last_dates(cursor, table_name: str) -> Dict[int, str]:
+        """종목별 기존 최대 날짜 ('YYYY-MM-DD')"""
+        return dict(cursor.execute(
+            f"SELECT stock_id, MAX(date) FROM {table_name} GROUP BY stock_id"
+        ).fetchall())
+
+    @staticmethod
+    def _drop_indexes(cursor, table_name: str) -> List[str]:
+        """명시적 인덱스 삭제 후 재생성용 SQL 반환 (UNIQUE/PK 자동 인덱스는 유지)"""
+        indexes = cursor.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table_name,)
+        ).fetchall()
+        for name, _ in indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+        return [sql for _, sql in indexes]
+
+    def _resolve_stock_ids(self, chunk: pd.DataFrame, stock_ids: Dict[str, int], cursor, report: ImportReport) -> pd.Series:
+        """
+        종목코드 → stock_id (없는 종목은 생성)
+
+        Raises:
+            ValidationException: 새 종목의 market이 없거나 MarketType이 아님 (stocks.market은 NOT NULL)
+        """
+        missing = chunk.loc[~chunk['code'].isin(stock_ids.keys()), ['code', 'name', 'market']]
+        if not missing.empty:
+            missing = missing.drop_duplicates('code')
+            invalid = sorted(missing.loc[~missing['market'].isin(MARKET_NAMES), 'code'])
+            if invalid:
+                raise ValidationException(
+                    "market",
+                    f"New stocks need a market column value ({'/'.join(MARKET_NAMES)}): "
+                    f"{invalid[:20]}{' ...' if len(invalid) > 20 else ''}"
+                )
+            now = datetime.now().isoformat(sep=' ')
+            for code, name, market in missing.itertuples(index=False, name=None):
+                cursor.execute(
+                    "INSERT INTO stocks (code, name, market, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (code, name if isinstance(name, str) and name else code, market, now, now)
+                )
+                stock_ids[code] = cursor.lastrowid
+                report.stocks_created += 1
+
+        return chunk['code'].map(stock_ids)
+
+    def _prepare_chunk(
+        self,
+        table_name: str,
+        chunk: pd.DataFrame,
+        columns: List[str],
+        stock_ids: Dict[str, int],
+        last_dates: Dict[int, str],
+        cursor,
+        report: ImportReport
+    ) -> List[tuple]:
+        """청크 검증/정규화 → executemany 용 튜플 리스트"""
+        required = {'code', 'date'} | ({'open', 'high', 'low', 'close', 'volume'} if table_name == 'price_data' else set())
+        missing_columns = required - set(chunk.columns)
+        if missing_columns:
+            raise ValidationException("columns", f"Dump is missing columns: {sorted(missing_columns)}")
+
+        chunk = chunk.copy()
+        chunk['code'] = chunk['code'].astype(str).str.zfill(6)
+        for column in ('name', 'market'):
+            if column not in chunk.columns:
+                chunk[column] = None
+
+        # 가격 검증 (벡터화)
+        if table_name == 'price_data':
+            masks = validate_ohlcv(
+                chunk['open'].to_numpy(dtype=np.float64),
+                chunk['high'].to_numpy(dtype=np.float64),
+                chunk['low'].to_numpy(dtype=np.float64),
+                chunk['close'].to_numpy(dtype=np.float64),
+                chunk['volume'].to_numpy(dtype=np.float64)
+            )
+            invalid = np.zeros(len(chunk), dtype=bool)
+            for mask in masks.values():
+                invalid |= mask
+            if invalid.any():
+                report.rows_invalid += int(invalid.sum())
+                chunk = chunk.loc[~invalid]
+
+        chunk['stock_id'] = self._resolve_stock_ids(chunk, stock_ids, cursor, report)
+        chunk['date'] = pd.to_datetime(chunk['date']).dt.strftime('%Y-%m-%d')
+
+        # 기존 데이터 이후 날짜만 적재
+        if last_dates:
+            last = chunk['stock_id'].map(last_dates)
+            existing = last.notna() & (chunk['date'] <= last.fillna(''))
+            if existing.any():
+                report.rows_skipped_existing += int(existing.sum())
+                chunk = chunk.loc[~existing]
+
+        if chunk.empty:
+            return []
+
+        values = []
+        for column in columns:
+            if column not in chunk.columns:
+                values.append([None] * len(chunk))
+                continue
+            series = chunk[column]
+            if series.dtype.kind in 'iu':
+                values.append(series.tolist())
+            else:
+                values.append(series.astype(object).where(series.notna(), None).tolist())
+
+        return list(zip(*values))
@@ -6,9 +6,18 @@ Repository 구현체 (SQLAlchemy)
 from .sqlalchemy_stock_repository import SQLAlchemyStockRepository
 from .sqlalchemy_price_data_repository import SQLAlchemyPriceDataRepository
 from .sqlalchemy_block_repository import SQLAlchemyBlockRepository
+from .sqlalchemy_detection_state_repository import SQLAlchemyDetectionStateRepository
+from .cached_price_data_repository import CachedPriceDataRepository
+from .block_writer import BlockWriter, BlockWriteResult, block_rows, entity_rows
 
 __all__ = [
     "SQLAlchemyStockRepository",
     "SQLAlchemyPriceDataRepository",
     "SQLAlchemyBlockRepository",
+    "SQLAlchemyDetectionStateRepository",
+    "CachedPriceDataRepository",
+    "BlockWriter",
+    "BlockWriteResult",
+    "block_rows",
+    "entity_rows",
 ]
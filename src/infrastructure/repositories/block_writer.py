@@ -0,0 +1,357 @@
+"""
+Block Writer
+거래량 블록 일괄 저장 (저장된 블록과 메모리 차분 → 한 트랜잭션에서 insert/update/delete)
+"""
+
+import logging
+import weakref
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, delete, insert, select, text, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+from core.enums import BlockType
+from infrastructure.database.batch import chunks
+from infrastructure.database.migrations import add_missing_columns
+from infrastructure.database.models import BlockPatternData, Case, SupportLevel, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+BlockKey = Tuple[int, BlockType, date]
+
+# (stock_id, block_type, date) 유니크 키 인덱스 (ON CONFLICT 대상)
+UNIQUE_KEY_INDEX = 'uq_volume_blocks_stock_type_date'
+
+# 탐지 결과로 덮어쓰는 컬럼 (Range/시장 대비 성과 등 후처리 컬럼은 유지)
+WRITE_FIELDS = (
+    'volume', 'trading_value', 'close_price',
+    'new_high_grade', 'max_volume_period_days',
+    'parent_block_id', 'days_from_parent', 'volume_ratio', 'pattern_type',
+    'quality_score', 'quality_grade',
+)
+
+# 블록 타입별 부모 블록 타입 (저장 순서 = 키 순서)
+PARENT_TYPES = {
+    BlockType.BLOCK_1: None,
+    BlockType.BLOCK_2: BlockType.BLOCK_1,
+    BlockType.BLOCK_3: BlockType.BLOCK_2,
+    BlockType.BLOCK_4: BlockType.BLOCK_3,
+}
+
+
+def _trading_value(block: Dict) -> float:
+    """거래대금 누락(None/NaN) 시 거래량 × 종가 (volume_blocks.trading_value는 NOT NULL)"""
+    value = block['trading_value']
+    if value is None or value != value:
+        return float(block['volume']) * float(block['close_price'])
+    return float(value)
+
+
+def block_rows(
+    blocks_1: Iterable[Dict],
+    blocks_2: Iterable[Dict] = (),
+    blocks_3: Iterable[Dict] = (),
+    blocks_4: Iterable[Dict] = ()
+) -> List[Dict]:
+    """
+    BlockDetector 결과 dict → 저장 행
+
+    2번 블록의 부모는 parent_date 키 또는 날짜 - days_from_block1 (달력일)로 찾음,
+    3번 블록은 2번 블록, 4번 블록은 3번 블록의 날짜(parent_date)로 찾음
+    """
+    rows = []
+    for block in blocks_1:
+        rows.append({
+            'block_type': BlockType.BLOCK_1,
+            'date': block['date'],
+            'volume': int(block['volume']),
+            'trading_value': _trading_value(block),
+            'close_price': float(block['close_price']),
+            'new_high_grade': block.get('new_high_grade'),
+            'max_volume_period_days': block.get('max_volume_period_days'),
+        })
+    for block in blocks_2:
+        days = int(block['days_from_block1'])
+        rows.append({
+            'block_type': BlockType.BLOCK_2,
+            'date': block['date'],
+            'volume': int(block['volume']),
+            'trading_value': _trading_value(block),
+            'close_price': float(block['close_price']),
+            'days_from_parent': days,
+            'volume_ratio': float(block['volume_ratio']),
+            'pattern_type': block.get('pattern_type'),
+            'parent_date': block.get('parent_date') or block['date'] - timedelta(days=days),
+        })
+    for block_type, blocks, days_key in (
+        (BlockType.BLOCK_3, blocks_3, 'days_from_block2'),
+        (BlockType.BLOCK_4, blocks_4, 'days_from_block3'),
+    ):
+        for block in blocks:
+            rows.append({
+                'block_type': block_type,
+                'date': block['date'],
+                'volume': int(block['volume']),
+                'trading_value': _trading_value(block),
+                'close_price': float(block['close_price']),
+                'days_from_parent': int(block[days_key]),
+                'volume_ratio': float(block['volume_ratio']),
+                'quality_score': block.get('quality_score'),
+                'quality_grade': block.get('quality_grade'),
+                'parent_date': block['parent_date'],
+            })
+    return rows
+
+
+def entity_rows(blocks) -> List[Dict]:
+    """VolumeBlock 엔티티 → 저장 행 (2~4번 블록 부모는 날짜 - days_from_parent)"""
+    rows = []
+    for block in blocks:
+        row = {name: getattr(block, name) for name in WRITE_FIELDS if name != 'parent_block_id'}
+        row['block_type'] = block.block_type
+        row['date'] = block.date
+        if block.block_type != BlockType.BLOCK_1 and block.days_from_parent is not None:
+            row['parent_date'] = block.date - timedelta(days=block.days_from_parent)
+        rows.append(row)
+    return rows
+
+
+@dataclass
+class BlockWriteResult:
+    """일괄 저장 결과"""
+
+    inserted: Dict[BlockType, int] = field(default_factory=dict)
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    # 입력 블록의 저장 id (stock_id, block_type, date) → id
+    ids: Dict[BlockKey, int] = field(default_factory=dict)
+
+    def inserted_count(self, block_type: BlockType) -> int:
+        return self.inserted.get(block_type, 0)
+
+
+class BlockWriter:
+    """
+    거래량 블록 일괄 저장
+
+    - 대상 종목의 저장된 블록을 한 번에 읽어 (stock_id, block_type, date) 키로 차분
+    - 새 블록은 insert (유니크 키 충돌 시 무시), 값이 바뀐 블록만 update
+    - replace_range를 주면 구간 안의 저장된 블록 중 이번 결과에 없는 것은 delete
+      (케이스/패턴 데이터가 참조하는 블록은 유지)
+    - 2/3/4번 블록 parent_block_id는 부모 타입(1/2/3번) insert 직후 같은 트랜잭션에서 날짜로 연결
+
+    Usage:
+        writer = BlockWriter(engine)
+        result = writer.write({stock_id: block_rows(blocks_1, blocks_2)})
+    """
+
+    # 컬럼/인덱스 반영을 마친 엔진 (복원/리셋 시 forget_engines로 비움)
+    _keyed_engines: "weakref.WeakKeyDictionary[Engine, bool]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self._engine = engine
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    @classmethod
+    def forget_engines(cls):
+        """엔진별 반영 기록 초기화 (스냅샷 복원/DB 리셋으로 스키마가 바뀐 경우)"""
+        cls._keyed_engines.clear()
+
+    def ensure_unique_key(self) -> bool:
+        """
+        기존 DB에 유니크 키 인덱스/새 컬럼 반영 (엔진당 1회)
+
+        Returns:
+            인덱스 사용 가능 여부 (중복 행이 있어 생성에 실패하면 False - 차분만으로 저장)
+        """
+        if self.engine in self._keyed_engines:
+            return True
+        add_missing_columns(self.engine, [VolumeBlock.__table__])
+        try:
+            for index in VolumeBlock.__table__.indexes:
+                if index.unique:
+                    index.create(self.engine, checkfirst=True)
+        except IntegrityError as e:
+            logger.warning(f"[BLOCK_WRITER] Duplicate blocks prevent unique key: {e.orig}")
+            return False
+        self._keyed_engines[self.engine] = True
+        return True
+
+    @staticmethod
+    def _has_unique_key(conn: Connection) -> bool:
+        """쓰기 트랜잭션에서 유니크 키 인덱스 존재 확인 (반영 후 외부에서 삭제된 경우 대비)"""
+        return conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = :name"),
+            {'name': UNIQUE_KEY_INDEX}
+        ).first() is not None
+
+    def write(
+        self,
+        blocks: Dict[int, List[Dict]],
+        replace_range: Optional[Tuple[date, date]] = None,
+        conn: Optional[Connection] = None
+    ) -> BlockWriteResult:
+        """
+        종목별 블록 행 일괄 저장 (한 트랜잭션)
+
+        Args:
+            blocks: {stock_id: block_rows()/entity_rows() 결과} - 같은 키는 먼저 나온 행만 저장
+            replace_range: (시작일, 종료일) - 구간의 1번 블록과 그 하위 블록을 이번 결과로 교체
+            conn: 호출자의 트랜잭션 연결 (None이면 새 트랜잭션)
+        """
+        if conn is None:
+            keyed = self.ensure_unique_key()
+            with self.engine.begin() as own:
+                return self._write(own, blocks, replace_range, keyed and self._has_unique_key(own))
+        keyed = conn.engine in self._keyed_engines and self._has_unique_key(conn)
+        return self._write(conn, blocks, replace_range, keyed)
+
+    # ===== 내부 =====
+
+    def _write(
+        self,
+        conn: Connection,
+        blocks: Dict[int, List[Dict]],
+        replace_range: Optional[Tuple[date, date]],
+        keyed: bool
+    ) -> BlockWriteResult:
+        result = BlockWriteResult()
+        stock_ids = list(blocks)
+        if not stock_ids:
+            return result
+
+        incoming: Dict[BlockKey, Dict] = {}
+        for stock_id, rows in blocks.items():
+            for row in rows:
+                incoming.setdefault((stock_id, row['block_type'], row['date']), row)
+
+        stored = self._load(conn, stock_ids)
+        now = datetime.now()
+
+        # 부모 타입 먼저 저장 → 자식 블록 부모 id를 같은 트랜잭션에서 조회
+        for block_type, parent_type in PARENT_TYPES.items():
+            parents = self._block_ids(stored, parent_type) if parent_type else {}
+            inserts, updates = [], []
+            for key, row in incoming.items():
+                if key[1] != block_type:
+                    continue
+                values = {name: row.get(name) for name in WRITE_FIELDS}
+                if parent_type:
+                    values['parent_block_id'] = parents.get((key[0], row.get('parent_date')))
+
+                current = stored.get(key)
+                if current is None:
+                    inserts.append({'stock_id': key[0], 'block_type': block_type, 'date': key[2],
+                                    **values, 'created_at': now, 'updated_at': now})
+                elif any(current[name] != values[name] for name in WRITE_FIELDS):
+                    updates.append({'_id': current['id'], **values, 'updated_at': now})
+                else:
+                    result.unchanged += 1
+
+            if inserts:
+                statement = insert(VolumeBlock)
+                if keyed:
+                    statement = sqlite_insert(VolumeBlock).on_conflict_do_nothing(
+                        index_elements=['stock_id', 'block_type', 'date']
+                    )
+                conn.execute(statement, inserts)
+                stored.update(self._load(conn, stock_ids, block_type, [row['date'] for row in inserts]))
+            if updates:
+                conn.execute(
+                    update(VolumeBlock)
+                    .where(VolumeBlock.id == bindparam('_id'))
+                    .values({name: bindparam(name) for name in (*WRITE_FIELDS, 'updated_at')}),
+                    updates
+                )
+            # 3/4번 블록은 저장한 경우만 집계 (1/2번 블록은 항상 0 이상으로 기록)
+            if inserts or parent_type in (None, BlockType.BLOCK_1):
+                result.inserted[block_type] = len(inserts)
+            result.updated += len(updates)
+
+        if replace_range is not None:
+            result.deleted = self._prune(conn, stored, incoming, replace_range)
+
+        result.ids = {key: stored[key]['id'] for key in incoming if key in stored}
+        return result
+
+    @staticmethod
+    def _load(
+        conn: Connection,
+        stock_ids: List[int],
+        block_type: Optional[BlockType] = None,
+        dates: Optional[List[date]] = None
+    ) -> Dict[BlockKey, Dict]:
+        """저장된 블록 {key: {id, WRITE_FIELDS...}}"""
+        columns = [VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.block_type, VolumeBlock.date,
+                   *(getattr(VolumeBlock, name) for name in WRITE_FIELDS)]
+        stored = {}
+        for chunk in chunks(stock_ids):
+            query = select(*columns).where(VolumeBlock.stock_id.in_(chunk))
+            if block_type is not None:
+                query = query.where(VolumeBlock.block_type == block_type)
+            if dates:
+                query = query.where(VolumeBlock.date >= min(dates), VolumeBlock.date <= max(dates))
+            for row in conn.execute(query).mappings():
+                stored[(row['stock_id'], row['block_type'], row['date'])] = dict(row)
+        return stored
+
+    @staticmethod
+    def _block_ids(stored: Dict[BlockKey, Dict], block_type: BlockType) -> Dict[Tuple[int, date], int]:
+        return {
+            (stock_id, block_date): row['id']
+            for (stock_id, stored_type, block_date), row in stored.items()
+            if stored_type == block_type
+        }
+
+    @staticmethod
+    def _prune(
+        conn: Connection,
+        stored: Dict[BlockKey, Dict],
+        incoming: Dict[BlockKey, Dict],
+        replace_range: Tuple[date, date]
+    ) -> int:
+        """구간의 1번 블록과 그 하위(2→3→4번) 블록 중 이번 결과에 없는 것 삭제"""
+        start, end = (value.date() if isinstance(value, datetime) else value for value in replace_range)
+        family = {
+            row['id'] for key, row in stored.items()
+            if key[1] == BlockType.BLOCK_1 and start <= key[2] <= end
+        }
+        for block_type, parent_type in PARENT_TYPES.items():
+            if parent_type:
+                family.update(
+                    row['id'] for key, row in stored.items()
+                    if key[1] == block_type and row['parent_block_id'] in family
+                )
+        stale = [row['id'] for key, row in stored.items() if key not in incoming and row['id'] in family]
+        if not stale:
+            return 0
+
+        # 케이스/패턴 데이터가 참조하는 블록은 유지
+        protected = set()
+        for chunk in chunks(stale):
+            protected.update(conn.execute(select(Case.first_block_id).where(Case.first_block_id.in_(chunk))).scalars())
+            protected.update(conn.execute(
+                select(BlockPatternData.block_id).where(BlockPatternData.block_id.in_(chunk))
+            ).scalars())
+        stale = [block_id for block_id in stale if block_id not in protected]
+
+        for chunk in chunks(stale):
+            conn.execute(delete(SupportLevel).where(SupportLevel.block_id.in_(chunk)))
+            conn.execute(update(VolumeBlock).where(VolumeBlock.parent_block_id.in_(chunk)).values(parent_block_id=None))
+            conn.execute(delete(VolumeBlock).where(VolumeBlock.id.in_(chunk)))
+
+        stale_ids = set(stale)
+        for key in [key for key, row in stored.items() if row['id'] in stale_ids]:
+            del stored[key]
+        return len(stale)
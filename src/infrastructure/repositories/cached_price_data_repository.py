@@ -0,0 +1,117 @@
+"""
+Cached Price Data Repository
+읽기 관통(read-through) LRU 캐시 데코레이터
+"""
+
+from typing import Optional, List
+from datetime import date
+
+from domain.repositories.price_data_repository import PriceDataRepository
+from domain.entities.price_data import PriceData as PriceDataEntity
+from domain.entities.price_series import PriceSeries
+from infrastructure.cache import LRUCache, price_series_cache
+
+
+class CachedPriceDataRepository(PriceDataRepository):
+    """
+    PriceDataRepository 캐시 데코레이터
+
+    - 종목별 전체 시계열을 한 번 로드해 캐시하고, 기간 조회는 메모리 슬라이스로 처리
+    - 쓰기(save/save_bulk/delete_by_stock)는 내부 Repository에 위임 후 해당 종목 무효화
+    - 캐시된 배열은 읽기 전용으로 고정 (공유 데이터 변조 방지)
+    """
+
+    def __init__(
+        self,
+        inner: PriceDataRepository,
+        cache: Optional[LRUCache] = None
+    ):
+        self._inner = inner
+        self._cache = cache if cache is not None else price_series_cache
+
+    @property
+    def cache(self) -> LRUCache:
+        """사용 중인 캐시"""
+        return self._cache
+
+    def _full_series(self, stock_id: int) -> PriceSeries:
+        """종목 전체 시계열 (캐시 미스 시 로드, 로드 중 무효화되면 저장하지 않음)"""
+        series = self._cache.get(stock_id)
+        if series is None:
+            generation = self._cache.generation(stock_id)
+            series = self._inner.get_series(stock_id)
+            self._freeze(series)
+            self._cache.put(stock_id, series, generation)
+        return series
+
+    @staticmethod
+    def _freeze(series: PriceSeries):
+        """캐시 공유 배열을 읽기 전용으로 설정"""
+        for name in PriceSeries.__slots__:
+            column = getattr(series, name)
+            if hasattr(column, 'flags'):
+                column.flags.writeable = False
+
+    def get_series(
+        self,
+        stock_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> PriceSeries:
+        """기간별 주가 시계열 조회 (캐시 슬라이스)"""
+        return self._full_series(stock_id).slice_dates(start_date, end_date)
+
+    def get_by_stock_and_date(
+        self,
+        stock_id: int,
+        target_date: date
+    ) -> Optional[PriceDataEntity]:
+        """특정 날짜의 주가 데이터 조회"""
+        rows = self.get_series(stock_id, target_date, target_date).to_price_data()
+        return rows[0] if rows else None
+
+    def get_by_stock_range(
+        self,
+        stock_id: int,
+        start_date: date,
+        end_date: date
+    ) -> List[PriceDataEntity]:
+        """기간별 주가 데이터 조회"""
+        return self.get_series(stock_id, start_date, end_date).to_price_data()
+
+    def get_latest(self, stock_id: int) -> Optional[PriceDataEntity]:
+        """최신 주가 데이터 조회"""
+        series = self._full_series(stock_id)
+        if not series:
+            return None
+        return series.slice_dates(series.last_date, None).to_price_data()[-1]
+
+    def get_latest_date(self, stock_id: int) -> Optional[date]:
+        """최신 데이터 날짜 조회"""
+        return self._full_series(stock_id).last_date
+
+    def save(self, price_data: PriceDataEntity) -> PriceDataEntity:
+        """주가 데이터 저장 (해당 종목 캐시 무효화)"""
+        try:
+            return self._inner.save(price_data)
+        finally:
+            self._cache.invalidate(price_data.stock_id)
+
+    def save_bulk(self, price_data_list: List[PriceDataEntity]) -> int:
+        """대량 주가 데이터 저장 (관련 종목 캐시 무효화)"""
+        try:
+            return self._inner.save_bulk(price_data_list)
+        finally:
+            for stock_id in {p.stock_id for p in price_data_list}:
+                self._cache.invalidate(stock_id)
+
+    def exists(self, stock_id: int, target_date: date) -> bool:
+        """특정 날짜 데이터 존재 여부"""
+        return len(self.get_series(stock_id, target_date, target_date)) > 0
+
+    def delete_by_stock(self, stock_id: int) -> int:
+        """종목의 모든 주가 데이터 삭제 (캐시 무효화)"""
+        try:
+            return self._inner.delete_by_stock(stock_id)
+        finally:
+            self._cache.invalidate(stock_id)
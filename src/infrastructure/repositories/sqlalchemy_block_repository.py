@@ -3,13 +3,15 @@ SQLAlchemy Block Repository Implementation
 거래량 블록 Repository 구현체
 """
 
-from typing import Optional, List
+from collections import defaultdict
+from typing import Optional, List, Tuple
 from datetime import date, datetime
 
 from domain.repositories.block_repository import BlockRepository
 from domain.entities.volume_block import VolumeBlock as BlockEntity
 from infrastructure.database.models import VolumeBlock as BlockORM
 from infrastructure.database.connection import get_session
+from infrastructure.repositories.block_writer import BlockWriter, entity_rows
 from core.enums import BlockType
 
 
@@ -35,6 +37,8 @@ class SQLAlchemyBlockRepository(BlockRepository):
             days_from_parent=orm.days_from_parent,
             volume_ratio=orm.volume_ratio,
             pattern_type=orm.pattern_type,
+            quality_score=orm.quality_score,
+            quality_grade=orm.quality_grade,
             range_end_date=orm.range_end_date,
             range_duration_days=orm.range_duration_days,
             range_high=orm.range_high,
@@ -45,6 +49,9 @@ class SQLAlchemyBlockRepository(BlockRepository):
             ma60_at_start=orm.ma60_at_start,
             ma60_at_end=orm.ma60_at_end,
             range_end_reason=orm.range_end_reason,
+            breakout_run_days=orm.breakout_run_days,
+            breakout_confirmed_date=orm.breakout_confirmed_date,
+            support_hold_days=orm.support_hold_days,
             market_index=orm.market_index,
             range_return=orm.range_return,
             index_return=orm.index_return,
@@ -72,6 +79,8 @@ class SQLAlchemyBlockRepository(BlockRepository):
             days_from_parent=entity.days_from_parent,
             volume_ratio=entity.volume_ratio,
             pattern_type=entity.pattern_type,
+            quality_score=entity.quality_score,
+            quality_grade=entity.quality_grade,
             range_end_date=entity.range_end_date,
             range_duration_days=entity.range_duration_days,
             range_high=entity.range_high,
@@ -82,6 +91,9 @@ class SQLAlchemyBlockRepository(BlockRepository):
             ma60_at_start=entity.ma60_at_start,
             ma60_at_end=entity.ma60_at_end,
             range_end_reason=entity.range_end_reason,
+            breakout_run_days=entity.breakout_run_days,
+            breakout_confirmed_date=entity.breakout_confirmed_date,
+            support_hold_days=entity.support_hold_days,
             market_index=entity.market_index,
             range_return=entity.range_return,
             index_return=entity.index_return,
@@ -186,23 +198,30 @@ class SQLAlchemyBlockRepository(BlockRepository):
             return self._to_entity(orm)
 
     def save_bulk(self, blocks: List[BlockEntity]) -> int:
-        """대량 블록 저장"""
-        saved_count = 0
+        """대량 블록 저장 (BlockWriter 차분 저장 - 새 블록 수 반환)"""
+        by_stock = defaultdict(list)
+        for block in blocks:
+            by_stock[block.stock_id].append(block)
 
+        result = BlockWriter().write({
+            stock_id: entity_rows(stock_blocks) for stock_id, stock_blocks in by_stock.items()
+        })
+        return sum(result.inserted.values())
+
+    def save_detection(
+        self,
+        stock_id: int,
+        blocks: List[BlockEntity],
+        replace_range: Optional[Tuple[date, date]] = None
+    ) -> List[BlockEntity]:
+        """종목 탐지 결과 일괄 저장 (BlockWriter) - 저장된 블록을 입력 순서로 반환"""
+        result = BlockWriter().write({stock_id: entity_rows(blocks)}, replace_range)
+
+        keys = [(stock_id, block.block_type, block.date) for block in blocks]
+        ids = [result.ids[key] for key in keys if key in result.ids]
         with get_session() as session:
-            for block in blocks:
-                existing = session.query(BlockORM).filter_by(
-                    stock_id=block.stock_id,
-                    block_type=block.block_type,
-                    date=block.date
-                ).first()
-
-                if not existing:
-                    orm = self._to_orm(block)
-                    session.add(orm)
-                    saved_count += 1
-
-        return saved_count
+            orms = {orm.id: orm for orm in session.query(BlockORM).filter(BlockORM.id.in_(ids)).all()}
+            return [self._to_entity(orms[block_id]) for block_id in dict.fromkeys(ids) if block_id in orms]
 
     def exists(
         self,
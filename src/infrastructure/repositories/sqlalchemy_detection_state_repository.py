@@ -0,0 +1,53 @@
+"""
+SQLAlchemy Detection State Repository Implementation
+증분 블록 탐지 상태 Repository 구현체
+"""
+
+from typing import Optional
+from datetime import datetime
+
+from domain.repositories.detection_state_repository import DetectionStateRepository
+from domain.services.incremental_block_detector import BlockDetectionState
+from infrastructure.database.models import DetectionState as DetectionStateORM
+from infrastructure.database.connection import get_session
+
+
+class SQLAlchemyDetectionStateRepository(DetectionStateRepository):
+    """SQLAlchemy 기반 Detection State Repository 구현 (상태는 JSON 컬럼)"""
+
+    def get(self, stock_id: int, settings_hash: str) -> Optional[BlockDetectionState]:
+        """상태 조회 (없으면 None)"""
+        with get_session() as session:
+            orm = session.query(DetectionStateORM).filter_by(
+                stock_id=stock_id,
+                settings_hash=settings_hash
+            ).first()
+            return BlockDetectionState.from_json(orm.state) if orm else None
+
+    def save(self, stock_id: int, settings_hash: str, state: BlockDetectionState) -> None:
+        """상태 저장 (있으면 갱신)"""
+        if state.last_date is None:
+            return  # 처리한 봉이 없으면 저장할 워터마크도 없음
+
+        with get_session() as session:
+            orm = session.query(DetectionStateORM).filter_by(
+                stock_id=stock_id,
+                settings_hash=settings_hash
+            ).first()
+
+            if orm:
+                orm.last_date = state.last_date
+                orm.state = state.to_json()
+                orm.updated_at = datetime.now()
+            else:
+                session.add(DetectionStateORM(
+                    stock_id=stock_id,
+                    settings_hash=settings_hash,
+                    last_date=state.last_date,
+                    state=state.to_json()
+                ))
+
+    def delete_by_stock(self, stock_id: int) -> int:
+        """종목의 모든 상태 삭제"""
+        with get_session() as session:
+            return session.query(DetectionStateORM).filter_by(stock_id=stock_id).delete()
@@ -8,8 +8,11 @@ from datetime import date, datetime
 
 from domain.repositories.price_data_repository import PriceDataRepository
 from domain.entities.price_data import PriceData as PriceDataEntity
+from domain.entities.price_series import PriceSeries
 from infrastructure.database.models import PriceData as PriceDataORM
 from infrastructure.database.connection import get_session
+from infrastructure.database.price_summary import refresh_price_summary
+from infrastructure.cache import price_series_cache
 from sqlalchemy import func
 
 
@@ -80,6 +83,34 @@ class SQLAlchemyPriceDataRepository(PriceDataRepository):
 
             return [self._to_entity(orm) for orm in orms]
 
+    def get_series(
+        self,
+        stock_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> PriceSeries:
+        """기간별 주가 시계열 조회 (ORM 객체 생성 없이 컬럼만 조회)"""
+        with get_session() as session:
+            query = session.query(
+                PriceDataORM.date,
+                PriceDataORM.open,
+                PriceDataORM.high,
+                PriceDataORM.low,
+                PriceDataORM.close,
+                PriceDataORM.volume,
+                PriceDataORM.trading_value,
+                PriceDataORM.market_cap
+            ).filter(PriceDataORM.stock_id == stock_id)
+
+            if start_date is not None:
+                query = query.filter(PriceDataORM.date >= start_date)
+            if end_date is not None:
+                query = query.filter(PriceDataORM.date <= end_date)
+
+            rows = query.order_by(PriceDataORM.date).all()
+
+        return PriceSeries.from_rows(stock_id, rows)
+
     def get_latest(self, stock_id: int) -> Optional[PriceDataEntity]:
         """최신 주가 데이터 조회"""
         with get_session() as session:
@@ -123,7 +154,11 @@ class SQLAlchemyPriceDataRepository(PriceDataRepository):
                 session.add(orm)
 
             session.flush()
-            return self._to_entity(orm)
+            entity = self._to_entity(orm)
+            refresh_price_summary(session, price_data.stock_id, [price_data.date])
+
+        price_series_cache.invalidate(price_data.stock_id)
+        return entity
 
     def save_bulk(self, price_data_list: List[PriceDataEntity]) -> int:
         """대량 주가 데이터 저장"""
@@ -152,6 +187,15 @@ class SQLAlchemyPriceDataRepository(PriceDataRepository):
                     session.add(orm)
                     saved_count += 1
 
+            session.flush()
+            for stock_id in {p.stock_id for p in price_data_list}:
+                refresh_price_summary(
+                    session, stock_id, [p.date for p in price_data_list if p.stock_id == stock_id]
+                )
+
+        for stock_id in {p.stock_id for p in price_data_list}:
+            price_series_cache.invalidate(stock_id)
+
         return saved_count
 
     def exists(self, stock_id: int, target_date: date) -> bool:
@@ -169,4 +213,7 @@ class SQLAlchemyPriceDataRepository(PriceDataRepository):
             deleted = session.query(PriceDataORM).filter_by(
                 stock_id=stock_id
             ).delete()
-            return deleted
+            refresh_price_summary(session, stock_id)
+
+        price_series_cache.invalidate(stock_id)
+        return deleted
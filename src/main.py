@@ -4,8 +4,11 @@ RoboStock - 거래량 블록 기반 장기투자 분석 플랫폼
 
 실행 방법:
     프로젝트 루트에서: python -m src.main
+    다른 DB로 실행: python -m src.main --db data/other.db   (또는 환경변수 ROBOSTOCK_DB, :memory: / temp 가능)
 """
 
+import argparse
+import multiprocessing
 import sys
 
 from PySide6.QtWidgets import QApplication
@@ -15,7 +18,7 @@ from PySide6.QtGui import QFont
 from core.config import APP_CONFIG
 from styles.theme import theme_manager
 from ui.windows.main_window import MainWindow
-from infrastructure.database import init_database
+from infrastructure.database import add_database_argument, configure_database, init_database
 
 
 def setup_app():
@@ -43,6 +46,12 @@ def setup_app():
 
 def main():
     """메인 함수"""
+    # DB 프로필 (Qt 옵션은 QApplication이 처리하도록 남김)
+    parser = argparse.ArgumentParser(description=APP_CONFIG["description"])
+    add_database_argument(parser)
+    args, _ = parser.parse_known_args()
+    configure_database(args.db)
+
     # 데이터베이스 초기화
     print("[INFO] Database initialization...")
     init_database()
@@ -58,4 +67,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # 병렬 블록 탐지 프로세스 (패키징 빌드용)
     main()
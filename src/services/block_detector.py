@@ -3,19 +3,32 @@ Block Detector Service
 거래량 블록 탐지 알고리즘
 """
 
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, Tuple
 import pandas as pd
 import numpy as np
 import logging
 
 from infrastructure.database import get_session
-from infrastructure.database.models import Stock, PriceData, VolumeBlock
-from core.enums import BlockType, NewHighGrade, PatternType
-from core.config import BLOCK_CRITERIA
+from infrastructure.database.models import Stock, PriceData, InvestorTrading
+from infrastructure.repositories.block_writer import BlockWriter, block_rows
+from core.enums import BlockType
+from core.config import BLOCK_CRITERIA, DETECTION_CONFIG
+from domain.services.detection_core import PriceColumns, find_block_1, find_block_2
+from domain.services.detection_kernels import (
+    block_3_4_candidates, lookup_by_date, quality_grades, supply_quality_scores
+)
+from domain.services.detection_params import DetectionParams
 
 logger = logging.getLogger(__name__)
 
+# 3번/4번 블록 수급 품질 점수에 쓰는 investor_trading 컬럼
+INVESTOR_COLUMNS = [
+    'institutional_net_buy', 'foreign_net_buy', 'program_net_buy',
+    'institutional_buying_strength', 'foreign_buying_strength',
+]
+
 
 class BlockDetector:
     """
@@ -24,7 +37,8 @@ class BlockDetector:
     알고리즘:
     1. 1번 블록 탐지: 최대거래량 + 신고가 조건
     2. 2번 블록 탐지: 1번 블록 이후 거래량 조건
-    3. 지지선 계산
+    3. 3번/4번 블록 탐지: 2번 블록 이후 거래량/가격대 조건 + 수급 품질
+    4. 지지선 계산
     """
 
     def __init__(self):
@@ -35,7 +49,8 @@ class BlockDetector:
         stock_id: int,
         start_date: datetime,
         end_date: datetime,
-        settings: dict = None
+        settings: dict = None,
+        df: Optional[pd.DataFrame] = None
     ) -> List[Dict]:
         """
         1번 블록 탐지
@@ -45,160 +60,145 @@ class BlockDetector:
         - 해당 날짜 기준 2년 이내 최대 거래량
         - 신고가 등급 계산
 
+        Args:
+            df: 이미 로드한 주가 DataFrame (None이면 start_date ~ end_date 조회)
+
         Returns:
             [{date, volume, trading_value, close_price, new_high_grade, ...}, ...]
         """
-        blocks_1 = []
+        if df is None:
+            df = self._load_price_frame(stock_id, start_date, end_date)
+
+        if df.empty:
+            return []  # 데이터 없으면 조용히 스킵
+
+        print(f"[DEBUG] Stock {stock_id}: Found {len(df)} price records")
+
+        # 샘플 데이터 출력 (첫 3개, 최대 거래대금 3개)
+        print(f"[DEBUG] Stock {stock_id}: Sample first 3 records:")
+        for i in range(min(3, len(df))):
+            row = df.iloc[i]
+            print(f"  {df.index[i].date()}: "
+                  f"Vol={row['volume']:,}, "
+                  f"Trading={row['trading_value']/1e8:.1f}억")
+
+        # 최대 거래대금 상위 3개
+        top_trading = df.nlargest(3, 'trading_value')
+        print(f"[DEBUG] Stock {stock_id}: Top 3 by trading value:")
+        for idx, row in top_trading.iterrows():
+            print(f"  {idx.date()}: "
+                  f"Vol={row['volume']:,}, "
+                  f"Trading={row['trading_value']/1e8:.1f}억")
+
+        # 1번 블록 조건 (설정값 또는 기본값 사용)
+        min_trading_value, max_period_days = self._block_1_criteria(settings)
+
+        print(f"[DEBUG] Stock {stock_id}: Criteria - "
+              f"min_trading_value={min_trading_value/1e8:.0f}억, "
+              f"max_period={max_period_days}days")
+        if settings:
+            print(f"[DEBUG] Stock {stock_id}: Using custom settings: {settings}")
+
+        blocks_1 = self._find_block_1(df, min_trading_value, max_period_days)
+
+        for block_info in blocks_1:
+            print(f"[DEBUG] Stock {stock_id}: Block 1 found on {block_info['date']} - "
+                  f"Trading={block_info['trading_value']/1e8:.0f}억")
+
+        passed_trading = int((~(df['trading_value'] < min_trading_value)).sum())
+        print(f"[DEBUG] Stock {stock_id}: Candidates={passed_trading}, "
+              f"Failed(trading)={len(df) - passed_trading}, "
+              f"Failed(volume)={passed_trading - len(blocks_1)}, "
+              f"Found={len(blocks_1)}")
+
+        return blocks_1
+
+    def _load_price_frame(
+        self,
+        stock_id: int,
+        start_date,
+        end_date
+    ) -> pd.DataFrame:
+        """
+        주가 데이터 조회 → 날짜 인덱스 DataFrame (컬럼 단위 조회, ORM 객체 생성 없음)
 
+        Returns:
+            index=date, columns=[open, high, low, close, volume, trading_value]
+        """
         with get_session() as session:
-            # 주가 데이터 조회
-            price_data = session.query(PriceData).filter(
+            rows = session.query(
+                PriceData.date,
+                PriceData.open,
+                PriceData.high,
+                PriceData.low,
+                PriceData.close,
+                PriceData.volume,
+                PriceData.trading_value
+            ).filter(
                 PriceData.stock_id == stock_id,
                 PriceData.date >= start_date,
                 PriceData.date <= end_date
             ).order_by(PriceData.date).all()
 
-            if not price_data:
-                return blocks_1  # 데이터 없으면 조용히 스킵
-
-            print(f"[DEBUG] Stock {stock_id}: Found {len(price_data)} price records")
-
-            # DataFrame으로 변환
-            df = pd.DataFrame([{
-                'date': p.date,
-                'open': p.open,
-                'high': p.high,
-                'low': p.low,
-                'close': p.close,
-                'volume': p.volume,
-                'trading_value': p.trading_value
-            } for p in price_data])
-
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.set_index('date')
-
-            # 샘플 데이터 출력 (첫 3개, 최대 거래대금 3개)
-            print(f"[DEBUG] Stock {stock_id}: Sample first 3 records:")
-            for i in range(min(3, len(df))):
-                row = df.iloc[i]
-                print(f"  {df.index[i].date()}: "
-                      f"Vol={row['volume']:,}, "
-                      f"Trading={row['trading_value']/1e8:.1f}억")
-
-            # 최대 거래대금 상위 3개
-            top_trading = df.nlargest(3, 'trading_value')
-            print(f"[DEBUG] Stock {stock_id}: Top 3 by trading value:")
-            for idx, row in top_trading.iterrows():
-                print(f"  {idx.date()}: "
-                      f"Vol={row['volume']:,}, "
-                      f"Trading={row['trading_value']/1e8:.1f}억")
-
-            # 1번 블록 조건 체크 (설정값 또는 기본값 사용)
-            if settings and 'block1' in settings:
-                block1_settings = settings['block1']
-                min_trading_value = block1_settings.get('min_trading_value', BLOCK_CRITERIA['block_1']['min_trading_value'])
-                if min_trading_value is None:
-                    min_trading_value = 0  # 조건 비활성화
-            else:
-                min_trading_value = BLOCK_CRITERIA['block_1']['min_trading_value']
-
-            max_period_days = BLOCK_CRITERIA['block_1']['max_volume_period_days']
+        return price_frame_from_rows(rows)
 
-            print(f"[DEBUG] Stock {stock_id}: Criteria - "
-                  f"min_trading_value={min_trading_value/1e8:.0f}억, "
-                  f"max_period={max_period_days}days")
-            if settings:
-                print(f"[DEBUG] Stock {stock_id}: Using custom settings: {settings}")
-
-            candidates = 0
-            failed_trading = 0
-            failed_volume = 0
-
-            for idx, row in df.iterrows():
-                # 조건 1: 거래대금 >= 500억원
-                if row['trading_value'] < min_trading_value:
-                    failed_trading += 1
-                    continue
-
-                candidates += 1
-
-                # 조건 2: 2년 이내 최대 거래량 확인
-                lookback_start = idx - timedelta(days=max_period_days)
-                lookback_data = df[lookback_start:idx]
-
-                if lookback_data.empty:
-                    continue
-
-                max_volume_in_period = lookback_data['volume'].max()
-                if row['volume'] < max_volume_in_period:
-                    failed_volume += 1
-                    continue
-
-                # 신고가 등급 계산
-                new_high_grade = self._calculate_new_high_grade(df, idx)
-
-                # 1번 블록 발견
-                block_info = {
-                    'date': idx.date(),
-                    'volume': int(row['volume']),
-                    'trading_value': float(row['trading_value']),
-                    'close_price': float(row['close']),
-                    'new_high_grade': new_high_grade,
-                    'max_volume_period_days': max_period_days
-                }
-
-                blocks_1.append(block_info)
-                print(f"[DEBUG] Stock {stock_id}: Block 1 found on {idx.date()} - "
-                      f"Trading={row['trading_value']/1e8:.0f}억")
-
-            print(f"[DEBUG] Stock {stock_id}: Candidates={candidates}, "
-                  f"Failed(trading)={failed_trading}, "
-                  f"Failed(volume)={failed_volume}, "
-                  f"Found={len(blocks_1)}")
+    @staticmethod
+    def _block_1_criteria(settings: dict = None) -> Tuple[float, int]:
+        """1번 블록 조건 (min_trading_value, max_period_days) - 설정값 또는 기본값"""
+        if settings and 'block1' in settings:
+            block1_settings = settings['block1']
+            min_trading_value = block1_settings.get('min_trading_value', BLOCK_CRITERIA['block_1']['min_trading_value'])
+            if min_trading_value is None:
+                min_trading_value = 0  # 조건 비활성화
+        else:
+            min_trading_value = BLOCK_CRITERIA['block_1']['min_trading_value']
 
-        return blocks_1
+        return min_trading_value, BLOCK_CRITERIA['block_1']['max_volume_period_days']
 
-    def _calculate_new_high_grade(self, df: pd.DataFrame, current_date) -> NewHighGrade:
-        """
-        신고가 등급 계산
-
-        S: 역사적 신고가 (전체 데이터)
-        A: 10년래 신고가
-        B: 5년래 신고가
-        C: 2년래 신고가
-        D: 1년래 신고가
-        E: 6개월래 신고가
-        F: 해당없음
+    def detect_from_frame(
+        self,
+        df: pd.DataFrame,
+        end_date,
+        settings: dict = None
+    ) -> Tuple[List[Dict], List[Dict]]:
         """
-        current_price = df.loc[current_date, 'high']
-
-        # 각 기간별 최고가 확인
-        periods = {
-            NewHighGrade.S: None,  # 전체
-            NewHighGrade.A: timedelta(days=3650),  # 10년
-            NewHighGrade.B: timedelta(days=1825),  # 5년
-            NewHighGrade.C: timedelta(days=730),   # 2년
-            NewHighGrade.D: timedelta(days=365),   # 1년
-            NewHighGrade.E: timedelta(days=180),   # 6개월
-        }
+        로드된 시계열에서 1번/2번 블록 탐지 (DB 접근/디버그 출력 없음 - 병렬 워커용)
 
-        for grade, period in periods.items():
-            if period is None:
-                # 전체 기간
-                lookback_data = df[:current_date]
-            else:
-                lookback_start = current_date - period
-                lookback_data = df[lookback_start:current_date]
+        Args:
+            df: 시작일 ~ end_date + 2번 블록 최대 간격까지의 DataFrame
+            end_date: 1번 블록 탐지 종료일
 
-            if lookback_data.empty:
-                continue
+        Returns:
+            (blocks_1, blocks_2)
+        """
+        min_trading_value, max_period_days = self._block_1_criteria(settings)
+        blocks_1 = self._find_block_1(
+            df[df.index <= pd.Timestamp(end_date)], min_trading_value, max_period_days
+        )
+        return blocks_1, self._find_block_2(df, blocks_1, settings)
 
-            max_high = lookback_data['high'].max()
+    def _find_block_1(
+        self,
+        df: pd.DataFrame,
+        min_trading_value: float,
+        max_period_days: int
+    ) -> List[Dict]:
+        """
+        1번 블록 조건을 전체 시계열에 대해 한 번에 계산 (detection_core, 기간 기준 lookback)
 
-            if current_price >= max_high:
-                return grade
+        조건:
+        - 거래대금 >= min_trading_value
+        - [날짜 - max_period_days일, 날짜] 구간 최대 거래량 (현재 행 포함)
 
-        return NewHighGrade.F
+        Args:
+            df: 날짜 인덱스(오름차순) DataFrame
+        """
+        params = replace(
+            DetectionParams.for_block_detector(),
+            min_trading_value=float(min_trading_value),
+            max_period_days=max_period_days
+        )
+        return find_block_1(PriceColumns.from_frame(df), params)
 
     def detect_block_2(
         self,
@@ -208,7 +208,7 @@ class BlockDetector:
         settings: dict = None
     ) -> List[Dict]:
         """
-        2번 블록 탐지
+        2번 블록 탐지 (단일 1번 블록)
 
         조건:
         - 1번 블록 이후 180일 이내
@@ -218,176 +218,193 @@ class BlockDetector:
         Returns:
             [{date, volume, trading_value, close_price, pattern_type, ...}, ...]
         """
-        blocks_2 = []
-
-        # 설정값 또는 기본값 사용
-        if settings and 'block2' in settings:
-            block2_settings = settings['block2']
-            max_days = BLOCK_CRITERIA['block_2']['max_days_from_block1']
-            min_volume_ratio = block2_settings.get('min_volume_ratio', BLOCK_CRITERIA['block_2']['volume_ratio_min'])
-            if min_volume_ratio is None:
-                min_volume_ratio = 0  # 조건 비활성화
-            min_trading_value = block2_settings.get('min_trading_value')
-        else:
-            max_days = BLOCK_CRITERIA['block_2']['max_days_from_block1']
-            min_volume_ratio = BLOCK_CRITERIA['block_2']['volume_ratio_min']
-            min_trading_value = None
+        max_days = BLOCK_CRITERIA['block_2']['max_days_from_block1']
+        df = self._load_price_frame(stock_id, block_1_date, block_1_date + timedelta(days=max_days))
 
-        end_date = block_1_date + timedelta(days=max_days)
+        return self._find_block_2(
+            df,
+            [{'date': block_1_date, 'volume': block_1_volume}],
+            settings
+        )
 
-        with get_session() as session:
-            # 1번 블록 이후 데이터 조회
-            price_data = session.query(PriceData).filter(
-                PriceData.stock_id == stock_id,
-                PriceData.date > block_1_date,
-                PriceData.date <= end_date
-            ).order_by(PriceData.date).all()
-
-            for idx, price in enumerate(price_data):
-                # 거래량 조건 체크
-                volume_ratio = price.volume / block_1_volume
-
-                if volume_ratio >= min_volume_ratio:
-                    # 거래대금 조건 체크
-                    if min_trading_value and price.trading_value < min_trading_value:
-                        continue
-
-                    # 패턴 분류
-                    pattern_type = self._classify_pattern(price_data, idx)
+    def _find_block_2(
+        self,
+        df: pd.DataFrame,
+        blocks_1: List[Dict],
+        settings: dict = None
+    ) -> List[Dict]:
+        """
+        로드된 시계열에서 모든 1번 블록의 2번 블록을 한 번에 탐지 (DB 접근 없음, detection_core)
 
-                    days_from_block1 = (price.date - block_1_date).days
+        Args:
+            df: 날짜 인덱스(오름차순) DataFrame - 각 1번 블록 이후 max_days일까지 포함해야 함
+            blocks_1: [{date, volume, ...}, ...]
 
-                    block_info = {
-                        'date': price.date,
-                        'volume': price.volume,
-                        'trading_value': price.trading_value,
-                        'close_price': price.close,
-                        'volume_ratio': volume_ratio,
-                        'days_from_block1': days_from_block1,
-                        'pattern_type': pattern_type
-                    }
+        Returns:
+            1번 블록 순서대로 [{date, volume, trading_value, close_price, pattern_type, ...}, ...]
+        """
+        if df.empty or not blocks_1:
+            return []
 
-                    blocks_2.append(block_info)
-                    logger.info(f"Block 2 found: {price.date} - Volume ratio {volume_ratio*100:.1f}%, Pattern {pattern_type.value}")
+        blocks_2 = find_block_2(PriceColumns.from_frame(df), blocks_1, DetectionParams.for_block_detector(settings))
+        for block_info in blocks_2:
+            logger.info(f"Block 2 found: {block_info['date']} - Volume ratio {block_info['volume_ratio']*100:.1f}%, "
+                        f"Pattern {block_info['pattern_type'].value}")
 
         return blocks_2
 
-    def _classify_pattern(self, price_data: List[PriceData], current_idx: int) -> PatternType:
+    @staticmethod
+    def block_3_4_enabled(settings: dict = None) -> bool:
+        """3번/4번 블록 탐지 여부 (settings['block3']['enabled'] 또는 DETECTION_CONFIG['block_3_4'])"""
+        enabled = ((settings or {}).get('block3') or {}).get('enabled')
+        return DETECTION_CONFIG['block_3_4'] if enabled is None else bool(enabled)
+
+    @staticmethod
+    def data_horizon_days(settings: dict = None) -> int:
+        """1번 블록 종료일 이후 조회해야 하는 기간 (2번 블록 간격 + 3번 블록 간격)"""
+        days = BLOCK_CRITERIA['block_2']['max_days_from_block1']
+        if BlockDetector.block_3_4_enabled(settings):
+            days += BLOCK_CRITERIA['block_3']['max_days_from_block2']
+        return days
+
+    def _load_investor_frame(self, stock_id: int, start_date, end_date) -> pd.DataFrame:
+        """수급 데이터 조회 → date 컬럼 + INVESTOR_COLUMNS DataFrame"""
+        with get_session() as session:
+            rows = session.query(
+                InvestorTrading.date,
+                *(getattr(InvestorTrading, name) for name in INVESTOR_COLUMNS)
+            ).filter(
+                InvestorTrading.stock_id == stock_id,
+                InvestorTrading.date >= start_date,
+                InvestorTrading.date <= end_date
+            ).all()
+
+        return investor_frame_from_rows(rows)
+
+    def _find_block_3_4(
+        self,
+        df: pd.DataFrame,
+        blocks_2: List[Dict],
+        load_investor: Optional[Callable[[object, object], pd.DataFrame]] = None
+    ) -> Tuple[List[Dict], List[Dict]]:
         """
-        2번 블록 패턴 분류
+        로드된 시계열에서 3번/4번 블록 일괄 탐지 (DB 접근은 load_investor 콜백만)
 
-        D: 당일만 거래량 급증
-        D+D+1: 당일 + 다음날 연속 거래량
-        D+D+2: 당일 + 2일 후 거래량
-        D+D+1+D+2: 3일 연속 거래량
-        """
-        if current_idx >= len(price_data):
-            return PatternType.D_ONLY
+        - 1번 블록마다 첫 2번 블록을 기준(앵커)으로 D ~ D+2 최대 거래량/최고가 계산
+        - 3번 블록: 기준 이후 180일 이내 첫 행 (거래량 >= 기준 × 15%, 고가가 기준 고가 ±12%)
+        - 4번 블록: 같은 구간의 두 번째 충족 행
+        - 수급 품질: 후보 날짜에 수급 데이터를 날짜로 join해 점수/등급 일괄 계산
 
-        current = price_data[current_idx]
-        current_volume = current.volume
+        Args:
+            df: 날짜 인덱스 DataFrame - 각 2번 블록 이후 max_days_from_block2일까지 포함
+            blocks_2: _find_block_2 결과 (1번 블록 순서)
+            load_investor: (시작일, 종료일) → investor_frame_from_rows 형식 (None이면 품질 기본 5점)
 
-        # 평균 거래량 계산 (이전 20일)
-        if current_idx >= 20:
-            prev_20_volumes = [price_data[i].volume for i in range(current_idx - 20, current_idx)]
-            avg_volume = np.mean(prev_20_volumes)
-        else:
-            avg_volume = current_volume * 0.5
-
-        threshold = avg_volume * 0.8  # 평균의 80% 이상
-
-        # D+1 확인
-        has_d1 = False
-        if current_idx + 1 < len(price_data):
-            next_volume = price_data[current_idx + 1].volume
-            if next_volume >= threshold:
-                has_d1 = True
-
-        # D+2 확인
-        has_d2 = False
-        if current_idx + 2 < len(price_data):
-            d2_volume = price_data[current_idx + 2].volume
-            if d2_volume >= threshold:
-                has_d2 = True
-
-        # 패턴 분류
-        if has_d1 and has_d2:
-            return PatternType.D_D1_D2
-        elif has_d1:
-            return PatternType.D_D1
-        elif has_d2:
-            return PatternType.D_D2
-        else:
-            return PatternType.D_ONLY
+        Returns:
+            (blocks_3, blocks_4)
+        """
+        if df.empty or not blocks_2:
+            return [], []
+
+        criteria = BLOCK_CRITERIA['block_3']
+        anchor_dates = []
+        seen_parents = set()
+        for block in blocks_2:
+            parent = block.get('parent_date') or block['date'] - timedelta(days=block['days_from_block1'])
+            if parent not in seen_parents:
+                seen_parents.add(parent)
+                anchor_dates.append(block['date'])
+        anchor_dates = sorted(set(anchor_dates))
+
+        dates = df.index.values.astype('datetime64[D]')
+        anchor_rows = np.searchsorted(dates, np.asarray(anchor_dates, dtype='datetime64[D]'))
+        ref_volume, ref_high, row_3, row_4 = block_3_4_candidates(
+            dates,
+            df['high'].to_numpy(),
+            df['volume'].to_numpy(),
+            anchor_rows,
+            criteria['max_days_from_block2'],
+            criteria['volume_ratio_min'],
+            criteria['price_range_pct'],
+            BLOCK_CRITERIA['block_2']['pattern_match_days']
+        )
+
+        found = [
+            (BlockType.BLOCK_3, anchor, row, None)
+            for anchor, row in enumerate(row_3) if row >= 0
+        ] + [
+            (BlockType.BLOCK_4, anchor, row, row_3[anchor])
+            for anchor, row in enumerate(row_4) if row >= 0
+        ]
+        if not found:
+            return [], []
+
+        # 후보 날짜 ← 수급 데이터 (날짜 기준 left join, 없는 날은 NaN → 기본 점수)
+        candidate_dates = dates[[row for _, _, row, _ in found]]
+        investor = None
+        if load_investor:
+            investor = load_investor(pd.Timestamp(candidate_dates.min()), pd.Timestamp(candidate_dates.max()))
+        if investor is None:
+            investor = investor_frame_from_rows([])
+        supply = lookup_by_date(candidate_dates, investor['date'], investor[INVESTOR_COLUMNS])
+        scores = supply_quality_scores(
+            *(supply[:, INVESTOR_COLUMNS.index(name)] for name in (
+                'institutional_net_buy', 'foreign_net_buy',
+                'institutional_buying_strength', 'foreign_buying_strength', 'program_net_buy',
+            )),
+            criteria['buying_strength_sum_min']
+        )
+        grades = quality_grades(scores)
+
+        volumes = df['volume'].to_numpy()
+        highs = df['high'].to_numpy()
+        trading_values = df['trading_value'].to_numpy()
+        closes = df['close'].to_numpy()
+
+        blocks = {BlockType.BLOCK_3: {}, BlockType.BLOCK_4: {}}
+        for i, (block_type, anchor, row, parent_row) in enumerate(found):
+            block_date = dates[row].item()
+            if block_date in blocks[block_type]:
+                continue  # 여러 앵커가 같은 날을 가리키면 먼저 나온 것만
+            trading_value = trading_values[row]
+            block_info = {
+                'date': block_date,
+                'volume': int(volumes[row]),
+                'trading_value': None if np.isnan(trading_value) else float(trading_value),
+                'close_price': float(closes[row]),
+                'volume_ratio': float(volumes[row] / ref_volume[anchor]),
+                'price_diff_pct': float((highs[row] - ref_high[anchor]) / ref_high[anchor] * 100),
+                'days_from_block2': int((dates[row] - dates[anchor_rows[anchor]]).astype(int)),
+                'quality_score': int(scores[i]),
+                'quality_grade': grades[i],
+            }
+            if block_type == BlockType.BLOCK_3:
+                block_info['parent_date'] = anchor_dates[anchor]
+            else:
+                block_info['parent_date'] = dates[parent_row].item()
+                block_info['days_from_block3'] = int((dates[row] - dates[parent_row]).astype(int))
+            blocks[block_type][block_date] = block_info
+
+        return list(blocks[BlockType.BLOCK_3].values()), list(blocks[BlockType.BLOCK_4].values())
 
     def save_blocks_to_db(
         self,
         stock_id: int,
         blocks_1: List[Dict],
-        blocks_2: List[Dict] = None
+        blocks_2: List[Dict] = None,
+        blocks_3: List[Dict] = None,
+        blocks_4: List[Dict] = None
     ) -> Tuple[int, int]:
         """
-        탐지된 블록을 DB에 저장
+        탐지된 블록을 DB에 저장 (BlockWriter 차분 저장 - 한 트랜잭션)
+
+        이미 있는 블록은 값이 바뀐 경우만 갱신, 2/3/4번 블록은 부모 블록과 연결.
 
         Returns:
             (저장된 1번 블록 수, 저장된 2번 블록 수)
         """
-        saved_1 = 0
-        saved_2 = 0
-
-        with get_session() as session:
-            # 1번 블록 저장
-            for block_info in blocks_1:
-                # 기존 블록 확인
-                existing = session.query(VolumeBlock).filter_by(
-                    stock_id=stock_id,
-                    block_type=BlockType.BLOCK_1,
-                    date=block_info['date']
-                ).first()
-
-                if existing:
-                    continue  # 이미 존재
-
-                new_block = VolumeBlock(
-                    stock_id=stock_id,
-                    block_type=BlockType.BLOCK_1,
-                    date=block_info['date'],
-                    volume=block_info['volume'],
-                    trading_value=block_info['trading_value'],
-                    close_price=block_info['close_price'],
-                    new_high_grade=block_info['new_high_grade'],
-                    max_volume_period_days=block_info['max_volume_period_days']
-                )
-                session.add(new_block)
-                saved_1 += 1
-
-            # 2번 블록 저장 (있는 경우)
-            if blocks_2:
-                for block_info in blocks_2:
-                    existing = session.query(VolumeBlock).filter_by(
-                        stock_id=stock_id,
-                        block_type=BlockType.BLOCK_2,
-                        date=block_info['date']
-                    ).first()
-
-                    if existing:
-                        continue
-
-                    new_block = VolumeBlock(
-                        stock_id=stock_id,
-                        block_type=BlockType.BLOCK_2,
-                        date=block_info['date'],
-                        volume=block_info['volume'],
-                        trading_value=block_info['trading_value'],
-                        close_price=block_info['close_price'],
-                        days_from_parent=block_info['days_from_block1'],
-                        volume_ratio=block_info['volume_ratio'],
-                        pattern_type=block_info['pattern_type']
-                    )
-                    session.add(new_block)
-                    saved_2 += 1
-
-        return saved_1, saved_2
+        result = BlockWriter().write({stock_id: block_rows(blocks_1, blocks_2 or [], blocks_3 or [], blocks_4 or [])})
+        return result.inserted_count(BlockType.BLOCK_1), result.inserted_count(BlockType.BLOCK_2)
 
     def detect_all_blocks(
         self,
@@ -409,6 +426,8 @@ class BlockDetector:
             {
                 'blocks_1': [...],
                 'blocks_2': [...],
+                'blocks_3': [...],
+                'blocks_4': [...],
                 'stock_id': int
             }
         """
@@ -416,43 +435,72 @@ class BlockDetector:
             stock = session.query(Stock).filter_by(code=stock_code).first()
             if not stock:
                 logger.warning(f"Stock {stock_code} not found")
-                return {'blocks_1': [], 'blocks_2': [], 'stock_id': None}
+                return {'blocks_1': [], 'blocks_2': [], 'blocks_3': [], 'blocks_4': [], 'stock_id': None}
 
             # stock_id를 변수에 저장 (세션 종료 후에도 사용 가능)
             stock_id = stock.id
             stock_name = stock.name
 
+            # 주가 데이터 1회 로드 (2번/3번 블록 구간까지 포함)
+            horizon_days = self.data_horizon_days(settings)
+            df = self._load_price_frame(stock_id, start_date, end_date + timedelta(days=horizon_days))
+
             # 1번 블록 탐지 (settings 전달)
             logger.info(f"{stock_name} ({stock_code}) - Block 1 detection started...")
             if settings:
                 logger.info(f"Using custom settings for detection")
-            blocks_1 = self.detect_block_1(stock_id, start_date, end_date, settings)
+            blocks_1 = self.detect_block_1(
+                stock_id, start_date, end_date, settings,
+                df=df[df.index <= pd.Timestamp(end_date)]
+            )
 
             logger.info(f"Found {len(blocks_1)} Block 1")
 
-            # 각 1번 블록에 대해 2번 블록 탐지 (settings 전달)
-            all_blocks_2 = []
-            for block_1 in blocks_1:
-                blocks_2 = self.detect_block_2(
-                    stock_id,
-                    block_1['date'],
-                    block_1['volume'],
-                    settings
-                )
-                all_blocks_2.extend(blocks_2)
+            # 모든 1번 블록의 2번 블록을 같은 시계열에서 일괄 탐지 (settings 전달)
+            all_blocks_2 = self._find_block_2(df, blocks_1, settings)
 
             logger.info(f"Found {len(all_blocks_2)} Block 2")
 
+        # 3번/4번 블록 (2번 블록 구간만 남긴 시계열 + 수급 데이터)
+        blocks_3, blocks_4 = [], []
+        if self.block_3_4_enabled(settings):
+            blocks_3, blocks_4 = self._find_block_3_4(
+                df, all_blocks_2, lambda first, last: self._load_investor_frame(stock_id, first, last)
+            )
+            logger.info(f"Found {len(blocks_3)} Block 3, {len(blocks_4)} Block 4")
+
         # DB 저장 (세션 밖에서 실행, 내부에서 새 세션 생성)
-        saved_1, saved_2 = self.save_blocks_to_db(stock_id, blocks_1, all_blocks_2)
+        saved_1, saved_2 = self.save_blocks_to_db(stock_id, blocks_1, all_blocks_2, blocks_3, blocks_4)
         logger.info(f"DB saved: Block 1 {saved_1}, Block 2 {saved_2}")
 
         return {
             'blocks_1': blocks_1,
             'blocks_2': all_blocks_2,
+            'blocks_3': blocks_3,
+            'blocks_4': blocks_4,
             'stock_id': stock_id
         }
 
 
+def price_frame_from_rows(rows) -> pd.DataFrame:
+    """
+    (date, open, high, low, close, volume, trading_value) 행 → 날짜 인덱스 DataFrame
+    """
+    columns = ['date', 'open', 'high', 'low', 'close', 'volume', 'trading_value']
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    df['date'] = pd.to_datetime(df['date'])
+    df['trading_value'] = df['trading_value'].astype(float)
+    return df.set_index('date')
+
+
+def investor_frame_from_rows(rows) -> pd.DataFrame:
+    """
+    (date, *INVESTOR_COLUMNS) 행 → date 컬럼 DataFrame (price_frame_from_rows 인덱스와 merge 가능)
+    """
+    df = pd.DataFrame.from_records(rows, columns=['date', *INVESTOR_COLUMNS])
+    df['date'] = pd.to_datetime(df['date'])
+    return df.astype({name: float for name in INVESTOR_COLUMNS})
+
+
 # 전역 블록 탐지 인스턴스
 block_detector = BlockDetector()
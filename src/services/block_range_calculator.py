@@ -0,0 +1,139 @@
+"""
+Block Range Calculator
+블록 기간(D일 ~ 60이평선 회귀일) 필드 일괄 계산 및 저장
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import or_, select
+from sqlalchemy.engine import Connection, Engine
+
+from core.config import BLOCK_CRITERIA, DETECTION_CONFIG
+from core.enums import RangeEndReason
+from domain.services.range_kernels import block_ranges, range_fields
+from infrastructure.database.batch import lead_start, select_in_chunks, update_by_id
+from infrastructure.database.migrations import add_missing_columns
+from infrastructure.database.models import PriceData, VolumeBlock
+from services.block_detector import price_frame_from_rows
+
+logger = logging.getLogger(__name__)
+
+RANGE_FIELDS = (
+    'range_end_date', 'range_duration_days',
+    'range_high', 'range_high_date', 'range_low', 'range_low_date',
+    'range_avg_volume', 'ma60_at_start', 'ma60_at_end', 'range_end_reason',
+    'breakout_run_days', 'breakout_confirmed_date', 'support_hold_days',
+)
+
+
+class BlockRangeCalculator:
+    """
+    블록 기간 계산 엔진
+
+    - 대상 블록(id, 종목, 날짜)을 쿼리 한 번으로 읽어 종목별로 묶음
+    - 종목마다 주가를 한 번만 조회하고 60이평을 한 번만 계산 → 블록별 종료일/최고·최저가/평균 거래량은
+      range_kernels의 첫 True 검색과 구간 축약으로 일괄 계산
+    - 돌파 확인(D일 고가 위 breakout_hold_days일 연속 종가)/지지 유지 일수는 run_kernels 연속 판정
+    - batch_size 종목 단위로 executemany update + 커밋 (중단돼도 완료된 배치는 유지)
+
+    Usage:
+        calculator = BlockRangeCalculator()
+        calculator.update()                    # volume_blocks 전체 백필
+        calculator.update([stock_id])          # 특정 종목만
+        calculator.update(only_missing=True)   # 미계산 + 진행중 블록만
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        ma_period: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        self._engine = engine
+        self.ma_period = ma_period or BLOCK_CRITERIA['ma_period']
+        self.hold_days = BLOCK_CRITERIA['breakout_hold_days']
+        self.batch_size = batch_size or DETECTION_CONFIG['write_batch_size']
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def update(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        only_missing: bool = False,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> int:
+        """
+        블록 기간 필드 계산 후 저장
+
+        Args:
+            stock_ids: 대상 종목 (None이면 전체)
+            only_missing: True면 기간/연속 판정이 비어 있거나 아직 회귀하지 않은(진행중) 블록만
+            progress_callback: (완료 종목 수, 전체, 메시지)
+
+        Returns:
+            갱신된 블록 수
+        """
+        start = time.perf_counter()
+        add_missing_columns(self.engine, [VolumeBlock.__table__])
+        blocks = self._load_blocks(stock_ids, only_missing)
+        groups = list(blocks.groupby('stock_id', sort=True)) if len(blocks) else []
+        total = len(groups)
+
+        updated = 0
+        pending: List[Dict] = []
+        with self.engine.connect() as conn:
+            for completed, (stock_id, group) in enumerate(groups, start=1):
+                pending.extend(self._stock_updates(conn, stock_id, group))
+                if completed % self.batch_size == 0:
+                    updated += self._write(conn, pending)
+                    pending = []
+                if progress_callback:
+                    progress_callback(completed, total, f"[{completed}/{total}] 블록 기간 계산 중")
+            updated += self._write(conn, pending)
+
+        logger.info(f"[BLOCK_RANGE] Updated {updated} blocks ({total} stocks) in {time.perf_counter() - start:.1f}s")
+        return updated
+
+    # ===== 내부 =====
+
+    def _load_blocks(self, stock_ids: Optional[Sequence[int]], only_missing: bool) -> pd.DataFrame:
+        query = select(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date)
+        if only_missing:
+            query = query.where(or_(
+                VolumeBlock.range_end_date.is_(None),
+                VolumeBlock.support_hold_days.is_(None),
+                VolumeBlock.range_end_reason == RangeEndReason.OPEN.value
+            ))
+        with self.engine.connect() as conn:
+            rows = select_in_chunks(
+                conn, query.order_by(VolumeBlock.stock_id, VolumeBlock.date), VolumeBlock.stock_id, stock_ids
+            )
+        return pd.DataFrame.from_records(rows, columns=['id', 'stock_id', 'date'])
+
+    def _stock_updates(self, conn: Connection, stock_id: int, blocks: pd.DataFrame) -> List[Dict]:
+        """종목 1개의 블록 기간 계산 → update 파라미터"""
+        rows = conn.execute(
+            select(PriceData.date, PriceData.open, PriceData.high, PriceData.low,
+                   PriceData.close, PriceData.volume, PriceData.trading_value)
+            .where(PriceData.stock_id == stock_id, PriceData.date >= lead_start(blocks['date'].min(), self.ma_period))
+            .order_by(PriceData.date)
+        ).all()
+        if not rows:
+            return []
+
+        df = price_frame_from_rows(rows)
+        fields = range_fields(df, block_ranges(df, blocks['date'].to_numpy(), self.ma_period, self.hold_days))
+        return [{'_id': int(block_id), **values} for block_id, values in zip(blocks['id'], fields) if values]
+
+    @staticmethod
+    def _write(conn: Connection, updates: List[Dict]) -> int:
+        """블록 기간 executemany update 후 커밋 (배치 단위 트랜잭션)"""
+        return update_by_id(conn, VolumeBlock, RANGE_FIELDS, updates)
@@ -0,0 +1,221 @@
+"""
+Case Pipeline
+1번/2번 블록 쌍으로 케이스 일괄 생성 + 사후 수익률 라벨링 (진행 중인 케이스만 새 봉으로 증분 갱신)
+"""
+
+import logging
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import aliased
+
+from core.config import CASE_CONFIG, DETECTION_CONFIG
+from core.enums import BlockType, CaseStatus, ReturnLevel
+from domain.services.case_kernels import forward_labels, return_levels
+from domain.services.detection_kernels import lookup_by_date
+from infrastructure.database.batch import optional_float, select_in_chunks, update_by_id
+from infrastructure.database.migrations import add_missing_columns
+from infrastructure.database.models import Case, PriceData, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+LABEL_FIELDS = (
+    'entry_price', 'peak_price', 'peak_date', 'max_return', 'return_level',
+    'days_to_target', 'evaluated_through', 'status',
+)
+
+_CASE_COLUMNS = [
+    'id', 'stock_id', 'entry_date', 'entry_price', 'peak_price', 'peak_date', 'days_to_target', 'evaluated_through',
+]
+
+
+class CasePipeline:
+    """
+    케이스 생성/라벨링 엔진
+
+    - 생성: 케이스가 없는 1번 블록 중 2번 블록이 있는 블록을 쿼리 한 번으로 찾아 일괄 insert
+      (진입일 = 첫 2번 블록 날짜)
+    - 라벨링: active 케이스만 읽어 종목마다 주가를 한 번 조회 → case_kernels 전방 최대값 테이블로
+      진입가/최고가/최고가 날짜/목표 수익률 도달일 일괄 계산
+    - 증분: evaluated_through 이후의 새 봉만 관찰 구간으로 보고 저장된 최고가와 병합,
+      관찰 기간(horizon_days)이 지나면 completed/failed로 확정해 이후 갱신 대상에서 제외
+
+    Usage:
+        pipeline = CasePipeline()
+        created, labeled = pipeline.update()       # 새 케이스 생성 + 진행 중 케이스 갱신
+        pipeline.update([stock_id])
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        horizon_days: Optional[int] = None,
+        target_return_pct: Optional[float] = None,
+        batch_size: Optional[int] = None
+    ):
+        self._engine = engine
+        self.horizon_days = horizon_days or CASE_CONFIG['horizon_days']
+        self.target_return_pct = target_return_pct or CASE_CONFIG['target_return_pct']
+        self.level_thresholds = CASE_CONFIG['level_thresholds']
+        self.batch_size = batch_size or DETECTION_CONFIG['write_batch_size']
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def update(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Tuple[int, int]:
+        """
+        케이스 생성 후 진행 중인 케이스 라벨링
+
+        Args:
+            stock_ids: 대상 종목 (None이면 전체)
+            progress_callback: (완료 종목 수, 전체, 메시지)
+
+        Returns:
+            (생성된 케이스 수, 라벨을 갱신한 케이스 수)
+        """
+        add_missing_columns(self.engine, [Case.__table__])
+        created = self.create_cases(stock_ids)
+        labeled = self.label_cases(stock_ids, progress_callback)
+        return created, labeled
+
+    def create_cases(self, stock_ids: Optional[Sequence[int]] = None) -> int:
+        """케이스가 없는 1번 블록 중 2번 블록이 있는 블록 → 케이스 일괄 생성"""
+        child = aliased(VolumeBlock)
+        query = (
+            select(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date, func.min(child.date))
+            .join(child, (child.parent_block_id == VolumeBlock.id) & (child.block_type == BlockType.BLOCK_2))
+            .outerjoin(Case, Case.first_block_id == VolumeBlock.id)
+            .where(VolumeBlock.block_type == BlockType.BLOCK_1, Case.id.is_(None))
+            .group_by(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date)
+        )
+
+        with self.engine.begin() as conn:
+            rows = [
+                {'stock_id': stock_id, 'first_block_id': block_id, 'case_date': block_date,
+                 'entry_date': entry_date, 'status': CaseStatus.ACTIVE.value}
+                for block_id, stock_id, block_date, entry_date
+                in select_in_chunks(conn, query, VolumeBlock.stock_id, stock_ids)
+            ]
+            if rows:
+                conn.execute(insert(Case), rows)
+
+        logger.info(f"[CASE] Created {len(rows)} cases")
+        return len(rows)
+
+    def label_cases(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> int:
+        """진행 중(active) 케이스 사후 수익률 라벨링 (새 봉만 반영)"""
+        start = time.perf_counter()
+        cases = self._load_active(stock_ids)
+        groups = list(cases.groupby('stock_id', sort=True)) if len(cases) else []
+        total = len(groups)
+
+        labeled = 0
+        pending: List[Dict] = []
+        with self.engine.connect() as conn:
+            for completed, (stock_id, group) in enumerate(groups, start=1):
+                pending.extend(self._stock_updates(conn, stock_id, group))
+                if completed % self.batch_size == 0:
+                    labeled += self._write(conn, pending)
+                    pending = []
+                if progress_callback:
+                    progress_callback(completed, total, f"[{completed}/{total}] 케이스 라벨링 중")
+            labeled += self._write(conn, pending)
+
+        logger.info(f"[CASE] Labeled {labeled} cases ({total} stocks) in {time.perf_counter() - start:.1f}s")
+        return labeled
+
+    # ===== 내부 =====
+
+    def _load_active(self, stock_ids: Optional[Sequence[int]]) -> pd.DataFrame:
+        query = (
+            select(Case.id, Case.stock_id, Case.entry_date, Case.entry_price, Case.peak_price,
+                   Case.peak_date, Case.days_to_target, Case.evaluated_through)
+            .where(Case.status == CaseStatus.ACTIVE.value, Case.entry_date.isnot(None))
+        )
+        with self.engine.connect() as conn:
+            rows = select_in_chunks(conn, query.order_by(Case.stock_id, Case.entry_date), Case.stock_id, stock_ids)
+        return pd.DataFrame.from_records(rows, columns=_CASE_COLUMNS).astype(object)
+
+    def _stock_updates(self, conn: Connection, stock_id: int, cases: pd.DataFrame) -> List[Dict]:
+        """종목 1개의 진행 중 케이스 라벨 계산 → update 파라미터"""
+        # 진입가가 없는 케이스는 진입일부터, 나머지는 마지막 반영일부터 조회
+        resume = [entry if done is None else done for entry, done in zip(cases['entry_date'], cases['evaluated_through'])]
+        rows = conn.execute(
+            select(PriceData.date, PriceData.high, PriceData.close)
+            .where(PriceData.stock_id == stock_id, PriceData.date >= min(resume))
+            .order_by(PriceData.date)
+        ).all()
+        if not rows:
+            return []
+
+        dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+        high = np.array([row[1] for row in rows], dtype=np.float64)
+        close = np.array([row[2] for row in rows], dtype=np.float64)
+
+        entry_dates = np.array(list(cases['entry_date']), dtype='datetime64[D]')
+        stored_entry = np.array([np.nan if v is None else v for v in cases['entry_price']], dtype=np.float64)
+        entry_price = np.where(np.isnan(stored_entry), lookup_by_date(entry_dates, dates, close), stored_entry)
+
+        # 관찰 구간: 마지막 반영일(없으면 진입일) 다음 거래일 ~ 진입일 + horizon_days
+        horizon_end = entry_dates + np.timedelta64(self.horizon_days, 'D')
+        starts = np.searchsorted(dates, np.array(resume, dtype='datetime64[D]'), side='right')
+        ends = np.searchsorted(dates, horizon_end, side='right') - 1
+        reached_before = np.array([v is not None for v in cases['days_to_target']])
+        targets = np.where(reached_before, np.nan, entry_price * (1 + self.target_return_pct / 100))
+        labels = forward_labels(high, starts, ends, targets)
+
+        # 저장된 최고가와 병합 (새 구간 최고가가 더 높을 때만 최고가 날짜 갱신)
+        prior_peak = np.array([np.nan if v is None else v for v in cases['peak_price']], dtype=np.float64)
+        new_peak = ~np.isnan(labels.peak) & (np.isnan(prior_peak) | (labels.peak > prior_peak))
+        peak = np.where(new_peak, labels.peak, prior_peak)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            max_return = (peak / entry_price - 1.0) * 100
+        levels = return_levels(max_return, self.level_thresholds)
+        finished = dates[-1] >= horizon_end
+
+        updates = []
+        for i, case_id in enumerate(cases['id']):
+            if np.isnan(entry_price[i]):
+                continue  # 진입일 시세 없음 - 다음 수집 후 재시도
+            evaluated = dates[ends[i]].item() if ends[i] >= starts[i] else cases['evaluated_through'].iloc[i]
+            days_to_target = cases['days_to_target'].iloc[i]
+            if labels.reach_row[i] >= 0:
+                days_to_target = int((dates[labels.reach_row[i]] - entry_dates[i]).astype(int))
+            level = ReturnLevel(int(levels[i])) if levels[i] >= 0 else None
+            status = CaseStatus.ACTIVE
+            if finished[i]:
+                status = CaseStatus.FAILED if level in (None, ReturnLevel.LEVEL_0) else CaseStatus.COMPLETED
+            updates.append({
+                '_id': int(case_id),
+                'entry_price': float(entry_price[i]),
+                'peak_price': optional_float(peak[i]),
+                'peak_date': dates[labels.peak_row[i]].item() if new_peak[i] else cases['peak_date'].iloc[i],
+                'max_return': optional_float(max_return[i]),
+                'return_level': level,
+                'days_to_target': days_to_target,
+                'evaluated_through': evaluated or entry_dates[i].item(),
+                'status': status.value,
+            })
+        return updates
+
+    @staticmethod
+    def _write(conn: Connection, updates: List[Dict]) -> int:
+        """라벨 executemany update 후 커밋 (배치 단위 트랜잭션)"""
+        return update_by_id(conn, Case, LABEL_FIELDS, updates)
@@ -15,11 +15,13 @@ import socket
 # 전역 HTTP 타임아웃 설정 (10초)
 socket.setdefaulttimeout(10.0)
 
-from infrastructure.database import get_session
-from infrastructure.database.models import Stock, PriceData, InvestorTrading
+from infrastructure.database import get_session, refresh_price_summary
+from infrastructure.database.models import Stock, PriceData, InvestorTrading, IndexPrice
+from infrastructure.cache import price_series_cache, index_series_cache
 from core.enums import MarketType
-from core.config import COLLECTION_LOG_CONFIG
+from core.config import COLLECTION_LOG_CONFIG, MARKET_CONFIG
 from sqlalchemy import func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from shared.utils.collection_logger import CollectionLogger, CompactLogger, DetailedLogger
 
 
@@ -31,6 +33,7 @@ class DataCollector:
     - KOSPI/KOSDAQ 종목 리스트 수집
     - 일별 OHLCV 데이터 수집
     - 거래대금, 시가총액 수집
+    - KOSPI/KOSDAQ 지수 일별 시세 수집
     """
 
     def __init__(self):
@@ -360,6 +363,104 @@ class DataCollector:
             print(f"[ERROR] Trading data save failed: {e}")
             return 0
 
+    def collect_index_data(
+        self,
+        index_code: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[pd.DataFrame]:
+        """
+        시장 지수 일별 시세 수집
+
+        Args:
+            index_code: MarketType 값 (KOSPI/KOSDAQ)
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            DataFrame (날짜 인덱스, 시가/고가/저가/종가/거래량/거래대금)
+        """
+        ticker = MARKET_CONFIG['index_tickers'][index_code]
+        try:
+            df = pykrx_stock.get_index_ohlcv(start_date, end_date, ticker)
+        except Exception as e:
+            print(f"[ERROR] {index_code} index collection failed: {e}")
+            return None
+        if df is None or df.empty:
+            return None
+        return df
+
+    def save_index_data_to_db(self, index_code: str, df: pd.DataFrame) -> int:
+        """
+        지수 시세 upsert (한 트랜잭션, 청크 단위 executemany) 후 지수 시계열 캐시 무효화
+
+        Returns:
+            저장된 레코드 수 (실패 시 0 - 전체 롤백)
+        """
+        if df is None or df.empty:
+            return 0
+
+        now = datetime.now()
+        rows = [
+            {
+                'index_code': index_code,
+                'date': date_idx.date() if hasattr(date_idx, 'date') else date_idx,
+                'open': float(row['시가']),
+                'high': float(row['고가']),
+                'low': float(row['저가']),
+                'close': float(row['종가']),
+                'volume': float(row.get('거래량', 0)),
+                'trading_value': float(row.get('거래대금', 0)),
+                'created_at': now,
+            }
+            for date_idx, row in df.iterrows()
+        ]
+        # 행마다 바인딩 (다중 VALUES 한 문장은 장기 백필에서 SQLite 변수 한도 초과)
+        statement = sqlite_insert(IndexPrice)
+        statement = statement.on_conflict_do_update(
+            index_elements=['index_code', 'date'],
+            set_={name: statement.excluded[name] for name in ('open', 'high', 'low', 'close', 'volume', 'trading_value')}
+        )
+        chunk_size = MARKET_CONFIG['index_write_chunk']
+        try:
+            with get_session() as session:
+                for i in range(0, len(rows), chunk_size):
+                    session.execute(statement, rows[i:i + chunk_size])
+        except Exception as e:
+            print(f"[ERROR] Failed to save {index_code} index data ({len(rows)} rows): {e}")
+            return 0
+        finally:
+            index_series_cache.invalidate(index_code)
+        return len(rows)
+
+    def collect_all_indices(self, start_date: str, end_date: str) -> int:
+        """
+        KOSPI/KOSDAQ 지수 시세 수집 (지수별 마지막 저장일 다음 날부터 증분)
+
+        Returns:
+            저장된 레코드 수
+        """
+        saved = 0
+        failed = []
+        for index_code in MARKET_CONFIG['index_tickers']:
+            with get_session() as session:
+                last_date = session.query(func.max(IndexPrice.date)).filter_by(index_code=index_code).scalar()
+            collection_start = start_date
+            if last_date:
+                collection_start = max(start_date, (last_date + timedelta(days=1)).strftime("%Y%m%d"))
+            if collection_start > end_date:
+                continue
+            df = self.collect_index_data(index_code, collection_start, end_date)
+            count = self.save_index_data_to_db(index_code, df)
+            if count == 0 and df is not None and not df.empty:
+                failed.append(index_code)
+            saved += count
+        print(f"[INDEX] {saved} index records saved")
+        if failed:
+            print(f"[ERROR] Index prices not saved for {', '.join(failed)} "
+                  f"- market performance will be skipped for these markets")
+        return saved
+
     def save_price_data_to_db(
         self,
         stock_code: str,
@@ -379,6 +480,7 @@ class DataCollector:
             return 0
 
         saved_count = 0
+        stock_id = None
 
         try:
             with get_session() as session:
@@ -388,6 +490,8 @@ class DataCollector:
                     print(f"[WARNING] Stock {stock_code} not found in DB")
                     return 0
 
+                stock_id = stock.id
+
                 # DataFrame 순회하며 저장/업데이트
                 for date_idx, row in df.iterrows():
                     date_obj = date_idx.date() if hasattr(date_idx, 'date') else date_idx
@@ -421,10 +525,19 @@ class DataCollector:
                         session.add(price_data)
                         saved_count += 1
 
+                # 탐지 사전 필터용 월별 요약 갱신 (같은 트랜잭션)
+                session.flush()
+                refresh_price_summary(session, stock.id, df.index)
+
         except Exception as e:
             print(f"[ERROR] Failed to save {stock_code} to DB: {e}")
             return 0
 
+        finally:
+            # 캐시된 시계열 무효화 (차트/탐지가 새 데이터를 보도록)
+            if stock_id is not None:
+                price_series_cache.invalidate(stock_id)
+
         return saved_count
 
     def collect_all_stocks(
@@ -463,8 +576,9 @@ class DataCollector:
             print("[ERROR] Stock list is empty")
             return
 
-        # 2. 종목 정보 DB 저장
+        # 2. 종목 정보 DB 저장 + 시장 지수 시세 (블록 시장 대비 성과 기준)
         self.save_stocks_to_db(stocks)
+        self.collect_all_indices(start_date, end_date)
 
         # 3. 각 종목별 주가 데이터 수집
         total_stocks = len(stocks)
@@ -799,8 +913,9 @@ class DataCollector:
             stocks = stocks[:limit]
             print(f"   Limited to top {limit} stocks")
 
-        # DB 저장
+        # DB 저장 + 시장 지수 시세
         self.save_stocks_to_db(stocks)
+        self.collect_all_indices(start_date, end_date)
 
         total_stocks = len(stocks)
         completed = 0
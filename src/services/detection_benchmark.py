@@ -0,0 +1,262 @@
+"""
+Detection Benchmark
+합성 종목군 크기별 탐지/후처리 엔진 실행 시간 측정 + JSON 기준치 대비 회귀 판정
+"""
+
+import json
+import logging
+import platform
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from core.config import BENCHMARK_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def _run_block_detector(market, db_path: Path) -> int:
+    from services.block_detector import BlockDetector
+
+    detector = BlockDetector()
+    start, end = datetime.combine(market.start, datetime.min.time()), datetime.combine(market.end, datetime.min.time())
+    return sum(len(detector.detect_all_blocks(s['code'], start, end)['blocks_1']) for s in market.stock_list())
+
+
+def _run_use_case_bulk(market, db_path: Path) -> int:
+    from application.use_cases.detect_blocks_use_case import DetectBlocksUseCase
+    from infrastructure.repositories import (
+        CachedPriceDataRepository, SQLAlchemyBlockRepository, SQLAlchemyPriceDataRepository, SQLAlchemyStockRepository
+    )
+
+    use_case = DetectBlocksUseCase(
+        SQLAlchemyStockRepository(), CachedPriceDataRepository(SQLAlchemyPriceDataRepository()), SQLAlchemyBlockRepository()
+    )
+    results = use_case.execute_bulk([s['code'] for s in market.stock_list()], market.start, market.end)
+    return sum(len(result.get('blocks_1', [])) for result in results)
+
+
+def _run_parallel_detector(market, db_path: Path) -> int:
+    from services.parallel_block_detector import ParallelBlockDetector
+
+    stocks = [{'id': s['id'], 'code': s['code'], 'name': s['name']} for s in market.stock_list()]
+    blocks_1, _ = ParallelBlockDetector(db_path=db_path).detect(stocks, market.start, market.end, use_cache=False)
+    return blocks_1
+
+
+def _run_range_calculator(market, db_path: Path) -> int:
+    from services.block_range_calculator import BlockRangeCalculator
+    return BlockRangeCalculator().update()
+
+
+def _run_support_levels(market, db_path: Path) -> int:
+    from services.support_level_calculator import SupportLevelCalculator
+    return SupportLevelCalculator().update()
+
+
+def _run_pattern_snapshots(market, db_path: Path) -> int:
+    from services.pattern_snapshot_builder import PatternSnapshotBuilder
+    return PatternSnapshotBuilder().build()
+
+
+def _run_case_pipeline(market, db_path: Path) -> int:
+    from services.case_pipeline import CasePipeline
+    return sum(CasePipeline().update())
+
+
+# 탐지 엔진 (빈 블록 테이블에서 시작)
+DETECTION_ENGINES: Dict[str, Callable] = {
+    'block_detector': _run_block_detector,
+    'use_case_bulk': _run_use_case_bulk,
+    'parallel_detector': _run_parallel_detector,
+}
+
+# 후처리 엔진 (block_detector 탐지 결과가 저장된 DB에서 시작)
+POST_ENGINES: Dict[str, Callable] = {
+    'range_calculator': _run_range_calculator,
+    'support_levels': _run_support_levels,
+    'pattern_snapshots': _run_pattern_snapshots,
+    'case_pipeline': _run_case_pipeline,
+}
+
+ENGINES = tuple(DETECTION_ENGINES) + tuple(POST_ENGINES)
+
+
+def result_key(engine: str, size: int, years: int, seed: int) -> str:
+    """
+    측정 키 '<engine>@<종목 수>x<년>y-s<시드>' (예: block_detector@50x5y-s42)
+
+    데이터 구성(기간/시드)이 다른 측정은 키가 달라 서로 비교되거나 기준치에서 덮어써지지 않음.
+    """
+    return f'{engine}@{size}x{years}y-s{seed}'
+
+
+@dataclass
+class Regression:
+    """기준치 대비 느려진 측정"""
+
+    key: str            # result_key() - '<engine>@<종목 수>x<년>y-s<시드>'
+    baseline: float     # 초
+    current: float      # 초
+
+    @property
+    def pct(self) -> float:
+        return (self.current / self.baseline - 1) * 100
+
+
+class DetectionBenchmark:
+    """
+    탐지 벤치마크
+
+    - 종목군 크기마다 SyntheticMarket으로 템플릿 DB를 한 번 생성
+    - 엔진마다 반복 횟수만큼 템플릿 복사본(매번 새 파일)에서 실행 → 최솟값 기록 (캐시/잔여 블록 영향 없음)
+    - 후처리 엔진은 block_detector 결과가 저장된 복사본에서 시작
+    - 실행 중에는 use_database로 전역 DB를 복사본으로 전환 (앱 DB는 건드리지 않음)
+
+    Usage:
+        report = DetectionBenchmark(sizes=[10, 50]).run()
+        regressions = compare(report, load_baseline())
+    """
+
+    def __init__(
+        self,
+        sizes: Optional[Sequence[int]] = None,
+        years: Optional[int] = None,
+        seed: Optional[int] = None,
+        repeat: Optional[int] = None,
+        engines: Optional[Sequence[str]] = None,
+        work_dir: Optional[Path] = None
+    ):
+        self.sizes = list(sizes or BENCHMARK_CONFIG['universe_sizes'])
+        self.years = years or BENCHMARK_CONFIG['years']
+        self.seed = BENCHMARK_CONFIG['seed'] if seed is None else seed
+        self.repeat = repeat or BENCHMARK_CONFIG['repeat']
+        self.engines = list(engines or ENGINES)
+        unknown = [name for name in self.engines if name not in ENGINES]
+        if unknown:
+            raise ValueError(f"Unknown benchmark engines: {unknown} (available: {', '.join(ENGINES)})")
+        self.work_dir = work_dir
+
+    def run(self, progress_callback: Optional[Callable[[str, int, float], None]] = None) -> Dict:
+        """
+        전체 측정
+
+        Args:
+            progress_callback: (엔진, 종목 수, 초) - 측정 하나가 끝날 때마다
+
+        Returns:
+            {'meta': {...}, 'results': {result_key(): {'seconds', 'runs', 'output'}}}
+        """
+        results: Dict[str, Dict] = {}
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as tmp:
+            for size in self.sizes:
+                for name, result in self._run_size(Path(tmp), size).items():
+                    results[result_key(name, size, self.years, self.seed)] = result
+                    if progress_callback:
+                        progress_callback(name, size, result['seconds'])
+
+        return {
+            'meta': {
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'years': self.years,
+                'seed': self.seed,
+                'repeat': self.repeat,
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+            },
+            'results': results,
+        }
+
+    # ===== 내부 =====
+
+    def _run_size(self, tmp: Path, size: int) -> Dict[str, Dict]:
+        from services.synthetic_market import SyntheticMarket
+
+        market = SyntheticMarket(stocks=size, years=self.years, seed=self.seed)
+        template = market.write_sqlite(tmp / f'template_{size}.db')
+        detected = None
+        if any(name in POST_ENGINES for name in self.engines):
+            detected = tmp / f'detected_{size}.db'
+            shutil.copyfile(template, detected)
+            self._timed(_run_block_detector, market, detected)
+
+        results = {}
+        for name in self.engines:
+            source = template if name in DETECTION_ENGINES else detected
+            engine = DETECTION_ENGINES.get(name) or POST_ENGINES[name]
+            runs, output = [], None
+            for i in range(self.repeat):
+                db_path = tmp / f'{name}_{size}_{i}.db'
+                shutil.copyfile(source, db_path)
+                seconds, output = self._timed(engine, market, db_path)
+                runs.append(round(seconds, 4))
+                db_path.unlink(missing_ok=True)
+            results[name] = {'seconds': min(runs), 'runs': runs, 'output': output}
+            logger.info(f"[BENCHMARK] {name}@{size}: {min(runs):.3f}s (output {output})")
+        return results
+
+    @staticmethod
+    def _timed(engine: Callable, market, db_path: Path):
+        from infrastructure.database.connection import use_database
+
+        with use_database(db_path):
+            start = time.perf_counter()
+            output = engine(market, db_path)
+            return time.perf_counter() - start, output
+
+
+def load_baseline(path: Optional[Path] = None) -> Optional[Dict]:
+    """기준치 JSON 로드 (없으면 None)"""
+    path = Path(path or BENCHMARK_CONFIG['baseline_path'])
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(report: Dict, path: Optional[Path] = None) -> Path:
+    """측정 결과를 기준치로 저장 (기존 기준치의 다른 크기/엔진/기간/시드 항목은 유지)"""
+    path = Path(path or BENCHMARK_CONFIG['baseline_path'])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    baseline = load_baseline(path) or {'results': {}}
+    merged = {'meta': report['meta'], 'results': {**baseline['results'], **report['results']}}
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2, ensure_ascii=False, sort_keys=True)
+    tmp_path.replace(path)
+    return path
+
+
+def compare(
+    report: Dict,
+    baseline: Optional[Dict],
+    max_regression_pct: Optional[float] = None,
+    min_seconds: Optional[float] = None
+) -> List[Regression]:
+    """
+    기준치보다 max_regression_pct% 넘게 느려진 측정 (기준치에 없는 항목/둘 다 min_seconds 미만은 제외)
+
+    키에 기간/시드가 들어 있어 같은 합성 데이터로 잰 측정끼리만 비교됨.
+    """
+    if not baseline:
+        return []
+    if max_regression_pct is None:
+        max_regression_pct = BENCHMARK_CONFIG['max_regression_pct']
+    if min_seconds is None:
+        min_seconds = BENCHMARK_CONFIG['min_seconds']
+
+    regressions = []
+    for key, result in report['results'].items():
+        previous = baseline['results'].get(key)
+        if previous is None:
+            continue
+        base, current = previous['seconds'], result['seconds']
+        if max(base, current) < min_seconds:
+            continue
+        if current > max(base, 1e-9) * (1 + max_regression_pct / 100):
+            regressions.append(Regression(key, base, current))
+    return regressions
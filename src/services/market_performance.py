@@ -0,0 +1,232 @@
+"""
+Market Performance Calculator
+블록 기간 시장 대비 성과(지수 수익률, 상대 수익률, 베타/알파) 일괄 계산 - 종목 단위 멀티프로세스
+"""
+
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import create_engine, select
+from sqlalchemy.engine import Engine
+
+from core.config import DETECTION_CONFIG, MARKET_CONFIG
+from domain.services.market_kernels import market_performance
+from infrastructure.cache.index_series_cache import IndexSeries, IndexSeriesCache
+from infrastructure.database.batch import lead_start, optional_float, select_in_chunks, update_by_id
+from infrastructure.database.models import Stock, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+MARKET_FIELDS = (
+    'market_index', 'range_return', 'index_return', 'relative_return', 'beta', 'alpha', 'outperformance',
+)
+
+# (stock_id, 지수 코드, [(block_id, 시작일, 기간 종료일), ...])
+StockBlocks = Tuple[int, str, List[tuple]]
+
+
+def _stock_updates(
+    conn: sqlite3.Connection,
+    index: IndexSeries,
+    entry: StockBlocks,
+    beta_min_days: int
+) -> List[Dict]:
+    """종목 1개의 블록 성과 → update 파라미터 (주가 1회 조회)"""
+    stock_id, index_code, blocks = entry
+    first = lead_start(min(block[1] for block in blocks), beta_min_days)
+    last = max(block[2] for block in blocks)
+    rows = conn.execute(
+        "SELECT date, close FROM price_data WHERE stock_id = ? AND date >= ? AND date <= ? ORDER BY date",
+        (stock_id, first.isoformat(), last.isoformat())
+    ).fetchall()
+    if not rows:
+        return []
+
+    dates = np.array([row[0] for row in rows], dtype='datetime64[D]')
+    close = np.array([row[1] for row in rows], dtype=np.float64)
+    block_dates = np.array([block[1] for block in blocks], dtype='datetime64[D]')
+    starts = np.searchsorted(dates, block_dates)
+    ends = np.searchsorted(dates, np.array([block[2] for block in blocks], dtype='datetime64[D]'), side='right') - 1
+    found = (starts < len(dates)) & (ends >= starts)
+    found[found] = dates[starts[found]] == block_dates[found]
+    if not found.any():
+        return []
+
+    performance = market_performance(close, index.close_at(dates), starts[found], ends[found], beta_min_days)
+    updates = []
+    for i, block in enumerate(block for block, ok in zip(blocks, found) if ok):
+        relative = optional_float(performance.relative_return[i])
+        updates.append({
+            '_id': block[0],
+            'market_index': index_code,
+            'range_return': optional_float(performance.range_return[i]),
+            'index_return': optional_float(performance.index_return[i]),
+            'relative_return': relative,
+            'beta': optional_float(performance.beta[i]),
+            'alpha': optional_float(performance.alpha[i]),
+            'outperformance': None if relative is None else relative > 0,
+        })
+    return updates
+
+
+# ===== 워커 프로세스 =====
+
+_worker_conn: Optional[sqlite3.Connection] = None
+_worker_index: Dict[str, IndexSeries] = {}
+
+
+def _init_worker(db_path: str, index_series: Dict[str, IndexSeries]):
+    """워커 프로세스 초기화 - 읽기 전용 연결 + 지수 배열 (프로세스당 1회 전달)"""
+    global _worker_conn, _worker_index
+    _worker_conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True)
+    _worker_conn.execute("PRAGMA query_only = ON")
+    _worker_index = index_series
+
+
+def _compute_shard(entries: List[StockBlocks], beta_min_days: int) -> Tuple[List[Dict], Dict[int, str]]:
+    """샤드 계산 - 워커 프로세스에서 실행. (update 파라미터, {stock_id: 오류})"""
+    updates, errors = [], {}
+    for entry in entries:
+        try:
+            updates.extend(_stock_updates(_worker_conn, _worker_index[entry[1]], entry, beta_min_days))
+        except Exception as e:
+            errors[entry[0]] = str(e)
+    return updates, errors
+
+
+# ===== 부모 프로세스 =====
+
+class MarketPerformanceCalculator:
+    """
+    블록 시장 대비 성과 계산 엔진
+
+    - 기간(range_end_date)이 계산된 블록을 쿼리 한 번으로 읽어 종목 샤드로 분배
+    - 지수 종가는 지수별 배열로 한 번만 읽어 워커 초기화 때 전달 → 종목 날짜에 정렬
+    - 워커는 종목마다 종가를 한 번 조회하고 market_kernels로 모든 블록을 일괄 계산
+    - 부모는 결과를 받아 write_batch_size 블록 단위 executemany update
+
+    Usage:
+        calculator = MarketPerformanceCalculator()
+        calculator.update()              # 전체 블록
+        calculator.update([stock_id])
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        db_path: Optional[Path] = None,
+        beta_min_days: Optional[int] = None
+    ):
+        """
+        Args:
+            db_path: 대상 DB 파일 (None이면 현재 DB 프로필 파일 - 전역 엔진/지수 캐시 사용)
+        """
+        self.max_workers = max_workers or DETECTION_CONFIG['max_workers'] or os.cpu_count() or 1
+        self.shard_size = shard_size or DETECTION_CONFIG['shard_size']
+        self.write_batch_size = DETECTION_CONFIG['write_batch_size']
+        self.beta_min_days = beta_min_days or MARKET_CONFIG['beta_min_days']
+        self._engine: Optional[Engine] = create_engine(f"sqlite:///{db_path}") if db_path else None
+        self._index_cache = IndexSeriesCache(self._engine) if db_path else None
+        if db_path is None:
+            from infrastructure.database.connection import db_manager
+            db_path = db_manager.file_path()
+        self.db_path = Path(db_path)
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    @property
+    def index_cache(self) -> IndexSeriesCache:
+        if self._index_cache is None:
+            from infrastructure.cache import index_series_cache
+            self._index_cache = index_series_cache
+        return self._index_cache
+
+    def update(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> int:
+        """
+        블록 시장 대비 성과 계산 후 저장
+
+        Args:
+            stock_ids: 대상 종목 (None이면 전체)
+            progress_callback: (완료 종목 수, 전체, 메시지)
+
+        Returns:
+            갱신된 블록 수
+        """
+        start = time.perf_counter()
+        index_series = {code: self.index_cache.get(code) for code in MARKET_CONFIG['index_tickers']}
+        missing = [code for code, series in index_series.items() if not len(series)]
+        if missing:
+            logger.warning(f"[MARKET] No index prices for {missing} - collect index data first")
+
+        entries = [entry for entry in self._load_blocks(stock_ids) if entry[1] not in missing]
+        shards = [entries[i:i + self.shard_size] for i in range(0, len(entries), self.shard_size)]
+        total = len(entries)
+        if not shards:
+            return 0
+
+        updated = completed = 0
+        pending: List[Dict] = []
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(shards)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(str(self.db_path), index_series)
+        ) as executor, self.engine.connect() as conn:
+            futures = {executor.submit(_compute_shard, shard, self.beta_min_days): len(shard) for shard in shards}
+            for future in as_completed(futures):
+                shard_updates, errors = future.result()
+                for stock_id, error in errors.items():
+                    print(f"[ERROR] stock {stock_id} 시장 성과 계산 실패: {error}")
+                pending.extend(shard_updates)
+                completed += futures[future]
+                if len(pending) >= self.write_batch_size:
+                    updated += self._write(conn, pending)
+                    pending = []
+                if progress_callback:
+                    progress_callback(completed, total, f"[{completed}/{total}] 시장 대비 성과 계산 중")
+            updated += self._write(conn, pending)
+
+        logger.info(f"[MARKET] Updated {updated} blocks ({total} stocks) in {time.perf_counter() - start:.1f}s")
+        return updated
+
+    # ===== 내부 =====
+
+    def _load_blocks(self, stock_ids: Optional[Sequence[int]]) -> List[StockBlocks]:
+        """기간이 계산된 블록 (종목별 묶음, 지수는 종목 시장 구분)"""
+        query = (
+            select(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date, VolumeBlock.range_end_date, Stock.market)
+            .join(Stock, Stock.id == VolumeBlock.stock_id)
+            .where(VolumeBlock.range_end_date.isnot(None))
+            .order_by(VolumeBlock.stock_id, VolumeBlock.date)
+        )
+
+        grouped: Dict[int, StockBlocks] = {}
+        with self.engine.connect() as conn:
+            for block_id, stock_id, block_date, end_date, market in select_in_chunks(
+                conn, query, VolumeBlock.stock_id, stock_ids
+            ):
+                entry = grouped.setdefault(stock_id, (stock_id, market.value, []))
+                entry[2].append((block_id, block_date, end_date))
+        return list(grouped.values())
+
+    @staticmethod
+    def _write(conn, updates: List[Dict]) -> int:
+        """성과 executemany update 후 커밋"""
+        return update_by_id(conn, VolumeBlock, MARKET_FIELDS, updates)
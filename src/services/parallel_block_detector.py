@@ -0,0 +1,416 @@
+"""
+Parallel Block Detector
+종목 단위 샤딩 + 멀티프로세스 블록 탐지
+"""
+
+import logging
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+from core.config import DETECTION_CONFIG
+from core.enums import BlockType
+from domain.services.detection_params import DetectionParams
+from domain.services.incremental_block_detector import BlockDetectionState, IncrementalBlockDetector
+from infrastructure.cache.detection_result_cache import CachedBlocks, DetectionResultCache, detection_settings_hash
+from infrastructure.database.batch import upsert_rows
+from infrastructure.database.models import DetectionState
+from infrastructure.database.price_summary import PriceSummaryStore
+from infrastructure.repositories.block_writer import BlockWriter, block_rows
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StockDetectionResult:
+    """종목별 탐지 결과 (워커 → 부모 프로세스)"""
+
+    stock_id: int
+    code: str
+    name: str
+    blocks_1: List[Dict]
+    blocks_2: List[Dict]
+    blocks_3: List[Dict] = field(default_factory=list)
+    blocks_4: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    # 증분 모드: 갱신된 탐지 상태 (부모가 저장)
+    settings_hash: Optional[str] = None
+    last_date: Optional[date] = None
+    state: Optional[str] = None
+    # 결과 캐시 키/데이터 워터마크 (부모가 설정, 저장 시 캐시 갱신)
+    cache_key: Optional[str] = None
+    watermark: Optional[str] = None
+
+
+# ===== 워커 프로세스 =====
+
+_worker_conn: Optional[sqlite3.Connection] = None
+_worker_detector = None
+
+
+def _init_worker(db_path: str):
+    """워커 프로세스 초기화 - 프로세스 전용 읽기 전용 연결"""
+    global _worker_conn, _worker_detector
+    from services.block_detector import BlockDetector
+
+    _worker_conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True)
+    _worker_conn.execute("PRAGMA query_only = ON")
+    _worker_detector = BlockDetector()
+
+
+def _date_param(value) -> str:
+    """SQLAlchemy Date 바인딩과 같은 'YYYY-MM-DD' 문자열"""
+    if isinstance(value, (datetime, date)):
+        return value.strftime('%Y-%m-%d')
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+def _load_rows(stock_id: int, start_param: str, end_param: str) -> List[tuple]:
+    return _worker_conn.execute(
+        "SELECT date, open, high, low, close, volume, trading_value "
+        "FROM price_data WHERE stock_id = ? AND date >= ? AND date <= ? ORDER BY date",
+        (stock_id, start_param, end_param)
+    ).fetchall()
+
+
+def _load_investor(stock_id: int, first, last) -> pd.DataFrame:
+    from services.block_detector import INVESTOR_COLUMNS, investor_frame_from_rows
+
+    return investor_frame_from_rows(_worker_conn.execute(
+        f"SELECT date, {', '.join(INVESTOR_COLUMNS)} "
+        "FROM investor_trading WHERE stock_id = ? AND date >= ? AND date <= ?",
+        (stock_id, _date_param(first), _date_param(last))
+    ).fetchall())
+
+
+def _detect_shard(
+    stocks: List[Dict],
+    start_date,
+    end_date,
+    settings: Optional[Dict],
+    incremental: bool = False
+) -> List[StockDetectionResult]:
+    """샤드(종목 묶음) 탐지 - 워커 프로세스에서 실행"""
+    from services.block_detector import price_frame_from_rows
+
+    if incremental:
+        return [_detect_incremental(stock, start_date, end_date, settings) for stock in stocks]
+
+    block_3_4 = _worker_detector.block_3_4_enabled(settings)
+    start_param = _date_param(start_date)
+    end_param = _date_param(pd.Timestamp(end_date) + timedelta(days=_worker_detector.data_horizon_days(settings)))
+
+    results = []
+    for stock in stocks:
+        try:
+            rows = _load_rows(stock['id'], start_param, end_param)
+
+            if not rows:
+                results.append(StockDetectionResult(stock['id'], stock['code'], stock['name'], [], []))
+                continue
+
+            df = price_frame_from_rows(rows)
+            blocks_1, blocks_2 = _worker_detector.detect_from_frame(df, end_date, settings)
+            blocks_3, blocks_4 = [], []
+            if block_3_4:
+                blocks_3, blocks_4 = _worker_detector._find_block_3_4(
+                    df, blocks_2, lambda first, last, stock_id=stock['id']: _load_investor(stock_id, first, last)
+                )
+            results.append(StockDetectionResult(
+                stock['id'], stock['code'], stock['name'], blocks_1, blocks_2, blocks_3, blocks_4
+            ))
+
+        except Exception as e:
+            results.append(StockDetectionResult(stock['id'], stock['code'], stock['name'], [], [], error=str(e)))
+
+    return results
+
+
+def _detect_incremental(stock: Dict, start_date, end_date, settings: Optional[Dict]) -> StockDetectionResult:
+    """
+    증분 탐지 - 저장된 상태 다음 날부터 end_date까지의 봉만 평가
+
+    2번 블록 구간은 end_date 이후로 미리 읽지 않고 상태(열린 1번 블록)로 이월.
+    3번/4번 블록은 상태에 포함되지 않으므로 전체 기간 탐지에서만 계산.
+    """
+    from services.block_detector import price_frame_from_rows
+
+    params = DetectionParams.for_block_detector(settings)
+    settings_hash = params.fingerprint()
+    try:
+        row = _worker_conn.execute(
+            "SELECT state FROM detection_states WHERE stock_id = ? AND settings_hash = ?",
+            (stock['id'], settings_hash)
+        ).fetchone()
+        state = BlockDetectionState.from_json(row[0]) if row else None
+        detector = IncrementalBlockDetector(params, state)
+
+        load_from = state.last_date + timedelta(days=1) if state else start_date
+        rows = _load_rows(stock['id'], _date_param(load_from), _date_param(end_date))
+        if not rows:
+            return StockDetectionResult(stock['id'], stock['code'], stock['name'], [], [])
+
+        events = detector.update_frame(price_frame_from_rows(rows))
+        return StockDetectionResult(
+            stock['id'], stock['code'], stock['name'],
+            blocks_1=[e.block for e in events if e.block_type == BlockType.BLOCK_1],
+            blocks_2=[e.block for e in events if e.block_type == BlockType.BLOCK_2],
+            settings_hash=settings_hash,
+            last_date=detector.state.last_date,
+            state=detector.state.to_json()
+        )
+
+    except Exception as e:
+        return StockDetectionResult(stock['id'], stock['code'], stock['name'], [], [], error=str(e))
+
+
+# ===== 부모 프로세스 =====
+
+class ParallelBlockDetector:
+    """
+    멀티프로세스 블록 탐지 엔진
+
+    - 종목 목록을 shard_size 단위로 나눠 ProcessPoolExecutor에 분배
+    - 워커는 프로세스별 읽기 전용 SQLite 연결로 주가 조회 → GIL 경합 없이 코어 수만큼 확장
+    - 결과는 샤드 완료 순으로 부모에 스트리밍, 부모가 write_batch_size 종목 단위로 일괄 저장
+    - 진행률/중지는 콜백으로 전달 (Qt 워커에서 시그널로 연결)
+
+    Usage:
+        engine = ParallelBlockDetector()
+        engine.detect(stocks, start_dt, end_dt, settings,
+                      progress_callback=..., is_cancelled=lambda: not running)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        write_batch_size: Optional[int] = None,
+        db_path: Optional[Path] = None
+    ):
+        """
+        Args:
+            db_path: 대상 DB 파일 (None이면 현재 DB 프로필 파일 - 저장은 전역 엔진 사용)
+        """
+        self.max_workers = max_workers or DETECTION_CONFIG['max_workers'] or os.cpu_count() or 1
+        self.shard_size = shard_size or DETECTION_CONFIG['shard_size']
+        self.write_batch_size = write_batch_size or DETECTION_CONFIG['write_batch_size']
+        self._engine: Optional[Engine] = create_engine(f"sqlite:///{db_path}") if db_path else None
+        if db_path is None:
+            from infrastructure.database.connection import db_manager
+            db_path = db_manager.file_path()
+        self.db_path = Path(db_path)
+
+    @property
+    def engine(self) -> Engine:
+        """저장용 엔진"""
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def detect(
+        self,
+        stocks: List[Dict],
+        start_date,
+        end_date,
+        settings: Optional[Dict] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        stock_callback: Optional[Callable[[StockDetectionResult], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        save: bool = True,
+        incremental: bool = False,
+        use_cache: Optional[bool] = None,
+        use_prefilter: Optional[bool] = None
+    ) -> Tuple[int, int]:
+        """
+        전체 종목 병렬 탐지
+
+        Args:
+            stocks: [{'id', 'code', 'name'}, ...]
+            progress_callback: (완료 종목 수, 전체, 메시지)
+            stock_callback: 종목별 결과 (부모 프로세스에서 호출)
+            is_cancelled: True 반환 시 남은 샤드 취소 (받은 결과는 저장)
+            save: False면 DB 저장 생략
+            incremental: True면 종목별 탐지 상태 이후의 봉만 평가하고 상태 갱신
+            use_cache: 결과 캐시 사용 여부 (None이면 DETECTION_CONFIG['result_cache'],
+                       전체 기간 탐지 + 저장할 때만 적용)
+            use_prefilter: 사전 필터 사용 여부 (None이면 DETECTION_CONFIG['prefilter'],
+                           전체 기간 탐지에만 적용 - 증분 모드는 열린 1번 블록의 2번 블록을 놓칠 수 있음)
+
+        Returns:
+            (1번 블록 수, 2번 블록 수) - 탐지 기준
+        """
+        total = len(stocks)
+        completed = 0
+        total_blocks_1 = 0
+        total_blocks_2 = 0
+        pending_writes: List[StockDetectionResult] = []
+        start = time.perf_counter()
+
+        if incremental:
+            # 워커는 읽기 전용 연결이므로 상태 테이블은 부모가 미리 생성
+            DetectionState.__table__.create(self.engine, checkfirst=True)
+
+        # 사전 필터: 기간 최대 거래대금이 1번 블록 조건 미만인 종목은 워커/캐시 조회 생략
+        skipped: List[Dict] = []
+        if use_prefilter is None:
+            use_prefilter = DETECTION_CONFIG['prefilter']
+        min_trading_value = DetectionParams.for_block_detector(settings).min_trading_value
+        if use_prefilter and not incremental and min_trading_value:
+            store = PriceSummaryStore(self.engine)
+            store.ensure()
+            stocks, skipped = store.prefilter(stocks, start_date, end_date, min_trading_value)
+
+        # 결과 캐시: 같은 설정/기간으로 탐지했고 데이터가 그대로인 종목은 워커에 보내지 않음
+        cached: Dict[int, CachedBlocks] = {}
+        cache_key = None
+        watermarks: Dict[int, str] = {}
+        if use_cache is None:
+            use_cache = DETECTION_CONFIG['result_cache']
+        if use_cache and save and not incremental:
+            from services.block_detector import BlockDetector
+
+            cache = DetectionResultCache(self.engine)
+            cache.ensure_table()
+            cache_key = detection_settings_hash(settings, start_date, end_date)
+            watermarks = cache.watermarks(start_date, end_date, BlockDetector.data_horizon_days(settings))
+            cached = cache.get_many(cache_key, watermarks)
+
+        to_detect = [stock for stock in stocks if stock['id'] not in cached]
+        shards = [to_detect[i:i + self.shard_size] for i in range(0, len(to_detect), self.shard_size)]
+
+        print(f"[PARALLEL] {total} stocks ({len(skipped)} skipped, {len(cached)} cached), {len(shards)} shards, "
+              f"{self.max_workers} processes{' (incremental)' if incremental else ''}")
+
+        def collect(result: StockDetectionResult, from_cache: bool = False):
+            nonlocal completed, total_blocks_1, total_blocks_2
+            completed += 1
+            total_blocks_1 += len(result.blocks_1)
+            total_blocks_2 += len(result.blocks_2)
+
+            if result.error:
+                print(f"[ERROR] {result.name} ({result.code}) 탐지 실패: {result.error}")
+            elif stock_callback:
+                stock_callback(result)
+
+            if cache_key and not from_cache and not result.error and result.stock_id in watermarks:
+                result.cache_key = cache_key
+                result.watermark = watermarks[result.stock_id]
+            pending_writes.append(result)
+
+        completed = len(skipped)
+        if skipped and progress_callback:
+            progress_callback(completed, total, f"[{completed}/{total}] 사전 필터로 {len(skipped)}개 종목 제외 "
+                                                f"(최대 거래대금 < {min_trading_value / 1e8:,.0f}억)")
+
+        for stock in stocks:
+            if stock['id'] in cached:
+                collect(StockDetectionResult(stock['id'], stock['code'], stock['name'], *cached[stock['id']]), from_cache=True)
+        if cached and progress_callback:
+            progress_callback(completed, total, f"[{completed}/{total}] 캐시된 결과 {len(cached)}개 종목 사용")
+
+        executor = None
+        try:
+            if shards:
+                executor = ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(shards)),
+                    mp_context=multiprocessing.get_context('spawn'),  # Qt 스레드가 있는 부모에서 fork 금지
+                    initializer=_init_worker,
+                    initargs=(str(self.db_path),)
+                )
+                futures = [
+                    executor.submit(_detect_shard, shard, start_date, end_date, settings, incremental)
+                    for shard in shards
+                ]
+
+                for future in as_completed(futures):
+                    if is_cancelled and is_cancelled():
+                        print("[PARALLEL] Cancelled - remaining shards dropped")
+                        break
+
+                    for result in future.result():
+                        collect(result)
+
+                    if progress_callback:
+                        progress_callback(completed, total, f"[{completed}/{total}] {result.name} ({result.code}) 완료")
+
+                    if save and len(pending_writes) >= self.write_batch_size:
+                        self.save_results(pending_writes)
+                        pending_writes = []
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if save and pending_writes:
+                self.save_results(pending_writes)
+
+        elapsed = time.perf_counter() - start
+        print(f"[PARALLEL] {completed}/{total} stocks in {elapsed:.1f}s "
+              f"({completed / elapsed if elapsed > 0 else 0:,.1f} stocks/s) - "
+              f"B1={total_blocks_1}, B2={total_blocks_2}")
+        return total_blocks_1, total_blocks_2
+
+    def save_results(self, results: List[StockDetectionResult]) -> Tuple[int, int]:
+        """
+        탐지 결과 일괄 저장 (한 세션/트랜잭션)
+
+        BlockWriter가 저장된 블록과 (종목, 블록 타입, 날짜) 키로 차분해 새 블록만 insert,
+        값이 바뀐 블록만 update하고 2/3/4번 블록을 부모 블록에 연결.
+        증분 모드 결과의 탐지 상태와 결과 캐시도 같은 트랜잭션에서 upsert.
+
+        Returns:
+            (저장된 1번 블록 수, 저장된 2번 블록 수)
+        """
+        blocks = {
+            r.stock_id: block_rows(r.blocks_1, r.blocks_2, r.blocks_3, r.blocks_4)
+            for r in results if r.blocks_1 or r.blocks_2
+        }
+        states = [r for r in results if r.state is not None]
+        to_cache = [r for r in results if r.cache_key is not None]
+        if not blocks and not states and not to_cache:
+            return 0, 0
+
+        writer = BlockWriter(self.engine)
+        writer.ensure_unique_key()
+        with self.engine.begin() as conn:
+            if states:
+                self._save_states(conn, states)
+            for cache_key in {r.cache_key for r in to_cache}:
+                DetectionResultCache.put_many(conn, cache_key, [
+                    (r.stock_id, r.watermark, r.blocks_1, r.blocks_2, r.blocks_3, r.blocks_4)
+                    for r in to_cache if r.cache_key == cache_key
+                ])
+            if not blocks:
+                return 0, 0
+            written = writer.write(blocks, conn=conn)
+
+        saved_1 = written.inserted_count(BlockType.BLOCK_1)
+        saved_2 = written.inserted_count(BlockType.BLOCK_2)
+        logger.info(f"[PARALLEL] Saved Block 1 {saved_1}, Block 2 {saved_2}, updated {written.updated} "
+                    f"({len(results)} stocks)")
+        return saved_1, saved_2
+
+    @staticmethod
+    def _save_states(conn, results: List[StockDetectionResult]):
+        """탐지 상태 upsert (종목 × 설정 지문, executemany)"""
+        now = datetime.now()
+        upsert_rows(conn, DetectionState, ('stock_id', 'settings_hash'), ('last_date', 'state', 'updated_at'), [
+            {
+                'stock_id': r.stock_id,
+                'settings_hash': r.settings_hash,
+                'last_date': r.last_date,
+                'state': r.state,
+                'updated_at': now,
+            }
+            for r in results
+        ])
@@ -0,0 +1,184 @@
+"""
+Parameter Sweep
+블록 조건 파라미터 그리드 스윕 (종목 단위 멀티프로세스 + 집계)
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from core.config import DETECTION_CONFIG
+from domain.services.sweep_kernels import StockSweep, SweepGrid, summarize, sensitivity, sweep_stock
+from services.parallel_block_detector import _date_param
+
+# ===== 워커 프로세스 =====
+
+_worker_conn: Optional[sqlite3.Connection] = None
+
+
+def _init_worker(db_path: str):
+    """워커 프로세스 초기화 - 프로세스 전용 읽기 전용 연결"""
+    global _worker_conn
+    _worker_conn = sqlite3.connect(f"file:{Path(db_path).as_posix()}?mode=ro", uri=True)
+    _worker_conn.execute("PRAGMA query_only = ON")
+
+
+def _data_end(grid: SweepGrid, end_date) -> pd.Timestamp:
+    """2번 블록 최대 간격 / 최대 수익률 기간(거래일 → 달력일 환산)까지 포함하는 조회 종료일"""
+    horizon_days = max(grid.return_horizons, default=0) * 7 // 5 + 30
+    return pd.Timestamp(end_date) + timedelta(days=max(max(grid.block2_windows), horizon_days))
+
+
+def _sweep_shard(
+    stocks: List[Dict],
+    grid: SweepGrid,
+    start_date,
+    end_date,
+    collect_blocks: bool = False
+) -> List[tuple]:
+    """샤드 스윕 - 워커 프로세스에서 실행. [(stock_id, StockSweep | None, error)]"""
+    from services.block_detector import price_frame_from_rows
+
+    start_param = _date_param(start_date)
+    end_param = _date_param(_data_end(grid, end_date))
+
+    results = []
+    for stock in stocks:
+        try:
+            rows = _worker_conn.execute(
+                "SELECT date, open, high, low, close, volume, trading_value "
+                "FROM price_data WHERE stock_id = ? AND date >= ? AND date <= ? ORDER BY date",
+                (stock['id'], start_param, end_param)
+            ).fetchall()
+            sweep = sweep_stock(price_frame_from_rows(rows), grid, end_date, collect_blocks) if rows else None
+            results.append((stock['id'], sweep, None))
+        except Exception as e:
+            results.append((stock['id'], None, str(e)))
+    return results
+
+
+@dataclass
+class SweepResult:
+    """스윕 결과 (전 종목 합계 + 종목별 1번 블록 날짜)"""
+
+    grid: SweepGrid
+    total: StockSweep
+    stocks: int = 0
+    errors: Dict[int, str] = field(default_factory=dict)
+    # {stock_id: {(t, l): 1번 블록 날짜 배열}} (collect_blocks=True일 때)
+    block_dates: Dict[int, Dict] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def summary(self) -> pd.DataFrame:
+        """조합별 블록 수/확인율/사후 수익률"""
+        return summarize(self.grid, self.total)
+
+    def sensitivity(self, axis: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """한 파라미터 값별 평균 (나머지 축 평균)"""
+        return sensitivity(self.summary(), axis, columns)
+
+    def blocks_for(self, stock_id: int, min_trading_value: float, lookback_days: int) -> np.ndarray:
+        """특정 조합의 1번 블록 날짜 (collect_blocks=True로 실행한 경우)"""
+        t = self.grid.min_trading_values.index(min_trading_value)
+        l = self.grid.lookback_days.index(lookback_days)
+        return self.block_dates.get(stock_id, {}).get((t, l), np.array([], dtype='datetime64[D]'))
+
+
+class ParameterSweep:
+    """
+    블록 조건 파라미터 스윕 엔진
+
+    - 종목마다 시계열을 한 번만 조회하고 피처를 한 번만 계산 → 그리드 전체를 브로드캐스트로 판정
+    - 종목 묶음을 ProcessPoolExecutor에 분배, 부모는 종목별 집계 배열을 더하기만 함
+    - 탐지 결과는 DB에 저장하지 않음 (분석 전용)
+
+    Usage:
+        sweep = ParameterSweep(SweepGrid.from_config())
+        result = sweep.run(stocks, start_dt, end_dt)
+        result.summary()
+        result.sensitivity('lookback_days')
+    """
+
+    def __init__(
+        self,
+        grid: Optional[SweepGrid] = None,
+        max_workers: Optional[int] = None,
+        shard_size: Optional[int] = None,
+        db_path: Optional[Path] = None
+    ):
+        self.grid = grid or SweepGrid.from_config()
+        self.max_workers = max_workers or DETECTION_CONFIG['max_workers'] or os.cpu_count() or 1
+        self.shard_size = shard_size or DETECTION_CONFIG['shard_size']
+        if db_path is None:
+            from infrastructure.database.connection import db_manager
+            db_path = db_manager.file_path()
+        self.db_path = Path(db_path)
+
+    def run(
+        self,
+        stocks: Sequence[Dict],
+        start_date,
+        end_date,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        collect_blocks: bool = False
+    ) -> SweepResult:
+        """
+        전체 종목 스윕
+
+        Args:
+            stocks: [{'id', 'code', 'name'}, ...]
+            start_date / end_date: 1번 블록 탐지 기간
+            progress_callback: (완료 종목 수, 전체, 메시지)
+            collect_blocks: True면 종목/조합별 1번 블록 날짜도 반환
+        """
+        stocks = list(stocks)
+        result = SweepResult(self.grid, StockSweep.zeros(self.grid))
+        shards = [stocks[i:i + self.shard_size] for i in range(0, len(stocks), self.shard_size)]
+        if not shards:
+            return result
+
+        combinations = int(np.prod(self.grid.shape))
+        print(f"[SWEEP] {len(stocks)} stocks x {combinations} combinations, "
+              f"{len(shards)} shards, {self.max_workers} processes")
+
+        start = time.perf_counter()
+        completed = 0
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(shards)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(str(self.db_path),)
+        ) as executor:
+            futures = [
+                executor.submit(_sweep_shard, shard, self.grid, start_date, end_date, collect_blocks)
+                for shard in shards
+            ]
+            for future in as_completed(futures):
+                for stock_id, sweep, error in future.result():
+                    completed += 1
+                    if error:
+                        result.errors[stock_id] = error
+                        continue
+                    if sweep is None:
+                        continue
+                    result.total.add(sweep)
+                    result.stocks += 1
+                    if collect_blocks:
+                        result.block_dates[stock_id] = sweep.block_dates
+
+                if progress_callback:
+                    progress_callback(completed, len(stocks), f"[{completed}/{len(stocks)}] 스윕 진행 중")
+
+        result.elapsed = time.perf_counter() - start
+        print(f"[SWEEP] {completed} stocks in {result.elapsed:.1f}s "
+              f"({completed * combinations / result.elapsed if result.elapsed > 0 else 0:,.0f} stock-combinations/s)")
+        return result
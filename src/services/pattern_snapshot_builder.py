@@ -0,0 +1,190 @@
+"""
+Pattern Snapshot Builder
+2번 블록 D/D+1/D+2 시세 + 수급 스냅샷(block_pattern_data) 일괄 생성
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+
+from core.config import BLOCK_CRITERIA, DETECTION_CONFIG
+from core.enums import BlockType
+from domain.services.pattern_kernels import gather_columns, pattern_snapshots
+from infrastructure.database.batch import chunks, replace_block_rows, select_in_chunks
+from infrastructure.database.migrations import add_missing_indexes
+from infrastructure.database.models import BlockPatternData, InvestorTrading, PriceData, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close', 'volume', 'trading_value')
+
+INVESTOR_FIELDS = (
+    'institutional_net_buy', 'foreign_net_buy', 'individual_net_buy', 'program_net_buy',
+    'institutional_buying_strength', 'foreign_buying_strength', 'foreign_institutional_buying_strength',
+)
+
+
+class PatternSnapshotBuilder:
+    """
+    패턴 스냅샷 생성 엔진
+
+    - 대상 2번 블록(스냅샷이 없거나 D+2까지 채워지지 않은 블록)을 쿼리 한 번으로 읽음
+    - batch_size 종목 단위로 쿼리 한 번: 블록별 D일부터 pattern_match_days개 거래일 시세만
+      (ROW_NUMBER 윈도우) + 같은 날 수급을 조인해 블록 순서대로 읽음
+    - pattern_kernels로 모든 블록의 D ~ D+2 행을 위치 인덱싱으로 모아 비율/돌파/인정 여부 일괄 판정
+    - 같은 배치에서 기존 스냅샷 delete + executemany insert 후 커밋
+
+    Usage:
+        builder = PatternSnapshotBuilder()
+        builder.build()                 # 미완성 블록만
+        builder.build(rebuild=True)     # 전체 재생성
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        batch_size: Optional[int] = None
+    ):
+        self._engine = engine
+        self.days = BLOCK_CRITERIA['block_2']['pattern_match_days']
+        self.volume_ratio_min = BLOCK_CRITERIA['block_2']['pattern_volume_ratio_min']
+        self.batch_size = batch_size or DETECTION_CONFIG['write_batch_size']
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def build(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        rebuild: bool = False,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> int:
+        """
+        패턴 스냅샷 생성 후 저장
+
+        Args:
+            stock_ids: 대상 종목 (None이면 전체)
+            rebuild: True면 이미 완성된 블록도 다시 생성
+            progress_callback: (완료 종목 수, 전체, 메시지)
+
+        Returns:
+            저장된 스냅샷 행 수
+        """
+        start = time.perf_counter()
+        add_missing_indexes(self.engine, [InvestorTrading.__table__, BlockPatternData.__table__])
+        blocks = self._load_blocks(stock_ids, rebuild)
+        stocks = blocks['stock_id'].unique()
+        total = len(stocks)
+
+        written = 0
+        with self.engine.connect() as conn:
+            for i in range(0, total, self.batch_size):
+                batch = blocks[blocks['stock_id'].isin(stocks[i:i + self.batch_size])]
+                written += self._write(conn, batch['id'].tolist(), self._batch_rows(conn, batch))
+                completed = min(i + self.batch_size, total)
+                if progress_callback:
+                    progress_callback(completed, total, f"[{completed}/{total}] 패턴 스냅샷 생성 중")
+
+        logger.info(f"[PATTERN] Wrote {written} snapshot rows for {len(blocks)} Block 2 "
+                    f"({total} stocks) in {time.perf_counter() - start:.1f}s")
+        return written
+
+    # ===== 내부 =====
+
+    def _load_blocks(self, stock_ids: Optional[Sequence[int]], rebuild: bool) -> pd.DataFrame:
+        """2번 블록 (rebuild=False면 스냅샷 행이 pattern_match_days개 미만인 블록만, id순)"""
+        stored = (
+            select(BlockPatternData.block_id, func.count().label('rows'))
+            .group_by(BlockPatternData.block_id)
+            .subquery()
+        )
+        query = (
+            select(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date)
+            .outerjoin(stored, stored.c.block_id == VolumeBlock.id)
+            .where(VolumeBlock.block_type == BlockType.BLOCK_2)
+        )
+        if not rebuild:
+            query = query.where(func.coalesce(stored.c.rows, 0) < self.days)
+        with self.engine.connect() as conn:
+            rows = select_in_chunks(conn, query.order_by(VolumeBlock.id), VolumeBlock.stock_id, stock_ids)
+        rows.sort(key=lambda row: row[0])  # 종목 분할 조회 → id순 재정렬
+        return pd.DataFrame.from_records(rows, columns=['id', 'stock_id', 'date'])
+
+    def _window_rows(self, conn: Connection, block_ids: List[int]) -> list:
+        """블록별 D일부터 days개 거래일 시세 + 수급 (block_id, 날짜순)"""
+        # 거래일 days개를 덮는 달력일 범위 안에서 ROW_NUMBER로 자름
+        window = (
+            select(
+                VolumeBlock.id.label('block_id'), PriceData.stock_id, PriceData.date,
+                *(getattr(PriceData, name) for name in PRICE_FIELDS),
+                func.row_number().over(partition_by=VolumeBlock.id, order_by=PriceData.date).label('rn'),
+            )
+            .join(PriceData, (PriceData.stock_id == VolumeBlock.stock_id)
+                  & (PriceData.date >= VolumeBlock.date)
+                  & (PriceData.date <= func.date(VolumeBlock.date, f'+{self.days * 7} days')))
+            .where(VolumeBlock.id.in_(block_ids))
+            .subquery()
+        )
+        query = (
+            select(window.c.block_id, window.c.date, *(window.c[name] for name in PRICE_FIELDS),
+                   *(getattr(InvestorTrading, name) for name in INVESTOR_FIELDS))
+            .outerjoin(InvestorTrading, (InvestorTrading.stock_id == window.c.stock_id)
+                       & (InvestorTrading.date == window.c.date))
+            .where(window.c.rn <= self.days)
+            .order_by(window.c.block_id, window.c.date, InvestorTrading.id)
+        )
+        return conn.execute(query).all()
+
+    def _batch_rows(self, conn: Connection, blocks: pd.DataFrame) -> List[Dict]:
+        """종목 배치의 2번 블록 스냅샷 → insert 행"""
+        block_ids = blocks['id'].tolist()
+        fetched = []
+        for chunk in chunks(block_ids):
+            fetched.extend(self._window_rows(conn, chunk))
+        if not fetched:
+            return []
+
+        names = ('block_id', 'date', *PRICE_FIELDS, *INVESTOR_FIELDS)
+        data = pd.DataFrame.from_records(fetched, columns=names)
+        # 같은 날 수급 행이 중복이면 첫 행만
+        data = data.drop_duplicates(['block_id', 'date'], keep='first').reset_index(drop=True)
+
+        sorted_ids = np.asarray(block_ids, dtype=np.int64)
+        owner = np.searchsorted(sorted_ids, data['block_id'].to_numpy(dtype=np.int64))
+        dates = data['date'].to_numpy(dtype='datetime64[D]')
+        columns = {name: data[name].to_numpy(dtype=np.float64) for name in (*PRICE_FIELDS, *INVESTOR_FIELDS)}
+
+        snapshots = pattern_snapshots(
+            owner, dates, columns['high'], columns['volume'], blocks['date'].to_numpy(),
+            self.days, self.volume_ratio_min
+        )
+        values = gather_columns(columns, snapshots.row)
+        values['volume_ratio_vs_d'] = snapshots.volume_ratio_vs_d
+        # 컬럼 단위로 파이썬 값 변환 (NaN → None), 행 dict는 마지막에 한 번 조립
+        output = {
+            'block_id': sorted_ids[snapshots.block_index].tolist(),
+            'day_offset': snapshots.offset.tolist(),
+            'date': dates[snapshots.row].tolist(),
+            'is_qualified': snapshots.is_qualified.tolist(),
+            'is_high_breakout': snapshots.is_high_breakout.tolist(),
+        }
+        for name, column in values.items():
+            output[name] = [None if value != value else value for value in column.tolist()]
+        output['volume'] = [None if value is None else int(value) for value in output['volume']]
+        names = list(output)
+        return [dict(zip(names, row)) for row in zip(*output.values())]
+
+    @staticmethod
+    def _write(conn: Connection, block_ids: List[int], rows: List[Dict]) -> int:
+        """대상 블록의 기존 스냅샷 교체 → 저장한 스냅샷 행 수"""
+        replace_block_rows(conn, BlockPatternData, block_ids, rows)
+        return len(rows)
@@ -0,0 +1,318 @@
+"""
+Streaming Block Detector
+봉 단위 실시간 블록 탐지 (종목별 증분 상태, 디스크 직렬화, 리플레이 검증)
+"""
+
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import asdict
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from core.enums import BlockType
+from core.exceptions import ConfigurationException
+from domain.services.detection_params import DetectionParams
+from domain.services.incremental_block_detector import (
+    BlockDetectionState, BlockEvent, IncrementalBlockDetector,
+    open_blocks_from_dict, open_blocks_to_dict
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_FORMAT_VERSION = 1
+
+
+class StreamingBlockDetector:
+    """
+    다종목 스트리밍 블록 탐지기
+
+    - 종목별 IncrementalBlockDetector 상태 (단조 deque 구간 최대값, 누적 최고가,
+      2번 블록 구간이 열린 1번 블록) → 봉당 분할상환 O(1), 과거 데이터 재조회 없음
+    - 봉 하나(on_bar) 또는 하루치 전 종목 봉(on_day) 단위 입력
+    - 이벤트 block dict는 BlockDetector 결과와 같은 형식
+      (2번 블록은 D+2 봉 도착 또는 구간 종료 시 확정)
+    - save/load: 전 종목 상태를 컬럼 배열로 모은 압축 npz 한 파일
+
+    Usage:
+        detector = StreamingBlockDetector.load(path) if path.exists() else StreamingBlockDetector(settings)
+        for event in detector.on_day(today, bars_df):
+            notify(event)
+        detector.save(path)
+    """
+
+    def __init__(self, settings: Optional[Dict] = None, params: Optional[DetectionParams] = None):
+        self.params = params or DetectionParams.for_block_detector(settings)
+        self._detectors: Dict[int, IncrementalBlockDetector] = {}
+
+    def __len__(self) -> int:
+        return len(self._detectors)
+
+    def __contains__(self, stock_id: int) -> bool:
+        return stock_id in self._detectors
+
+    @property
+    def stock_ids(self) -> List[int]:
+        return list(self._detectors)
+
+    def state_of(self, stock_id: int) -> Optional[BlockDetectionState]:
+        detector = self._detectors.get(stock_id)
+        return detector.state if detector else None
+
+    def _detector(self, stock_id: int) -> IncrementalBlockDetector:
+        detector = self._detectors.get(stock_id)
+        if detector is None:
+            detector = self._detectors[stock_id] = IncrementalBlockDetector(self.params)
+        return detector
+
+    # ===== 입력 =====
+
+    def on_bar(
+        self,
+        stock_id: int,
+        bar_date: date,
+        high: float,
+        close: float,
+        volume: int,
+        trading_value: float
+    ) -> List[BlockEvent]:
+        """
+        봉 하나 반영 (종목별 날짜 오름차순, 이미 반영한 날짜 이하는 무시)
+
+        Returns:
+            확정된 이벤트 (stock_id 설정됨)
+        """
+        events = self._detector(stock_id).update(bar_date, high, close, volume, trading_value)
+        for event in events:
+            event.stock_id = stock_id
+        return events
+
+    def on_day(self, bar_date: date, bars: pd.DataFrame) -> List[BlockEvent]:
+        """
+        하루치 봉 일괄 반영
+
+        Args:
+            bars: stock_id 인덱스, columns=[high, close, volume, trading_value]
+        """
+        events = []
+        for stock_id, high, close, volume, trading_value in zip(
+            bars.index.tolist(),
+            bars['high'].to_numpy(dtype=np.float64).tolist(),
+            bars['close'].to_numpy(dtype=np.float64).tolist(),
+            bars['volume'].to_numpy(dtype=np.int64).tolist(),
+            bars['trading_value'].to_numpy(dtype=np.float64).tolist()
+        ):
+            events.extend(self.on_bar(stock_id, bar_date, high, close, volume, trading_value))
+        return events
+
+    def flush(self, stock_id: Optional[int] = None) -> List[BlockEvent]:
+        """대기 중인 2번 블록 후보 확정 (stock_id가 None이면 전 종목) - 리플레이 종료 시 사용"""
+        stock_ids = self.stock_ids if stock_id is None else [stock_id]
+        events = []
+        for sid in stock_ids:
+            for event in self._detectors[sid].flush():
+                event.stock_id = sid
+                events.append(event)
+        return events
+
+    # ===== 직렬화 =====
+
+    def save(self, path: Path):
+        """
+        전 종목 상태를 압축 npz 한 파일로 저장 (임시 파일 → 교체)
+
+        구간 deque/직전 거래량은 종목별 오프셋을 둔 연결 배열로, 열린 1번 블록만 JSON으로 저장.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        stock_ids = self.stock_ids
+        states = [self._detectors[sid].state for sid in stock_ids]
+
+        def offsets(lengths: Iterable[int]) -> np.ndarray:
+            return np.concatenate(([0], np.cumsum(list(lengths), dtype=np.int64)))
+
+        def column(items, position, dtype) -> np.ndarray:
+            return np.fromiter((item[position] for item in items), dtype=dtype)
+
+        volume_windows = [item for state in states for item in state.volume_window]
+        high_windows = [item for state in states for item in state.high_window]
+
+        arrays = {
+            'stock_ids': np.asarray(stock_ids, dtype=np.int64),
+            'last_date': np.asarray(
+                [state.last_date.toordinal() if state.last_date else 0 for state in states], dtype=np.int64
+            ),
+            'rows': np.asarray([state.rows for state in states], dtype=np.int64),
+            'expanding_high': np.asarray(
+                [np.nan if state.expanding_high is None else state.expanding_high for state in states],
+                dtype=np.float64
+            ),
+            'volume_offsets': offsets(len(state.volume_window) for state in states),
+            'volume_keys': column(volume_windows, 0, np.int64),
+            'volume_values': column(volume_windows, 1, np.int64),
+            'high_offsets': offsets(len(state.high_window) for state in states),
+            'high_keys': column(high_windows, 0, np.int64),
+            'high_values': column(high_windows, 1, np.float64),
+            'recent_offsets': offsets(len(state.recent_volumes) for state in states),
+            'recent_volumes': np.fromiter(
+                (v for state in states for v in state.recent_volumes), dtype=np.int64
+            ),
+            'open_blocks': np.asarray(json.dumps(
+                [open_blocks_to_dict(state.open_blocks) for state in states], separators=(',', ':')
+            )),
+            'meta': np.asarray(json.dumps({
+                'version': STATE_FORMAT_VERSION,
+                'fingerprint': self.params.fingerprint(),
+                'params': asdict(self.params),
+            })),
+        }
+
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        tmp_path.replace(path)
+        logger.info(f"[STREAM] Saved state of {len(stock_ids)} stocks to {path} ({path.stat().st_size:,} bytes)")
+
+    @classmethod
+    def load(cls, path: Path, params: Optional[DetectionParams] = None) -> 'StreamingBlockDetector':
+        """
+        save()로 저장한 상태 복원
+
+        Args:
+            params: 기대하는 탐지 파라미터 (None이면 파일에 기록된 값 사용)
+
+        Raises:
+            ConfigurationException: 파라미터 지문 또는 포맷 버전 불일치
+        """
+        with np.load(Path(path), allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+
+        meta = json.loads(arrays['meta'].item())
+        if meta['version'] != STATE_FORMAT_VERSION:
+            raise ConfigurationException('streaming_state', f"unsupported format version {meta['version']}")
+        stored = DetectionParams(**meta['params'])
+        if params is not None and params.fingerprint() != meta['fingerprint']:
+            raise ConfigurationException('streaming_state', "state was built with different detection settings")
+
+        detector = cls(params=params or stored)
+        open_blocks = json.loads(arrays['open_blocks'].item())
+        volume_offsets, high_offsets, recent_offsets = (
+            arrays['volume_offsets'], arrays['high_offsets'], arrays['recent_offsets']
+        )
+
+        for i, stock_id in enumerate(arrays['stock_ids'].tolist()):
+            v_lo, v_hi = volume_offsets[i], volume_offsets[i + 1]
+            h_lo, h_hi = high_offsets[i], high_offsets[i + 1]
+            r_lo, r_hi = recent_offsets[i], recent_offsets[i + 1]
+            last_date = int(arrays['last_date'][i])
+            expanding_high = float(arrays['expanding_high'][i])
+
+            state = BlockDetectionState(
+                last_date=date.fromordinal(last_date) if last_date else None,
+                rows=int(arrays['rows'][i]),
+                expanding_high=None if np.isnan(expanding_high) else expanding_high,
+                volume_window=deque(zip(
+                    arrays['volume_keys'][v_lo:v_hi].tolist(), arrays['volume_values'][v_lo:v_hi].tolist()
+                )),
+                high_window=deque(zip(
+                    arrays['high_keys'][h_lo:h_hi].tolist(), arrays['high_values'][h_lo:h_hi].tolist()
+                )),
+                recent_volumes=deque(arrays['recent_volumes'][r_lo:r_hi].tolist()),
+                open_blocks=open_blocks_from_dict(open_blocks[i]),
+            )
+            detector._detectors[stock_id] = IncrementalBlockDetector(detector.params, state)
+
+        return detector
+
+
+# ===== 리플레이 =====
+
+def stack_frames(frames: Dict[int, pd.DataFrame]) -> pd.DataFrame:
+    """
+    종목별 날짜 인덱스 DataFrame → (date, stock_id) 정렬된 한 DataFrame
+
+    Args:
+        frames: {stock_id: BlockDetector._load_price_frame 형식 DataFrame}
+    """
+    parts = [
+        df[['high', 'close', 'volume', 'trading_value']].assign(stock_id=stock_id)
+        for stock_id, df in frames.items() if not df.empty
+    ]
+    if not parts:
+        return pd.DataFrame(columns=['stock_id', 'high', 'close', 'volume', 'trading_value'])
+    stacked = pd.concat(parts).rename_axis('date').reset_index()
+    return stacked.sort_values(['date', 'stock_id'], kind='stable').reset_index(drop=True)
+
+
+def replay(
+    detector: StreamingBlockDetector,
+    frames: Dict[int, pd.DataFrame],
+    flush: bool = True
+) -> Tuple[List[BlockEvent], float]:
+    """
+    과거 시계열을 날짜순 하루치 배치로 흘려 넣기
+
+    Returns:
+        (이벤트 목록, 소요 시간 초)
+    """
+    stacked = stack_frames(frames)
+    start = time.perf_counter()
+    events = []
+    for bar_date, day in stacked.groupby('date', sort=True):
+        events.extend(detector.on_day(bar_date.date(), day.set_index('stock_id')))
+    if flush:
+        events.extend(detector.flush())
+    return events, time.perf_counter() - start
+
+
+def _sorted_frame(blocks: List[Dict], keys: List[str]) -> pd.DataFrame:
+    if not blocks:
+        return pd.DataFrame()
+    return pd.DataFrame(blocks).sort_values(keys, kind='stable').reset_index(drop=True)
+
+
+def check_parity(
+    frames: Dict[int, pd.DataFrame],
+    settings: Optional[Dict] = None,
+    events: Optional[List[BlockEvent]] = None
+) -> Dict[int, str]:
+    """
+    스트리밍 결과와 BlockDetector 배치 결과 비교 (각 종목 전체 기간, end_date = 마지막 봉)
+
+    Args:
+        events: replay() 결과 (None이면 새 탐지기로 리플레이)
+
+    Returns:
+        {stock_id: 불일치 설명} - 비어 있으면 완전히 일치
+    """
+    from services.block_detector import BlockDetector
+
+    if events is None:
+        events, _ = replay(StreamingBlockDetector(settings), frames)
+
+    by_stock: Dict[int, Tuple[List[Dict], List[Dict]]] = {stock_id: ([], []) for stock_id in frames}
+    for event in events:
+        blocks_1, blocks_2 = by_stock.setdefault(event.stock_id, ([], []))
+        (blocks_1 if event.block_type == BlockType.BLOCK_1 else blocks_2).append(event.block)
+
+    batch = BlockDetector()
+    mismatches = {}
+    for stock_id, df in frames.items():
+        if df.empty:
+            continue
+        expected_1, expected_2 = batch.detect_from_frame(df, df.index[-1], settings)
+        actual_1, actual_2 = by_stock[stock_id]
+
+        if not _sorted_frame(actual_1, ['date']).equals(_sorted_frame(expected_1, ['date'])):
+            mismatches[stock_id] = f"Block 1: stream {len(actual_1)} vs batch {len(expected_1)}"
+        elif not _sorted_frame(actual_2, ['date', 'days_from_block1']).equals(
+                _sorted_frame(expected_2, ['date', 'days_from_block1'])):
+            mismatches[stock_id] = f"Block 2: stream {len(actual_2)} vs batch {len(expected_2)}"
+
+    return mismatches
@@ -0,0 +1,156 @@
+"""
+Support Level Calculator
+2번 블록 지지선(S1/S2/S3) 일괄 계산 및 support_levels 저장 (입력이 바뀐 블록만 재계산)
+"""
+
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import aliased
+
+from core.config import BLOCK_CRITERIA, DETECTION_CONFIG
+from core.enums import BlockType
+from domain.services.support_kernels import support_input_key, support_levels, support_rows
+from infrastructure.database.batch import lead_start, replace_block_rows, select_in_chunks
+from infrastructure.database.migrations import add_missing_columns
+from infrastructure.database.models import PriceData, SupportLevel, VolumeBlock
+
+logger = logging.getLogger(__name__)
+
+
+class SupportLevelCalculator:
+    """
+    지지선 계산 엔진
+
+    - 2번 블록(id, 종목, 날짜, 부모 1번 블록 날짜, 저장된 입력 키)을 쿼리 한 번으로 읽음
+    - 저장된 입력 키와 현재 키가 같은 블록은 건너뜀 → 새 블록/부모가 바뀐 블록만 재계산
+    - 대상 종목마다 주가를 한 번만 조회하고 이평을 한 번만 계산 → support_kernels의 날짜 조회로 일괄 계산
+    - batch_size 종목 단위로 기존 지지선 delete + executemany insert 후 커밋
+
+    Usage:
+        calculator = SupportLevelCalculator()
+        calculator.update()                 # 변경된 2번 블록만
+        calculator.update([stock_id])
+        calculator.update(force=True)       # 주가 재수집(수정주가) 후 전체 재계산
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        ma_period: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ):
+        self._engine = engine
+        self.ma_period = ma_period or BLOCK_CRITERIA['ma_period']
+        self.batch_size = batch_size or DETECTION_CONFIG['write_batch_size']
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            from infrastructure.database.connection import db_manager
+            self._engine = db_manager.engine
+        return self._engine
+
+    def update(
+        self,
+        stock_ids: Optional[Sequence[int]] = None,
+        force: bool = False,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> int:
+        """
+        지지선 계산 후 저장
+
+        Args:
+            stock_ids: 대상 종목 (None이면 전체)
+            force: True면 입력 키와 무관하게 모든 2번 블록 재계산
+            progress_callback: (완료 종목 수, 전체, 메시지)
+
+        Returns:
+            지지선을 다시 계산한 2번 블록 수
+        """
+        start = time.perf_counter()
+        add_missing_columns(self.engine, [SupportLevel.__table__])
+
+        blocks = self._load_blocks(stock_ids)
+        if len(blocks) and not force:
+            blocks = blocks[blocks['stored_key'] != blocks['input_key']]
+        groups = list(blocks.groupby('stock_id', sort=True)) if len(blocks) else []
+        total = len(groups)
+
+        updated = 0
+        block_ids: List[int] = []
+        rows: List[Dict] = []
+        with self.engine.connect() as conn:
+            for completed, (stock_id, group) in enumerate(groups, start=1):
+                block_ids.extend(int(block_id) for block_id in group['id'])
+                rows.extend(self._stock_rows(conn, stock_id, group))
+                if completed % self.batch_size == 0:
+                    updated += self._write(conn, block_ids, rows)
+                    block_ids, rows = [], []
+                if progress_callback:
+                    progress_callback(completed, total, f"[{completed}/{total}] 지지선 계산 중")
+            updated += self._write(conn, block_ids, rows)
+
+        logger.info(f"[SUPPORT] Updated {updated} Block 2 ({total} stocks) in {time.perf_counter() - start:.1f}s")
+        return updated
+
+    # ===== 내부 =====
+
+    def _load_blocks(self, stock_ids: Optional[Sequence[int]]) -> pd.DataFrame:
+        """2번 블록 + 부모 1번 블록 날짜 + 저장된 입력 키 (지지선이 없으면 None)"""
+        parent = aliased(VolumeBlock)
+        stored = (
+            select(SupportLevel.block_id, func.max(SupportLevel.input_key).label('input_key'))
+            .group_by(SupportLevel.block_id)
+            .subquery()
+        )
+        query = (
+            select(VolumeBlock.id, VolumeBlock.stock_id, VolumeBlock.date, parent.date, stored.c.input_key)
+            .outerjoin(parent, parent.id == VolumeBlock.parent_block_id)
+            .outerjoin(stored, stored.c.block_id == VolumeBlock.id)
+            .where(VolumeBlock.block_type == BlockType.BLOCK_2)
+        )
+        # 시장 전체 종목 목록도 들어옴 (BlockDetectionWorker) → IN 절 분할
+        with self.engine.connect() as conn:
+            rows = select_in_chunks(
+                conn, query.order_by(VolumeBlock.stock_id, VolumeBlock.date), VolumeBlock.stock_id, stock_ids
+            )
+
+        blocks = pd.DataFrame.from_records(
+            rows, columns=['id', 'stock_id', 'date', 'parent_date', 'stored_key']
+        ).astype({'parent_date': object, 'stored_key': object})
+        blocks['input_key'] = [
+            support_input_key(block_date, parent_date, self.ma_period)
+            for block_date, parent_date in zip(blocks['date'], blocks['parent_date'])
+        ]
+        return blocks
+
+    def _stock_rows(self, conn: Connection, stock_id: int, blocks: pd.DataFrame) -> List[Dict]:
+        """종목 1개의 2번 블록 지지선 계산 → insert 행"""
+        first = lead_start(blocks['date'].min(), self.ma_period)
+        parent_dates = blocks['parent_date'].dropna()
+        if len(parent_dates):
+            first = min(first, parent_dates.min())
+        rows = conn.execute(
+            select(PriceData.date, PriceData.open, PriceData.low, PriceData.close)
+            .where(PriceData.stock_id == stock_id, PriceData.date >= first, PriceData.date <= blocks['date'].max())
+            .order_by(PriceData.date)
+        ).all()
+        if not rows:
+            return []
+
+        df = pd.DataFrame.from_records(rows, columns=['date', 'open', 'low', 'close'])
+        df = df.set_index(pd.to_datetime(df.pop('date')))
+        parent_dates = [None if pd.isna(d) else d for d in blocks['parent_date']]
+        levels = support_levels(df, blocks['date'].to_numpy(), parent_dates, self.ma_period)
+        return support_rows(blocks['id'], levels, blocks['input_key'], self.ma_period)
+
+    @staticmethod
+    def _write(conn: Connection, block_ids: List[int], rows: List[Dict]) -> int:
+        """대상 블록의 기존 지지선 교체 → 재계산한 블록 수"""
+        replace_block_rows(conn, SupportLevel, block_ids, rows)
+        return len(block_ids)
@@ -0,0 +1,208 @@
+"""
+Synthetic Market
+시드 고정 합성 시장 데이터 생성 (탐지 테스트/벤치마크용 - 실제 DB 없이 재현 가능한 종목군)
+"""
+
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, insert
+
+from core.enums import MarketType
+from infrastructure.database.models import Base, InvestorTrading, PriceData, Stock
+
+logger = logging.getLogger(__name__)
+
+# 연간 휴장일 수 (주말 제외, 시장 공통)
+HOLIDAYS_PER_YEAR = 10
+# DB 저장 청크 (행)
+INSERT_CHUNK = 50_000
+
+
+class SyntheticMarket:
+    """
+    합성 종목군 OHLCV + 수급 생성기
+
+    - 시장 공통 영업일(평일 - 휴장일), 종목별 상장 지연/거래정지 구간(행 누락)
+    - 로그 정규 수익률 + 종목별 상승 국면(추세) → 신고가 갱신, 급등일 시가 갭
+    - 로그 정규 거래량 + 급등/상승 국면 시작일 거래량 급증 → 1번/2번 블록 후보
+    - 종목별 난수 시드 = (seed, stock_id) → 같은 시드면 종목 수와 무관하게 같은 종목은 같은 데이터
+
+    Usage:
+        market = SyntheticMarket(stocks=200, years=5, seed=42)
+        market.write_sqlite("data/benchmarks/synthetic_200.db")
+        market.write(db_manager.engine)             # 현재 DB 프로필 (예: 인메모리)
+        market.write_dump("data/exports/synthetic", fmt="csv")
+    """
+
+    def __init__(self, stocks: int = 50, years: int = 5, seed: int = 42, start: date = date(2015, 1, 2)):
+        self.stocks = stocks
+        self.years = years
+        self.seed = seed
+        self.start = start
+
+    @property
+    def end(self) -> date:
+        """마지막 영업일"""
+        return pd.Timestamp(self.trading_days()[-1]).date()
+
+    def trading_days(self) -> np.ndarray:
+        """시장 공통 영업일 (datetime64[D])"""
+        days = pd.bdate_range(self.start, periods=self.years * 261).values.astype('datetime64[D]')
+        rng = np.random.default_rng([self.seed, 0])
+        holidays = rng.choice(len(days), size=self.years * HOLIDAYS_PER_YEAR, replace=False)
+        return np.delete(days, holidays)
+
+    def stock_list(self) -> List[Dict]:
+        """[{'id', 'code', 'name', 'market'}, ...]"""
+        return [
+            {
+                'id': stock_id,
+                'code': f'{900000 + stock_id:06d}',
+                'name': f'합성{stock_id:04d}',
+                'market': MarketType.KOSPI if stock_id % 3 else MarketType.KOSDAQ,
+            }
+            for stock_id in range(1, self.stocks + 1)
+        ]
+
+    def prices(self, stock_id: int) -> pd.DataFrame:
+        """
+        종목 일봉 (date, open, high, low, close, volume, trading_value, market_cap)
+
+        원 단위 정수 가격, 거래대금 = 거래량 × 종가
+        """
+        rng = np.random.default_rng([self.seed, stock_id])
+        days = self.trading_days()
+        n = len(days)
+
+        # 상승 국면: 종목당 1~4회, 20~80거래일, 일 평균 +0.6~1.5%
+        drift = np.full(n, rng.normal(0.0002, 0.0003))
+        jumps = rng.random(n) < 0.01
+        for _ in range(rng.integers(1, 5)):
+            begin = int(rng.integers(0, n - 20))
+            drift[begin:begin + int(rng.integers(20, 80))] += rng.uniform(0.006, 0.015)
+            jumps[begin] = True
+
+        returns = drift + rng.normal(0, rng.uniform(0.015, 0.03), n)
+        returns[jumps] += rng.uniform(0.05, 0.15, int(jumps.sum())) * rng.choice([1, 1, 1, -1], int(jumps.sum()))
+        close = rng.uniform(3_000, 60_000) * np.exp(np.cumsum(returns))
+
+        # 시가 갭: 급등일은 수익률 대부분을 시가에 반영
+        previous = np.concatenate(([close[0]], close[:-1]))
+        gap = np.where(jumps, 0.8, rng.uniform(0, 0.3, n))
+        open_ = previous * np.exp(np.log(close / previous) * gap)
+        body_high = np.maximum(open_, close)
+        body_low = np.minimum(open_, close)
+        high = body_high * (1 + np.abs(rng.normal(0, 0.01, n)))
+        low = body_low * (1 - np.abs(rng.normal(0, 0.01, n)))
+
+        # 거래량: 기본 수준 × 로그 정규 잡음, 급등일 8~30배 + 무작위 급증
+        volume = rng.uniform(50_000, 1_500_000) * np.exp(rng.normal(0, 0.4, n))
+        spikes = jumps | (rng.random(n) < 0.01)
+        volume[spikes] *= rng.uniform(8, 30, int(spikes.sum()))
+        volume = np.maximum(volume.astype(np.int64), 1)
+
+        # 상장 지연 + 거래정지 구간 (행 누락)
+        keep = np.ones(n, dtype=bool)
+        if rng.random() < 0.2:
+            keep[:int(rng.integers(20, n // 3))] = False
+        for _ in range(rng.integers(0, 3)):
+            halt = int(rng.integers(0, n - 30))
+            keep[halt:halt + int(rng.integers(3, 20))] = False
+
+        high, low, close, open_ = (np.round(x) for x in (high, low, close, open_))
+        shares = rng.integers(5_000_000, 200_000_000)
+        frame = pd.DataFrame({
+            'date': days.astype('datetime64[ns]'),
+            'open': open_,
+            'high': np.maximum(high, np.maximum(open_, close)),
+            'low': np.minimum(low, np.minimum(open_, close)),
+            'close': close,
+            'volume': volume,
+            'trading_value': volume * close,
+            'market_cap': close * shares,
+        })
+        return frame[keep].reset_index(drop=True)
+
+    def investor(self, stock_id: int, prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        종목 수급 (기관/외국인/개인 순매수 합 0, 거래대금에 비례)
+
+        매수 강도 = 순매수 / 거래대금 × 100
+        """
+        rng = np.random.default_rng([self.seed, stock_id, 1])
+        value = prices['trading_value'].to_numpy()
+        n = len(value)
+        institutional = value * rng.normal(0, 0.05, n)
+        foreign = value * rng.normal(0.005, 0.06, n)
+        return pd.DataFrame({
+            'date': prices['date'],
+            'institutional_net_buy': institutional,
+            'foreign_net_buy': foreign,
+            'individual_net_buy': -(institutional + foreign),
+            'program_net_buy': value * rng.normal(0, 0.03, n),
+            'institutional_buying_strength': institutional / value * 100,
+            'foreign_buying_strength': foreign / value * 100,
+            'individual_buying_strength': -(institutional + foreign) / value * 100,
+        })
+
+    def write(self, engine, investor: bool = True):
+        """엔진 DB에 테이블 생성 후 종목/주가/수급 저장 (빈 DB 기준)"""
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(insert(Stock), self.stock_list())
+            for stock in self.stock_list():
+                prices = self.prices(stock['id'])
+                self._insert(conn, PriceData, stock['id'], prices)
+                if investor:
+                    self._insert(conn, InvestorTrading, stock['id'], self.investor(stock['id'], prices))
+
+    def write_sqlite(self, path, investor: bool = True) -> Path:
+        """
+        새 SQLite 파일에 종목/주가/수급 저장 (기존 파일은 삭제)
+
+        Returns:
+            DB 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+
+        engine = create_engine(f"sqlite:///{path}")
+        try:
+            self.write(engine, investor=investor)
+        finally:
+            engine.dispose()
+
+        logger.info(f"[SYNTHETIC] {self.stocks} stocks x {self.years}y (seed {self.seed}) -> {path}")
+        return path
+
+    def write_dump(self, output_dir, fmt: Optional[str] = 'csv', investor: bool = True) -> Dict:
+        """
+        덤프 형식(DataExporter 파티션 구조)으로 저장 - 임시 SQLite를 거쳐 내보냄
+
+        Returns:
+            {테이블명: ExportReport}
+        """
+        from infrastructure.dumps import DataExporter
+
+        output_dir = Path(output_dir)
+        db_path = self.write_sqlite(output_dir / '_synthetic.db', investor=investor)
+        engine = create_engine(f"sqlite:///{db_path}")
+        try:
+            tables = ['price_data', 'investor_trading'] if investor else ['price_data']
+            return DataExporter(engine).export_all(output_dir, fmt=fmt, tables=tables)
+        finally:
+            engine.dispose()
+            db_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _insert(conn, model, stock_id: int, frame: pd.DataFrame):
+        frame = frame.assign(stock_id=stock_id, date=frame['date'].dt.date)
+        rows = frame.to_dict('records')
+        for i in range(0, len(rows), INSERT_CHUNK):
+            conn.execute(insert(model), rows[i:i + INSERT_CHUNK])
@@ -7,10 +7,14 @@ from .utils import (
     CollectionLogger,
     CompactLogger,
     DetailedLogger,
+    MetricsRegistry,
+    metrics,
 )
 
 __all__ = [
     "CollectionLogger",
     "CompactLogger",
     "DetailedLogger",
+    "MetricsRegistry",
+    "metrics",
 ]
@@ -9,10 +9,13 @@ from .collection_logger import (
     DetailedLogger,
     LogLevel,
 )
+from .instrumentation import MetricsRegistry, metrics
 
 __all__ = [
     "CollectionLogger",
     "CompactLogger",
     "DetailedLogger",
     "LogLevel",
+    "MetricsRegistry",
+    "metrics",
 ]
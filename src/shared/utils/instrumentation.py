@@ -0,0 +1,56 @@
+"""
+Instrumentation
+스레드 안전 카운터 레지스트리 (캐시 적중률, 처리량 등 계측용)
+"""
+
+import threading
+from typing import Dict, Optional
+
+
+class MetricsRegistry:
+    """
+    이름 기반 카운터 레지스트리
+
+    Usage:
+        metrics.increment("price_cache.hits")
+        metrics.snapshot("price_cache.")  # {'price_cache.hits': 1, ...}
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: int = 1):
+        """카운터 증가"""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set(self, name: str, value: int):
+        """게이지 값 설정 (현재 사용량 등)"""
+        with self._lock:
+            self._counters[name] = value
+
+    def get(self, name: str) -> int:
+        """카운터 값 조회 (없으면 0)"""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self, prefix: Optional[str] = None) -> Dict[str, int]:
+        """카운터 스냅샷 (prefix로 필터링 가능)"""
+        with self._lock:
+            if prefix is None:
+                return dict(self._counters)
+            return {k: v for k, v in self._counters.items() if k.startswith(prefix)}
+
+    def reset(self, prefix: Optional[str] = None):
+        """카운터 초기화 (prefix로 필터링 가능)"""
+        with self._lock:
+            if prefix is None:
+                self._counters.clear()
+            else:
+                for key in [k for k in self._counters if k.startswith(prefix)]:
+                    del self._counters[key]
+
+
+# 전역 계측 레지스트리
+metrics = MetricsRegistry()
@@ -237,6 +237,12 @@ class BlockDetectorPanel(QWidget):
         self.end_date.setCalendarPopup(True)
         layout.addWidget(self.end_date)
 
+        # 증분 탐지 (저장된 탐지 상태 이후의 새 봉만 평가 - 시작일은 첫 실행에만 사용)
+        self.cb_incremental = QCheckBox("증분 탐지 (새 데이터만)")
+        self.cb_incremental.setFont(QFont("Pretendard Variable", FONT_SIZES['body']))
+        self.cb_incremental.setToolTip("종목별 마지막 탐지일 이후의 거래일만 평가합니다")
+        layout.addWidget(self.cb_incremental)
+
         # 기간 표시
         period_label = QLabel("10년 9개월")
         period_label.setAlignment(Qt.AlignCenter)
@@ -721,7 +727,8 @@ class BlockDetectorPanel(QWidget):
             start_date=start_date,
             end_date=end_date,
             market_filter=None,  # 전체 시장
-            settings=settings
+            settings=settings,
+            incremental=self.cb_incremental.isChecked()
         )
         print("[DEBUG] Worker created")
 
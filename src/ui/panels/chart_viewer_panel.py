@@ -22,7 +22,11 @@ from ui.widgets.charts.candlestick_chart import CandlestickChart
 from ui.widgets.common.glass_card import GlassCard
 from resources.icons import get_menu_icon, get_primary_icon
 from infrastructure.database import get_session
-from infrastructure.database.models import Stock, VolumeBlock
+from infrastructure.database.models import Stock, SupportLevel, VolumeBlock
+from infrastructure.repositories import (
+    CachedPriceDataRepository,
+    SQLAlchemyPriceDataRepository
+)
 
 
 class ChartViewerPanel(QWidget):
@@ -43,6 +47,8 @@ class ChartViewerPanel(QWidget):
         self._sync_in_progress = False  # 재귀 방지 플래그
         self._total_data_range = None  # 전체 데이터 범위
         self._visible_range = 180  # 표시할 일 수 (기본 6개월)
+        # 주가 시계열 캐시 (트리 클릭마다 SQLite 재조회 방지)
+        self._price_repo = CachedPriceDataRepository(SQLAlchemyPriceDataRepository())
         self._setup_ui()
 
     def _setup_ui(self):
@@ -628,7 +634,6 @@ class ChartViewerPanel(QWidget):
         print(f"[DEBUG] _load_stock_chart called with code: {stock_code}, block_date: {block_date}")
         try:
             import pandas as pd
-            from infrastructure.database.models import PriceData
 
             with get_session() as session:
                 # 종목 조회
@@ -666,33 +671,29 @@ class ChartViewerPanel(QWidget):
                     end_date = datetime.now()
                     start_date = end_date - timedelta(days=365)
 
-                price_data = session.query(PriceData).filter(
-                    PriceData.stock_id == stock_id,
-                    PriceData.date >= start_date,
-                    PriceData.date <= end_date
-                ).order_by(PriceData.date).all()
+                # 가격 데이터 조회 (캐시된 시계열에서 슬라이스)
+                series = self._price_repo.get_series(
+                    stock_id,
+                    start_date.date(),
+                    end_date.date()
+                )
 
-                print(f"[DEBUG] Found {len(price_data)} price data records")
+                print(f"[DEBUG] Found {len(series)} price data records")
 
-                if not price_data:
+                if not series:
                     print(f"[WARN] No price data found for {stock_name}")
                     # 샘플 데이터로 폴백
                     df = None
                 else:
                     # DataFrame 생성
-                    data = []
-                    for p in price_data:
-                        data.append({
-                            'Date': p.date,
-                            'Open': p.open,
-                            'High': p.high,
-                            'Low': p.low,
-                            'Close': p.close,
-                            'Volume': p.volume
-                        })
-                    df = pd.DataFrame(data)
-                    df['Date'] = pd.to_datetime(df['Date'])
-                    df = df.set_index('Date')
+                    df = series.to_dataframe().rename(columns={
+                        'open': 'Open',
+                        'high': 'High',
+                        'low': 'Low',
+                        'close': 'Close',
+                        'volume': 'Volume'
+                    })[['Open', 'High', 'Low', 'Close', 'Volume']]
+                    df.index.name = 'Date'
                     print(f"[DEBUG] Created DataFrame with {len(df)} rows")
 
                 # 블록 조회
@@ -715,12 +716,24 @@ class ChartViewerPanel(QWidget):
                         'pattern_type': block.pattern_type
                     })
 
+                # 지지선 조회 (SupportLevelCalculator가 탐지 후 미리 계산해 저장 - UI 스레드에서는 읽기만)
+                support_rows = session.query(
+                    VolumeBlock.date, SupportLevel.level_number, SupportLevel.price, SupportLevel.label
+                ).join(SupportLevel, SupportLevel.block_id == VolumeBlock.id).filter(
+                    VolumeBlock.stock_id == stock_id
+                ).order_by(VolumeBlock.date, SupportLevel.level_number).all()
+                support_list = [
+                    {'date': block_date, 'level': level, 'price': price, 'label': label}
+                    for block_date, level, price, label in support_rows
+                ]
+
             # 차트 업데이트 (실제 데이터 + 블록 정보 전달, 거래량 포함)
             print(f"[DEBUG] Updating candlestick chart with actual data and {len(block_list)} blocks")
             self.candlestick_chart.plot_stock(
                 ticker=f"{stock_name} ({stock_code})",
                 df=df,
-                blocks=block_list
+                blocks=block_list,
+                support_levels=support_list
             )
 
         except Exception as e:
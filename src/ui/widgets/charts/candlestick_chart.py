@@ -65,6 +65,7 @@ class CandlestickChart(FigureCanvasQTAgg):
         # 데이터
         self.df = None
         self.blocks = []
+        self.support_levels = []
         self.current_ticker = None
 
         # 줌 상태 저장
@@ -126,7 +127,8 @@ class CandlestickChart(FigureCanvasQTAgg):
         # 여백 (상단 여백을 충분히 확보)
         self.fig.subplots_adjust(left=0.08, right=0.95, top=0.95, bottom=0.10)
 
-    def plot_stock(self, ticker: str = None, df: pd.DataFrame = None, blocks: list = None):
+    def plot_stock(self, ticker: str = None, df: pd.DataFrame = None, blocks: list = None,
+                   support_levels: list = None):
         """
         종목 차트 그리기
 
@@ -134,9 +136,11 @@ class CandlestickChart(FigureCanvasQTAgg):
             ticker: 종목 코드
             df: OHLCV 데이터프레임 (columns: Date, Open, High, Low, Close, Volume)
             blocks: 블록 리스트 (dict with keys: type, date, trading_value, etc.)
+            support_levels: 저장된 지지선 리스트 (dict with keys: date(2번 블록), level, price, label)
         """
         self.current_ticker = ticker
         self.blocks = blocks or []
+        self.support_levels = support_levels or []
 
         # 데이터 없으면 샘플 데이터 생성
         if df is None:
@@ -155,6 +159,9 @@ class CandlestickChart(FigureCanvasQTAgg):
         # 60일 이동평균선
         self._draw_moving_average()
 
+        # 지지선 (2번 블록 D일부터 차트 끝까지)
+        self._draw_support_levels()
+
         # 블록 마커
         self._draw_block_markers()
 
@@ -419,6 +426,41 @@ class CandlestickChart(FigureCanvasQTAgg):
                     align='center'
                 )
 
+    def _draw_support_levels(self):
+        """지지선 그리기 (계산 없이 저장된 가격만 사용)"""
+        if not self.support_levels or self.df is None or len(self.df) == 0:
+            return
+
+        colors = theme_manager.colors
+        line_color = rgba_to_mpl(colors['support_line'])
+        line_styles = {1: '-', 2: '--', 3: ':'}
+        x_end = mdates.date2num(self.df.index[-1].to_pydatetime())
+
+        for support in self.support_levels:
+            x_start = mdates.date2num(pd.Timestamp(support['date']).to_pydatetime())
+            if x_start > x_end:
+                continue
+            x_start = max(x_start, mdates.date2num(self.df.index[0].to_pydatetime()))
+            self.ax.hlines(
+                support['price'],
+                x_start,
+                x_end,
+                colors=[line_color],
+                linestyles=line_styles.get(support['level'], '-'),
+                linewidth=1.2,
+                zorder=5
+            )
+            self.ax.text(
+                x_end,
+                support['price'],
+                support['label'].split(' ')[0],
+                ha='left',
+                va='center',
+                fontsize=8,
+                color=colors['text_secondary'],
+                zorder=6
+            )
+
     def _draw_block_markers(self):
         """블록 플로팅 마커 그리기"""
         if not self.blocks:
@@ -5,14 +5,17 @@ QThread 기반 백그라운드 블록 탐지 워커
 
 from PySide6.QtCore import QThread, Signal
 from datetime import datetime
-from services.block_detector import block_detector
+from services.parallel_block_detector import ParallelBlockDetector
+from services.pattern_snapshot_builder import PatternSnapshotBuilder
+from services.case_pipeline import CasePipeline
+from services.support_level_calculator import SupportLevelCalculator
 from data.database import get_session
 from data.models import Stock
 
 
 class BlockDetectionWorker(QThread):
     """
-    블록 탐지 백그라운드 워커
+    블록 탐지 백그라운드 워커 (탐지는 ParallelBlockDetector 프로세스 풀에서 실행)
 
     Signals:
         progress: (current, total, message)
@@ -26,13 +29,14 @@ class BlockDetectionWorker(QThread):
     finished = Signal(bool, int, int)  # success, total_blocks_1, total_blocks_2
     error = Signal(str)
 
-    def __init__(self, start_date, end_date, market_filter=None, settings=None):
+    def __init__(self, start_date, end_date, market_filter=None, settings=None, incremental=False):
         super().__init__()
         self.setTerminationEnabled(True)  # 강제 종료 가능하도록 설정
         self.start_date = start_date
         self.end_date = end_date
         self.market_filter = market_filter
         self.settings = settings  # 탐지 설정 (None이면 기본값 사용)
+        self.incremental = incremental  # 종목별 탐지 상태 이후의 새 봉만 평가
         self._is_running = True
         self.total_blocks_1 = 0
         self.total_blocks_2 = 0
@@ -73,55 +77,31 @@ class BlockDetectionWorker(QThread):
             print(f"[DEBUG] Emitting initial progress signal")
             self.progress.emit(0, total_stocks, f"총 {total_stocks}개 종목 탐지 시작...")
 
-            # 각 종목별 블록 탐지
-            print(f"[DEBUG] Starting detection loop for {total_stocks} stocks")
-            for idx, stock in enumerate(stocks):
-                if not self._is_running:
-                    print("[DEBUG] Worker stopped by user")
-                    self.progress.emit(idx, total_stocks, "사용자에 의해 중지됨")
-                    break
-
-                if idx % 100 == 0:
-                    print(f"[DEBUG] Processing stock {idx+1}/{total_stocks}")
-
-                self.progress.emit(
-                    idx + 1,
-                    total_stocks,
-                    f"[{idx+1}/{total_stocks}] {stock['name']} ({stock['code']}) 탐지 중..."
-                )
-
-                try:
-                    # 블록 탐지 실행 (settings 전달)
-                    result = block_detector.detect_all_blocks(
-                        stock['code'],
-                        start_dt,
-                        end_dt,
-                        self.settings
-                    )
-
-                    blocks_1_count = len(result['blocks_1'])
-                    blocks_2_count = len(result['blocks_2'])
-
-                    # 카운트 누적
-                    self.total_blocks_1 += blocks_1_count
-                    self.total_blocks_2 += blocks_2_count
-
-                    # 종목 완료 시그널
-                    if blocks_1_count > 0 or blocks_2_count > 0:
-                        print(f"[DEBUG] Blocks found for {stock['name']}: "
-                              f"B1={blocks_1_count}, B2={blocks_2_count}")
-                        self.stock_completed.emit(
-                            stock['name'],
-                            blocks_1_count,
-                            blocks_2_count
-                        )
-
-                except Exception as e:
-                    print(f"[ERROR] {stock['name']} ({stock['code']}) "
-                          f"탐지 실패: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            # 멀티프로세스 블록 탐지 (종목 샤드 단위, 결과는 부모에서 일괄 저장)
+            print(f"[DEBUG] Starting parallel detection for {total_stocks} stocks")
+            engine = ParallelBlockDetector()
+            self.total_blocks_1, self.total_blocks_2 = engine.detect(
+                stocks,
+                start_dt,
+                end_dt,
+                self.settings,
+                progress_callback=self.progress.emit,
+                stock_callback=self._on_stock_completed,
+                is_cancelled=lambda: not self._is_running,
+                incremental=self.incremental
+            )
+
+            if not self._is_running:
+                print("[DEBUG] Worker stopped by user")
+                self.progress.emit(total_stocks, total_stocks, "사용자에 의해 중지됨")
+            else:
+                # 지지선 (새 블록/부모가 바뀐 2번 블록만) - 차트는 저장된 값을 그리기만 함
+                stock_ids = [s['id'] for s in stocks]
+                SupportLevelCalculator().update(stock_ids, progress_callback=self.progress.emit)
+                # D/D+1/D+2 패턴 스냅샷 (스냅샷이 없거나 D+2가 아직 채워지지 않은 2번 블록만)
+                PatternSnapshotBuilder().build(stock_ids, progress_callback=self.progress.emit)
+                # 새 1번/2번 블록 쌍 → 케이스 생성 + 라벨링
+                CasePipeline().update(stock_ids, progress_callback=self.progress.emit)
 
             # 완료
             print(f"[DEBUG] Detection loop finished. "
@@ -144,6 +124,11 @@ class BlockDetectionWorker(QThread):
             self.error.emit(str(e))
             self.finished.emit(False, 0, 0)
 
+    def _on_stock_completed(self, result):
+        """종목 완료 시그널 (블록이 있는 종목만)"""
+        if result.blocks_1 or result.blocks_2:
+            self.stock_completed.emit(result.name, len(result.blocks_1), len(result.blocks_2))
+
     def stop(self):
         """탐지 중지"""
         self._is_running = False
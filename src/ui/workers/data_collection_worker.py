@@ -5,6 +5,7 @@ QThread 기반 백그라운드 데이터 수집 워커
 
 from PySide6.QtCore import QThread, Signal
 from datetime import datetime
+from services.case_pipeline import CasePipeline
 from services.data_collector import data_collector
 from core.enums import MarketType
 
@@ -93,6 +94,10 @@ class DataCollectionWorker(QThread):
                 priority_mode=priority_mode
             )
 
+            # 새 봉 반영 - 진행 중인 케이스만 사후 수익률 갱신
+            if self._is_running:
+                CasePipeline().label_cases(progress_callback=progress_callback)
+
             # 완료
             if self._is_running:
                 self.finished.emit(True, data_collector.collected_count)
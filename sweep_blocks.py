@@ -0,0 +1,77 @@
+"""
+블록 조건 파라미터 스윕 스크립트
+SWEEP_CONFIG 그리드 전체를 한 번에 평가해 조합별 블록 수/확인율/사후 수익률 출력
+
+Usage:
+    python sweep_blocks.py                              # 전 종목, 최근 5년
+    python sweep_blocks.py --codes 005930 000660 --years 3
+    python sweep_blocks.py --lookback-days 365 730 --output data/sweep.csv
+"""
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import pandas as pd
+
+from domain.services.sweep_kernels import GRID_AXES, SweepGrid
+from infrastructure.database import add_database_argument, configure_database, get_session
+from infrastructure.database.models import Stock
+from services.parameter_sweep import ParameterSweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Block criteria parameter sweep")
+    parser.add_argument("--codes", nargs="*", default=None, help="종목 코드 (기본: 전 종목)")
+    parser.add_argument("--years", type=int, default=5, help="1번 블록 탐지 기간 (년)")
+    parser.add_argument("--min-trading-values", nargs="+", type=float, default=None, help="최소 거래대금 후보 (원)")
+    parser.add_argument("--lookback-days", nargs="+", type=int, default=None, help="조회 기간 후보 (일)")
+    parser.add_argument("--volume-ratios", nargs="+", type=float, default=None, help="2번 블록 거래량 비율 후보")
+    parser.add_argument("--block2-windows", nargs="+", type=int, default=None, help="2번 블록 최대 간격 후보 (일)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    parser.add_argument("--output", default=None, help="요약표 CSV 저장 경로")
+    add_database_argument(parser)
+    args = parser.parse_args()
+    configure_database(args.db)
+
+    overrides = {
+        key: value for key, value in (
+            ('min_trading_values', args.min_trading_values),
+            ('lookback_days', args.lookback_days),
+            ('volume_ratios', args.volume_ratios),
+            ('block2_windows', args.block2_windows),
+        ) if value
+    }
+    grid = SweepGrid.from_config(**overrides)
+
+    with get_session() as session:
+        query = session.query(Stock.id, Stock.code, Stock.name)
+        if args.codes:
+            query = query.filter(Stock.code.in_(args.codes))
+        stocks = [{'id': s.id, 'code': s.code, 'name': s.name} for s in query.all()]
+
+    end = date.today() - timedelta(days=max(grid.block2_windows))
+    start = end - timedelta(days=365 * args.years)
+    print(f"[INFO] {len(stocks)} stocks, {start} ~ {end}")
+
+    result = ParameterSweep(grid, max_workers=args.workers).run(stocks, start, end)
+    for stock_id, error in result.errors.items():
+        print(f"  [ERROR] stock {stock_id}: {error}")
+
+    summary = result.summary()
+    with pd.option_context('display.max_rows', None, 'display.width', 200, 'display.float_format', '{:.4f}'.format):
+        print(summary.to_string(index=False))
+        for axis in GRID_AXES:
+            print(f"\n[SENSITIVITY] {axis}")
+            print(result.sensitivity(axis).to_string())
+
+    if args.output:
+        summary.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"[SUCCESS] Summary saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,32 @@ Pytest Configuration
 테스트 픽스처 및 설정
 """
 
+import os
+import shutil
 import sys
+from datetime import date
 from pathlib import Path
 
 # src 디렉토리를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
+# 기본 DB = 세션 전용 임시 파일 (운영 data/robostock.db를 건드리지 않고 병렬 실행 가능)
+# 실제 데이터가 필요한 테스트: ROBOSTOCK_DB=data/robostock.db pytest ...
+from core.config import DATABASE_CONFIG
+os.environ.setdefault(DATABASE_CONFIG['env_var'], 'temp')
+
+import numpy as np
+import pandas as pd
 import pytest
+from sqlalchemy import create_engine
+
 from data.database import DatabaseManager
+from domain.entities.price_data import PriceData
+from domain.entities.price_series import PriceSeries
+from infrastructure.database import DatabaseProfile, use_database
+from infrastructure.database.models import Base
+from services.synthetic_market import SyntheticMarket
 
 
 @pytest.fixture(scope="session")
@@ -28,3 +45,119 @@ def db_session(db_manager):
     """각 테스트마다 새로운 세션"""
     with db_manager.get_session() as session:
         yield session
+
+
+@pytest.fixture
+def memory_db():
+    """테스트 전용 빈 인메모리 DB (테이블 생성됨, 끝나면 폐기)"""
+    with use_database(DatabaseProfile.memory()) as manager:
+        yield manager
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """
+    테스트 전용 빈 SQLite 파일 엔진 (테이블 생성됨) - 엔진을 직접 받는 일괄 계산/저장 엔진용
+
+    초기 데이터가 필요하면 같은 이름 픽스처로 덮어써서 engine을 받아 채움.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _random_frame(
+    seed: int,
+    days: int = 700,
+    start: date = date(2019, 1, 1),
+    missing_value_every: int = 0
+) -> pd.DataFrame:
+    """
+    시드 고정 무작위 일봉 (영업일 5% 누락, 거래량 5% 15배 급증, 거래대금 = 거래량 × 종가)
+
+    Args:
+        missing_value_every: N > 0이면 N행마다 거래대금 NaN (거래량 × 종가 대체 경로)
+    """
+    rng = np.random.default_rng(seed)
+    all_dates = pd.bdate_range(start, periods=days)
+    dates = all_dates[rng.random(days) > 0.05]
+    n = len(dates)
+    volume = rng.integers(1_000, 50_000, n)
+    volume[rng.random(n) < 0.05] *= 15
+    close = 5_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    df = pd.DataFrame({
+        'open': close, 'high': close * 1.02, 'low': close * 0.98, 'close': close,
+        'volume': volume, 'trading_value': volume * close,
+    }, index=pd.DatetimeIndex(dates, name='date'))
+    if missing_value_every:
+        df.loc[df.index[::missing_value_every], 'trading_value'] = np.nan
+    return df
+
+
+@pytest.fixture
+def random_frame():
+    """시드 고정 무작위 일봉 생성 함수 (random_frame(seed, days=..., start=...))"""
+    return _random_frame
+
+
+def _random_series(seed: int, days: int = 1500, tie_max: bool = False) -> PriceSeries:
+    """
+    시드 고정 무작위 PriceSeries (영업일 5% 누락, 고가/저가 ±3% 무작위, 거래량 2% 20배 급증)
+
+    Args:
+        tie_max: True면 1% 행의 거래량을 최대값으로 (동률 최대 거래량 경로)
+    """
+    rng = np.random.default_rng(seed)
+    all_dates = pd.bdate_range(date(2015, 1, 1), periods=days)
+    dates = all_dates[rng.random(days) > 0.05]  # 휴장일 흉내
+    n = len(dates)
+
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    high = close * (1 + rng.random(n) * 0.03)
+    low = close * (1 - rng.random(n) * 0.03)
+    volume = rng.integers(1_000, 100_000, n)
+    volume[rng.random(n) < 0.02] *= 20  # 거래량 급증
+    if tie_max:
+        volume[rng.random(n) < 0.01] = volume.max()
+    trading_value = volume * close
+
+    rows = [
+        PriceData(
+            stock_id=1, date=d.date(), open=float(c), high=float(h), low=float(l),
+            close=float(c), volume=int(v), trading_value=float(tv)
+        )
+        for d, c, h, l, v, tv in zip(dates, close, high, low, volume, trading_value)
+    ]
+    return PriceSeries.from_price_data(1, rows)
+
+
+@pytest.fixture
+def random_series():
+    """시드 고정 무작위 PriceSeries 생성 함수 (random_series(seed, days=..., tie_max=...))"""
+    return _random_series
+
+
+@pytest.fixture(scope="session")
+def synthetic_market():
+    """시드 고정 합성 종목군 (5종목 × 4년)"""
+    return SyntheticMarket(stocks=5, years=4, seed=42)
+
+
+@pytest.fixture(scope="session")
+def _synthetic_template(synthetic_market, tmp_path_factory):
+    return synthetic_market.write_sqlite(tmp_path_factory.mktemp("synthetic") / "template.db")
+
+
+@pytest.fixture
+def seeded_db(synthetic_market, _synthetic_template):
+    """
+    합성 종목군이 채워진 테스트 전용 DB (세션 템플릿 복사본 임시 파일 - 워커 프로세스도 사용 가능)
+
+    Yields:
+        SyntheticMarket
+    """
+    profile = DatabaseProfile.temp()
+    shutil.copyfile(_synthetic_template, profile.path)
+    with use_database(profile):
+        yield synthetic_market
@@ -0,0 +1,125 @@
+"""
+벡터화 1번 블록 탐지 / 신고가 등급 동등성 테스트
+기존 행 단위 루프 구현(참조)과 결과가 완전히 같은지 확인
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.enums import NewHighGrade
+from domain.services import BlockDetectionService
+from domain.services.detection_kernels import new_high_grades
+from services.block_detector import BlockDetector
+
+
+# ===== 참조 구현 (기존 루프) =====
+
+GRADE_PERIODS = {
+    NewHighGrade.S: None,
+    NewHighGrade.A: 3650,
+    NewHighGrade.B: 1825,
+    NewHighGrade.C: 730,
+    NewHighGrade.D: 365,
+    NewHighGrade.E: 180,
+}
+
+
+def _reference_grade_rows(df, current_idx):
+    current_high = df.iloc[current_idx]['high']
+    for grade, days in GRADE_PERIODS.items():
+        start = 0 if days is None else max(0, current_idx - days)
+        if current_high >= df.iloc[start:current_idx + 1]['high'].max():
+            return grade
+    return NewHighGrade.F
+
+
+def _reference_grade_days(df, current_date):
+    current_high = df.loc[current_date, 'high']
+    for grade, days in GRADE_PERIODS.items():
+        if days is None:
+            lookback_data = df[:current_date]
+        else:
+            lookback_data = df[current_date - timedelta(days=days):current_date]
+        if current_high >= lookback_data['high'].max():
+            return grade
+    return NewHighGrade.F
+
+
+def _reference_domain(series, min_trading_value, max_period_days):
+    df = series.to_dataframe()
+    found = []
+    for idx in range(len(df)):
+        row = df.iloc[idx]
+        if row['trading_value'] < min_trading_value:
+            continue
+        lookback_data = df.iloc[max(0, idx - max_period_days):idx + 1]
+        if row['volume'] < lookback_data['volume'].max():
+            continue
+        found.append((df.index[idx].date(), int(row['volume']), float(row['trading_value']),
+                      float(row['close']), _reference_grade_rows(df, idx)))
+    return found
+
+
+def _reference_legacy(df, min_trading_value, max_period_days):
+    found = []
+    for idx, row in df.iterrows():
+        if row['trading_value'] < min_trading_value:
+            continue
+        lookback_data = df[idx - timedelta(days=max_period_days):idx]
+        if lookback_data.empty or row['volume'] < lookback_data['volume'].max():
+            continue
+        found.append({
+            'date': idx.date(),
+            'volume': int(row['volume']),
+            'trading_value': float(row['trading_value']),
+            'close_price': float(row['close']),
+            'new_high_grade': _reference_grade_days(df, idx),
+            'max_volume_period_days': max_period_days,
+        })
+    return found
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("min_trading_value", [0, 5e8, 2e9])
+def test_domain_block1_matches_row_loop(random_series, seed, min_trading_value):
+    service = BlockDetectionService()
+    series = random_series(seed, tie_max=True)
+    settings = {'block1': {'min_trading_value': min_trading_value}}
+
+    blocks = service.detect_block_1_from_data(1, series, settings)
+    actual = [(b.date, b.volume, b.trading_value, b.close_price, b.new_high_grade) for b in blocks]
+
+    assert actual == _reference_domain(series, min_trading_value, 730)
+    assert actual
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("min_trading_value", [0, 5e8, 2e9])
+def test_legacy_block1_matches_label_slice_loop(random_series, seed, min_trading_value):
+    detector = BlockDetector()
+    df = random_series(seed, tie_max=True).to_dataframe()
+    df.loc[df.index[::50], 'trading_value'] = np.nan  # 거래대금 누락 행 (조건 통과)
+
+    actual = detector._find_block_1(df, min_trading_value, 730)
+
+    expected = _reference_legacy(df, min_trading_value, 730)
+    assert actual
+    assert pd.DataFrame(actual).equals(pd.DataFrame(expected))  # NaN 거래대금 포함 비교
+
+
+@pytest.mark.parametrize("seed", [3, 4])
+def test_grade_kernel_matches_per_row_grading(random_series, seed):
+    series = random_series(seed, days=3200, tie_max=True)
+    df = series.to_dataframe()
+    df.loc[df.index[10], 'high'] = np.nan
+
+    by_rows = new_high_grades(df['high'].to_numpy(), by='rows')
+    by_days = new_high_grades(df['high'].to_numpy(), df.index, by='days')
+
+    assert list(by_rows) == [_reference_grade_rows(df, i) for i in range(len(df))]
+    assert list(by_days) == [_reference_grade_days(df, d) for d in df.index]
+    assert by_rows[10] == NewHighGrade.F
+    assert len(set(by_days)) >= 4
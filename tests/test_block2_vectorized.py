@@ -0,0 +1,114 @@
+"""
+벡터화 2번 블록 탐지 동등성 테스트
+1번 블록별 재조회 + 행 단위 패턴 분류(참조)와 결과가 같은지 확인
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.enums import PatternType
+from domain.services.detection_kernels import trailing_mean
+from services.block_detector import BlockDetector
+
+
+# 공용 random_frame 설정 (2018년부터 900영업일, 37행마다 거래대금 누락)
+FRAME = {'days': 900, 'start': date(2018, 1, 1), 'missing_value_every': 37}
+
+
+# ===== 참조 구현 (기존 detect_block_2 + _classify_pattern 루프) =====
+
+def _reference_classify(price_data, current_idx):
+    current_volume = price_data[current_idx].volume
+    if current_idx >= 20:
+        avg_volume = np.mean([price_data[i].volume for i in range(current_idx - 20, current_idx)])
+    else:
+        avg_volume = current_volume * 0.5
+    threshold = avg_volume * 0.8
+    has_d1 = current_idx + 1 < len(price_data) and price_data[current_idx + 1].volume >= threshold
+    has_d2 = current_idx + 2 < len(price_data) and price_data[current_idx + 2].volume >= threshold
+    if has_d1 and has_d2:
+        return PatternType.D_D1_D2
+    if has_d1:
+        return PatternType.D_D1
+    if has_d2:
+        return PatternType.D_D2
+    return PatternType.D_ONLY
+
+
+def _reference_block_2(df, block_1_date, block_1_volume, min_volume_ratio, min_trading_value, max_days=180):
+    window = df[(df.index > pd.Timestamp(block_1_date))
+                & (df.index <= pd.Timestamp(block_1_date + timedelta(days=max_days)))]
+    price_data = [
+        SimpleNamespace(
+            date=d.date(), volume=int(r.volume), close=float(r.close),
+            trading_value=None if np.isnan(r.trading_value) else float(r.trading_value)
+        )
+        for d, r in window.iterrows()
+    ]
+
+    found = []
+    for idx, price in enumerate(price_data):
+        volume_ratio = price.volume / block_1_volume
+        if volume_ratio < min_volume_ratio:
+            continue
+        if min_trading_value and price.trading_value is not None and price.trading_value < min_trading_value:
+            continue
+        found.append({
+            'date': price.date,
+            'volume': price.volume,
+            'trading_value': price.trading_value,
+            'close_price': price.close,
+            'volume_ratio': volume_ratio,
+            'days_from_block1': (price.date - block_1_date).days,
+            'pattern_type': _reference_classify(price_data, idx),
+        })
+    return found
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("block2_settings", [
+    None,
+    {'min_volume_ratio': 0.3},
+    {'min_volume_ratio': 0.1, 'min_trading_value': 5e8},
+])
+def test_block2_batch_matches_per_block_loop(seed, block2_settings, random_frame):
+    df = random_frame(seed, **FRAME)
+    # 밀집 구간 포함: 랜덤 1번 블록 40개 (겹치는 구간 다수)
+    rng = np.random.default_rng(seed + 100)
+    picks = np.sort(rng.choice(len(df) - 10, 40, replace=False))
+    blocks_1 = [{'date': df.index[i].date(), 'volume': int(df['volume'].iloc[i])} for i in picks]
+    settings = {'block2': block2_settings} if block2_settings else None
+
+    actual = BlockDetector()._find_block_2(df, blocks_1, settings)
+
+    min_ratio = (block2_settings or {}).get('min_volume_ratio', 0.8)
+    min_tv = (block2_settings or {}).get('min_trading_value')
+    expected = []
+    for block_1 in blocks_1:
+        expected.extend(_reference_block_2(df, block_1['date'], block_1['volume'], min_ratio, min_tv))
+
+    assert actual == expected
+    assert {b['pattern_type'] for b in actual} >= {PatternType.D_ONLY, PatternType.D_D1}
+
+
+def test_trailing_mean_is_exact():
+    values = np.array([10**12 + i * 7 for i in range(50)], dtype=np.int64)
+    means = trailing_mean(values, 20)
+    assert np.isnan(means[:20]).all()
+    for i in range(20, 50):
+        assert means[i] == np.mean([int(v) for v in values[i - 20:i]])
+
+
+def test_detect_block_1_accepts_preloaded_frame(random_frame):
+    df = random_frame(5, **FRAME).dropna()
+    settings = {'block1': {'min_trading_value': None}}
+    detector = BlockDetector()
+
+    blocks_1 = detector.detect_block_1(1, df.index[0], df.index[-1], settings, df=df)
+
+    assert blocks_1 == detector._find_block_1(df, 0, 730)
+    assert blocks_1
@@ -0,0 +1,110 @@
+"""
+3번/4번 블록 탐지 테스트
+벡터화 후보 계산이 행 단위 참조 루프와 같은지, 수급 품질/부모 연결 저장 확인
+"""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import insert, select, text
+
+from core.enums import BlockType, MarketType
+from domain.services.detection_kernels import block_3_4_candidates, quality_grades, supply_quality_scores
+from infrastructure.database.models import Stock, VolumeBlock
+from infrastructure.repositories.block_writer import BlockWriter, block_rows
+from services.block_detector import BlockDetector, investor_frame_from_rows
+
+
+def _reference(df, anchor_row, max_days=180, ratio=0.15, price_pct=0.12):
+    """앵커별 행 단위 루프 (3번 블록, 4번 블록 행 번호)"""
+    reference = df.iloc[anchor_row:anchor_row + 3]
+    ref_volume, ref_high = reference['volume'].max(), reference['high'].max()
+    limit = df.index[anchor_row] + timedelta(days=max_days)
+    found = []
+    for row in range(anchor_row + 3, len(df)):
+        if df.index[row] > limit:
+            break
+        price = df.iloc[row]
+        if price['volume'] >= ref_volume * ratio and abs(price['high'] - ref_high) <= ref_high * price_pct:
+            found.append(row)
+    return (found + [-1, -1])[:2]
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_block_3_4_candidates_match_reference_loop(seed, random_frame):
+    df = random_frame(seed)
+    anchors = np.sort(np.random.default_rng(seed).choice(len(df) - 5, 40, replace=False))
+
+    _, _, row_3, row_4 = block_3_4_candidates(
+        df.index.values, df['high'].to_numpy(), df['volume'].to_numpy(), anchors, 180, 0.15, 0.12
+    )
+
+    expected = np.array([_reference(df, anchor) for anchor in anchors])
+    np.testing.assert_array_equal(row_3, expected[:, 0])
+    np.testing.assert_array_equal(row_4, expected[:, 1])
+
+
+def test_supply_quality_scores_and_grades():
+    scores = supply_quality_scores(
+        institutional_net_buy=[1, 1, -1, np.nan, 1],
+        foreign_net_buy=[1, -1, -1, np.nan, 1],
+        institutional_strength=[3, 0, 0, np.nan, 1],
+        foreign_strength=[3, 0, 0, np.nan, 1],
+        program_net_buy=[1, 1, 0, np.nan, 0],
+    )
+    assert scores.tolist() == [10, 9, 5, 5, 10]
+    assert quality_grades([10, 9, 8, 7, 6, 5]).tolist() == ['S', 'A', 'A', 'B', 'B', 'C']
+
+
+@pytest.fixture
+def engine(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+    return engine
+
+
+def test_detected_blocks_are_saved_with_parent_chain(engine, random_frame):
+    df = random_frame(7)
+    detector = BlockDetector()
+    end_date = df.index[400].date()
+    settings = {'block1': {'min_trading_value': None}}
+    blocks_1, blocks_2 = detector.detect_from_frame(df, end_date, settings)
+
+    investor_dates = []
+
+    def load_investor(first, last):
+        investor_dates.append((first, last))
+        return investor_frame_from_rows([(d, 1e9, 1e9, 1e8, 4.0, 4.0) for d in df.index])
+
+    blocks_3, blocks_4 = detector._find_block_3_4(df, blocks_2, load_investor)
+    assert blocks_3 and blocks_4 and len(investor_dates) == 1
+    assert all(b['quality_score'] == 10 and b['quality_grade'] == 'S' for b in blocks_3 + blocks_4)
+    assert all(b['days_from_block3'] > 0 for b in blocks_4)
+
+    result = BlockWriter(engine).write({1: block_rows(blocks_1, blocks_2, blocks_3, blocks_4)})
+    assert result.inserted_count(BlockType.BLOCK_3) == len(blocks_3)
+
+    with engine.connect() as conn:
+        stored = {(row.block_type, row.date): row for row in conn.execute(select(VolumeBlock))}
+    ids = {row.id: key for key, row in stored.items()}
+    for block in blocks_3:
+        row = stored[(BlockType.BLOCK_3, block['date'])]
+        assert ids[row.parent_block_id] == (BlockType.BLOCK_2, block['parent_date'])
+        assert row.quality_grade == 'S'
+    for block in blocks_4:
+        row = stored[(BlockType.BLOCK_4, block['date'])]
+        assert ids[row.parent_block_id] == (BlockType.BLOCK_3, block['parent_date'])
+
+
+def test_writer_adds_quality_columns_to_old_database(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_volume_blocks_stock_type_date"))
+        conn.execute(text("ALTER TABLE volume_blocks DROP COLUMN quality_score"))
+        conn.execute(text("ALTER TABLE volume_blocks DROP COLUMN quality_grade"))
+
+    BlockWriter.forget_engines()
+    assert BlockWriter(engine).ensure_unique_key()
+    with engine.connect() as conn:
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(volume_blocks)"))}
+    assert {'quality_score', 'quality_grade'} <= columns
@@ -0,0 +1,101 @@
+"""
+블록 기간(60이평선 회귀) 계산 테스트
+벡터화 계산이 행 단위 참조 루프와 같은지, 일괄 저장이 모든 블록을 채우는지 확인
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import insert, select
+
+from core.enums import BlockType, MarketType, NewHighGrade, RangeEndReason
+from domain.services.range_kernels import block_ranges, range_fields, segment_reduce
+from infrastructure.database.models import PriceData, Stock, VolumeBlock
+from services.block_range_calculator import BlockRangeCalculator
+
+
+def _random_frame(seed: int, days: int = 500) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(date(2019, 1, 1), periods=days)
+    close = 5_000 * np.exp(np.cumsum(rng.normal(0.001, 0.02, days)))
+    return pd.DataFrame({
+        'open': close, 'high': close * (1 + rng.random(days) * 0.03), 'low': close * (1 - rng.random(days) * 0.03),
+        'close': close, 'volume': rng.integers(1_000, 50_000, days), 'trading_value': np.nan,
+    }, index=pd.DatetimeIndex(dates, name='date'))
+
+
+def _reference(df, start_row, period=60):
+    ma = df['close'].rolling(period).mean().to_numpy()
+    end, reason = len(df) - 1, RangeEndReason.OPEN.value
+    for row in range(start_row + 1, len(df)):
+        if df['close'].iloc[row] < ma[row]:
+            end, reason = row, RangeEndReason.BREAK.value
+            break
+        if df['low'].iloc[row] <= ma[row]:
+            end, reason = row, RangeEndReason.TOUCH.value
+            break
+    window = df.iloc[start_row:end + 1]
+    return {
+        'range_end_date': df.index[end].date(),
+        'range_end_reason': reason,
+        'range_high': window['high'].max(),
+        'range_high_date': window['high'].idxmax().date(),
+        'range_low': window['low'].min(),
+        'range_low_date': window['low'].idxmin().date(),
+        'range_avg_volume': int(round(window['volume'].mean())),
+    }
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_block_ranges_match_reference_loop(seed):
+    df = _random_frame(seed)
+    rows = np.sort(np.random.default_rng(seed).choice(len(df), 30, replace=False))
+    fields = range_fields(df, block_ranges(df, df.index.values[rows]))
+
+    for row, values in zip(rows, fields):
+        expected = _reference(df, row)
+        assert {key: values[key] for key in expected} == pytest.approx(expected)
+
+
+def test_missing_start_date_and_overlapping_segments():
+    df = _random_frame(4, days=100)
+    ranges = block_ranges(df, [np.datetime64('2018-01-01'), df.index.values[10]])
+    assert ranges.end_row[0] == -1 and range_fields(df, ranges)[0] == {}
+
+    values = np.arange(10, dtype=float)
+    np.testing.assert_array_equal(segment_reduce(np.maximum, values, [0, 2, 5], [6, 3, 9]), [6, 3, 9])
+
+
+def test_backfill_updates_all_blocks(engine):
+    df = _random_frame(5)
+    block_dates = [df.index[i].date() for i in (80, 200, 350)]
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+        conn.execute(insert(PriceData), [
+            {'stock_id': 1, 'date': d.date(), 'open': r.open, 'high': r.high, 'low': r.low,
+             'close': r.close, 'volume': int(r.volume)}
+            for d, r in df.iterrows()
+        ])
+        conn.execute(insert(VolumeBlock), [
+            {'stock_id': 1, 'block_type': BlockType.BLOCK_1, 'date': d, 'volume': 1, 'trading_value': 1.0,
+             'close_price': 1.0, 'new_high_grade': NewHighGrade.C}
+            for d in block_dates
+        ])
+
+    calculator = BlockRangeCalculator(engine, batch_size=1)
+    assert calculator.update() == 3
+
+    with engine.connect() as conn:
+        stored = conn.execute(select(VolumeBlock).order_by(VolumeBlock.date)).all()
+    for block, block_date in zip(stored, block_dates):
+        expected = _reference(df, df.index.get_loc(pd.Timestamp(block_date)))
+        assert block.range_end_date == expected['range_end_date']
+        assert block.range_end_reason == expected['range_end_reason']
+        assert block.range_high == pytest.approx(expected['range_high'])
+        assert block.ma60_at_start is not None
+
+    # 회귀가 끝난 블록은 다시 계산하지 않음
+    open_blocks = sum(block.range_end_reason == RangeEndReason.OPEN.value for block in stored)
+    assert calculator.update(only_missing=True) == open_blocks
@@ -0,0 +1,155 @@
+"""
+블록 일괄 저장(BlockWriter) 테스트 (임시 SQLite DB 사용)
+"""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, func, insert, select, text
+
+from core.enums import BlockType, MarketType, NewHighGrade, PatternType
+from infrastructure.database.connection import use_database
+from infrastructure.database.models import Base, Case, Stock, SupportLevel, VolumeBlock
+from infrastructure.repositories.block_writer import BlockWriter, block_rows
+
+
+def _block_1(day: date, volume: int = 10_000):
+    return {'date': day, 'volume': volume, 'trading_value': volume * 1_000.0, 'close_price': 1_000.0,
+            'new_high_grade': NewHighGrade.C, 'max_volume_period_days': 730}
+
+
+def _block_2(parent: date, day: date, volume: int = 8_000):
+    return {'date': day, 'volume': volume, 'trading_value': float('nan'), 'close_price': 1_100.0,
+            'days_from_block1': (day - parent).days, 'volume_ratio': volume / 10_000,
+            'pattern_type': PatternType.D_ONLY}
+
+
+@pytest.fixture
+def engine(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': i, 'code': f"{i:06d}", 'name': f"종목{i}", 'market': MarketType.KOSPI} for i in (1, 2)
+        ])
+    return engine
+
+
+def _stored(engine):
+    with engine.connect() as conn:
+        return {
+            (row.stock_id, row.block_type, row.date): row
+            for row in conn.execute(select(VolumeBlock))
+        }
+
+
+def test_write_inserts_links_parents_and_skips_unchanged(engine):
+    d1, d2, d3 = date(2020, 3, 2), date(2020, 3, 10), date(2020, 4, 1)
+    blocks = {
+        1: block_rows([_block_1(d1)], [_block_2(d1, d2), _block_2(d1, d3)]),
+        2: block_rows([_block_1(d1)], [_block_2(d1, d2), _block_2(d1, d2, volume=9_000)]),  # 같은 날짜는 1개
+    }
+    writer = BlockWriter(engine)
+    result = writer.write(blocks)
+
+    assert result.inserted == {BlockType.BLOCK_1: 2, BlockType.BLOCK_2: 3}
+    stored = _stored(engine)
+    assert len(stored) == 5
+    for stock_id in (1, 2):
+        parent_id = stored[(stock_id, BlockType.BLOCK_1, d1)].id
+        assert stored[(stock_id, BlockType.BLOCK_2, d2)].parent_block_id == parent_id
+        assert result.ids[(stock_id, BlockType.BLOCK_1, d1)] == parent_id
+    assert stored[(2, BlockType.BLOCK_2, d2)].volume == 8_000
+    assert stored[(1, BlockType.BLOCK_2, d2)].trading_value == 8_000 * 1_100.0  # 거래대금 누락 보정
+
+    # 같은 결과 재저장: 변경 없음 / 값이 바뀐 블록만 갱신
+    again = writer.write(blocks)
+    assert sum(again.inserted.values()) == 0 and again.updated == 0 and again.unchanged == 5
+
+    blocks[1][0]['close_price'] = 1_050.0
+    changed = writer.write(blocks)
+    assert changed.updated == 1 and changed.unchanged == 4
+    assert _stored(engine)[(1, BlockType.BLOCK_1, d1)].close_price == 1_050.0
+
+
+def test_replace_range_deletes_stale_blocks_but_keeps_referenced(engine):
+    d1, d2, d3, outside = date(2020, 3, 2), date(2020, 3, 10), date(2020, 5, 4), date(2019, 1, 2)
+    writer = BlockWriter(engine)
+    writer.write({1: block_rows(
+        [_block_1(outside), _block_1(d1), _block_1(d3)],
+        [_block_2(d1, d2), _block_2(d3, date(2020, 5, 6))]
+    )})
+    stored = _stored(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Case), [{'stock_id': 1, 'first_block_id': stored[(1, BlockType.BLOCK_1, d1)].id,
+                                     'case_date': d1}])
+        conn.execute(insert(SupportLevel), [{'block_id': stored[(1, BlockType.BLOCK_1, d3)].id,
+                                             'level_number': 1, 'price': 900.0}])
+
+    # 새 결과에는 d1/d3 1번 블록이 없음 → d3와 그 2번 블록/지지선은 삭제, 케이스가 참조하는 d1은 유지
+    result = writer.write({1: block_rows([_block_1(date(2020, 4, 1))])},
+                          replace_range=(date(2020, 1, 1), date(2020, 12, 31)))
+
+    assert result.inserted == {BlockType.BLOCK_1: 1, BlockType.BLOCK_2: 0}
+    assert result.deleted == 3
+    remaining = _stored(engine)
+    assert set(remaining) == {
+        (1, BlockType.BLOCK_1, outside), (1, BlockType.BLOCK_1, d1), (1, BlockType.BLOCK_1, date(2020, 4, 1))
+    }
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(SupportLevel)).scalar() == 0
+
+
+def test_unique_key_is_added_to_existing_databases(engine):
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_volume_blocks_stock_type_date"))
+
+    assert BlockWriter(engine).ensure_unique_key()
+    with engine.connect() as conn:
+        names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    assert 'uq_volume_blocks_stock_type_date' in names
+
+
+def test_write_falls_back_when_unique_key_was_dropped(engine):
+    d1, d2 = date(2020, 3, 2), date(2020, 3, 10)
+    writer = BlockWriter(engine)
+    writer.write({1: block_rows([_block_1(d1)])})
+
+    # 반영 기록이 남은 엔진에서 인덱스가 사라져도 ON CONFLICT 없이 차분으로 저장
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_volume_blocks_stock_type_date"))
+    assert writer.write({2: block_rows([_block_1(d1)])}).inserted[BlockType.BLOCK_1] == 1
+    with engine.begin() as conn:
+        result = writer.write({1: block_rows([_block_1(d1)], [_block_2(d1, d2)])}, conn=conn)
+    assert result.inserted[BlockType.BLOCK_2] == 1
+    assert len(_stored(engine)) == 3
+
+    # 복원/리셋 후처럼 기록을 비우면 다음 저장에서 인덱스 재생성
+    BlockWriter.forget_engines()
+    assert writer.ensure_unique_key()
+    with engine.connect() as conn:
+        names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    assert 'uq_volume_blocks_stock_type_date' in names
+
+
+def test_startup_upgrade_skips_unique_key_when_duplicates_exist(tmp_path):
+    path = tmp_path / 'dup.db'
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    day = date(2020, 3, 10)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX uq_volume_blocks_stock_type_date"))
+        conn.execute(text("DROP INDEX ix_price_data_stock_date_value"))
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+        conn.execute(insert(VolumeBlock), [
+            {'stock_id': 1, 'block_type': BlockType.BLOCK_2, 'date': day, 'volume': v, 'trading_value': 1.0,
+             'close_price': 1.0}
+            for v in (100, 200)
+        ])
+    engine.dispose()
+
+    # init_database와 같은 경로 (create_all_tables → add_missing_indexes)가 중복 행에서 실패하지 않음
+    with use_database(path) as manager:
+        with manager.engine.connect() as conn:
+            names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+        assert 'uq_volume_blocks_stock_type_date' not in names
+        assert 'ix_price_data_stock_date_value' in names
+        assert not BlockWriter(manager.engine).ensure_unique_key()
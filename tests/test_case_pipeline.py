@@ -0,0 +1,121 @@
+"""
+케이스 생성/사후 수익률 라벨링 테스트
+전방 최대값 테이블 조회가 슬라이스 참조와 같은지, 새 봉 증분 갱신이 전체 재계산과 같은지 확인 (임시 SQLite DB)
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import delete, insert, select
+
+from core.enums import BlockType, CaseStatus, MarketType, NewHighGrade, ReturnLevel
+from domain.services.case_kernels import first_reach, forward_max_table, range_max, return_levels
+from infrastructure.database.models import Case, PriceData, Stock, VolumeBlock
+from services.case_pipeline import CasePipeline
+
+
+def test_range_max_and_first_reach_match_slices():
+    rng = np.random.default_rng(1)
+    values = rng.random(777)
+    values[[5, 300]] = np.nan
+    table = forward_max_table(values)
+
+    starts = rng.integers(0, 777, 200)
+    ends = np.minimum(starts + rng.integers(-5, 400, 200), 776)
+    targets = rng.random(200) * 1.05
+    maxima, reach = range_max(table, starts, ends), first_reach(table, starts, ends, targets)
+
+    for s, e, t, m, r in zip(starts, ends, targets, maxima, reach):
+        window = values[s:e + 1]
+        if e < s:
+            assert np.isnan(m) and r == -1
+            continue
+        assert m == pytest.approx(np.nanmax(window))
+        hits = np.flatnonzero(window >= t)
+        assert r == (s + hits[0] if len(hits) else -1)
+
+
+def test_return_levels():
+    levels = return_levels([np.nan, -10, 49.9, 50, 150, 300, 5000])
+    np.testing.assert_array_equal(levels, [-1, 0, 0, 1, 2, 3, 4])
+
+
+DATES = pd.bdate_range(date(2018, 1, 1), periods=600)
+
+
+def _insert_prices(conn, close, rows):
+    conn.execute(insert(PriceData), [
+        {'stock_id': 1, 'date': DATES[i].date(), 'open': close[i], 'high': close[i] * 1.02,
+         'low': close[i] * 0.98, 'close': close[i], 'volume': 1}
+        for i in rows
+    ])
+
+
+@pytest.fixture
+def setup(engine):
+    close = 1_000 * np.exp(np.cumsum(np.random.default_rng(2).normal(0.003, 0.02, len(DATES))))
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+        conn.execute(insert(VolumeBlock), [
+            {'id': 1, 'stock_id': 1, 'block_type': BlockType.BLOCK_1, 'date': DATES[20].date(), 'volume': 1,
+             'trading_value': 1.0, 'close_price': 1.0, 'new_high_grade': NewHighGrade.C},
+            {'id': 2, 'stock_id': 1, 'block_type': BlockType.BLOCK_1, 'date': DATES[400].date(), 'volume': 1,
+             'trading_value': 1.0, 'close_price': 1.0, 'new_high_grade': NewHighGrade.C},
+        ])
+        conn.execute(insert(VolumeBlock), [
+            {'id': 10 + i, 'stock_id': 1, 'block_type': BlockType.BLOCK_2, 'date': DATES[row].date(),
+             'parent_block_id': 1, 'volume': 1, 'trading_value': 1.0, 'close_price': 1.0}
+            for i, row in enumerate((40, 60))
+        ])
+    return engine, close
+
+
+def _cases(engine):
+    with engine.connect() as conn:
+        return conn.execute(select(Case).order_by(Case.id)).all()
+
+
+def test_pipeline_creates_and_labels_incrementally(setup):
+    engine, close = setup
+    with engine.begin() as conn:
+        _insert_prices(conn, close, range(0, 300))
+
+    pipeline = CasePipeline(engine, horizon_days=365, batch_size=1)
+    assert pipeline.update() == (1, 1)  # 2번 블록이 없는 1번 블록(id=2)은 케이스 없음
+
+    # 새 봉 추가 후 증분 갱신 → 전체 재계산 결과와 같아야 함
+    with engine.begin() as conn:
+        _insert_prices(conn, close, range(300, 600))
+    assert pipeline.update() == (0, 1)
+    incremental = _cases(engine)[0]
+
+    with engine.begin() as conn:
+        conn.execute(delete(Case))
+    assert pipeline.update() == (1, 1)
+    full = _cases(engine)[0]
+
+    entry_row = 40  # 첫 2번 블록
+    end_row = np.searchsorted(DATES, DATES[entry_row] + pd.Timedelta(days=365), side='right') - 1
+    high = close * 1.02
+    peak_row = entry_row + 1 + int(np.argmax(high[entry_row + 1:end_row + 1]))
+    max_return = (high[peak_row] / close[entry_row] - 1) * 100
+    reach = np.flatnonzero(high[entry_row + 1:end_row + 1] >= close[entry_row] * 1.5)
+
+    for case in (incremental, full):
+        assert case.entry_date == DATES[entry_row].date()
+        assert case.entry_price == pytest.approx(close[entry_row])
+        assert case.peak_price == pytest.approx(high[peak_row])
+        assert case.peak_date == DATES[peak_row].date()
+        assert case.max_return == pytest.approx(max_return)
+        assert case.return_level == ReturnLevel(int(return_levels([max_return])[0]))
+        assert case.evaluated_through == DATES[end_row].date()
+        assert case.status != CaseStatus.ACTIVE.value
+        if len(reach):
+            assert case.days_to_target == (DATES[entry_row + 1 + reach[0]] - DATES[entry_row]).days
+        else:
+            assert case.days_to_target is None
+
+    # 확정된 케이스는 다시 갱신하지 않음
+    assert pipeline.update() == (0, 0)
@@ -0,0 +1,117 @@
+"""
+스트리밍 내보내기 테스트 (임시 SQLite DB 사용)
+"""
+
+import gzip
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from core.enums import MarketType
+from infrastructure.database.models import PriceData, Stock
+from infrastructure.dumps import DataExporter
+
+
+@pytest.fixture
+def engine(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': 1, 'code': '005930', 'name': '삼성전자', 'market': MarketType.KOSPI},
+            {'id': 2, 'code': '035720', 'name': '카카오', 'market': MarketType.KOSDAQ},
+        ])
+        _insert_prices(conn, date(2023, 12, 20), 20)
+    return engine
+
+
+def _insert_prices(conn, start: date, days: int):
+    rows = []
+    for stock_id in (1, 2):
+        for i in range(days):
+            rows.append({
+                'stock_id': stock_id,
+                'date': start + timedelta(days=i),
+                'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0,
+                'volume': 1000 + i,
+                'trading_value': 105_000.0 + i,
+            })
+    conn.execute(insert(PriceData), rows)
+
+
+def test_csv_export_partitions_by_market_and_year(engine, tmp_path):
+    out = tmp_path / "out"
+    report = DataExporter(engine, chunk_size=7).export_table("price_data", out, fmt="csv")
+
+    assert report.rows == 40
+    assert report.chunks == 6
+    partitions = sorted(p.parent.relative_to(out / "price_data").as_posix()
+                        for p in (out / "price_data").rglob("*.csv.gz"))
+    assert partitions == [
+        "market=KOSDAQ/year=2023", "market=KOSDAQ/year=2024",
+        "market=KOSPI/year=2023", "market=KOSPI/year=2024",
+    ]
+
+    with gzip.open(out / "price_data/market=KOSPI/year=2023" / report.files[0].split("/")[-1], "rt") as f:
+        frame = pd.read_csv(f, dtype={'code': str})
+    assert set(frame['code']) == {'005930'}
+    assert len(frame) == 12
+
+
+def test_parquet_export_and_incremental_watermark(engine, tmp_path):
+    pytest.importorskip("pyarrow")
+    out = tmp_path / "out"
+    exporter = DataExporter(engine, chunk_size=16)
+
+    first = exporter.export_table("price_data", out, fmt="parquet", partition_by=())
+    assert first.rows == 40
+    frame = pd.read_parquet(first.files[0])
+    assert str(frame['date'].iloc[0]) == '2023-12-20'
+    assert frame['market'].iloc[0] == 'KOSPI'
+
+    with engine.begin() as conn:
+        _insert_prices(conn, date(2024, 2, 1), 3)
+
+    second = exporter.export_table(
+        "price_data", out, fmt="parquet", partition_by=(), incremental=True
+    )
+    assert second.since_id == first.last_id
+    assert second.rows == 6
+
+
+def _read_partition(directory):
+    files = list(directory.glob("*.csv.gz"))
+    return files, pd.concat(pd.read_csv(path, dtype={'code': str}) for path in files)
+
+
+def test_incremental_export_rewrites_partitions_with_updated_rows(engine, tmp_path):
+    out = tmp_path / "out"
+    exporter = DataExporter(engine, chunk_size=7)
+    first = exporter.export_table("price_data", out, fmt="csv", incremental=True)
+
+    # 수집기 거래대금 보강처럼 기존 행을 제자리 수정 + 새 행 추가
+    with Session(engine) as session:
+        row = session.query(PriceData).filter_by(stock_id=1, date=date(2024, 1, 2)).one()
+        row.trading_value = 999.0
+        session.commit()
+    with engine.begin() as conn:
+        _insert_prices(conn, date(2024, 2, 1), 3)
+
+    second = exporter.export_table("price_data", out, fmt="csv", incremental=True)
+    assert second.since_id == first.last_id
+    assert second.rewritten == ["market=KOSPI/year=2024"]
+    # KOSPI 2024 전체(8 + 3) + KOSDAQ 새 행(3)
+    assert second.rows == 14
+    assert second.last_id == first.last_id + 6
+
+    files, frame = _read_partition(out / "price_data/market=KOSPI/year=2024")
+    assert len(files) == 1 and len(frame) == 11 and frame['id'].is_unique
+    assert frame.loc[frame['date'] == '2024-01-02', 'trading_value'].item() == 999.0
+
+    files, frame = _read_partition(out / "price_data/market=KOSDAQ/year=2024")
+    assert len(files) == 2 and len(frame) == 11 and frame['id'].is_unique
+
+    # 변경 없으면 아무것도 다시 쓰지 않음
+    third = exporter.export_table("price_data", out, fmt="csv", incremental=True)
+    assert third.rows == 0 and third.rewritten == []
@@ -0,0 +1,118 @@
+"""
+덤프 가져오기 테스트 (내보내기 → 빈 DB로 왕복)
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, insert, select
+
+from core.enums import MarketType
+from core.exceptions import ValidationException
+from infrastructure.database.models import Base, PriceData, Stock
+from infrastructure.dumps import DataExporter, DataImporter
+
+
+def _engine(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def source(tmp_path):
+    engine = _engine(tmp_path / "source.db")
+    rows = []
+    for stock_id in (1, 2):
+        for i in range(30):
+            rows.append({
+                'stock_id': stock_id,
+                'date': date(2023, 12, 15) + timedelta(days=i),
+                'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0,
+                'volume': 1000 + i,
+                'trading_value': None if i == 0 else 105_000.0,
+            })
+    # 잘못된 행 (high < low)
+    rows.append({'stock_id': 1, 'date': date(2024, 2, 1), 'open': 100.0, 'high': 80.0,
+                 'low': 90.0, 'close': 85.0, 'volume': 10, 'trading_value': 850.0})
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': 1, 'code': '005930', 'name': '삼성전자', 'market': MarketType.KOSPI},
+            {'id': 2, 'code': '035720', 'name': '카카오', 'market': MarketType.KOSDAQ},
+        ])
+        conn.execute(insert(PriceData), rows)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_roundtrip_creates_stocks_and_skips_invalid(source, tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    out = tmp_path / "dump"
+    DataExporter(source, chunk_size=8).export_table("price_data", out, fmt=fmt)
+
+    target = _engine(tmp_path / "target.db")
+    report = DataImporter(target, chunk_size=8).import_dir(out, tables=["price_data"])["price_data"]
+
+    assert report.rows_read == 61
+    assert report.rows_inserted == 60
+    assert report.rows_invalid == 1
+    assert report.stocks_created == 2
+
+    with target.connect() as conn:
+        stocks = dict(conn.execute(select(Stock.code, Stock.market)).all())
+        first = conn.execute(
+            select(PriceData).join(Stock).where(Stock.code == '005930').order_by(PriceData.date)
+        ).first()
+        indexes = conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='price_data'"
+        ).scalars().all()
+
+    assert stocks == {'005930': MarketType.KOSPI, '035720': MarketType.KOSDAQ}
+    assert first.date == date(2023, 12, 15)
+    assert first.trading_value is None
+    assert first.volume == 1000
+    assert {'ix_price_data_stock_id', 'ix_price_data_date'} <= set(indexes)
+    target.dispose()
+
+
+def test_reimport_skips_existing_dates(source, tmp_path):
+    out = tmp_path / "dump"
+    DataExporter(source).export_table("price_data", out, fmt="csv", partition_by=())
+
+    target = _engine(tmp_path / "target.db")
+    importer = DataImporter(target)
+    importer.import_dir(out, tables=["price_data"])
+    again = importer.import_dir(out, tables=["price_data"])["price_data"]
+
+    assert again.rows_inserted == 0
+    assert again.rows_skipped_existing == 60
+    with target.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(PriceData)).scalar() == 60
+    target.dispose()
+
+
+def test_new_stocks_require_a_valid_market(source, tmp_path):
+    out = tmp_path / "dump"
+    DataExporter(source).export_table("price_data", out, fmt="csv", partition_by=())
+    dump = DataImporter.find_files(out)[0]
+    frame = pd.read_csv(dump, dtype={'code': str})
+
+    # 기존 종목은 market 없이도 적재, 새 종목은 market 누락/오류 시 종목코드와 함께 거부
+    target = _engine(tmp_path / "target.db")
+    with target.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '005930', 'name': '삼성전자', 'market': MarketType.KOSPI}])
+    frame.drop(columns=['market']).to_csv(dump, index=False)
+    with pytest.raises(ValidationException, match="035720"):
+        DataImporter(target).import_dir(out, tables=["price_data"])
+    frame.assign(market=frame['market'].replace('KOSDAQ', 'NASDAQ')).to_csv(dump, index=False)
+    with pytest.raises(ValidationException, match="035720"):
+        DataImporter(target).import_dir(out, tables=["price_data"])
+    with target.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(PriceData)).scalar() == 0
+
+    frame.loc[frame['code'] == '005930'].drop(columns=['market']).to_csv(dump, index=False)
+    assert DataImporter(target).import_dir(out, tables=["price_data"])["price_data"].rows_inserted == 30
+    target.dispose()
@@ -0,0 +1,91 @@
+"""
+DB 프로필 테스트
+프로필 파싱, 인메모리/임시 파일 DB 격리 및 정리, 전역 매니저 전환/복귀, 세션 기본 DB가 운영 파일이 아닌지 확인
+"""
+
+import sqlite3
+
+import pytest
+
+from core.config import DB_PATH
+from core.enums import MarketType
+from core.exceptions import DatabaseConnectionException
+from infrastructure.database import DatabaseProfile, db_manager, get_session, use_database
+from infrastructure.database.models import PriceData, Stock
+from services.parallel_block_detector import ParallelBlockDetector
+
+
+def _add_stock(code: str):
+    with get_session() as session:
+        session.add(Stock(code=code, name=code, market=MarketType.KOSPI))
+
+
+def _codes():
+    with get_session() as session:
+        return sorted(code for (code,) in session.query(Stock.code))
+
+
+def test_parse_values(tmp_path):
+    assert DatabaseProfile.parse(None) == DatabaseProfile.file(DB_PATH)
+    assert DatabaseProfile.parse(tmp_path / 'a.db') == DatabaseProfile.file(tmp_path / 'a.db')
+    assert DatabaseProfile.parse('memory:bench') == DatabaseProfile.memory('bench')
+
+    memory = DatabaseProfile.parse(':memory:')
+    assert memory.kind == 'memory' and memory != DatabaseProfile.parse(':memory:')
+    assert not memory.is_file and 'mode=memory&cache=shared' in memory.url
+
+    temp = DatabaseProfile.parse('temp')
+    assert temp.kind == 'temp' and temp.path.exists()
+    temp.path.unlink()
+
+    env = DatabaseProfile.from_env({'ROBOSTOCK_DB': str(tmp_path / 'env.db')})
+    assert env.path == tmp_path / 'env.db'
+
+
+def test_session_default_is_not_production():
+    assert db_manager.profile.is_file and db_manager.db_path != DB_PATH
+
+
+def test_memory_databases_are_isolated(memory_db):
+    _add_stock('000001')
+    assert _codes() == ['000001']
+
+    with use_database(DatabaseProfile.memory()):
+        assert _codes() == []
+        _add_stock('000002')
+    assert _codes() == ['000001']
+
+    # 워커 프로세스는 파일 DB 필요
+    with pytest.raises(DatabaseConnectionException):
+        ParallelBlockDetector()
+
+
+def test_use_database_restores_and_releases(tmp_path):
+    before = db_manager.profile
+    memory, temp = DatabaseProfile.memory(), DatabaseProfile.temp()
+
+    with use_database(memory):
+        _add_stock('000001')
+        keeper = sqlite3.connect(memory.sqlite_uri, uri=True)
+        assert keeper.execute("SELECT COUNT(*) FROM stocks").fetchone()[0] == 1
+        keeper.close()
+    with use_database(temp):
+        assert db_manager.db_path == temp.path and ParallelBlockDetector().db_path == temp.path
+
+    assert db_manager.profile == before
+    assert not temp.path.exists()
+    # 인메모리 DB는 유지 연결이 닫혀 사라짐
+    with use_database(memory):
+        assert _codes() == []
+
+    # 파일 프로필은 남음
+    with use_database(tmp_path / 'kept.db'):
+        _add_stock('000003')
+    with use_database(tmp_path / 'kept.db'):
+        assert _codes() == ['000003']
+
+
+def test_seeded_db(seeded_db):
+    with get_session() as session:
+        assert session.query(Stock).count() == seeded_db.stocks
+        assert session.query(PriceData).filter_by(stock_id=1).count() == len(seeded_db.prices(1))
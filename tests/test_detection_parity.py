@@ -0,0 +1,149 @@
+"""
+탐지 코어 동등성 테스트
+고정 합성 종목군에서 레거시 BlockDetector / DetectBlocksUseCase / 증분 탐지가 같은 블록을 내는지 확인
+(규칙 차이는 DetectionParams로만 - 같은 파라미터면 같은 블록)
+"""
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from application.use_cases.detect_blocks_use_case import DetectBlocksUseCase
+from core.enums import BlockType
+from domain.entities.price_series import PriceSeries
+from domain.services import BlockDetectionService
+from domain.services.detection_params import DetectionParams
+from domain.services.incremental_block_detector import IncrementalBlockDetector
+from services.block_detector import BlockDetector
+
+START, END = date(2015, 1, 1), date(2020, 12, 31)
+SETTINGS = [None, {'block1': {'min_trading_value': 5e8}, 'block2': {'min_volume_ratio': 0.5}}]
+
+
+def _universe(count: int = 6):
+    """종목 코드 → PriceSeries (휴장일/거래량 급증/평탄 구간 포함, 거래대금 누락 없음)"""
+    universe = {}
+    for stock_id in range(1, count + 1):
+        rng = np.random.default_rng(100 + stock_id)
+        all_dates = pd.bdate_range(START, END)
+        dates = all_dates[rng.random(len(all_dates)) > 0.04]
+        n = len(dates)
+        close = 8_000 * np.exp(np.cumsum(rng.normal(0.0003, 0.02, n)))
+        volume = rng.integers(10_000, 800_000, n)  # 급증일 거래대금이 기본 500억 기준을 넘도록
+        volume[rng.random(n) < 0.03] *= 25
+        rows = [
+            (d.date(), c, c * (1 + r * 0.03), c * (1 - r * 0.03), c, int(v), float(v * c), np.nan)
+            for d, c, r, v in zip(dates, close, rng.random(n), volume)
+        ]
+        universe[f'{stock_id:06d}'] = PriceSeries.from_rows(stock_id, rows)
+    return universe
+
+
+class _Stocks:
+    def __init__(self, universe):
+        self._stocks = {code: SimpleNamespace(id=s.stock_id, code=code, name=code) for code, s in universe.items()}
+
+    def get_by_code(self, code):
+        return self._stocks.get(code)
+
+
+class _Prices:
+    def __init__(self, universe):
+        self._series = {s.stock_id: s for s in universe.values()}
+
+    def get_series(self, stock_id, start_date, end_date):
+        return self._series[stock_id].slice_dates(start_date, end_date)
+
+
+class _Blocks:
+    def save_detection(self, stock_id, blocks, replace_range=None):
+        for i, block in enumerate(blocks, start=1):
+            block.id = i
+        return blocks
+
+
+def _from_dicts(blocks_1, blocks_2):
+    return (
+        [(b['date'], b['volume'], b['close_price'], b['new_high_grade']) for b in blocks_1],
+        sorted((b['date'], b['date'] - timedelta(days=b['days_from_block1']), b['volume'],
+                b['volume_ratio'], b['pattern_type']) for b in blocks_2),
+    )
+
+
+def _from_entities(blocks_1, blocks_2):
+    return (
+        [(b.date, b.volume, b.close_price, b.new_high_grade) for b in blocks_1],
+        sorted((b.date, b.date - timedelta(days=b.days_from_parent), b.volume,
+                b.volume_ratio, b.pattern_type) for b in blocks_2),
+    )
+
+
+def _incremental(series, params):
+    detector = IncrementalBlockDetector(params)
+    events = detector.update_series(series) + detector.flush()
+    return _from_dicts(
+        [e.block for e in events if e.block_type == BlockType.BLOCK_1],
+        [e.block for e in events if e.block_type == BlockType.BLOCK_2],
+    )
+
+
+@pytest.fixture(scope='module')
+def universe():
+    return _universe()
+
+
+@pytest.mark.parametrize('settings', SETTINGS)
+def test_legacy_rules_identical_across_paths(universe, settings):
+    params = DetectionParams.for_block_detector(settings)
+    use_case = DetectBlocksUseCase(_Stocks(universe), _Prices(universe), _Blocks(), params=params)
+
+    total = 0
+    for code, series in universe.items():
+        legacy = _from_dicts(*BlockDetector().detect_from_frame(series.to_dataframe(), END, settings))
+        result = use_case.execute(code, START, END)
+        clean = _from_entities(result['blocks_1'], result['blocks_2'])
+
+        assert clean == legacy
+        assert _incremental(series, params) == legacy
+        total += len(legacy[1])
+    assert total > 0
+
+
+@pytest.mark.parametrize('settings', SETTINGS)
+def test_service_rules_identical_across_paths(universe, settings):
+    params = DetectionParams.for_detection_service(settings)
+    service = BlockDetectionService()
+    use_case = DetectBlocksUseCase(_Stocks(universe), _Prices(universe), _Blocks(), params=params)
+
+    total = 0
+    for code, series in universe.items():
+        # 1번 블록별 슬라이스 + 단건 2번 블록 탐지 (기존 유스케이스 흐름)
+        blocks_1 = service.detect_block_1_from_data(series.stock_id, series, settings)
+        for block_id, block_1 in enumerate(blocks_1, start=1):
+            block_1.id = block_id
+        blocks_2 = [
+            block_2
+            for block_1 in blocks_1
+            for block_2 in service.detect_block_2_from_data(
+                series.stock_id, block_1, series.slice_dates(block_1.date, END), settings
+            )
+        ]
+        expected = _from_entities(blocks_1, blocks_2)
+        result = use_case.execute(code, START, END)
+
+        assert _from_entities(result['blocks_1'], result['blocks_2']) == expected
+        assert _incremental(series, params) == expected
+        total += len(expected[1])
+    assert total > 0
+
+
+def test_batched_service_links_parents(universe):
+    series = universe['000001']
+    blocks_1, blocks_2 = BlockDetectionService().detect_blocks_from_data(series.stock_id, series)
+
+    parents = {b.id: b.date for b in blocks_1}
+    assert blocks_2 and all(b.id < 0 for b in blocks_1)
+    assert all(parents[b.parent_block_id] == b.date - timedelta(days=b.days_from_parent) for b in blocks_2)
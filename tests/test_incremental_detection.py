@@ -0,0 +1,119 @@
+"""
+증분 블록 탐지 테스트
+봉을 나눠 넣고 상태를 직렬화/복원해도 배치 탐지와 결과가 같은지 확인
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.enums import BlockType
+from domain.services import BlockDetectionService
+from domain.services.detection_params import DetectionParams
+from domain.services.incremental_block_detector import BlockDetectionState, IncrementalBlockDetector
+from services.block_detector import BlockDetector
+
+LEGACY_SETTINGS = [
+    {'block1': {'min_trading_value': 5e8}},
+    {'block1': {'min_trading_value': None}, 'block2': {'min_volume_ratio': None, 'min_trading_value': 5e8}},
+]
+
+
+def _run_in_chunks(params, update, parts):
+    """조각마다 상태를 JSON으로 저장/복원하며 증분 탐지 (일별 실행 흉내)"""
+    state = None
+    events = []
+    for part in parts:
+        detector = IncrementalBlockDetector(params, state)
+        events.extend(update(detector, part))
+        state = BlockDetectionState.from_json(detector.state.to_json())
+    events.extend(IncrementalBlockDetector(params, state).flush())
+    return events
+
+
+def _split(df: pd.DataFrame):
+    cuts = [0, len(df) // 3, len(df) // 3 + 1, len(df) - 5, len(df)]
+    return [df.iloc[a:b] for a, b in zip(cuts, cuts[1:])]
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+@pytest.mark.parametrize("settings", LEGACY_SETTINGS)
+def test_incremental_matches_legacy_batch(random_series, seed, settings):
+    df = random_series(seed).to_dataframe()
+    df.loc[df.index[::40], 'trading_value'] = np.nan  # 거래대금 누락 행
+
+    blocks_1, blocks_2 = BlockDetector().detect_from_frame(df, df.index[-1], settings)
+
+    events = _run_in_chunks(
+        DetectionParams.for_block_detector(settings),
+        lambda detector, part: detector.update_frame(part),
+        _split(df)
+    )
+    actual_1 = [e.block for e in events if e.block_type == BlockType.BLOCK_1]
+    actual_2 = [e.block for e in events if e.block_type == BlockType.BLOCK_2]
+
+    assert blocks_1 and blocks_2
+    assert pd.DataFrame(actual_1).equals(pd.DataFrame(blocks_1))
+
+    def key(block):
+        return block['date'], block['days_from_block1']
+
+    assert pd.DataFrame(sorted(actual_2, key=key)).equals(pd.DataFrame(sorted(blocks_2, key=key)))
+    assert len({b['pattern_type'] for b in actual_2}) > 1
+
+
+def test_incremental_matches_detection_service(random_series):
+    service = BlockDetectionService()
+    series = random_series(2)
+    settings = {'block1': {'min_trading_value': 5e8}}
+
+    blocks_1 = service.detect_block_1_from_data(1, series, settings)
+    expected_2 = []
+    for block_id, block_1 in enumerate(blocks_1, start=1):
+        block_1.id = block_id
+        after = series.slice_dates(block_1.date, series.last_date)
+        expected_2.extend(
+            (b.date, b.volume, b.volume_ratio, b.days_from_parent, b.pattern_type)
+            for b in service.detect_block_2_from_data(1, block_1, after)
+        )
+
+    dates = series.dates
+    cut = np.searchsorted(dates, dates[len(dates) // 2])
+    events = _run_in_chunks(
+        DetectionParams.for_detection_service(settings),
+        lambda detector, part: detector.update_series(part),
+        [series.slice_dates(series.first_date, dates[cut - 1].item()),
+         series.slice_dates(dates[cut].item(), series.last_date)]
+    )
+
+    actual_1 = [(e.block['date'], e.block['volume'], e.block['new_high_grade'])
+                for e in events if e.block_type == BlockType.BLOCK_1]
+    actual_2 = [(e.block['date'], e.block['volume'], e.block['volume_ratio'],
+                 e.block['days_from_block1'], e.block['pattern_type'])
+                for e in events if e.block_type == BlockType.BLOCK_2]
+
+    assert expected_2
+    assert actual_1 == [(b.date, b.volume, b.new_high_grade) for b in blocks_1]
+    assert sorted(actual_2, key=lambda b: (b[0], b[3])) == sorted(expected_2, key=lambda b: (b[0], b[3]))
+
+
+def test_already_processed_bars_are_skipped(random_series):
+    df = random_series(3, days=400).to_dataframe()
+    detector = IncrementalBlockDetector(DetectionParams.for_block_detector())
+    detector.update_frame(df)
+    state_json = detector.state.to_json()
+
+    assert detector.update_frame(df) == []
+    assert detector.state.to_json() == state_json
+    assert detector.state.last_date == df.index[-1].date()
+
+
+def test_fingerprint_tracks_settings():
+    default = DetectionParams.for_block_detector()
+
+    assert default.fingerprint() == DetectionParams.for_block_detector({}).fingerprint()
+    assert default.fingerprint() != DetectionParams.for_block_detector(LEGACY_SETTINGS[0]).fingerprint()
+    assert default.fingerprint() != DetectionParams.for_detection_service().fingerprint()
+    # 비활성화 표현(None/0)은 같은 지문
+    assert (DetectionParams.for_block_detector({'block2': {'min_volume_ratio': None}}).fingerprint()
+            == DetectionParams.for_block_detector({'block2': {'min_volume_ratio': 0}}).fingerprint())
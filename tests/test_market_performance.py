@@ -0,0 +1,138 @@
+"""
+블록 시장 대비 성과 테스트
+구간 누적합 베타가 np.polyfit 회귀와 같은지, 멀티프로세스 일괄 저장 확인 (임시 SQLite DB)
+"""
+
+import sqlite3
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, insert, select
+
+from core.enums import BlockType, MarketType, NewHighGrade
+from domain.services.market_kernels import daily_returns, market_performance, segment_betas
+from infrastructure.cache import IndexSeries
+from infrastructure.database.models import Base, IndexPrice, PriceData, Stock, VolumeBlock
+from services.market_performance import MarketPerformanceCalculator
+
+DATES = pd.bdate_range(date(2019, 1, 1), periods=400)
+
+
+def _series(seed: int, market=None):
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(0, 0.01, len(DATES))
+    returns = noise if market is None else 1.3 * market + noise
+    return 1_000 * np.exp(np.cumsum(returns)), returns
+
+
+def test_segment_betas_match_polyfit():
+    index_close, index_returns = _series(1)
+    close, _ = _series(2, index_returns)
+    index_close[[50, 51, 120]] = np.nan  # 지수 누락일은 회귀에서 제외
+
+    rs, rm = daily_returns(close), daily_returns(index_close)
+    starts, ends = np.array([1, 40, 100, 300]), np.array([60, 200, 130, 399])
+    betas, counts = segment_betas(rs, rm, starts, ends)
+
+    for beta, count, s, e in zip(betas, counts, starts, ends):
+        valid = ~np.isnan(rs[s:e + 1]) & ~np.isnan(rm[s:e + 1])
+        assert count == valid.sum()
+        assert beta == pytest.approx(np.polyfit(rm[s:e + 1][valid], rs[s:e + 1][valid], 1)[0])
+
+
+def test_market_performance_returns_and_alpha():
+    index_close, index_returns = _series(3)
+    close, _ = _series(4, index_returns)
+    result = market_performance(close, index_close, [100], [130], beta_min_days=60)
+
+    assert result.range_return[0] == pytest.approx((close[130] / close[100] - 1) * 100)
+    assert result.index_return[0] == pytest.approx((index_close[130] / index_close[100] - 1) * 100)
+    assert result.alpha[0] == pytest.approx(result.range_return[0] - result.beta[0] * result.index_return[0])
+    assert 1.0 < result.beta[0] < 1.6
+
+    rs, rm = daily_returns(close), daily_returns(index_close)
+    assert result.beta[0] == pytest.approx(np.polyfit(rm[71:131], rs[71:131], 1)[0])
+
+
+def test_index_series_lookup():
+    series = IndexSeries.from_rows('KOSPI', [(date(2020, 1, 3), 3.0), (date(2020, 1, 2), 2.0)])
+    closes = series.close_at(np.array(['2020-01-02', '2020-01-03', '2020-01-06'], dtype='datetime64[D]'))
+    np.testing.assert_array_equal(closes[:2], [2.0, 3.0])
+    assert np.isnan(closes[2]) and not series.close.flags.writeable
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "market.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+
+    index_close, index_returns = _series(5)
+    with engine.begin() as conn:
+        conn.execute(insert(IndexPrice), [
+            {'index_code': 'KOSPI', 'date': d.date(), 'close': float(c)} for d, c in zip(DATES, index_close)
+        ])
+        conn.execute(insert(Stock), [
+            {'id': i, 'code': f"{i:06d}", 'name': f"종목{i}", 'market': market}
+            for i, market in ((1, MarketType.KOSPI), (2, MarketType.KOSPI), (3, MarketType.KOSDAQ))
+        ])
+        for stock_id in (1, 2, 3):
+            close, _ = _series(10 + stock_id, index_returns)
+            conn.execute(insert(PriceData), [
+                {'stock_id': stock_id, 'date': d.date(), 'open': c, 'high': c, 'low': c, 'close': c, 'volume': 1}
+                for d, c in zip(DATES, map(float, close))
+            ])
+            conn.execute(insert(VolumeBlock), [
+                {'stock_id': stock_id, 'block_type': BlockType.BLOCK_1, 'date': DATES[s].date(),
+                 'range_end_date': DATES[e].date(), 'volume': 1, 'trading_value': 1.0, 'close_price': 1.0,
+                 'new_high_grade': NewHighGrade.C}
+                for s, e in ((100, 150), (200, 380))
+            ])
+    engine.dispose()
+    return path
+
+
+def test_calculator_updates_blocks_in_parallel(db_path):
+    updated = MarketPerformanceCalculator(max_workers=2, shard_size=1, db_path=db_path).update()
+    assert updated == 4  # KOSDAQ 지수 데이터가 없는 종목 3은 제외
+
+    engine = create_engine(f"sqlite:///{db_path}")
+    with engine.connect() as conn:
+        blocks = conn.execute(select(VolumeBlock).order_by(VolumeBlock.stock_id, VolumeBlock.date)).all()
+        prices = pd.DataFrame(conn.execute(select(PriceData.stock_id, PriceData.close)).all())
+        index = [row.close for row in conn.execute(select(IndexPrice.close).order_by(IndexPrice.date))]
+    engine.dispose()
+
+    kospi = [b for b in blocks if b.stock_id != 3]
+    assert all(b.market_index == 'KOSPI' and b.beta is not None for b in kospi)
+    assert all(b.market_index is None for b in blocks if b.stock_id == 3)
+
+    close = prices[prices['stock_id'] == 1]['close'].to_numpy()
+    expected = market_performance(close, np.array(index), [100], [150])
+    assert kospi[0].relative_return == pytest.approx(expected.relative_return[0])
+    assert kospi[0].beta == pytest.approx(expected.beta[0])
+    assert kospi[0].outperformance == (expected.relative_return[0] > 0)
+
+
+def test_index_backfill_saves_beyond_sqlite_variable_limit(memory_db):
+    # 구버전 SQLite 기본 변수 한도(999)에서 9개 컬럼 × 2000행 백필
+    from services.data_collector import DataCollector
+
+    engine = memory_db.engine
+    event.listen(engine, 'connect', lambda conn, _: conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999))
+    engine.dispose()
+
+    days = pd.bdate_range(date(2000, 1, 3), periods=2000)
+    close = 1_000 * np.exp(np.cumsum(np.random.default_rng(7).normal(0, 0.01, len(days))))
+    frame = pd.DataFrame({'시가': close, '고가': close, '저가': close, '종가': close, '거래량': 1.0}, index=days)
+
+    collector = DataCollector()
+    assert collector.save_index_data_to_db('KOSPI', frame) == len(days)
+    assert collector.save_index_data_to_db('KOSPI', frame.iloc[-10:] * 2) == 10  # upsert
+
+    with engine.connect() as conn:
+        closes = [c for (c,) in conn.execute(select(IndexPrice.close).order_by(IndexPrice.date))]
+    assert len(closes) == len(days)
+    assert closes[-1] == pytest.approx(close[-1] * 2) and closes[0] == pytest.approx(close[0])
@@ -0,0 +1,277 @@
+"""
+멀티프로세스 블록 탐지 테스트 (임시 SQLite DB 사용)
+"""
+
+import sqlite3
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, event, func, insert, select, update
+
+from core.enums import BlockType, MarketType
+from infrastructure.cache import DetectionResultCache, detection_settings_hash
+from infrastructure.database import PriceSummaryStore, refresh_price_summary
+from infrastructure.database.models import (
+    Base, DetectionState, InvestorTrading, PriceData, PriceSummary, Stock, VolumeBlock
+)
+from services.block_detector import BlockDetector, price_frame_from_rows
+from services.parallel_block_detector import ParallelBlockDetector, StockDetectionResult
+
+START = datetime(2018, 1, 1)
+END = datetime(2020, 6, 30, 23, 59, 59)
+
+
+def _price_rows(stock_id: int, seed: int):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(date(2018, 1, 1), date(2021, 3, 31))
+    n = len(dates)
+    volume = rng.integers(1_000, 50_000, n)
+    volume[rng.random(n) < 0.05] *= 15
+    close = 5_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    return [
+        {
+            'stock_id': stock_id, 'date': d.date(),
+            'open': float(c), 'high': float(c) * 1.02, 'low': float(c) * 0.98, 'close': float(c),
+            'volume': int(v), 'trading_value': float(v * c),
+        }
+        for d, v, c in zip(dates, volume, close)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "detect.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': i, 'code': f"{i:06d}", 'name': f"종목{i}", 'market': MarketType.KOSPI}
+            for i in range(1, 6)
+        ])
+        for i in range(1, 6):
+            conn.execute(insert(PriceData), _price_rows(i, seed=i))
+    engine.dispose()
+    return path
+
+
+def _stocks():
+    return [{'id': i, 'code': f"{i:06d}", 'name': f"종목{i}"} for i in range(1, 6)]
+
+
+def test_parallel_matches_sequential_and_saves_once(db_path):
+    settings = {'block1': {'min_trading_value': 0}, 'block2': {'min_volume_ratio': 0.5}}
+    collected = {}
+    progress = []
+
+    engine = ParallelBlockDetector(max_workers=2, shard_size=2, write_batch_size=2, db_path=db_path)
+    totals = engine.detect(
+        _stocks(), START, END, settings,
+        progress_callback=lambda done, total, msg: progress.append((done, total)),
+        stock_callback=lambda result: collected.setdefault(result.stock_id, result)
+    )
+
+    detector = BlockDetector()
+    expected_1 = expected_2 = 0
+    for stock_id in range(1, 6):
+        rows = [(r['date'].isoformat(), r['open'], r['high'], r['low'], r['close'], r['volume'], r['trading_value'])
+                for r in _price_rows(stock_id, seed=stock_id) if r['date'] <= date(2020, 12, 27)]
+        blocks_1, blocks_2 = detector.detect_from_frame(price_frame_from_rows(rows), END, settings)
+        assert collected[stock_id].blocks_1 == blocks_1
+        assert collected[stock_id].blocks_2 == blocks_2
+        expected_1 += len(blocks_1)
+        expected_2 += len(blocks_2)
+
+    assert totals == (expected_1, expected_2)
+    assert progress[-1] == (5, 5)
+
+    with engine.engine.connect() as conn:
+        saved_1 = conn.execute(select(func.count()).where(VolumeBlock.block_type == BlockType.BLOCK_1)).scalar()
+        saved_2 = conn.execute(select(func.count()).where(VolumeBlock.block_type == BlockType.BLOCK_2)).scalar()
+    assert saved_1 == expected_1
+    assert 0 < saved_2 <= expected_2  # 같은 날짜의 2번 블록은 한 번만 저장
+
+    # 재실행 시 기존 블록은 건너뜀
+    assert engine.save_results(list(collected.values())) == (0, 0)
+
+
+def test_cancel_stops_before_processing(db_path):
+    engine = ParallelBlockDetector(max_workers=1, shard_size=1, db_path=db_path)
+    totals = engine.detect(_stocks(), START, END, is_cancelled=lambda: True)
+
+    assert totals == (0, 0)
+    with engine.engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(VolumeBlock)).scalar() == 0
+
+
+def test_incremental_runs_resume_from_saved_state(tmp_path, db_path):
+    settings = {'block1': {'min_trading_value': 0}}
+
+    # 두 번에 나눠 실행 (두 번째 실행은 저장된 상태 이후의 봉만 평가)
+    split = ParallelBlockDetector(max_workers=2, shard_size=3, db_path=db_path)
+    first = split.detect(_stocks(), START, datetime(2019, 6, 30), settings, incremental=True)
+    second = split.detect(_stocks(), START, END, settings, incremental=True)
+
+    with split.engine.connect() as conn:
+        watermarks = conn.execute(select(DetectionState.last_date)).scalars().all()
+        split_blocks = set(conn.execute(
+            select(VolumeBlock.stock_id, VolumeBlock.block_type, VolumeBlock.date)
+        ).all())
+    assert watermarks == [date(2020, 6, 30)] * 5
+
+    # 같은 기간 한 번에 실행한 결과와 비교
+    whole_path = tmp_path / "whole.db"
+    whole_path.write_bytes(db_path.read_bytes())
+    with create_engine(f"sqlite:///{whole_path}").begin() as conn:
+        conn.execute(VolumeBlock.__table__.delete())
+        conn.execute(DetectionState.__table__.delete())
+
+    whole = ParallelBlockDetector(max_workers=2, shard_size=3, db_path=whole_path)
+    totals = whole.detect(_stocks(), START, END, settings, incremental=True)
+    with whole.engine.connect() as conn:
+        whole_blocks = set(conn.execute(
+            select(VolumeBlock.stock_id, VolumeBlock.block_type, VolumeBlock.date)
+        ).all())
+
+    assert totals[0] == first[0] + second[0] > 0
+    assert split_blocks == whole_blocks
+
+
+def test_result_cache_skips_unchanged_stocks(db_path):
+    settings = {'block1': {'min_trading_value': 0, 'two_year_max': True}}
+    engine = ParallelBlockDetector(max_workers=2, shard_size=2, db_path=db_path)
+    first = {}
+    totals = engine.detect(_stocks(), START, END, settings,
+                           stock_callback=lambda r: first.setdefault(r.stock_id, r))
+
+    # 같은 설정 재실행: 워커 없이 캐시에서 (중지 요청이 있어도 캐시 결과는 모두 반영)
+    again = {}
+    assert engine.detect(_stocks(), START, END, settings, is_cancelled=lambda: True,
+                         stock_callback=lambda r: again.setdefault(r.stock_id, r)) == totals
+    assert {sid: (r.blocks_1, r.blocks_2) for sid, r in again.items()} == \
+           {sid: (r.blocks_1, r.blocks_2) for sid, r in first.items()}
+
+    # 한 종목 데이터가 바뀌면 그 종목만 캐시 무효
+    assert first[3].blocks_1
+    with engine.engine.begin() as conn:
+        conn.execute(update(PriceData).where(PriceData.stock_id == 3, PriceData.date == date(2019, 5, 2))
+                     .values(volume=PriceData.volume + 1))
+    partial = engine.detect(_stocks(), START, END, settings, is_cancelled=lambda: True)
+    assert partial == (totals[0] - len(first[3].blocks_1), totals[1] - len(first[3].blocks_2))
+
+
+def test_watermark_changes_on_in_place_price_backfills(db_path):
+    cache = DetectionResultCache(create_engine(f"sqlite:///{db_path}"))
+    before = cache.watermarks(START, END)
+    day = date(2019, 5, 2)
+
+    # 수집기 방식의 거래대금 채우기 (행 수/거래량/고가 그대로)
+    with cache.engine.begin() as conn:
+        conn.execute(update(PriceData).where(PriceData.stock_id == 2, PriceData.date == day).values(trading_value=None))
+    after_value = cache.watermarks(START, END)
+    with cache.engine.begin() as conn:
+        conn.execute(update(PriceData).where(PriceData.stock_id == 4, PriceData.date == day)
+                     .values(close=PriceData.close + 1))
+    after_close = cache.watermarks(START, END)
+    cache.engine.dispose()
+
+    assert after_value[2] != before[2] and after_close[4] != before[4]
+    assert {sid: w for sid, w in after_close.items() if sid not in (2, 4)} == \
+           {sid: w for sid, w in before.items() if sid not in (2, 4)}
+
+
+def test_investor_changes_invalidate_cached_block_3_4(db_path):
+    settings = {'block1': {'min_trading_value': 0}}
+    engine = ParallelBlockDetector(max_workers=2, shard_size=2, db_path=db_path)
+    engine.detect(_stocks(), START, END, settings)
+    assert BlockDetector.block_3_4_enabled(settings)
+
+    # 3/4번 블록 quality_score 입력인 수급만 바뀐 종목은 캐시에서 제외 → 재탐지
+    before = DetectionResultCache(engine.engine).watermarks(START, END, BlockDetector.data_horizon_days(settings))
+    with engine.engine.begin() as conn:
+        conn.execute(insert(InvestorTrading), [
+            {'stock_id': 3, 'date': d.date(), 'institutional_net_buy': 1e8, 'foreign_net_buy': -5e7}
+            for d in pd.bdate_range(date(2019, 5, 1), date(2019, 5, 31))
+        ])
+    after = DetectionResultCache(engine.engine).watermarks(START, END, BlockDetector.data_horizon_days(settings))
+    assert after[3] != before[3]
+    assert {sid: w for sid, w in after.items() if sid != 3} == {sid: w for sid, w in before.items() if sid != 3}
+
+    served = []
+    engine.detect(_stocks(), START, END, settings, is_cancelled=lambda: True,
+                  stock_callback=lambda r: served.append(r.stock_id))
+    assert sorted(served) == [1, 2, 4, 5]
+
+    redetected = []
+    engine.detect(_stocks(), START, END, settings, stock_callback=lambda r: redetected.append(r.stock_id))
+    assert sorted(redetected) == [1, 2, 3, 4, 5]
+
+
+def test_state_and_cache_upserts_fit_sqlite_variable_limit(db_path):
+    engine = create_engine(f"sqlite:///{db_path}")
+    # 구버전 SQLite 변수 한도(999)에서도 저장 배치(수백 종목)를 upsert
+    event.listen(engine, 'connect', lambda conn, _: conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999))
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': i, 'code': f"{i:06d}", 'name': f"종목{i}", 'market': MarketType.KOSDAQ} for i in range(6, 406)
+        ])
+    results = [
+        StockDetectionResult(i, f"{i:06d}", f"종목{i}", [], [], settings_hash='h', last_date=date(2020, 6, 30),
+                             state='{}', cache_key='k', watermark=f"w{i}")
+        for i in range(6, 406)
+    ]
+
+    for _ in range(2):  # 두 번째는 충돌 → 갱신
+        with engine.begin() as conn:
+            ParallelBlockDetector._save_states(conn, results)
+            DetectionResultCache.put_many(conn, 'k', [(r.stock_id, r.watermark, [], [], [], []) for r in results])
+
+    marks = {r.stock_id: r.watermark for r in results}
+    assert len(DetectionResultCache(engine).get_many('k', marks)) == 400
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(DetectionState)).scalar() == 400
+    engine.dispose()
+
+
+def test_prefilter_skips_stocks_that_cannot_qualify(db_path):
+    max_values = {
+        i: max(r['trading_value'] for r in _price_rows(i, seed=i) if START.date() <= r['date'] <= END.date())
+        for i in range(1, 6)
+    }
+    threshold = sorted(max_values.values())[2]
+    settings = {'block1': {'min_trading_value': threshold}}
+    engine = ParallelBlockDetector(max_workers=2, shard_size=2, db_path=db_path)
+
+    # 거래대금 누락 행이 있는 종목은 제외하지 않음 (요약은 쓰기와 같은 트랜잭션에서 갱신)
+    low = min(max_values, key=max_values.get)
+    PriceSummaryStore(engine.engine).ensure()
+    with engine.engine.begin() as conn:
+        conn.execute(update(PriceData).where(PriceData.stock_id == low, PriceData.date == date(2019, 5, 2))
+                     .values(trading_value=None))
+        refresh_price_summary(conn, low, [date(2019, 5, 2)])
+        assert conn.execute(select(func.sum(PriceSummary.null_trading_values))).scalar() == 1
+
+    progress, filtered, unfiltered = [], {}, {}
+    totals = engine.detect(_stocks(), START, END, settings, save=False,
+                           progress_callback=lambda done, total, msg: progress.append(msg),
+                           stock_callback=lambda r: filtered.setdefault(r.stock_id, r))
+    expected = engine.detect(_stocks(), START, END, settings, save=False, use_prefilter=False,
+                             stock_callback=lambda r: unfiltered.setdefault(r.stock_id, r))
+
+    skipped = {i for i, value in max_values.items() if value < threshold and i != low}
+    assert len(skipped) == 1
+    assert totals == expected and totals[0] > 0
+    assert set(filtered) == set(unfiltered) - skipped
+    assert {sid: r.blocks_1 for sid, r in filtered.items()} == {sid: unfiltered[sid].blocks_1 for sid in filtered}
+    assert "사전 필터로 1개 종목 제외" in progress[0]
+
+
+def test_settings_hash_ignores_inactive_options():
+    base = detection_settings_hash({'block1': {'min_trading_value': None}}, START, END)
+
+    assert base == detection_settings_hash(
+        {'block1': {'min_trading_value': 0, 'new_high_months': 6}}, START, datetime(2020, 6, 30)
+    )
+    assert base != detection_settings_hash({'block1': {'min_trading_value': 1e9}}, START, END)
+    assert base != detection_settings_hash({'block1': {'min_trading_value': None}}, START, datetime(2020, 7, 1))
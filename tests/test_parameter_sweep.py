@@ -0,0 +1,122 @@
+"""
+파라미터 스윕 테스트
+그리드 일괄 평가 결과가 조합별 BlockDetector 탐지와 같은지 확인
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, insert
+
+from core.enums import MarketType
+from domain.services.detection_kernels import block_2_candidates
+from domain.services.sweep_kernels import StockSweep, SweepGrid, forward_returns, sweep_stock
+from infrastructure.database.models import Base, PriceData, Stock
+from services.block_detector import BlockDetector
+from services.parameter_sweep import ParameterSweep
+
+GRID = SweepGrid(
+    min_trading_values=(0.0, 5e8, 2e9),
+    lookback_days=(90, 365, 730),
+    volume_ratios=(0.3, 0.8, 1.0),
+    block2_windows=(60, 180),
+    return_horizons=(5, 20),
+)
+END = date(2019, 12, 31)
+START = date(2016, 1, 1)
+# 2016-01 ~ 2020-09 영업일, 50행마다 거래대금 누락
+FRAME = {'start': START, 'days': len(pd.bdate_range(START, date(2020, 9, 30))), 'missing_value_every': 50}
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_sweep_matches_detector_per_combination(random_frame, seed):
+    df = random_frame(seed, **FRAME)
+    detector = BlockDetector()
+    sweep = sweep_stock(df, GRID, END, collect_blocks=True)
+    returns = forward_returns(df['close'].to_numpy(), GRID.return_horizons)
+    dates = df.index.values.astype('datetime64[D]')
+
+    for t, min_value in enumerate(GRID.min_trading_values):
+        for l, lookback in enumerate(GRID.lookback_days):
+            blocks_1 = detector._find_block_1(df[df.index <= pd.Timestamp(END)], min_value, lookback)
+            block_dates = np.array([b['date'] for b in blocks_1], dtype='datetime64[D]')
+            assert sweep.blocks_1[t, l] == len(blocks_1)
+            assert np.array_equal(sweep.block_dates[(t, l)], block_dates)
+
+            positions = np.searchsorted(dates, block_dates)
+            np.testing.assert_allclose(sweep.b1_return_sum[t, l], np.nansum(returns[positions], axis=0))
+
+            for r, ratio in enumerate(GRID.volume_ratios):
+                for w, window in enumerate(GRID.block2_windows):
+                    window_idx, *_ = block_2_candidates(
+                        dates, df['volume'].to_numpy(), df['trading_value'].to_numpy(),
+                        block_dates, [b['volume'] for b in blocks_1], window, ratio
+                    )
+                    assert sweep.blocks_2[t, l, r, w] == len(window_idx)
+                    assert sweep.confirmed[t, l, r, w] == len(np.unique(window_idx))
+
+    # 레거시 탐지 (730일 조회 기간 / 180일 2번 블록 구간 고정)
+    settings = {'block1': {'min_trading_value': 5e8}, 'block2': {'min_volume_ratio': 0.8}}
+    blocks_1, blocks_2 = detector.detect_from_frame(df, END, settings)
+    assert sweep.blocks_1[1, 2] == len(blocks_1)
+    assert sweep.blocks_2[1, 2, 1, 1] == len(blocks_2) > 0
+
+
+def test_summary_and_sensitivity_shapes(random_frame):
+    total = StockSweep.zeros(GRID)
+    for seed in (0, 1):
+        total.add(sweep_stock(random_frame(seed, **FRAME), GRID, END))
+
+    from services.parameter_sweep import SweepResult
+    result = SweepResult(GRID, total, stocks=2)
+    summary = result.summary()
+
+    assert len(summary) == int(np.prod(GRID.shape))
+    row = summary[(summary.min_trading_value == 5e8) & (summary.lookback_days == 365)
+                  & (summary.volume_ratio == 0.8) & (summary.block2_window == 180)].iloc[0]
+    assert row.blocks_1 == total.blocks_1[1, 1]
+    assert row.confirmed <= row.blocks_1
+    # 거래대금/조회 기간 조건이 엄격해질수록 1번 블록 수는 줄어듦
+    by_value = result.sensitivity('min_trading_value', ['blocks_1'])['blocks_1']
+    by_lookback = result.sensitivity('lookback_days', ['blocks_1'])['blocks_1']
+    assert by_value.is_monotonic_decreasing and by_lookback.is_monotonic_decreasing
+    with pytest.raises(ValueError):
+        result.sensitivity('unknown')
+
+
+def test_parallel_sweep_sums_stocks(random_frame, tmp_path):
+    path = tmp_path / "sweep.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    frames = {i: random_frame(i, **FRAME) for i in range(1, 4)}
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [
+            {'id': i, 'code': f"{i:06d}", 'name': f"종목{i}", 'market': MarketType.KOSPI} for i in frames
+        ])
+        for i, df in frames.items():
+            conn.execute(insert(PriceData), [
+                {'stock_id': i, 'date': d.date(), 'open': r.open, 'high': r.high, 'low': r.low,
+                 'close': r.close, 'volume': int(r.volume),
+                 'trading_value': None if np.isnan(r.trading_value) else r.trading_value}
+                for d, r in df.iterrows()
+            ])
+    engine.dispose()
+
+    stocks = [{'id': i, 'code': f"{i:06d}", 'name': f"종목{i}"} for i in frames]
+    progress = []
+    result = ParameterSweep(GRID, max_workers=2, shard_size=2, db_path=path).run(
+        stocks, START, END,
+        progress_callback=lambda done, total, msg: progress.append(done), collect_blocks=True
+    )
+
+    expected = StockSweep.zeros(GRID)
+    for df in frames.values():
+        expected.add(sweep_stock(df, GRID, END))
+
+    assert result.stocks == 3 and not result.errors
+    assert sorted(progress)[-1] == 3
+    for name in StockSweep.SUMMABLE:
+        np.testing.assert_allclose(getattr(result.total, name), getattr(expected, name))
+    assert len(result.blocks_for(1, 5e8, 365)) == sweep_stock(frames[1], GRID, END).blocks_1[1, 1]
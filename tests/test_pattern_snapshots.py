@@ -0,0 +1,97 @@
+"""
+2번 블록 D/D+1/D+2 패턴 스냅샷 테스트
+위치 인덱싱 일괄 판정이 블록별 참조 루프와 같은지, 수급 조인/미완성 블록 재생성 확인 (임시 SQLite DB)
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import insert, select
+
+from core.enums import BlockType, MarketType
+from domain.services.pattern_kernels import pattern_snapshots
+from infrastructure.database.models import BlockPatternData, InvestorTrading, PriceData, Stock, VolumeBlock
+from services.pattern_snapshot_builder import PatternSnapshotBuilder
+
+DATES = pd.bdate_range(date(2020, 1, 1), periods=200)
+
+
+def _arrays(seed: int):
+    rng = np.random.default_rng(seed)
+    high = 1_000 * np.exp(np.cumsum(rng.normal(0, 0.03, len(DATES))))
+    volume = rng.integers(1_000, 10_000, len(DATES)).astype(float)
+    return high, volume
+
+
+def test_snapshots_match_reference_loop():
+    high, volume = _arrays(1)
+    block_rows = [5, 50, 120, 198, 199]
+    dates = DATES.values.astype('datetime64[D]')
+    # 블록별 D일부터의 구간을 이어 붙인 입력 (마지막 블록 구간은 D일 시세 없음)
+    windows = [np.arange(d, min(d + 5, len(DATES))) for d in block_rows[:-1]] + [np.arange(150, 152)]
+    owner = np.concatenate([np.full(len(w), i) for i, w in enumerate(windows)])
+    flat = np.concatenate(windows)
+    block_dates = dates[block_rows]
+    block_dates[-1] = np.datetime64('2020-01-01')
+    result = pattern_snapshots(owner, dates[flat], high[flat], volume[flat], block_dates)
+
+    expected = []
+    for i, d in enumerate(block_rows[:-1]):
+        for offset in range(3):
+            row = d + offset
+            if row >= len(DATES):
+                continue
+            breakout = offset > 0 and high[row] > high[d]
+            qualified = offset == 0 or (breakout and volume[row] >= 0.5 * volume[d])
+            expected.append((i, offset, row, volume[row] / volume[d], breakout, qualified))
+
+    actual = list(zip(result.block_index, result.offset, flat[result.row], result.volume_ratio_vs_d,
+                      result.is_high_breakout, result.is_qualified))
+    assert actual == expected
+
+
+def _insert_prices(conn, high, volume, rows):
+    conn.execute(insert(PriceData), [
+        {'stock_id': 1, 'date': DATES[i].date(), 'open': high[i] * 0.97, 'high': high[i], 'low': high[i] * 0.95,
+         'close': high[i] * 0.98, 'volume': int(volume[i]), 'trading_value': float(volume[i] * high[i])}
+        for i in rows
+    ])
+
+
+def test_builder_joins_investors_and_completes_recent_blocks(engine):
+    high, volume = _arrays(2)
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+        _insert_prices(conn, high, volume, range(0, 150))
+        conn.execute(insert(InvestorTrading), [
+            {'stock_id': 1, 'date': DATES[i].date(), 'institutional_net_buy': float(i), 'foreign_net_buy': -float(i)}
+            for i in range(0, 200, 2)  # 수급은 격일만 존재
+        ])
+        conn.execute(insert(VolumeBlock), [
+            {'id': 10 + i, 'stock_id': 1, 'block_type': BlockType.BLOCK_2, 'date': DATES[row].date(),
+             'volume': 1, 'trading_value': 1.0, 'close_price': 1.0}
+            for i, row in enumerate((30, 80, 148))
+        ])
+
+    builder = PatternSnapshotBuilder(engine, batch_size=1)
+    assert builder.build() == 8  # 148일 블록은 D+1까지만
+
+    with engine.connect() as conn:
+        stored = conn.execute(select(BlockPatternData).order_by(BlockPatternData.block_id, BlockPatternData.day_offset)).all()
+    by_key = {(row.block_id, row.day_offset): row for row in stored}
+    d, d1 = by_key[(11, 0)], by_key[(11, 1)]
+    assert d.date == DATES[80].date() and d1.date == DATES[81].date()
+    assert d.institutional_net_buy == 80.0 and d1.institutional_net_buy is None
+    assert d1.volume == int(volume[81]) and d1.volume_ratio_vs_d == pytest.approx(int(volume[81]) / int(volume[80]))
+    assert d1.is_high_breakout == (high[81] > high[80])
+    assert d1.is_qualified == (high[81] > high[80] and int(volume[81]) >= 0.5 * int(volume[80]))
+
+    # 새 봉이 들어오면 미완성(148일) 블록만 다시 생성
+    assert builder.build() == 2
+    with engine.begin() as conn:
+        _insert_prices(conn, high, volume, range(150, 200))
+    assert builder.build() == 3
+    assert builder.build() == 0
+    assert builder.build(rebuild=True) == 9
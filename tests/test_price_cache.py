@@ -0,0 +1,136 @@
+"""
+주가 시계열 LRU 캐시 테스트
+"""
+
+from datetime import date, timedelta
+from typing import List, Optional
+
+import numpy as np
+
+from domain.entities.price_data import PriceData
+from domain.entities.price_series import PriceSeries
+from domain.repositories.price_data_repository import PriceDataRepository
+from infrastructure.cache import LRUCache
+from infrastructure.repositories.cached_price_data_repository import CachedPriceDataRepository
+
+
+class InMemoryPriceDataRepository(PriceDataRepository):
+    """조회 횟수를 세는 메모리 Repository"""
+
+    def __init__(self, rows: List[PriceData]):
+        self.rows = list(rows)
+        self.series_calls = 0
+
+    def get_series(self, stock_id, start_date=None, end_date=None) -> PriceSeries:
+        self.series_calls += 1
+        rows = [r for r in self.rows if r.stock_id == stock_id]
+        return PriceSeries.from_price_data(stock_id, rows).slice_dates(start_date, end_date)
+
+    def get_by_stock_and_date(self, stock_id, target_date) -> Optional[PriceData]:
+        raise NotImplementedError
+
+    def get_by_stock_range(self, stock_id, start_date, end_date) -> List[PriceData]:
+        raise NotImplementedError
+
+    def get_latest(self, stock_id):
+        raise NotImplementedError
+
+    def get_latest_date(self, stock_id):
+        raise NotImplementedError
+
+    def save(self, price_data: PriceData) -> PriceData:
+        self.rows.append(price_data)
+        return price_data
+
+    def save_bulk(self, price_data_list: List[PriceData]) -> int:
+        self.rows.extend(price_data_list)
+        return len(price_data_list)
+
+    def exists(self, stock_id, target_date) -> bool:
+        raise NotImplementedError
+
+    def delete_by_stock(self, stock_id) -> int:
+        before = len(self.rows)
+        self.rows = [r for r in self.rows if r.stock_id != stock_id]
+        return before - len(self.rows)
+
+
+def _rows(stock_id: int, count: int, start: date = date(2020, 1, 1)) -> List[PriceData]:
+    return [
+        PriceData(
+            stock_id=stock_id,
+            date=start + timedelta(days=i),
+            open=100.0, high=110.0, low=90.0, close=105.0,
+            volume=1000 + i
+        )
+        for i in range(count)
+    ]
+
+
+def test_lru_cache_evicts_by_bytes():
+    cache = LRUCache(max_bytes=100, name="test_cache")
+    cache.put('a', np.zeros(5))   # 40 bytes
+    cache.put('b', np.zeros(5))   # 40 bytes
+    cache.get('a')                # 'a' 최근 사용
+    cache.put('c', np.zeros(5))   # 'b' 제거
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.current_bytes == 80
+    assert not cache.put('huge', np.zeros(100))
+
+
+def test_range_queries_served_from_cache():
+    inner = InMemoryPriceDataRepository(_rows(1, 100))
+    repo = CachedPriceDataRepository(inner, LRUCache(10 * 1024 * 1024, name="test_price"))
+
+    first = repo.get_series(1, date(2020, 1, 10), date(2020, 1, 19))
+    second = repo.get_series(1, date(2020, 2, 1), date(2020, 2, 29))
+
+    assert len(first) == 10
+    assert len(second) == 29
+    assert inner.series_calls == 1
+    assert repo.get_latest_date(1) == date(2020, 4, 9)
+    assert repo.cache.stats().hits == 2
+
+
+def test_writes_invalidate_stock_entry():
+    inner = InMemoryPriceDataRepository(_rows(1, 10) + _rows(2, 10))
+    repo = CachedPriceDataRepository(inner, LRUCache(10 * 1024 * 1024, name="test_price"))
+
+    repo.get_series(1)
+    repo.get_series(2)
+    repo.save_bulk(_rows(1, 5, start=date(2020, 2, 1)))
+
+    assert 1 not in repo.cache
+    assert 2 in repo.cache
+    assert len(repo.get_series(1)) == 15
+
+
+def test_cached_arrays_are_read_only():
+    inner = InMemoryPriceDataRepository(_rows(1, 10))
+    repo = CachedPriceDataRepository(inner, LRUCache(10 * 1024 * 1024, name="test_price"))
+
+    series = repo.get_series(1)
+    assert not series.close.flags.writeable
+
+
+def test_invalidation_during_load_skips_stale_put():
+    inner = InMemoryPriceDataRepository(_rows(1, 10))
+    repo = CachedPriceDataRepository(inner, LRUCache(10 * 1024 * 1024, name="test_price"))
+    load = inner.get_series
+
+    # 캐시 미스 로드가 끝나기 전에 다른 쓰기가 같은 종목을 무효화
+    def racing_load(stock_id, start_date=None, end_date=None):
+        series = load(stock_id, start_date, end_date)
+        repo.save_bulk(_rows(1, 5, start=date(2020, 2, 1)))
+        return series
+
+    inner.get_series = racing_load
+    assert len(repo.get_series(1)) == 10
+    assert 1 not in repo.cache
+
+    inner.get_series = load
+    assert len(repo.get_series(1)) == 15
+    assert 1 in repo.cache
@@ -0,0 +1,94 @@
+"""
+PriceSeries 값 객체 테스트
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from domain.entities.price_data import PriceData
+from domain.entities.price_series import PriceSeries
+from domain.services.block_detection_service import BlockDetectionService
+
+
+def _make_rows(count: int, start: date = date(2020, 1, 1)):
+    rows = []
+    for i in range(count):
+        close = 1000.0 + i
+        rows.append(PriceData(
+            stock_id=1,
+            date=start + timedelta(days=i),
+            open=close - 5,
+            high=close + 10,
+            low=close - 10,
+            close=close,
+            volume=1000 + (i % 7) * 100,
+            trading_value=None if i % 2 else close * 1000
+        ))
+    return rows
+
+
+def test_from_price_data_sorts_and_fills_trading_value():
+    rows = _make_rows(5)
+    series = PriceSeries.from_price_data(1, list(reversed(rows)))
+
+    assert len(series) == 5
+    assert series.first_date == rows[0].date
+    assert series.last_date == rows[-1].date
+    # trading_value None → 거래량 × 종가
+    assert series.trading_value[1] == rows[1].calculate_trading_value()
+    assert series.trading_value[0] == rows[0].trading_value
+
+
+def test_validation_masks_report_bad_rows_without_raising():
+    series = PriceSeries(
+        stock_id=1,
+        dates=[date(2020, 1, d) for d in range(1, 6)],
+        open=[10, 10, 10, -1, 10],
+        high=[12, 9, 11, 12, 12],
+        low=[9, 10, 12, 9, 9],
+        close=[11, 10, 10, 11, 13],
+        volume=[100, 100, 100, 100, -5],
+    )
+
+    masks = series.validation_masks()
+    assert masks['high_below_low'].tolist() == [False, True, True, False, False]
+    assert masks['non_positive_price'].tolist() == [False, False, False, True, False]
+    assert masks['high_below_open_close'].tolist() == [False, True, False, False, True]
+    assert masks['negative_volume'].tolist() == [False, False, False, False, True]
+
+    assert series.invalid_mask().tolist() == [False, True, True, True, True]
+    assert len(series.drop_invalid()) == 1
+
+
+def test_slice_dates_is_inclusive_view():
+    series = PriceSeries.from_price_data(1, _make_rows(30))
+
+    sliced = series.slice_dates(date(2020, 1, 5), date(2020, 1, 10))
+    assert len(sliced) == 6
+    assert sliced.first_date == date(2020, 1, 5)
+    assert sliced.last_date == date(2020, 1, 10)
+    assert np.shares_memory(sliced.close, series.close)
+
+    assert len(series.after(date(2020, 1, 28))) == 2
+    assert len(series.slice_dates(date(2021, 1, 1), None)) == 0
+
+
+def test_detection_service_accepts_series_and_list_equally():
+    rows = _make_rows(300)
+    service = BlockDetectionService()
+    settings = {'block1': {'min_trading_value': 0}}
+
+    from_list = service.detect_block_1_from_data(1, rows, settings)
+    from_series = service.detect_block_1_from_data(
+        1, PriceSeries.from_price_data(1, rows), settings
+    )
+
+    assert [b.date for b in from_list] == [b.date for b in from_series]
+    assert [b.new_high_grade for b in from_list] == [b.new_high_grade for b in from_series]
+
+
+def test_invalid_stock_id_rejected():
+    with pytest.raises(ValueError):
+        PriceSeries.empty(0)
@@ -0,0 +1,78 @@
+"""
+연속 구간(런) 커널 테스트
+누적합 런 길이 인코딩이 구간별 카운터 루프와 같은지, 블록 기간의 돌파 확인/지지 유지 일수 확인
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from domain.services.range_kernels import block_ranges, range_fields
+from domain.services.run_kernels import run_lengths, runs_above, segment_runs
+
+
+def _reference_runs(hits, min_length):
+    longest, longest_end, run, completed = 0, -1, 0, -1
+    for i, hit in enumerate(hits):
+        run = run + 1 if hit else 0
+        if run > longest:
+            longest, longest_end = run, i
+        if completed < 0 and min_length and run >= min_length:
+            completed = i
+    leading = next((i for i, hit in enumerate(hits) if not hit), len(hits))
+    return longest, longest_end, leading, completed
+
+
+def test_run_lengths_resets_at_segment_starts():
+    np.testing.assert_array_equal(run_lengths([1, 1, 0, 1, 1, 1, 0, 1]), [1, 2, 0, 1, 2, 3, 0, 1])
+    np.testing.assert_array_equal(run_lengths([1, 1, 1, 1], resets=[0, 0, 1, 0]), [1, 2, 1, 2])
+    assert len(run_lengths([])) == 0
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_segment_runs_match_counter_loop(seed):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(0, 1, 400)
+    values[rng.choice(400, 20)] = np.nan
+    starts = rng.integers(0, 400, 60)
+    ends = starts + rng.integers(-3, 80, 60)  # 빈 구간 / 배열 끝 넘는 구간 포함
+    ends = np.minimum(ends, 399)
+    levels = rng.normal(-0.5, 0.3, 60)
+
+    stats = runs_above(values, levels, starts, ends, min_length=5)
+    for i, (s, e) in enumerate(zip(starts, ends)):
+        hits = [values[row] > levels[i] for row in range(s, e + 1)]
+        longest, end, leading, completed = _reference_runs(hits, 5)
+        assert stats.longest[i] == longest
+        assert stats.longest_end[i] == (s + end if end >= 0 else -1)
+        assert stats.leading[i] == leading
+        assert stats.completed[i] == (s + completed if completed >= 0 else -1)
+
+    mask = values > 0
+    plain = segment_runs(mask, starts, ends)
+    assert (plain.completed == -1).all()
+    np.testing.assert_array_equal(plain.longest, runs_above(values, np.zeros(60), starts, ends).longest)
+
+
+def test_block_ranges_breakout_and_support_hold():
+    dates = pd.bdate_range(date(2020, 1, 1), periods=120)
+    close = np.full(120, 100.0)
+    close[60] = 110.0                # D일 (고가 112, 저가 105)
+    close[61:66] = 113.0             # 5일 연속 돌파 후
+    close[66] = 108.0                # 한 번 끊기고 (저가 이상은 유지)
+    close[67:85] = 115.0             # 18일 연속 → 14번째(80행)에서 확인
+    close[85:] = 104.0               # 저가 아래 + 60이평 하방이탈로 기간 종료
+    df = pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1_000},
+                      index=pd.DatetimeIndex(dates, name='date'))
+    df.loc[dates[60], ['high', 'low']] = (112.0, 105.0)
+
+    ranges = block_ranges(df, [dates[60].to_datetime64()], hold_days=14)
+    assert ranges.end_row[0] == 85
+    assert ranges.breakout_run[0] == 18
+    assert ranges.breakout_row[0] == 80
+    assert ranges.support_hold[0] == 24
+    fields = range_fields(df, ranges)[0]
+    assert fields['breakout_confirmed_date'] == dates[80].date()
+    assert fields['breakout_run_days'] == 18 and fields['support_hold_days'] == 24
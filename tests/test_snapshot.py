@@ -0,0 +1,120 @@
+"""
+DB 스냅샷/복원 테스트
+"""
+
+import gzip
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.config import SNAPSHOT_CONFIG
+from core.exceptions import EntityNotFoundException, RepositoryException
+from infrastructure.database.snapshot import SnapshotManager
+
+
+def _count(db_path) -> int:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    db_path = tmp_path / "robostock.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, payload TEXT)")
+    conn.executemany("INSERT INTO items (payload) VALUES (?)", [("x" * 200,)] * 500)
+    conn.commit()
+    conn.close()
+    return SnapshotManager(db_path=db_path, snapshot_dir=tmp_path / "snapshots")
+
+
+def test_snapshot_restore_roundtrip_with_open_connection(manager):
+    info = manager.create(reason="test", pages_per_step=4)
+    assert info.pages > 4
+    assert info.file_size < info.db_size
+    assert manager.verify(info.file)
+
+    # 앱이 연결을 잡고 있는 상태에서 변경 후 복원
+    live = sqlite3.connect(str(manager.db_path))
+    live.execute("DELETE FROM items")
+    live.commit()
+
+    manager.restore(info.file)
+    assert live.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 500
+    live.close()
+
+    # 복원 전 안전 스냅샷이 남음
+    reasons = [s.reason for s in manager.list_snapshots()]
+    assert reasons == ["test", f"before restore of {info.file}"]
+
+
+def test_snapshot_is_consistent_while_another_connection_writes(manager, monkeypatch):
+    monkeypatch.setitem(SNAPSHOT_CONFIG, 'step_sleep', 0.01)
+    done, written = threading.Event(), []
+
+    def writer():
+        conn = sqlite3.connect(str(manager.db_path), timeout=5)
+        while not done.is_set():
+            conn.execute("INSERT INTO items (payload) VALUES ('y')")
+            conn.commit()
+            written.append(1)
+        conn.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        info = manager.create(pages_per_step=1)
+    finally:
+        done.set()
+        thread.join()
+
+    # 백업 중에도 쓰기 진행 (WAL), 스냅샷은 백업 시작 시점 그대로
+    assert written
+    assert manager.verify(info.file)
+    raw = manager.snapshot_dir / "check.db"
+    manager._decompress(info, raw)
+    assert 500 <= _count(raw) < _count(manager.db_path)
+
+
+def test_snapshot_timeout_raises_and_cleans_up(manager, monkeypatch):
+    monkeypatch.setitem(SNAPSHOT_CONFIG, 'timeout', -1)
+    with pytest.raises(RepositoryException, match="timed out"):
+        manager.create(pages_per_step=1)
+    assert manager.list_snapshots() == []
+    assert list(manager.snapshot_dir.iterdir()) == []
+
+
+def test_corrupt_snapshot_fails_verification(manager):
+    info = manager.create()
+    with gzip.open(manager.snapshot_dir / info.file, 'wb') as f:
+        f.write(b"garbage")
+
+    assert not manager.verify(info.file)
+    with pytest.raises(Exception, match="checksum"):
+        manager.restore(info.file, safety_snapshot=False)
+    assert _count(manager.db_path) == 500
+
+
+def test_prune_keeps_latest_and_applies_age(manager):
+    for _ in range(4):
+        manager.create(apply_retention=False)
+
+    snapshots = manager.list_snapshots()
+    snapshots[0].created_at = (datetime.now() - timedelta(days=90)).isoformat(timespec='seconds')
+    manager._save_manifest(snapshots)
+
+    removed = manager.prune(keep_last=3, max_age_days=30)
+    remaining = manager.list_snapshots()
+
+    assert len(removed) == 1
+    assert len(remaining) == 3
+    assert all((manager.snapshot_dir / s.file).exists() for s in remaining)
+    assert not (manager.snapshot_dir / removed[0].file).exists()
+
+    with pytest.raises(EntityNotFoundException):
+        manager.get("missing.db.gz")
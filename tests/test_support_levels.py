@@ -0,0 +1,102 @@
+"""
+2번 블록 지지선(S1/S2/S3) 계산 테스트
+날짜 조회 일괄 계산이 행 단위 참조와 같은지, 입력이 바뀐 블록만 다시 저장하는지 확인 (임시 SQLite DB)
+"""
+
+import sqlite3
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import event, insert, select, update
+
+from core.enums import BlockType, MarketType, NewHighGrade
+from domain.services.support_kernels import support_levels
+from infrastructure.database.models import PriceData, Stock, SupportLevel, VolumeBlock
+from services.support_level_calculator import SupportLevelCalculator
+
+
+def _random_frame(seed: int, days: int = 300) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(date(2019, 1, 1), periods=days)
+    close = 5_000 * np.exp(np.cumsum(rng.normal(0.001, 0.02, days)))
+    open_ = close * (1 + rng.normal(0, 0.01, days))
+    return pd.DataFrame({
+        'open': open_, 'high': np.maximum(open_, close) * 1.01, 'low': np.minimum(open_, close) * 0.99,
+        'close': close, 'volume': rng.integers(1_000, 50_000, days),
+    }, index=pd.DatetimeIndex(dates, name='date'))
+
+
+def test_support_levels_match_row_lookup():
+    df = _random_frame(1)
+    ma = df['close'].rolling(60).mean()
+    b2_rows, b1_rows = [30, 120, 250], [10, 100, None]
+    levels = support_levels(
+        df, df.index.values[b2_rows], [None if r is None else df.index[r].date() for r in b1_rows]
+    )
+
+    for i, (b2, b1) in enumerate(zip(b2_rows, b1_rows)):
+        assert levels.s1[i] == pytest.approx(df['low'].iloc[b2])
+        if b2 >= 59:
+            assert levels.s3[i] == pytest.approx(ma.iloc[b2])
+        else:
+            assert np.isnan(levels.s3[i])
+        if b1 is None:
+            assert np.isnan(levels.s2[i]) and set(levels.levels(i)) == {1, 3}
+        else:
+            assert levels.s2[i] == pytest.approx(min(df['open'].iloc[b1], df['close'].iloc[b1]))
+
+
+def test_calculator_stores_and_skips_unchanged_blocks(engine):
+    df = _random_frame(2)
+    block_1_rows, block_2_rows = (50, 150), (90, 200, 230)
+    with engine.begin() as conn:
+        conn.execute(insert(Stock), [{'id': 1, 'code': '000001', 'name': '종목1', 'market': MarketType.KOSPI}])
+        conn.execute(insert(PriceData), [
+            {'stock_id': 1, 'date': d.date(), 'open': r.open, 'high': r.high, 'low': r.low,
+             'close': r.close, 'volume': int(r.volume)}
+            for d, r in df.iterrows()
+        ])
+        conn.execute(insert(VolumeBlock), [
+            {'id': i + 1, 'stock_id': 1, 'block_type': BlockType.BLOCK_1, 'date': df.index[row].date(),
+             'volume': 1, 'trading_value': 1.0, 'close_price': 1.0, 'new_high_grade': NewHighGrade.C}
+            for i, row in enumerate(block_1_rows)
+        ])
+        conn.execute(insert(VolumeBlock), [
+            {'id': 10 + i, 'stock_id': 1, 'block_type': BlockType.BLOCK_2, 'date': df.index[row].date(),
+             'parent_block_id': parent, 'volume': 1, 'trading_value': 1.0, 'close_price': 1.0}
+            for i, (row, parent) in enumerate(zip(block_2_rows, (1, 2, 2)))
+        ])
+
+    calculator = SupportLevelCalculator(engine, batch_size=1)
+    assert calculator.update() == 3
+
+    with engine.connect() as conn:
+        stored = conn.execute(
+            select(SupportLevel.block_id, SupportLevel.level_number, SupportLevel.price)
+            .order_by(SupportLevel.block_id, SupportLevel.level_number)
+        ).all()
+    assert len(stored) == 9
+    prices = {(block_id, level): price for block_id, level, price in stored}
+    assert prices[(10, 1)] == pytest.approx(df['low'].iloc[90])
+    assert prices[(11, 2)] == pytest.approx(min(df['open'].iloc[150], df['close'].iloc[150]))
+    assert prices[(12, 3)] == pytest.approx(df['close'].iloc[171:231].mean())
+
+    # 입력이 그대로면 재계산하지 않고, 부모가 바뀐 블록만 다시 계산
+    assert calculator.update() == 0
+    with engine.begin() as conn:
+        conn.execute(update(VolumeBlock).where(VolumeBlock.id == 12).values(parent_block_id=1))
+    assert calculator.update() == 1
+    with engine.connect() as conn:
+        s2 = conn.execute(
+            select(SupportLevel.price).where(SupportLevel.block_id == 12, SupportLevel.level_number == 2)
+        ).scalar_one()
+        assert len(conn.execute(select(SupportLevel.id)).all()) == 9
+    assert s2 == pytest.approx(min(df['open'].iloc[50], df['close'].iloc[50]))
+    assert calculator.update(force=True) == 3
+
+    # 시장 전체 종목 목록 (BlockDetectionWorker) - 구버전 SQLite 변수 한도(999)에서도 IN 절 분할 조회
+    event.listen(engine, 'connect', lambda conn, _: conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999))
+    engine.dispose()
+    assert calculator.update([*range(3000, 1, -1), 1], force=True) == 3
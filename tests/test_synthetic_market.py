@@ -0,0 +1,103 @@
+"""
+합성 시장 생성기 / 탐지 벤치마크 테스트
+시드 재현성, 생성 데이터 특성(갭/급증/신고가/누락), SQLite 저장, 기준치 회귀 판정 확인
+"""
+
+import sqlite3
+
+import numpy as np
+import pytest
+
+from services.detection_benchmark import DetectionBenchmark, compare, load_baseline, result_key, save_baseline
+from services.synthetic_market import SyntheticMarket
+
+
+def test_same_seed_same_data_regardless_of_universe_size():
+    small = SyntheticMarket(stocks=3, years=2, seed=7)
+    large = SyntheticMarket(stocks=20, years=2, seed=7)
+
+    assert small.prices(2).equals(large.prices(2))
+    assert not small.prices(2).equals(SyntheticMarket(stocks=3, years=2, seed=8).prices(2))
+    assert not small.prices(1).equals(small.prices(2))
+
+
+def test_generated_prices_have_spikes_gaps_and_new_highs():
+    market = SyntheticMarket(stocks=10, years=3, seed=1)
+    calendar = market.trading_days()
+    assert len(calendar) == 3 * 261 - 3 * 10
+
+    for stock in market.stock_list():
+        df = market.prices(stock['id'])
+        assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+        assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+        assert np.allclose(df['trading_value'], df['volume'] * df['close'])
+        assert df['date'].is_monotonic_increasing and set(df['date'].values.astype('datetime64[D]')) <= set(calendar)
+        # 거래량 급증 (중앙값 대비 8배 이상)
+        assert (df['volume'] > 8 * df['volume'].median()).any()
+
+    frames = [market.prices(stock['id']) for stock in market.stock_list()]
+    # 거래정지/상장 지연으로 영업일보다 행이 적은 종목, 이전 최고가를 넘는 종가가 있는 종목
+    assert any(len(df) < len(calendar) for df in frames)
+    assert all((df['close'].iloc[250:] > df['high'].cummax().shift().iloc[250:]).any() for df in frames)
+
+
+def test_write_sqlite_round_trip(tmp_path):
+    market = SyntheticMarket(stocks=4, years=1, seed=3)
+    path = market.write_sqlite(tmp_path / 'synthetic.db')
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM stocks").fetchone()[0] == 4
+        rows = conn.execute("SELECT close, volume FROM price_data WHERE stock_id = 2 ORDER BY date").fetchall()
+        investor_rows = conn.execute("SELECT COUNT(*) FROM investor_trading WHERE stock_id = 2").fetchone()[0]
+
+    df = market.prices(2)
+    assert rows == list(zip(df['close'], df['volume']))
+    assert investor_rows == len(df)
+
+
+def test_compare_flags_only_meaningful_regressions():
+    def key(engine, seed=42):
+        return result_key(engine, 10, 5, seed)
+
+    baseline = {'results': {
+        key('block_detector'): {'seconds': 1.0},
+        key('use_case_bulk'): {'seconds': 1.0},
+        key('range_calculator'): {'seconds': 0.01},
+        key('support_levels'): {'seconds': 1.0},
+    }}
+    report = {'results': {
+        key('block_detector'): {'seconds': 1.2},      # 허용 범위
+        key('use_case_bulk'): {'seconds': 1.5},       # 회귀
+        key('range_calculator'): {'seconds': 0.03},   # 잡음 (min_seconds 미만)
+        key('case_pipeline'): {'seconds': 9.0},       # 기준치 없음
+        key('support_levels', seed=7): {'seconds': 9.0},  # 다른 시드 - 비교 안 함
+    }}
+
+    regressions = compare(report, baseline, max_regression_pct=25.0, min_seconds=0.05)
+    assert [r.key for r in regressions] == ['use_case_bulk@10x5y-s42']
+    assert regressions[0].pct == pytest.approx(50.0)
+    assert compare(report, None) == []
+
+
+def test_benchmark_run_and_baseline_merge(tmp_path):
+    benchmark = DetectionBenchmark(sizes=[3], years=2, seed=5, repeat=1,
+                                   engines=['block_detector', 'use_case_bulk', 'range_calculator'],
+                                   work_dir=tmp_path)
+    report = benchmark.run()
+
+    results = report['results']
+    assert set(results) == {'block_detector@3x2y-s5', 'use_case_bulk@3x2y-s5', 'range_calculator@3x2y-s5'}
+    assert results['block_detector@3x2y-s5']['output'] == results['use_case_bulk@3x2y-s5']['output'] > 0
+    assert results['range_calculator@3x2y-s5']['output'] > 0
+    assert list(tmp_path.iterdir()) == []  # 임시 DB 정리
+
+    path = tmp_path / 'baseline.json'
+    # 다른 시드로 잰 같은 엔진/크기 기준치는 덮어쓰지 않고 유지
+    other = result_key('block_detector', 3, 2, 6)
+    save_baseline({'meta': {}, 'results': {other: {'seconds': 1.0}}}, path)
+    save_baseline(report, path)
+    assert set(load_baseline(path)['results']) == set(results) | {other}
+    assert compare(report, load_baseline(path)) == []
+
+    with pytest.raises(ValueError):
+        DetectionBenchmark(engines=['unknown'])